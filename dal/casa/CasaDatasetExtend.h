@@ -59,6 +59,7 @@ template<typename T, typename BASE> void CasaDatasetExtend<T,BASE>::getMatrix( c
 {
   const size_t rank = BASE::ndims();
   std::vector<size_t> dpos(rank), dsize(rank), dstrides(rank);
+  const std::vector<size_t> dfileStride(0), dfileBlock(0);
 
   const casa::IPosition &shape = buffer.shape();
   const casa::IPosition &steps = buffer.steps();
@@ -73,13 +74,14 @@ template<typename T, typename BASE> void CasaDatasetExtend<T,BASE>::getMatrix( c
     dstrides[i] = steps[rank-1 -i];
   }
 
-  matrixIO(dpos, dsize, dstrides, buffer.data(), true);
+  matrixIO(dpos, buffer.data(), dsize, dstrides, dfileStride, dfileBlock, true);
 }
 
 template<typename T, typename BASE> void CasaDatasetExtend<T,BASE>::setMatrix( const casa::IPosition &pos, const casa::Array<T> &buffer )
 {
   const size_t rank = BASE::ndims();
   std::vector<size_t> dpos(rank), dsize(rank), dstrides(rank);
+  const std::vector<size_t> dfileStride(0), dfileBlock(0);
 
   const casa::IPosition &shape = buffer.shape();
   const casa::IPosition &steps = buffer.steps();
@@ -94,7 +96,7 @@ template<typename T, typename BASE> void CasaDatasetExtend<T,BASE>::setMatrix( c
     dstrides[i] = steps[rank-1 -i];
   }
 
-  matrixIO(dpos, dsize, dstrides, const_cast<T *>(buffer.data()), false);
+  matrixIO(dpos, const_cast<T *>(buffer.data()), dsize, dstrides, dfileStride, dfileBlock, false);
 }
 
 }
@@ -31,6 +31,21 @@
 // This copy only happens for metadata vectors. Dataset data is not passed in STL vectors.
 %include "dal/vectors.i"
 
+// -------------------------------
+// Type marshalling - NumPy arrays
+// -------------------------------
+
+// Dataset data and numeric vector attributes are passed as NumPy arrays.
+%{
+  #define SWIG_FILE_WITH_INIT
+%}
+
+%include "external/numpy.i"
+
+%init %{
+  import_array();
+%}
+
 // ignore DAL-global functions that need renaming but are not needed for Python users
 %ignore dal::swap;
 
@@ -40,16 +55,26 @@
 
 %include "dal/hdf5/exceptions/exceptions.i"
 
+// -------------------------------
+// Thread support
+// -------------------------------
+
+%include "dal/threads.i"
+
 // -------------------------------
 // DAL classes and templates
 // -------------------------------
 
 %{
+  #include "dal/hdf5/BlockIterator.h"
+  #include "dal/hdf5/DatasetAppender.h"
   #include "dal/lofar/CommonTuples.h"
   #include "dal/lofar/StationNames.h"
   #include "dal/lofar/Flagging.h"
   #include "dal/lofar/BF_File.h"
   #include "dal/lofar/TBB_File.h"
+  #include "dal/lofar/TBB_DipoleReader.h"
+  #include "dal/lofar/TBB_DipoleAppender.h"
 
   #include "dal/dal_version.h"
 
@@ -60,6 +85,9 @@
 %include "dal/hdf5/Attribute.i"
 %include "dal/hdf5/Group.i"
 %include "dal/hdf5/Dataset.i"
+%include "dal/hdf5/BlockIterator.i"
+%include "dal/hdf5/DatasetAppender.i"
+%include dal/hdf5/types/FileAccessProfile.h
 %include dal/hdf5/File.h
 
 %include "dal/hdf5/types/h5tuple.i"
@@ -71,7 +99,7 @@
 %include "dal/lofar/Flagging.i"
 %include "dal/lofar/CommonTuples.i"
 %include dal/lofar/CLA_File.h
-%include dal/lofar/Coordinates.h
+%include "dal/lofar/Coordinates.i"
 %include dal/lofar/BF_File.h
 %include "dal/lofar/TBB_File.i"
 
@@ -18,6 +18,7 @@
 #define DAL_ATTRIBUTE_H
 
 #include <cstdlib>
+#include <algorithm>
 #include <string>
 #include <vector>
 #include <ostream>
@@ -66,6 +67,24 @@ public:
    * using the type defined by this object.
    */
   virtual bool valid() const;
+
+protected:
+  /*!
+   * Returns the HDF5 path of the group or dataset holding this attribute.
+   */
+  std::string parentPath() const;
+
+  /*!
+   * Sets `value` to the value of this attribute in the attribute cache of the file, if
+   * the cache is enabled and contains it. Returns whether it does.
+   */
+  template<typename T> bool getCached( T &value ) const;
+
+  //! Stores `value` as the value of this attribute in the attribute cache of the file, if enabled.
+  template<typename T> void setCached( const T &value ) const;
+
+  //! Removes this attribute from the attribute cache of the file, if enabled.
+  void invalidateCached() const;
 };
 
 #ifndef SWIG
@@ -291,6 +310,20 @@ public:
    */
   void set( const std::vector<T> &value );
 
+  /*!
+   * Reads the value of this attribute directly into `outbuffer`, which holds
+   * `len` == size() elements. A DALValueError is thrown if `len` differs from size().
+   * Like get(), but without an intermediate std::vector, unless the value is stored
+   * in the attribute cache (see File::setAttributeCaching()). Not for std::string elements.
+   */
+  void getValues( T *outbuffer, size_t len ) const;
+
+  /*!
+   * Stores the `len` elements in `inbuffer` as the value of this attribute.
+   * Like set(), but without an intermediate std::vector. Not for std::string elements.
+   */
+  void setValues( const T *inbuffer, size_t len );
+
   /*!
    * Validates the attribute by checking whether it exists, and whether it can be read
    * using the type defined by this object.
@@ -298,6 +331,10 @@ public:
   virtual bool valid() const;
 
   AttributeValue< std::vector<T> > value;
+
+private:
+  //! Reads all size() elements of this attribute into `outbuffer`.
+  void read( T *outbuffer ) const;
 };
 
 }
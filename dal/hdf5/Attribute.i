@@ -25,6 +25,10 @@ namespace dal {
 // We will provide an Attribute.value implementation in Python
 %ignore dal::Attribute::value;
 
+// Numeric vector attributes provide _getValues/_setValues instead (see AddNumericAttributeAndVector)
+%ignore dal::Attribute::getValues;
+%ignore dal::Attribute::setValues;
+
 %include dal/hdf5/Attribute.h
 
 %extend dal::Attribute {
@@ -78,23 +82,99 @@ namespace dal {
   AddSimpleAttributeAndVector( %arg(PythonName), %arg(CPPName) );
 %enddef
 
+// Numeric vectors are read and written as numpy arrays of dtype PythonDType,
+// directly from and into the array buffer.
+%define AddNumericAttributeAndVector( PythonName, CPPName, NumpyType, PythonDType )
+  %numpy_typemaps(%arg(CPPName), NumpyType, size_t)
+  %apply (CPPName* INPLACE_ARRAY1, size_t DIM1) {(CPPName *outbuffer,      size_t len)}
+  %apply (CPPName* IN_ARRAY1,      size_t DIM1) {(const CPPName *inbuffer, size_t len)}
+
+  %extend dal::Attribute< std::vector< CPPName > > {
+    void _getValues( CPPName *outbuffer, size_t len ) const {
+      $self->getValues(outbuffer, len);
+    }
+
+    void _setValues( const CPPName *inbuffer, size_t len ) {
+      $self->setValues(inbuffer, len);
+    }
+  }
+
+  AddSimpleAttributeAndVector( %arg(PythonName), %arg(CPPName) );
+
+  %pythoncode {
+    AttributeV ## PythonName .dtype = PythonDType
+    AttributeV ## PythonName .get = _getNumericVector
+    AttributeV ## PythonName .set = _setNumericVector
+  }
+%enddef
+
 %pythoncode {
   # dal::Attribute templates can be registered here
   _Attributes = {}
+
+  def _getNumericVector(self):
+    """
+      Returns the value of this attribute as a numpy array.
+
+      Python example:
+
+           # Create a new HDF5 file
+           >>> f = File("example.h5", File.CREATE)
+
+           # Numeric vectors are stored and returned as numpy arrays
+           >>> import numpy
+           >>> a = AttributeVDouble(f, "EXAMPLE_DOUBLES")
+           >>> a.value = numpy.linspace(0.0, 1.0, 5)
+           >>> type(a.value) is numpy.ndarray, a.value.tolist()
+           (True, [0.0, 0.25, 0.5, 0.75, 1.0])
+
+           # Any sequence of numbers can be stored
+           >>> a.value = [1, 2, 3]
+           >>> a.value.dtype == AttributeVDouble.dtype
+           True
+
+           # Clean up
+           >>> import os
+           >>> os.remove("example.h5")
+    """
+    import numpy
+
+    values = numpy.empty(self.size(), dtype=self.dtype)
+    self._getValues(values)
+    return values
+
+  def _setNumericVector(self, value):
+    """
+      Stores `value`, a numpy array or any sequence of numbers, as the value
+      of this attribute. Arrays of the right dtype are stored without a copy.
+    """
+    import numpy
+
+    self._setValues(numpy.ascontiguousarray(value, dtype=self.dtype))
+}
+
+%pythoncode {
+  # the dtypes of the numeric vector attributes
+  import numpy
 }
 
 AddAttribute( Bool, bool );
-AddSimpleAttributeAndVector( Int,           int );
-AddSimpleAttributeAndVector( Long,          long );
-AddSimpleAttributeAndVector( UInt,          %arg(unsigned int) );
-AddSimpleAttributeAndVector( ULong,         %arg(unsigned long) );
-AddSimpleAttributeAndVector( LongLong,      %arg(long long) );
-AddSimpleAttributeAndVector( ULongLong,     %arg(unsigned long long) );
-AddSimpleAttributeAndVector( Float,         float );
-AddSimpleAttributeAndVector( Double,        double );
-AddSimpleAttributeAndVector( ComplexFloat,  %arg(std::complex<float>) );
-AddSimpleAttributeAndVector( ComplexDouble, %arg(std::complex<double>) );
+AddNumericAttributeAndVector( Int,           int,                          NPY_INT,       numpy.intc );
+AddNumericAttributeAndVector( Long,          long,                         NPY_LONG,      numpy.int_ );
+AddNumericAttributeAndVector( UInt,          %arg(unsigned int),           NPY_UINT,      numpy.uintc );
+AddNumericAttributeAndVector( ULong,         %arg(unsigned long),          NPY_ULONG,     numpy.uint );
+AddNumericAttributeAndVector( LongLong,      %arg(long long),              NPY_LONGLONG,  numpy.longlong );
+AddNumericAttributeAndVector( ULongLong,     %arg(unsigned long long),     NPY_ULONGLONG, numpy.ulonglong );
+AddNumericAttributeAndVector( Float,         float,                        NPY_FLOAT,     numpy.single );
+AddNumericAttributeAndVector( Double,        double,                       NPY_DOUBLE,    numpy.double );
+AddNumericAttributeAndVector( ComplexFloat,  %arg(std::complex<float>),    NPY_CFLOAT,    numpy.csingle );
+AddNumericAttributeAndVector( ComplexDouble, %arg(std::complex<double>),   NPY_CDOUBLE,   numpy.cdouble );
 AddSimpleAttributeAndVector( String,        std::string );
+
+%pythoncode {
+  del numpy
+}
+
 AddAttributeAndVector( UInt3,         %arg(Tuple<unsigned int, 3>) );
 AddAttributeAndVector( ULongLong2,    %arg(Tuple<unsigned long long, 2>) );
 AddAttributeAndVector( Double3,       %arg(Tuple<double, 3>) );
@@ -18,6 +18,10 @@ namespace dal {
 
 inline bool AttributeBase::exists() const
 {
+  // a cached attribute has been read since it was last changed or removed
+  if (fileAttributeCache().enabled() && fileAttributeCache().contains(parentPath(), _name))
+    return true;
+
   return H5Aexists(parent, _name.c_str()) > 0;
 }
 
@@ -27,6 +31,8 @@ inline bool AttributeBase::valid() const
 }
 
 inline void AttributeBase::remove() const {
+  invalidateCached();
+
   if (H5Adelete(parent, _name.c_str()) < 0)
     throw HDF5Exception("Could not remove attribute " + _name);
 }
@@ -64,6 +70,46 @@ inline size_t AttributeBase::size() const
   return nelems;
 }
 
+inline std::string AttributeBase::parentPath() const
+{
+  const ssize_t len = H5Iget_name(parent, NULL, 0);
+  if (len < 0)
+    throw HDF5Exception("Could not get path of parent of attribute " + _name);
+
+  std::vector<char> path(len + 1);
+
+  if (H5Iget_name(parent, &path[0], path.size()) < 0)
+    throw HDF5Exception("Could not get path of parent of attribute " + _name);
+
+  return std::string(&path[0], len);
+}
+
+template<typename T> inline bool AttributeBase::getCached( T &value ) const
+{
+  AttributeCache &cache = fileAttributeCache();
+
+  if (!cache.enabled())
+    return false;
+
+  return cache.get(parentPath(), _name, value);
+}
+
+template<typename T> inline void AttributeBase::setCached( const T &value ) const
+{
+  AttributeCache &cache = fileAttributeCache();
+
+  if (cache.enabled())
+    cache.put(parentPath(), _name, value);
+}
+
+inline void AttributeBase::invalidateCached() const
+{
+  AttributeCache &cache = fileAttributeCache();
+
+  if (cache.enabled())
+    cache.invalidate(parentPath(), _name);
+}
+
 template<typename T> AttributeValue<T>& AttributeValue<T>::operator=( const T& value )
 {
   if (!attr.exists())
@@ -148,6 +194,8 @@ static inline bool h5stringIsVariable( hid_t datatype )
 // generic variants
 template<typename T> inline Attribute<T>& Attribute<T>::create()
 {
+  invalidateCached();
+
   hid_gc_noref dataspace(h5scalar(), H5Sclose, "Could not create scalar dataspace for attribute " + _name);
 
   hid_gc_noref attr(H5Acreate2(parent, _name.c_str(), h5typemap<T>::attributeType(), dataspace, H5P_DEFAULT, H5P_DEFAULT), H5Aclose, "Could not create attribute " + _name);
@@ -157,6 +205,8 @@ template<typename T> inline Attribute<T>& Attribute<T>::create()
 
 template<typename T> inline void Attribute<T>::set( const T &value )
 {
+  invalidateCached();
+
   hid_gc_noref attr(H5Aopen(parent, _name.c_str(), H5P_DEFAULT), H5Aclose, "Could not open to set attribute " + _name);
 
   if (H5Awrite(attr, h5typemap<T>::memoryType(), &value) < 0)
@@ -167,11 +217,15 @@ template<typename T> inline T Attribute<T>::get() const
 {
   T value;
 
+  if (getCached(value))
+    return value;
+
   hid_gc_noref attr(H5Aopen(parent, _name.c_str(), H5P_DEFAULT), H5Aclose, "Could not open to get attribute " + _name);
 
   if (H5Aread(attr, h5typemap<T>::memoryType(), &value) < 0)
     throw HDF5Exception("Could not get attribute" + _name);
 
+  setCached(value);
   return value;
 }
 
@@ -194,6 +248,8 @@ template<typename T> inline bool Attribute<T>::valid() const
 
 template<typename T> inline Attribute< std::vector<T> >& Attribute< std::vector<T> >::create( size_t length )
 {
+  invalidateCached();
+
   hid_gc_noref dataspace(h5array(length), H5Sclose, "Could not create simple dataspace to create attribute " + _name);
 
   hid_gc_noref attr(H5Acreate2(parent, _name.c_str(), h5typemap<T>::attributeType(), dataspace, H5P_DEFAULT, H5P_DEFAULT), H5Aclose, "Could not create attribute " + _name);
@@ -203,35 +259,75 @@ template<typename T> inline Attribute< std::vector<T> >& Attribute< std::vector<
 
 template<typename T> inline void Attribute< std::vector<T> >::set( const std::vector<T> &value )
 {
-  if (size() != value.size()) {
+  setValues(value.empty() ? NULL : &value[0], value.size());
+}
+
+template<typename T> inline void Attribute< std::vector<T> >::setValues( const T *inbuffer, size_t len )
+{
+  invalidateCached();
+
+  if (size() != len) {
     // recreate the attribute to change the vector length on disk
     remove();
-    create(value.size());
+    create(len);
   }
     
-  if (value.empty())
+  if (len == 0)
     return; // cannot write to a NULL dataspace
 
   hid_gc_noref attr(H5Aopen(parent, _name.c_str(), H5P_DEFAULT), H5Aclose, "Could not open to set attribute " + _name);
 
-  if (H5Awrite(attr, h5typemap<T>::memoryType(), &value[0]) < 0)
+  if (H5Awrite(attr, h5typemap<T>::memoryType(), inbuffer) < 0)
     throw HDF5Exception("Could not write to attribute " + _name);
 }
 
 template<typename T> inline std::vector<T> Attribute< std::vector<T> >::get() const
 {
-  hid_gc_noref attr(H5Aopen_name(parent, _name.c_str()), H5Aclose, "Could not open to get attribute " + _name);
+  std::vector<T> value;
 
-  std::vector<T> value(size());
-  if (value.empty())
+  if (getCached(value))
     return value;
 
-  if (H5Aread(attr, h5typemap<T>::memoryType(), &value[0]) < 0)
-    throw HDF5Exception("Could not get attribute " + _name);
+  value.resize(size());
+
+  if (!value.empty())
+    read(&value[0]);
 
+  setCached(value);
   return value;
 }
 
+template<typename T> inline void Attribute< std::vector<T> >::getValues( T *outbuffer, size_t len ) const
+{
+  std::vector<T> value;
+
+  if (getCached(value)) {
+    if (len != value.size())
+      throw DALValueError("Buffer length does not match size of attribute " + _name);
+
+    std::copy(value.begin(), value.end(), outbuffer);
+    return;
+  }
+
+  if (len != size())
+    throw DALValueError("Buffer length does not match size of attribute " + _name);
+
+  if (len > 0)
+    read(outbuffer);
+
+  // copying the value into the cache is cheap compared to reading it from the file
+  if (fileAttributeCache().enabled())
+    setCached(std::vector<T>(outbuffer, outbuffer + len));
+}
+
+template<typename T> inline void Attribute< std::vector<T> >::read( T *outbuffer ) const
+{
+  hid_gc_noref attr(H5Aopen(parent, _name.c_str(), H5P_DEFAULT), H5Aclose, "Could not open to get attribute " + _name);
+
+  if (H5Aread(attr, h5typemap<T>::memoryType(), outbuffer) < 0)
+    throw HDF5Exception("Could not get attribute " + _name);
+}
+
 template<typename T> inline bool Attribute< std::vector<T> >::valid() const
 {
   if (!exists())
@@ -253,6 +349,8 @@ template<typename T> inline bool Attribute< std::vector<T> >::valid() const
 
 template<> inline Attribute<std::string>& Attribute<std::string>::create()
 {
+  invalidateCached();
+
   hid_gc_noref dataspace(h5scalar(), H5Sclose, "Could not create scalar dataspace to create attribute " + _name);
   hid_gc_noref datatype(h5variableStringType(), H5Tclose, "Could not create string datatype to create attribute " + _name);
 
@@ -263,6 +361,8 @@ template<> inline Attribute<std::string>& Attribute<std::string>::create()
 
 template<> inline void Attribute<std::string>::set( const std::string &value )
 {
+  invalidateCached();
+
   const char *cstr = value.c_str();
 
   hid_gc_noref attr(H5Aopen(parent, _name.c_str(), H5P_DEFAULT), H5Aclose, "Could not open to set attribute " + _name);
@@ -308,6 +408,9 @@ template<> inline std::string Attribute<std::string>::get() const
   char *buf = 0;
   std::string value;
 
+  if (getCached(value))
+    return value;
+
   hid_gc_noref attr(H5Aopen(parent, _name.c_str(), H5P_DEFAULT), H5Aclose, "Could not open to get attribute " + _name);
   hid_gc_noref diskdatatype(H5Aget_type(attr), H5Tclose, "Could not get string datatype to get attribute " + _name);
 
@@ -352,6 +455,8 @@ template<> inline std::string Attribute<std::string>::get() const
     value = buf;   
   }
 
+  setCached(value);
+
   return value;
 }
 
@@ -360,6 +465,8 @@ template<> inline std::string Attribute<std::string>::get() const
 
 template<> inline Attribute< std::vector<std::string> >& Attribute< std::vector<std::string> >::create( size_t length )
 {
+  invalidateCached();
+
   hid_gc_noref dataspace(h5array(length), H5Sclose, "Could not create simple dataspace to create attribute " + _name);
   hid_gc_noref datatype(h5variableStringType(), H5Tclose, "Could not create string datatype to create attribute " + _name);
 
@@ -370,6 +477,8 @@ template<> inline Attribute< std::vector<std::string> >& Attribute< std::vector<
 
 template<> inline void Attribute< std::vector<std::string> >::set( const std::vector<std::string> &value )
 {
+  invalidateCached();
+
   if (size() != value.size()) {
     // recreate the attribute to change the vector length on disk
     remove();
@@ -394,28 +503,54 @@ template<> inline void Attribute< std::vector<std::string> >::set( const std::ve
 
 template<> inline std::vector<std::string> Attribute< std::vector<std::string> >::get() const
 {
-  // H5Aread will allocate memory for us (use free() to free each element)
-  std::vector<char *> c_strs(size(), 0);
-  if (c_strs.empty())
-    return std::vector<std::string>();
+  std::vector<std::string> value;
+
+  if (getCached(value))
+    return value;
+
+  value.resize(size());
+  if (value.empty()) {
+    setCached(value);
+    return value;
+  }
 
-  hid_gc_noref datatype(h5variableStringType(), H5Tclose, "Could not create string datatype to get attribute " + _name);
   hid_gc_noref attr(H5Aopen(parent, _name.c_str(), H5P_DEFAULT), H5Aclose, "Could not open to get attribute " + _name);
-  hid_gc_noref dataspace(H5Aget_space(attr), H5Sclose, "Could not get dataspace of attribute " + _name);
+  hid_gc_noref diskdatatype(H5Aget_type(attr), H5Tclose, "Could not get string datatype to get attribute " + _name);
 
-  if (H5Aread(attr, datatype, &c_strs[0]) < 0)
-    throw HDF5Exception("Could not get attribute " + _name);
+  if (h5stringIsVariable(diskdatatype)) {
+    // H5Aread will allocate memory for us, which is freed for all elements at once below
+    std::vector<char *> c_strs(value.size(), 0);
 
-  // convert from C-style strings
-  std::vector<std::string> value(c_strs.size());
-  for (unsigned i = 0; i < value.size(); i++)
-    if (c_strs[i])
-      value[i] = c_strs[i];
+    hid_gc_noref datatype(h5variableStringType(), H5Tclose, "Could not create string datatype to get attribute " + _name);
+    hid_gc_noref dataspace(H5Aget_space(attr), H5Sclose, "Could not get dataspace of attribute " + _name);
 
-  // free the allocated memory
-  if (H5Dvlen_reclaim(datatype, dataspace, H5P_DEFAULT, &c_strs[0]) < 0)
-    throw DALException("Could not reclaim memory for variable-length attribute " + _name);
+    if (H5Aread(attr, datatype, &c_strs[0]) < 0)
+      throw HDF5Exception("Could not get attribute " + _name);
+
+    // convert from C-style strings
+    for (size_t i = 0; i < value.size(); i++)
+      if (c_strs[i])
+        value[i] = c_strs[i];
+
+    // free the allocated memory
+    if (H5Dvlen_reclaim(datatype, dataspace, H5P_DEFAULT, &c_strs[0]) < 0)
+      throw DALException("Could not reclaim memory for variable-length attribute " + _name);
+  } else {
+    // string type on disk is fixed (e.g. written by other tools) -- read all elements into one buffer,
+    // with room for a null terminator after each
+    const size_t stride = H5Tget_size(diskdatatype) + 1;
+    std::vector<char> buf(value.size() * stride);
+
+    hid_gc_noref datatype(h5fixedStringType(stride), H5Tclose, "Could not create fixed length string datatype to get attribute " + _name);
+
+    if (H5Aread(attr, datatype, &buf[0]) < 0)
+      throw HDF5Exception("Could not get attribute " + _name);
+
+    for (size_t i = 0; i < value.size(); i++)
+      value[i] = &buf[i * stride];
+  }
 
+  setCached(value);
   return value;
 }
 
@@ -0,0 +1,164 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#ifndef DAL_BLOCK_ITERATOR_H
+#define DAL_BLOCK_ITERATOR_H
+
+#include <cstddef>
+#include <complex>
+#include <string>
+#include <vector>
+#include <pthread.h>
+#include "Dataset.h"
+
+namespace dal {
+
+/*!
+ * \class BlockIterator
+ *
+ * Iterates over consecutive blocks of `blockLength` samples (positions in the first
+ * dimension) of a dataset, for example over time blocks of a BF_StokesDataset
+ * (samples x channels) or a TBB_DipoleDataset (samples). This allows processing
+ * datasets larger than memory without writing an offset loop around get2D()/get1D().
+ *
+ * The iterator owns two buffers of one block each. While the caller processes the
+ * current block, the next block is read ahead into the other buffer by a background
+ * thread. No memory is allocated per block.
+ *
+ * HDF5 is not thread-safe (unless built as such), so the read-ahead thread does not
+ * call HDF5. It reads the raw data file of the dataset directly instead (see
+ * Dataset::externalDataFile()), as LOFAR BF and TBB data are stored. Datasets stored
+ * inside the HDF5 file are read through HDF5 by next(), without read-ahead.
+ *
+ * The dataset must outlive the iterator. The iterator iterates up to the number of
+ * samples in the dataset at construction.
+ *
+ * C++ example:
+ * \code
+ *    BlockIterator<float> it(stokes, 4096);
+ *
+ *    while (it.next()) {
+ *      // process it.length() samples of it.rowLength() values each,
+ *      // starting at sample it.pos(), stored in it.data()
+ *    }
+ * \endcode
+ *
+ * Python example (see Dataset.blocks()):
+ * \code
+ *    >>> for block in stokes.blocks(4096):
+ *    ...   total += block.sum(axis=0)
+ * \endcode
+ */
+template<typename T> class BlockIterator {
+public:
+  /*!
+   * Create an iterator over blocks of `blockLength` samples of `dataset`, starting at sample `pos`.
+   *
+   * Requires:
+   *    - blockLength > 0
+   *    - pos <= dims()[0]
+   */
+  BlockIterator( Dataset<T> &dataset, size_t blockLength, size_t pos = 0 );
+
+  ~BlockIterator();
+
+  /*!
+   * Advances to the next block, and starts reading the one after it.
+   * Returns false if there are no more blocks. The last block can be shorter than blockLength.
+   */
+  bool next();
+
+  //! Returns the index of the first sample of the current block.
+  size_t pos() const;
+
+  //! Returns the number of samples in the current block.
+  size_t length() const;
+
+  //! Returns the number of values per sample (the product of all dimensions except the first).
+  size_t rowLength() const;
+
+  //! Returns the number of samples per block (except for the last block).
+  size_t blockLength() const;
+
+  //! Returns whether the next block is read ahead while the current one is processed.
+  bool readAhead() const;
+
+  /*!
+   * Returns the current block: length() x rowLength() values, in row-major order.
+   * The data is overwritten on the next call to next().
+   */
+  const T *data() const;
+
+  /*!
+   * Copies the current block into `outbuffer`.
+   *
+   * Requires:
+   *    len == length() * rowLength()
+   */
+  void getBlock( T *outbuffer, size_t len ) const;
+
+private:
+  Dataset<T> &dataset;
+  const size_t _blockLength;
+  size_t _rowLength;
+  size_t end;
+
+  std::vector<T> buffers[2];
+  unsigned current;
+
+  size_t _pos;
+  size_t _length;
+  size_t nextPos;
+
+  // raw data file (if any) of the dataset
+  bool raw;
+  std::string rawFilename;
+  size_t rawOffset;
+  bool rawBigEndian;
+
+  // read-ahead of the block at nextPos into buffers[1 - current]
+  struct Prefetch {
+    const BlockIterator<T> *iterator;
+    size_t pos;
+    size_t length;
+    T *buffer;
+    std::string error;
+  };
+
+  Prefetch prefetch;
+  pthread_t prefetchThread;
+  bool prefetching;
+
+  void readBlock( size_t pos, size_t length, T *buffer ) const;
+  void startPrefetch();
+  void finishPrefetch();
+  static void *prefetchWorker( void *arg );
+
+  // the size of the words to byte swap in raw data
+  template<typename U> static size_t wordSize( const U * ) { return sizeof(U); }
+  template<typename U> static size_t wordSize( const std::complex<U> * ) { return sizeof(U); }
+
+  // not copyable
+  BlockIterator( const BlockIterator<T> & );
+  BlockIterator<T> &operator=( const BlockIterator<T> & );
+};
+
+}
+
+#include "BlockIterator.tcc"
+
+#endif
+
@@ -0,0 +1,19 @@
+// SWIG customisations for class BlockIterator
+
+// data() returns a raw pointer, which cannot be marshalled. Use getBlock() instead.
+%ignore dal::BlockIterator::data;
+
+%include hdf5/BlockIterator.h
+
+namespace dal {
+  %template(BlockIteratorShort)        BlockIterator<short>;
+  %template(BlockIteratorFloat)        BlockIterator<float>;
+  %template(BlockIteratorComplexFloat) BlockIterator< std::complex<float> >;
+}
+
+%pythoncode %{
+  # record the block iterator to use for the various datasets
+  DatasetShort._blockIterator = BlockIteratorShort
+  DatasetFloat._blockIterator = BlockIteratorFloat
+  DatasetComplexFloat._blockIterator = BlockIteratorComplexFloat
+%}
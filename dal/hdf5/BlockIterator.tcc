@@ -0,0 +1,194 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either 
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public 
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#include "RawData.h"
+
+namespace dal {
+
+template<typename T> BlockIterator<T>::BlockIterator( Dataset<T> &dataset, size_t blockLength, size_t pos )
+:
+  dataset(dataset),
+  _blockLength(blockLength),
+  _rowLength(1),
+  current(0),
+  _pos(pos),
+  _length(0),
+  nextPos(pos),
+  raw(false),
+  rawOffset(0),
+  rawBigEndian(false),
+  prefetching(false)
+{
+  if (blockLength == 0)
+    throw DALValueError("Cannot iterate over blocks of 0 samples of dataset " + dataset.name());
+
+  const std::vector<ssize_t> dims(dataset.dims());
+
+  if (dims.empty())
+    throw DALValueError("Cannot iterate over blocks of a scalar dataset " + dataset.name());
+
+  end = dims[0];
+
+  if (pos > end)
+    throw DALIndexError("Cannot iterate over blocks starting beyond the end of dataset " + dataset.name());
+
+  for (size_t i = 1; i < dims.size(); i++)
+    _rowLength *= dims[i];
+
+  try {
+    rawFilename  = dataset.externalDataFile();
+    rawOffset    = dataset.externalDataOffset();
+    rawBigEndian = dataset.endianness() == Dataset<T>::BIG;
+    raw = true;
+  } catch (DALValueError &) {
+    // data is stored inside the HDF5 file
+  }
+
+  const size_t bufferLength = std::min(blockLength, end - pos) * _rowLength;
+
+  buffers[0].resize(bufferLength);
+  buffers[1].resize(bufferLength);
+
+  startPrefetch();
+}
+
+template<typename T> BlockIterator<T>::~BlockIterator()
+{
+  if (prefetching)
+    pthread_join(prefetchThread, NULL);
+}
+
+template<typename T> bool BlockIterator<T>::next()
+{
+  if (nextPos >= end) {
+    _length = 0;
+    return false;
+  }
+
+  const size_t length = std::min(_blockLength, end - nextPos);
+
+  if (prefetching)
+    finishPrefetch();
+  else
+    readBlock(nextPos, length, &buffers[1 - current][0]);
+
+  current = 1 - current;
+  _pos = nextPos;
+  _length = length;
+  nextPos += length;
+
+  startPrefetch();
+
+  return true;
+}
+
+template<typename T> size_t BlockIterator<T>::pos() const
+{
+  return _pos;
+}
+
+template<typename T> size_t BlockIterator<T>::length() const
+{
+  return _length;
+}
+
+template<typename T> size_t BlockIterator<T>::rowLength() const
+{
+  return _rowLength;
+}
+
+template<typename T> size_t BlockIterator<T>::blockLength() const
+{
+  return _blockLength;
+}
+
+template<typename T> bool BlockIterator<T>::readAhead() const
+{
+  return raw;
+}
+
+template<typename T> const T *BlockIterator<T>::data() const
+{
+  return buffers[current].empty() ? NULL : &buffers[current][0];
+}
+
+template<typename T> void BlockIterator<T>::getBlock( T *outbuffer, size_t len ) const
+{
+  if (len != _length * _rowLength)
+    throw DALValueError("Cannot copy block if buffer size does not match block size of dataset " + dataset.name());
+
+  std::copy(data(), data() + len, outbuffer);
+}
+
+template<typename T> void BlockIterator<T>::readBlock( size_t pos, size_t length, T *buffer ) const
+{
+  if (raw) {
+    const size_t nrValues = length * _rowLength;
+
+    readRawData(rawFilename, rawOffset + pos * _rowLength * sizeof(T), buffer,
+                nrValues * sizeof(T) / wordSize(buffer), wordSize(buffer), rawBigEndian);
+  } else {
+    const std::vector<ssize_t> dims(dataset.dims());
+    std::vector<size_t> vpos(dims.size(), 0);
+    std::vector<size_t> vsize(dims.begin(), dims.end());
+
+    vpos[0] = pos;
+    vsize[0] = length;
+
+    dataset.getHyperslab(vpos, vsize, std::vector<size_t>(), std::vector<size_t>(), buffer, length * _rowLength);
+  }
+}
+
+template<typename T> void BlockIterator<T>::startPrefetch()
+{
+  // only raw data can be read without HDF5, and thus in the background
+  if (!raw || nextPos >= end)
+    return;
+
+  prefetch.iterator = this;
+  prefetch.pos      = nextPos;
+  prefetch.length   = std::min(_blockLength, end - nextPos);
+  prefetch.buffer   = &buffers[1 - current][0];
+  prefetch.error.clear();
+
+  // if we cannot start a thread, next() reads the block instead
+  prefetching = pthread_create(&prefetchThread, NULL, &prefetchWorker, &prefetch) == 0;
+}
+
+template<typename T> void BlockIterator<T>::finishPrefetch()
+{
+  pthread_join(prefetchThread, NULL);
+  prefetching = false;
+
+  if (!prefetch.error.empty())
+    throw DALException(prefetch.error);
+}
+
+template<typename T> void *BlockIterator<T>::prefetchWorker( void *arg )
+{
+  Prefetch &job = *static_cast<Prefetch *>(arg);
+
+  try {
+    job.iterator->readBlock(job.pos, job.length, job.buffer);
+  } catch (DALException &e) {
+    job.error = e.what();
+  }
+
+  return NULL;
+}
+
+}
+
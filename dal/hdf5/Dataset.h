@@ -34,9 +34,11 @@
 #endif
 
 #include <string>
+#include <algorithm>
 #include <vector>
 #include <hdf5.h>
 #include "types/h5typemap.h"
+#include "types/DatasetCreateOptions.h"
 #include "exceptions/exceptions.h"
 #include "Group.h"
 
@@ -47,6 +49,14 @@ namespace dal {
  *
  * Provides generic functionality for HDF5 Datasets.
  *
+ * A Dataset object caches its file dataspace, whose selection every read and write
+ * changes in place, as well as its extent and the memory dataspace of the last
+ * transfer. A Dataset object must therefore not be used by multiple threads at the
+ * same time, even if HDF5 is built thread-safe: give each thread its own Dataset object
+ * (they can refer to the same dataset; a copy starts with an empty cache) or serialise
+ * the calls. The Python bindings serialise all HDF5 calls, and TBB_DipoleReader does not
+ * call HDF5 from its workers.
+ *
  * Python example:
  * \code
  *    # Create a new HDF5 file called "example.h5"
@@ -84,6 +94,12 @@ namespace dal {
  *    >>> x
  *    array([[ 0.,  0.,  0.], [ 0.,  1.,  1.]], dtype=float32)
  *
+ *    # Read every 2nd column (a stride of 2 in the second dimension); HDF5 skips the other values
+ *    >>> z = numpy.zeros((2,2), dtype=d.dtype)
+ *    >>> d.get2D([0,0], z, 0, 1, [1,2])
+ *    >>> z
+ *    array([[ 0.,  0.], [ 0.,  1.]], dtype=float32)
+ *
  *    # Clean up
  *    >>> import os
  *    >>> os.remove("example.h5")
@@ -93,7 +109,22 @@ template<typename T> class Dataset: public Group {
 public:
   enum Endianness { NATIVE = 0, LITTLE, BIG };
 
-  Dataset( Group &parent, const std::string &name ): Group(parent, name) {}
+  Dataset( Group &parent, const std::string &name ): Group(parent, name), extentCached(false), extentResizeCount(0) {}
+
+  /*!
+   * Copies a Dataset object. The copy refers to the same dataset, but starts with
+   * an empty extent cache, so it can be used by another thread than `other'.
+   */
+  Dataset( const Dataset &other ): Group(other), extentCached(false), extentResizeCount(0) {}
+
+  /*!
+   * Makes this object refer to the dataset of `other', with an empty extent cache.
+   */
+  Dataset& operator=( const Dataset &other ) {
+    Group::operator=(other);
+    invalidateExtent();
+    return *this;
+  }
 
   /*!
    * Destruct a Dataset object.
@@ -108,25 +139,31 @@ public:
    * the user, or will be created upon the first write. Note that the filename cannot be changed
    * after the dataset has been created (HDF5 1.8), so providing an absolute path will make the
    * dataset difficult to copy or move across systems. We strongly advice against absolute paths (and "../") here!
-   * Note that HDF5 1.8 has a problem accessing external files outside the current working directory.
-   * DAL works around this, but see Known Issue 1 on how the current working directory affects this.
+   * External files are looked up relative to the directory of the HDF5 file. HDF5 1.8 looks them up relative
+   * to the current working directory instead. DAL works around this, but see Known Issue 1 on how the current
+   * working directory affects this. With HDF5 1.10+, DAL does not touch the current working directory.
    *
-   * If `filename' equals "", then dims == maxdims is required due to limitations of HDF5.
+   * If `filename' equals "", then dims == maxdims is required due to limitations of HDF5,
+   * unless chunked storage is selected through `options'.
    *
    * `endianness` toggles the byte order of each stored data value. Typically:
    *  - NATIVE: use the endianness of the current machine
    *  - LITTLE: use little-endian: x86, x86_64, ARM
    *  - BIG:    use big-endian:    MIPS, POWER/PowerPC, SPARC, IA-64
    * Retrieving data stored in a non-native byte order will be automatically converted by HDF5.
+   *
+   * `options` selects the storage layout (contiguous or chunked), compression filters, and the fill value
+   * policy. The default is contiguous storage without filters. Chunked storage cannot be combined with a `filename'.
    */
   Dataset<T>& create( const std::vector<ssize_t> &dims, const std::vector<ssize_t> &maxdims = std::vector<ssize_t>(0),
-                const std::string &filename = "", enum Endianness endianness = NATIVE );
+                const std::string &filename = "", enum Endianness endianness = NATIVE,
+                const DatasetCreateOptions &options = DatasetCreateOptions() );
 
   /*!
    * Create a new 1D dataset. See Dataset::create(...).
    */
   Dataset<T>& create1D( ssize_t len, ssize_t maxlen, const std::string &filename = "",
-                enum Endianness endianness = NATIVE );
+                enum Endianness endianness = NATIVE, const DatasetCreateOptions &options = DatasetCreateOptions() );
 
   /*!
    * Returns the rank of the dataset.
@@ -157,10 +194,10 @@ public:
 
   /*!
    * Changes the dimensionality of the dataset. Elements of -1 represent unbounded dimensions.
-   * If this dataset uses internal storage (i.e. externalFiles() is empty), dimensions
-   * cannot be unbounded due to limitations of HDF5.
+   * If this dataset uses internal contiguous storage (i.e. externalFiles() is empty and it was
+   * not created chunked), dimensions cannot be unbounded due to limitations of HDF5.
    *
-   * For now, resizing is only supported if external files are used.
+   * For now, resizing is only supported if external files or chunked storage are used.
    */
   void resize( const std::vector<ssize_t> &newdims );
 
@@ -174,6 +211,27 @@ public:
    */
   std::vector<std::string> externalFiles();
 
+  /*!
+   * Returns the path of the external file containing all data of this dataset, relative to the cwd
+   * (or absolute). Together with externalDataOffset(), ndims(), dims() and endianness(), this allows
+   * the data to be memory mapped directly, bypassing HDF5.
+   *
+   * Throws a DALValueError if the data is not stored in exactly one external file segment.
+   */
+  std::string externalDataFile();
+
+  /*!
+   * Returns the byte offset in externalDataFile() at which the data of this dataset starts.
+   *
+   * Throws a DALValueError if the data is not stored in exactly one external file segment.
+   */
+  size_t externalDataOffset();
+
+  /*!
+   * Returns the byte order in which the data is stored: LITTLE or BIG.
+   */
+  enum Endianness endianness();
+
   /*!
    * Retrieves any matrix of data of sizes `size` from position `pos`.
    * `buffer` must point to a memory block large enough to hold the result.
@@ -191,6 +249,52 @@ public:
    */
   void setMatrix( const std::vector<size_t> &pos, const T *buffer, const std::vector<size_t> &size );
 
+  /*!
+   * Retrieves a strided block of `size` values from position `pos`. In dimension `i`,
+   * `size[i] / block[i]` blocks of `block[i]` consecutive values are selected, with the
+   * starts of consecutive blocks `stride[i]` values apart. For example, a stride of 4 and
+   * a block of 1 reads every 4th value. The values are stored contiguously in `outbuffer`,
+   * which must hold exactly `len` values.
+   *
+   * An empty `block` vector selects blocks of 1 value, and an empty `stride` vector selects
+   * a stride equal to the block size (i.e. no values are skipped).
+   *
+   * The decimation is done by HDF5, so the values that are skipped are not transferred.
+   *
+   * Requires:
+   *    - pos.size() == size.size() == ndims()
+   *    - stride.size() == ndims() or stride.empty()
+   *    - block.size() == ndims() or block.empty()
+   *    - size[i] is a multiple of block[i]
+   *    - block[i] <= stride[i]
+   *    - len == size[0] * size[1] * ... * size[ndims()-1]
+   */
+  void getHyperslab( const std::vector<size_t> &pos, const std::vector<size_t> &size, const std::vector<size_t> &stride, const std::vector<size_t> &block, T *outbuffer, size_t len );
+
+  /*!
+   * Stores a strided block of data. See Dataset::getHyperslab().
+   */
+  void setHyperslab( const std::vector<size_t> &pos, const std::vector<size_t> &size, const std::vector<size_t> &stride, const std::vector<size_t> &block, const T *inbuffer, size_t len );
+
+  /*!
+   * Retrieves several regions of data with a single read. Region `r` is the block of
+   * `size[r * ndims() + i]` values in dimension `i`, starting at `pos[r * ndims() + i]`.
+   * For a 1D dataset, `pos` and `size` are thus lists of offsets and lengths.
+   *
+   * The regions are stored one after the other in `outbuffer`, each in row-major order,
+   * which must hold exactly `len` values (the total size of all regions).
+   *
+   * If each region ends before the next starts in the first dimension (for example, sorted
+   * non-overlapping windows of a 1D dataset), the regions are selected as a union of
+   * hyperslabs. Otherwise, every value is selected individually, which costs more memory
+   * and CPU but allows overlapping regions in any order.
+   *
+   * Requires:
+   *    - pos.size() == size.size() == nrRegions * ndims()
+   *    - len == sum over all regions of size[r * ndims()] * ... * size[r * ndims() + ndims()-1]
+   */
+  void getRegions( const std::vector<size_t> &pos, const std::vector<size_t> &size, T *outbuffer, size_t len );
+
   /*!
    * Retrieves `len` data values from a dataset starting at index `pos`.
    * `outbuffer` must point to a memory block large enough to hold `len` data values.
@@ -200,13 +304,19 @@ public:
    * \param[out] outbuffer        1D destination array
    * \param[in] len               number of data values to retrieve
    * \param[in] dimIndex          index of the dimension to query
+   * \param[in] stride            distance between the starts of consecutive blocks of values in the dataset
+   * \param[in] block             number of consecutive values per block
+   *
+   * With the default stride and block of 1, `len` consecutive values are transferred. For example, a stride of 4
+   * transfers every 4th value, and a stride of 8 with a block of 2 transfers values 0, 1, 8, 9, 16, 17, etc.
    *
    * Requires:
-   *    - pos + len <= dims()
+   *    - pos + (len / block - 1) * stride + block <= dims()
    *    - len <= size of outbuffer
    *    - dimIndex < ndims()
+   *    - len is a multiple of block
    */
-  void get1D( size_t pos, T *outbuffer, size_t len, unsigned dimIndex = 0 );
+  void get1D( size_t pos, T *outbuffer, size_t len, unsigned dimIndex = 0, size_t stride = 1, size_t block = 1 );
 
   /*!
    * Stores `len` data values from a dataset starting at index `pos`.
@@ -217,13 +327,19 @@ public:
    * \param[in] inbuffer          1D source array
    * \param[in] len               number of data values to store
    * \param[in] dimIndex          index of the dimension to query
+   * \param[in] stride            distance between the starts of consecutive blocks of values in the dataset
+   * \param[in] block             number of consecutive values per block
+   *
+   * With the default stride and block of 1, `len` consecutive values are transferred. For example, a stride of 4
+   * transfers every 4th value, and a stride of 8 with a block of 2 transfers values 0, 1, 8, 9, 16, 17, etc.
    *
    * Requires:
-   *    - pos + len <= dims()
+   *    - pos + (len / block - 1) * stride + block <= dims()
    *    - len <= size of inbuffer
    *    - dimIndex < ndims()
+   *    - len is a multiple of block
    */
-  void set1D( size_t pos, const T *inbuffer, size_t len, unsigned dimIndex = 0 );
+  void set1D( size_t pos, const T *inbuffer, size_t len, unsigned dimIndex = 0, size_t stride = 1, size_t block = 1 );
 
   /*!
    * Retrieves a 2D matrix of data from a 2D dataset from position `pos`.
@@ -235,13 +351,17 @@ public:
    * \param[in] dim2              size of second dimension of outbuffer2; determines the number of data values to retrieve
    * \param[in] dim1index         index of the first dimension to query
    * \param[in] dim2index         index of the second dimension to query
+   * \param[in] stride            distance between the starts of consecutive blocks, for each dimension of the dataset (default: no gaps)
+   * \param[in] block             number of consecutive values per block, for each dimension of the dataset (default: 1)
    *
    * Requires:
    *    - ndims() >= 2
    *    - pos.size() == ndims()
    *    - dim1index < dim2index < ndims()
+   *    - stride and block are empty or have ndims() elements each; see Dataset::getHyperslab()
    */
-  void get2D( const std::vector<size_t> &pos, T *outbuffer2, size_t dim1, size_t dim2, unsigned dim1index = 0, unsigned dim2index = 1 );
+  void get2D( const std::vector<size_t> &pos, T *outbuffer2, size_t dim1, size_t dim2, unsigned dim1index = 0, unsigned dim2index = 1,
+               const std::vector<size_t> &stride = std::vector<size_t>(), const std::vector<size_t> &block = std::vector<size_t>() );
 
   /*!
    * Stores a 2D matrix of data from a 2D dataset at position `pos`.
@@ -252,13 +372,17 @@ public:
    * \param[in] dim2              size of second dimension of inbuffer2; determines the number of data values to store
    * \param[in] dim1index         index of the first dimension to query
    * \param[in] dim2index         index of the second dimension to query
+   * \param[in] stride            distance between the starts of consecutive blocks, for each dimension of the dataset (default: no gaps)
+   * \param[in] block             number of consecutive values per block, for each dimension of the dataset (default: 1)
    *
    * Requires:
    *    - ndims() >= 2
    *    - pos.size() == ndims()
    *    - dim1index < dim2index < ndims()
+   *    - stride and block are empty or have ndims() elements each; see Dataset::getHyperslab()
    */
-  void set2D( const std::vector<size_t> &pos, const T *inbuffer2, size_t dim1, size_t dim2, unsigned dim1index = 0, unsigned dim2index = 1 );
+  void set2D( const std::vector<size_t> &pos, const T *inbuffer2, size_t dim1, size_t dim2, unsigned dim1index = 0, unsigned dim2index = 1,
+               const std::vector<size_t> &stride = std::vector<size_t>(), const std::vector<size_t> &block = std::vector<size_t>() );
 
   /*!
    * Retrieves a 3D matrix of data from a 3D dataset from position `pos`.
@@ -272,13 +396,17 @@ public:
    * \param[in] dim1index         index of the first dimension to query
    * \param[in] dim2index         index of the second dimension to query
    * \param[in] dim3index         index of the third dimension to query
+   * \param[in] stride            distance between the starts of consecutive blocks, for each dimension of the dataset (default: no gaps)
+   * \param[in] block             number of consecutive values per block, for each dimension of the dataset (default: 1)
    *
    * Requires:
    *    - ndims() >= 3
    *    - pos.size() == ndims()
    *    - dim1index < dim2index < dim3index < ndims()
+   *    - stride and block are empty or have ndims() elements each; see Dataset::getHyperslab()
    */
-  void get3D( const std::vector<size_t> &pos, T *outbuffer3, size_t dim1, size_t dim2, size_t dim3, unsigned dim1index = 0, unsigned dim2index = 1, unsigned dim3index = 2 );
+  void get3D( const std::vector<size_t> &pos, T *outbuffer3, size_t dim1, size_t dim2, size_t dim3, unsigned dim1index = 0, unsigned dim2index = 1, unsigned dim3index = 2,
+               const std::vector<size_t> &stride = std::vector<size_t>(), const std::vector<size_t> &block = std::vector<size_t>() );
 
   /*!
    * Stores a 3D matrix of data from a 3D dataset at position `pos`.
@@ -291,13 +419,17 @@ public:
    * \param[in] dim1index         index of the first dimension to query
    * \param[in] dim2index         index of the second dimension to query
    * \param[in] dim3index         index of the third dimension to query
+   * \param[in] stride            distance between the starts of consecutive blocks, for each dimension of the dataset (default: no gaps)
+   * \param[in] block             number of consecutive values per block, for each dimension of the dataset (default: 1)
    *
    * Requires:
    *    - ndims() >= 3
    *    - pos.size() == ndims()
    *    - dim1index < dim2index < dim3index < ndims()
+   *    - stride and block are empty or have ndims() elements each; see Dataset::getHyperslab()
    */
-  void set3D( const std::vector<size_t> &pos, const T *inbuffer3, size_t dim1, size_t dim2, size_t dim3, unsigned dim1index = 0, unsigned dim2index = 1, unsigned dim3index = 2 );
+  void set3D( const std::vector<size_t> &pos, const T *inbuffer3, size_t dim1, size_t dim2, size_t dim3, unsigned dim1index = 0, unsigned dim2index = 1, unsigned dim3index = 2,
+               const std::vector<size_t> &stride = std::vector<size_t>(), const std::vector<size_t> &block = std::vector<size_t>() );
 
   /*!
    * Retrieves a single value from the dataset at position `pos`.
@@ -332,8 +464,40 @@ protected:
    */
   bool bigEndian( enum Endianness endianness ) const;
 
-  //! If the strides vector is empty, a continuous array is assumed.
-  void matrixIO( const std::vector<size_t> &pos, T *buffer, const std::vector<size_t> &size, const std::vector<size_t> &strides, bool read );
+  /*!
+   * Retrieves the name (as stored) and byte offset of the single external file segment of this dataset.
+   * Throws a DALValueError if the data is not stored in exactly one external file segment.
+   */
+  std::string externalSegment( size_t &offset );
+
+  /*!
+   * Transfers the block of `size` values at `pos` between the dataset and `buffer`.
+   * `strides` is the distance between neighbouring elements in memory; if the strides vector is empty, a continuous array is assumed.
+   * `fileStride` and `fileBlock` select `size[i] / fileBlock[i]` blocks of `fileBlock[i]` values, `fileStride[i]` values apart, in the dataset.
+   * If both are empty, a continuous block is selected. See Dataset::getHyperslab().
+   */
+  void matrixIO( const std::vector<size_t> &pos, T *buffer, const std::vector<size_t> &size, const std::vector<size_t> &strides,
+                 const std::vector<size_t> &fileStride, const std::vector<size_t> &fileBlock, bool read );
+
+  /*!
+   * Reads or writes the values selected in `filespace` from or to those selected in `memspace`.
+   */
+  void transferData( hid_t memspace, hid_t filespace, T *buffer, bool read );
+
+  //! Returns the number of values in a block of `size` values.
+  size_t hyperslabLength( const std::vector<size_t> &size ) const;
+
+  /*!
+   * Loads the rank, dimensions and file dataspace of this dataset into the extent cache,
+   * unless they are already cached and no dataset in this file has been resized since.
+   */
+  void cacheExtent();
+
+  /*!
+   * Drops the cached extent and memory dataspace. Called when the dataset is (re)created,
+   * (re)opened or resized.
+   */
+  void invalidateExtent();
 
 
   /*!
@@ -347,6 +511,24 @@ protected:
 
 private:
   virtual void open( hid_t parent, const std::string &name );
+
+  /*
+   * Extent cache. Avoids H5Dget_space() calls and dataspace (re)creation on every access.
+   * The cache is revalidated against the per-file resize count, so a resize through another
+   * Dataset object referring to the same file is noticed as well.
+   *
+   * cachedDataspace is reselected by each transfer, which is why a Dataset object cannot
+   * be shared between threads (see the class description).
+   */
+  bool extentCached;
+  unsigned long extentResizeCount;
+  std::vector<hsize_t> cachedDims;
+  std::vector<hsize_t> cachedMaxdims;
+  hid_gc cachedDataspace;
+
+  //! Memory dataspace of the last matrixIO() call, reused if the next block has the same shape.
+  std::vector<hsize_t> cachedMemspaceDims;
+  hid_gc cachedMemspace;
 };
 
 }
@@ -11,16 +11,6 @@
 // Type marshalling
 // -------------------------------
 
-%{
-  #define SWIG_FILE_WITH_INIT
-%}
-
-%include "external/numpy.i"
-
-%init %{
-  import_array();
-%}
-
 %define DATASETTYPE( datatype, numpytype, indextype )
 
 // tell numpy which combinations of data types and index types we use
@@ -56,6 +46,7 @@ DATASETTYPE(std::complex<float>, NPY_CFLOAT, size_t);
 %ignore *::getMatrix;
 %ignore *::setMatrix;
 
+%include hdf5/types/DatasetCreateOptions.h
 %include hdf5/Dataset.h
 
 // -------------------------------
@@ -75,6 +66,308 @@ DATASETTYPE(std::complex<float>, NPY_CFLOAT, size_t);
     def __len__(self):
       import operator
       return reduce(operator.mul, self.dims())
+
+    def _hyperslab(self, key):
+      """
+        Translates a numpy index `key` (integers, slices with any step,
+        and an optional Ellipsis) into a hyperslab selection.
+
+        Returns (pos, size, step, flip, shape): the block to transfer
+        with getHyperslab()/setHyperslab(), the axes to reverse (negative
+        steps are read with a positive step), and the shape of the result
+        without the dimensions indexed by an integer.
+      """
+      import operator
+
+      dims = self.dims()
+      rank = len(dims)
+
+      if not isinstance(key, tuple):
+        key = (key,)
+
+      ellipses = [i for i, k in enumerate(key) if k is Ellipsis]
+      if len(ellipses) > 1:
+        raise IndexError("an index can only have a single Ellipsis ('...')")
+      if ellipses:
+        i = ellipses[0]
+        key = key[:i] + (slice(None),) * (rank - len(key) + 1) + key[i+1:]
+
+      if len(key) > rank:
+        raise IndexError("too many indices for dataset of rank %d" % (rank,))
+      key = key + (slice(None),) * (rank - len(key))
+
+      pos, size, step, flip, shape = [], [], [], [], []
+
+      for axis, (k, n) in enumerate(zip(key, dims)):
+        if isinstance(k, slice):
+          start, stop, stride = k.indices(n)
+
+          if stride > 0:
+            count = max(0, (stop - start + stride - 1) // stride)
+          else:
+            count = max(0, (start - stop - stride - 1) // -stride)
+
+            # select the same elements in ascending order, and reverse them afterwards
+            start += (count - 1) * stride
+            stride = -stride
+            flip.append(axis)
+
+          pos.append(start if count > 0 else 0)
+          size.append(count)
+          step.append(stride)
+          shape.append(count)
+        else:
+          try:
+            index = operator.index(k)
+          except TypeError:
+            raise IndexError("only integers, slices and Ellipsis ('...') are valid dataset indices")
+
+          if index < 0:
+            index += n
+          if not 0 <= index < n:
+            raise IndexError("index %d is out of bounds for axis %d with size %d" % (k, axis, n))
+
+          pos.append(index)
+          size.append(1)
+          step.append(1)
+
+      return pos, size, step, flip, tuple(shape)
+
+    def _flipped(self, data, flip):
+      """ Returns `data` with the axes in `flip` reversed. """
+      if not flip:
+        return data
+
+      return data[tuple(slice(None, None, -1) if axis in flip else slice(None) for axis in range(data.ndim))]
+
+    def __getitem__(self, key):
+      """
+        Reads a selection of the dataset into a new numpy array, using
+        numpy indexing: integers, slices (with steps) and Ellipsis. The
+        selection is read with a single strided hyperslab read.
+
+        Python example:
+
+             # Create a new HDF5 file with a 2D dataset
+             >>> f = File("example.h5", File.CREATE)
+             >>> d = DatasetFloat(f, "EXAMPLE_DATASET")
+             >>> d.create([4,5], [4,5])
+             <...>
+
+             # Write and read using numpy indexing
+             >>> import numpy
+             >>> d[:,:] = numpy.arange(20).reshape(4,5)
+             >>> d[1].tolist()
+             [5.0, 6.0, 7.0, 8.0, 9.0]
+             >>> d[::2, 1::3].tolist()
+             [[1.0, 4.0], [11.0, 14.0]]
+             >>> d[-1, ::-2].tolist()
+             [19.0, 17.0, 15.0]
+             >>> float(d[2, 3])
+             13.0
+             >>> numpy.asarray(d).shape
+             (4, 5)
+
+             # Clean up:
+             >>> import os
+             >>> os.remove("example.h5")
+      """
+      import numpy
+
+      pos, size, step, flip, shape = self._hyperslab(key)
+
+      data = numpy.empty(size, dtype=self.dtype)
+      self.getHyperslab(pos, size, step, [], data.reshape(-1))
+
+      # drop the integer-indexed dimensions; returns a scalar if all were
+      return self._flipped(data, flip).reshape(shape)[()]
+
+    def __setitem__(self, key, value):
+      """
+        Writes `value` to a selection of the dataset, using numpy indexing
+        like __getitem__(). `value` is broadcast to the selection.
+      """
+      import numpy
+
+      pos, size, step, flip, shape = self._hyperslab(key)
+
+      data = numpy.empty(size, dtype=self.dtype)
+      data.reshape(shape)[...] = value
+      data = numpy.ascontiguousarray(self._flipped(data, flip))
+
+      self.setHyperslab(pos, size, step, [], data.reshape(-1))
+
+    def __array__(self, dtype=None):
+      """
+        Returns the full dataset as a numpy array, so that numpy.array(d)
+        and numpy.asarray(d) (and any numpy function) accept datasets.
+      """
+      data = self[...]
+
+      if dtype is not None:
+        data = data.astype(dtype)
+
+      return data
+
+    def readRegions(self, regions):
+      """
+        Reads several regions of the dataset with a single HDF5 read (see
+        getRegions()), and returns them as a list of numpy arrays. Each region
+        is an (offset, length) pair for a 1D dataset, or a (pos, size) pair of
+        sequences of ndims() values. The arrays share one packed buffer.
+
+        Python example:
+
+             # Create a new HDF5 file with a 1D dataset
+             >>> f = File("example.h5", File.CREATE)
+             >>> d = DatasetFloat(f, "EXAMPLE_DATASET")
+             >>> d.create1D(100, 100)
+             <...>
+             >>> import numpy
+             >>> d.set1D(0, numpy.arange(100, dtype=d.dtype))
+
+             # Read windows around a few positions of interest
+             >>> [w.tolist() for w in d.readRegions([(10, 3), (50, 2), (97, 3)])]
+             [[10.0, 11.0, 12.0], [50.0, 51.0], [97.0, 98.0, 99.0]]
+
+             # Clean up:
+             >>> import os
+             >>> os.remove("example.h5")
+      """
+      import numpy
+      import operator
+
+      pos, size, shapes = [], [], []
+
+      for offset, length in regions:
+        try:
+          offset, length = list(offset), list(length)
+        except TypeError:
+          offset, length = [offset], [length]
+
+        pos.extend(offset)
+        size.extend(length)
+        shapes.append(tuple(length))
+
+      lengths = [reduce(operator.mul, shape, 1) for shape in shapes]
+
+      packed = numpy.empty((sum(lengths),), dtype=self.dtype)
+      self.getRegions(pos, size, packed)
+
+      result = []
+      start = 0
+      for shape, length in zip(shapes, lengths):
+        result.append(packed[start:start + length].reshape(shape))
+        start += length
+
+      return result
+
+    def blocks(self, blockLength, pos=0):
+      """
+        Iterates over consecutive blocks of `blockLength` samples (positions
+        in the first dimension) of the dataset, starting at sample `pos`.
+        Yields numpy arrays of shape (n,) + dims()[1:], with n == blockLength
+        except for the last block. See BlockIterator.
+
+        The next block is read ahead while the current one is processed.
+        All blocks are read into the same numpy array, so each block is
+        overwritten by the next one. Copy a block to keep it.
+
+        Python example:
+
+             # Create a new HDF5 file with a 2D dataset in an external file
+             >>> f = File("example.h5", File.CREATE)
+             >>> d = DatasetFloat(f, "EXAMPLE_DATASET")
+             >>> d.create([5,2], [5,2], "example.raw")
+             <...>
+             >>> import numpy
+             >>> d[:] = numpy.arange(10).reshape(5,2)
+
+             # Process the dataset in blocks of 2 samples
+             >>> [block.tolist() for block in d.blocks(2)]
+             [[[0.0, 1.0], [2.0, 3.0]], [[4.0, 5.0], [6.0, 7.0]], [[8.0, 9.0]]]
+             >>> [block.sum() for block in d.blocks(2)]
+             [6.0, 22.0, 17.0]
+
+             # Clean up:
+             >>> import os
+             >>> os.remove("example.h5")
+             >>> os.remove("example.raw")
+      """
+      import numpy
+
+      iterator = self._blockIterator(self, blockLength, pos)
+
+      dims = tuple(self.dims())
+      buffer = numpy.empty((min(blockLength, dims[0] - pos),) + dims[1:], dtype=self.dtype)
+
+      while iterator.next():
+        block = buffer[:iterator.length()]
+        iterator.getBlock(block.reshape(-1))
+        yield block
+
+    def appender(self, bufferLength=65536, growLength=0):
+      """
+        Returns a DatasetAppender that appends samples (positions in the
+        first dimension) to this dataset. append() takes a 1D numpy array
+        of whole samples; reshape multi-dimensional blocks with
+        reshape(-1). Call close() on the appender to trim the dataset
+        to the appended data. See DatasetAppender.
+      """
+      appender = self._datasetAppender(self, bufferLength, growLength)
+
+      # the appender refers to this dataset, so keep it alive
+      appender._dataset = self
+      return appender
+
+    def mmap(self, mode='r'):
+      """
+        Returns a numpy.memmap of the data of this dataset, mapped directly
+        from its external file instead of copied through HDF5. The data must
+        be stored in a single external file segment (see externalDataFile()).
+
+        The returned array has the dimensions and byte order of the dataset.
+        It is backed by the page cache, so it can be shared across processes
+        and accessed randomly without reading the whole file. Use mode='r+'
+        to write through the mapping (the HDF5 file must be writable).
+
+        Python example:
+
+             # Create a new HDF5 file with a dataset in an external file
+             >>> f = File("example.h5", File.CREATE)
+             >>> d = DatasetFloat(f, "EXAMPLE_DATASET")
+             >>> d.create([2,3], [2,3], "example.raw", DatasetFloat.BIG)
+             <...>
+             >>> import numpy
+             >>> d.set2D([0,0], numpy.arange(6, dtype=d.dtype).reshape(2,3))
+
+             # Map the data without copying it
+             >>> m = d.mmap()
+             >>> m.shape
+             (2, 3)
+             >>> m.dtype.byteorder
+             '>'
+             >>> m[1,2]
+             5.0
+
+             # Clean up:
+             >>> del m
+             >>> import os
+             >>> os.remove("example.h5")
+             >>> os.remove("example.raw")
+      """
+      import numpy
+
+      # endianness() reports the byte order stored in the file: LITTLE or BIG
+      if self.endianness() == self.BIG:
+        byteorder = '>'
+      else:
+        byteorder = '<'
+
+      dtype = numpy.dtype(self.dtype).newbyteorder(byteorder)
+
+      return numpy.memmap(self.externalDataFile(), dtype=dtype, mode=mode,
+                          offset=self.externalDataOffset(), shape=tuple(self.dims()), order='C')
   }    
 }
 
@@ -16,14 +16,45 @@
  */
 namespace dal {
 
+/*
+ * Returns a new dataset access property list. On HDF5 1.10+, it makes HDF5 look for
+ * external data files relative to the directory of the HDF5 file instead of the cwd.
+ */
+static inline hid_t h5datasetAccessPlist()
+{
+  const hid_t dapl = H5Pcreate(H5P_DATASET_ACCESS);
+
+#ifdef DAL_HDF5_EFILE_PREFIX
+  if (dapl > 0 && H5Pset_efile_prefix(dapl, "${ORIGIN}") < 0) {
+    H5Pclose(dapl);
+    return -1;
+  }
+#endif
+
+  return dapl;
+}
+
 template<typename T> Dataset<T>& Dataset<T>::create( const std::vector<ssize_t> &dims,
-        const std::vector<ssize_t> &maxdims, const std::string &filename, enum Endianness endianness ) {
+        const std::vector<ssize_t> &maxdims, const std::string &filename, enum Endianness endianness,
+        const DatasetCreateOptions &options ) {
 
   const size_t rank = dims.size();
 
   if (!maxdims.empty() && maxdims.size() != rank)
     throw DALValueError("Current and maximum dimensions vectors must have equal length to create dataset " + _name);
 
+  if (options.chunked() && options.chunkDims().size() != rank)
+    throw DALValueError("Chunk dimensions vector must have the same length as the dimensions vector to create dataset " + _name);
+
+  if (options.chunked() && filename != "")
+    throw DALValueError("Cannot use chunked storage in an external file to create dataset " + _name);
+
+  if (options.filtered() && !options.chunked())
+    throw DALValueError("Cannot use compression filters without chunked storage to create dataset " + _name);
+
+  if (options.deflate() > 9)
+    throw DALValueError("Deflate level must be in the range 0-9 to create dataset " + _name);
+
   // convert from ssize_t -> hsize_t
   std::vector<hsize_t> hdims(rank), hmaxdims(rank);
 
@@ -39,59 +70,77 @@ template<typename T> Dataset<T>& Dataset<T>::create( const std::vector<ssize_t>
 
   hid_gc_noref dcpl(H5Pcreate(H5P_DATASET_CREATE), H5Pclose, "Could not create dataset creation property list to create dataset " + _name);
 
-  // avoid HDF5 chunked storage: not faster for our dense data sets and riskier integrity-wise
-  H5Pset_layout(dcpl, H5D_CONTIGUOUS);
+  if (options.chunked()) {
+    std::vector<hsize_t> hchunkdims(rank);
+    const std::vector<ssize_t> chunkdims(options.chunkDims());
+
+    for (size_t i = 0; i < rank; i++) {
+      hchunkdims[i] = chunkdims[i];
+    }
+
+    if (H5Pset_chunk(dcpl, rank, &hchunkdims[0]) < 0)
+      throw HDF5Exception("Could not set chunk dimensions to create dataset " + _name);
+
+    // shuffle must precede deflate in the filter pipeline to be of use
+    if (options.shuffle() && H5Pset_shuffle(dcpl) < 0)
+      throw HDF5Exception("Could not add shuffle filter to create dataset " + _name);
+
+    if (options.deflate() > 0 && H5Pset_deflate(dcpl, options.deflate()) < 0)
+      throw HDF5Exception("Could not add deflate filter to create dataset " + _name);
+  } else {
+    // by default, avoid HDF5 chunked storage: not faster for our dense data sets and riskier integrity-wise
+    H5Pset_layout(dcpl, H5D_CONTIGUOUS);
+  }
+
+  H5D_fill_time_t filltime;
+  switch (options.fillPolicy()) {
+    case DatasetCreateOptions::FILL_ALLOC: filltime = H5D_FILL_TIME_ALLOC; break;
+    case DatasetCreateOptions::FILL_NEVER: filltime = H5D_FILL_TIME_NEVER; break;
+    default:                               filltime = H5D_FILL_TIME_IFSET; break;
+  }
+
+  if (H5Pset_fill_time(dcpl, filltime) < 0)
+    throw HDF5Exception("Could not set fill time to create dataset " + _name);
 
   if (filename != "") {
     if (H5Pset_external(dcpl, filename.c_str(), 0, H5F_UNLIMITED) < 0)
       throw HDF5Exception("Could not add external file to create dataset " + _name);
   }
 
+  hid_gc_noref dapl(h5datasetAccessPlist(), H5Pclose, "Could not create dataset access property list to create dataset " + _name);
+
   // create the dataset
   _group = hid_gc(H5Dcreate2(parent, _name.c_str(), h5typemap<T>::dataType(bigEndian(endianness)),
-                  filespace, H5P_DEFAULT, dcpl, H5P_DEFAULT), H5Dclose, "Could not create dataset " + _name);
-  initNodes();
+                  filespace, H5P_DEFAULT, dcpl, dapl), H5Dclose, "Could not create dataset " + _name);
+  invalidateExtent();
 
   return *this;
 }
 
 template<typename T> Dataset<T>& Dataset<T>::create1D( ssize_t len, ssize_t maxlen,
-        const std::string &filename, enum Endianness endianness ) {
+        const std::string &filename, enum Endianness endianness, const DatasetCreateOptions &options ) {
   std::vector<ssize_t> vdims(1, len);
   std::vector<ssize_t> vmaxdims(1, maxlen);
-  Dataset<T>::create(vdims, vmaxdims, filename, endianness);
+  Dataset<T>::create(vdims, vmaxdims, filename, endianness, options);
   return *this;
 }
 
 template<typename T> size_t Dataset<T>::ndims()
 {
-  // TODO: this routine is often used for bounds checks. However, caching
-  // ndims() might lead to concurrency issues. Maybe only cache if data
-  // is read-only or only allow access through this API?
-
-  hid_gc_noref dataspace(H5Dget_space(group()), H5Sclose, "Could not get dataspace to get number of dimenstions of dataset " + _name);
-
-  int rank = H5Sget_simple_extent_ndims(dataspace);
+  cacheExtent();
 
-  if (rank < 0)
-    throw HDF5Exception("Could not get number of dimensions of dataset " + _name);
-
-  return rank;
+  return cachedDims.size();
 }
 
 template<typename T> std::vector<ssize_t> Dataset<T>::dims()
 {
-  const size_t rank = ndims();
-  std::vector<hsize_t> dims(rank);
-  std::vector<ssize_t> result(rank);
-
-  hid_gc_noref dataspace(H5Dget_space(group()), H5Sclose, "Could not get dataspace to get number of dimensions of dataset " + _name);
+  cacheExtent();
 
-  if (H5Sget_simple_extent_dims(dataspace, &dims[0], NULL) < 0)
-    throw HDF5Exception("Could not get number of dimensions of dataset " + _name);
+  const size_t rank = cachedDims.size();
+  std::vector<ssize_t> result(rank);
 
   for (size_t i = 0; i < rank; i++) {
-    result[i] = dims[i];
+    result[i] = cachedDims[i];
   }
 
   return result;
@@ -104,17 +153,13 @@ template<typename T> ssize_t Dataset<T>::dims1D()
 
 template<typename T> std::vector<ssize_t> Dataset<T>::maxdims()
 {
-  const size_t rank = ndims();
-  std::vector<hsize_t> maxdims(rank);
-  std::vector<ssize_t> result(rank);
-
-  hid_gc_noref dataspace(H5Dget_space(group()), H5Sclose, "Could not get dataspace to get maximum dimensions of dataset " + _name);
+  cacheExtent();
 
-  if (H5Sget_simple_extent_dims(dataspace, NULL, &maxdims[0]) < 0)
-    throw HDF5Exception("Could not get maximum dimensions of dataset " + _name);
+  const size_t rank = cachedMaxdims.size();
+  std::vector<ssize_t> result(rank);
 
   for (size_t i = 0; i < rank; i++) {
-    result[i] = maxdims[i];
+    result[i] = cachedMaxdims[i];
   }
 
   return result;
@@ -137,6 +182,10 @@ template<typename T> void Dataset<T>::resize( const std::vector<ssize_t> &newdim
     newdims_hsize_t[i] = newdims[i];
   }
 
+  // invalidate all cached extents in this file, even if H5Dset_extent() fails half-way
+  invalidateExtent();
+  incFileResizeCount();
+
   if (H5Dset_extent(group(), &newdims_hsize_t[0]) < 0)
     throw HDF5Exception("Could not resize dataset " + _name);
 }
@@ -172,24 +221,226 @@ template<typename T> std::vector<std::string> Dataset<T>::externalFiles()
   return files;
 }
 
+template<typename T> std::string Dataset<T>::externalDataFile()
+{
+  size_t offset;
+  const std::string name(externalSegment(offset));
+
+  // external files are relative to the HDF5 file, not to the cwd
+  if (name[0] == '/')
+    return name;
+
+  const std::string dirname(FileInfo::getDirname(filename()));
+  if (dirname == ".")
+    return name;
+
+  return dirname + "/" + name;
+}
+
+template<typename T> size_t Dataset<T>::externalDataOffset()
+{
+  size_t offset;
+  (void)externalSegment(offset);
+
+  return offset;
+}
+
+template<typename T> typename Dataset<T>::Endianness Dataset<T>::endianness()
+{
+  hid_gc_noref datatype(H5Dget_type(group()), H5Tclose, "Could not get datatype to get byte order of dataset " + _name);
+
+  H5T_order_t order = H5Tget_order(datatype);
+
+  if (order == H5T_ORDER_LE)
+    return LITTLE;
+  else if (order == H5T_ORDER_BE)
+    return BIG;
+  else
+    throw HDF5Exception("Could not get byte order of dataset " + _name);
+}
+
+template<typename T> std::string Dataset<T>::externalSegment( size_t &offset )
+{
+  hid_gc_noref dcpl(H5Dget_create_plist(group()), H5Pclose, "Could not open dataset creation property list to get external file of dataset " + _name);
+
+  int numfiles = H5Pget_external_count(dcpl);
+
+  if (numfiles < 0)
+    throw HDF5Exception("Could not get number of external files for dataset " + _name);
+
+  if (numfiles != 1)
+    throw DALValueError("Data is not stored in a single external file segment for dataset " + _name);
+
+  char buf[1024];
+  off_t h5offset;
+  hsize_t h5size;
+
+  if (H5Pget_external(dcpl, 0, sizeof buf, buf, &h5offset, &h5size) < 0)
+    throw HDF5Exception("Could not get external file segment for dataset " + _name);
+
+  // null-terminate in case file name is >=1024 characters long
+  buf[sizeof buf - 1] = 0;
+
+  offset = h5offset;
+  return buf;
+}
+
 template<typename T> void Dataset<T>::getMatrix( const std::vector<size_t> &pos,
         T *buffer, const std::vector<size_t> &size )
 {
   const std::vector<size_t> strides(0);
+  const std::vector<size_t> fileStride(0), fileBlock(0);
 
-  matrixIO(pos, buffer, size, strides, true);
+  matrixIO(pos, buffer, size, strides, fileStride, fileBlock, true);
 }
 
 template<typename T> void Dataset<T>::setMatrix( const std::vector<size_t> &pos,
         const T *buffer, const std::vector<size_t> &size )
 {
   const std::vector<size_t> strides(0);
+  const std::vector<size_t> fileStride(0), fileBlock(0);
+
+  matrixIO(pos, const_cast<T *>(buffer), size, strides, fileStride, fileBlock, false);
+}
+
+template<typename T> void Dataset<T>::getHyperslab( const std::vector<size_t> &pos,
+        const std::vector<size_t> &size, const std::vector<size_t> &stride, const std::vector<size_t> &block, T *outbuffer, size_t len )
+{
+  const std::vector<size_t> strides(0);
+
+  if (len != hyperslabLength(size))
+    throw DALValueError("Cannot getHyperslab if buffer length does not match the block size for dataset " + _name);
+
+  if (len == 0)
+    return;
+
+  matrixIO(pos, outbuffer, size, strides, stride, block, true);
+}
+
+template<typename T> void Dataset<T>::setHyperslab( const std::vector<size_t> &pos,
+        const std::vector<size_t> &size, const std::vector<size_t> &stride, const std::vector<size_t> &block, const T *inbuffer, size_t len )
+{
+  const std::vector<size_t> strides(0);
+
+  if (len != hyperslabLength(size))
+    throw DALValueError("Cannot setHyperslab if buffer length does not match the block size for dataset " + _name);
+
+  if (len == 0)
+    return;
+
+  matrixIO(pos, const_cast<T *>(inbuffer), size, strides, stride, block, false);
+}
+
+template<typename T> void Dataset<T>::getRegions( const std::vector<size_t> &pos,
+        const std::vector<size_t> &size, T *outbuffer, size_t len )
+{
+  const size_t rank = ndims();
+
+  if (rank == 0 || pos.size() % rank != 0)
+    throw DALValueError("Cannot getRegions if the number of positions is not a multiple of the dimensionality of dataset " + _name);
+
+  if (size.size() != pos.size())
+    throw DALValueError("Cannot getRegions if the number of sizes does not match the number of positions for dataset " + _name);
+
+  const size_t nrRegions = pos.size() / rank;
+
+  // Regions that follow each other in the first dimension are read in the order
+  // given by a union of hyperslabs. Otherwise, we need a point selection to
+  // preserve the order (and duplicates) of the requested values.
+  size_t total = 0;
+  bool ordered = true;
+
+  for (size_t r = 0; r < nrRegions; r++) {
+    const std::vector<size_t> regionSize(size.begin() + r * rank, size.begin() + (r + 1) * rank);
+    total += hyperslabLength(regionSize);
+
+    if (r > 0 && pos[(r - 1) * rank] + size[(r - 1) * rank] > pos[r * rank])
+      ordered = false;
+  }
+
+  if (len != total)
+    throw DALValueError("Cannot getRegions if buffer length does not match the total size of the regions for dataset " + _name);
+
+  if (len == 0)
+    return;
+
+  // ndims() above has filled the extent cache
+  const hid_t dataspace = cachedDataspace;
+
+  if (ordered) {
+    H5S_seloper_t op = H5S_SELECT_SET;
+    std::vector<hsize_t> offset(rank), count(rank);
+
+    for (size_t r = 0; r < nrRegions; r++) {
+      bool empty = false;
+
+      for (size_t i = 0; i < rank; i++) {
+        offset[i] = pos[r * rank + i];
+        count[i]  = size[r * rank + i];
+        empty = empty || count[i] == 0;
+      }
+
+      if (empty)
+        continue;
+
+      if (H5Sselect_hyperslab(dataspace, op, &offset[0], NULL, &count[0], NULL) < 0)
+        throw HDF5Exception("Could not select hyperslab to perform getRegions on dataset " + _name);
+
+      op = H5S_SELECT_OR;
+    }
+  } else {
+    std::vector<hsize_t> coords(len * rank);
+    std::vector<size_t> index(rank);
+    size_t n = 0;
+
+    for (size_t r = 0; r < nrRegions; r++) {
+      const std::vector<size_t> regionSize(size.begin() + r * rank, size.begin() + (r + 1) * rank);
+
+      if (hyperslabLength(regionSize) == 0)
+        continue;
+
+      // enumerate the region in row-major order
+      std::fill(index.begin(), index.end(), 0);
+
+      for (;;) {
+        for (size_t i = 0; i < rank; i++)
+          coords[n * rank + i] = pos[r * rank + i] + index[i];
+        n++;
+
+        size_t i = rank;
+        while (i > 0 && ++index[i - 1] == regionSize[i - 1]) {
+          index[i - 1] = 0;
+          i--;
+        }
+
+        if (i == 0)
+          break;
+      }
+    }
+
+    if (H5Sselect_elements(dataspace, H5S_SELECT_SET, len, &coords[0]) < 0)
+      throw HDF5Exception("Could not select points to perform getRegions on dataset " + _name);
+  }
+
+  const hsize_t memdims = len;
+  hid_gc_noref memspace(H5Screate_simple(1, &memdims, NULL), H5Sclose, "Could not create simple dataspace to perform getRegions on dataset " + _name);
+
+  transferData(memspace, dataspace, outbuffer, true);
+}
+
+template<typename T> size_t Dataset<T>::hyperslabLength( const std::vector<size_t> &size ) const
+{
+  size_t len = 1;
 
-  matrixIO(pos, const_cast<T *>(buffer), size, strides, false);
+  for (size_t i = 0; i < size.size(); i++)
+    len *= size[i];
+
+  return len;
 }
 
 template<typename T> void Dataset<T>::get2D( const std::vector<size_t> &pos,
-        T *outbuffer2, size_t dim1, size_t dim2, unsigned dim1index, unsigned dim2index )
+        T *outbuffer2, size_t dim1, size_t dim2, unsigned dim1index, unsigned dim2index,
+        const std::vector<size_t> &stride, const std::vector<size_t> &block )
 {
   std::vector<size_t> size(ndims(), 1);
 
@@ -209,11 +460,12 @@ template<typename T> void Dataset<T>::get2D( const std::vector<size_t> &pos,
   size[dim1index] = dim1;
   size[dim2index] = dim2;
 
-  getMatrix(pos, outbuffer2, size);
+  getHyperslab(pos, size, stride, block, outbuffer2, hyperslabLength(size));
 }
 
 template<typename T> void Dataset<T>::set2D( const std::vector<size_t> &pos,
-        const T *inbuffer2, size_t dim1, size_t dim2, unsigned dim1index, unsigned dim2index )
+        const T *inbuffer2, size_t dim1, size_t dim2, unsigned dim1index, unsigned dim2index,
+        const std::vector<size_t> &stride, const std::vector<size_t> &block )
 {
   std::vector<size_t> size(ndims(), 1);
 
@@ -233,11 +485,12 @@ template<typename T> void Dataset<T>::set2D( const std::vector<size_t> &pos,
   size[dim1index] = dim1;
   size[dim2index] = dim2;
 
-  setMatrix(pos, inbuffer2, size);
+  setHyperslab(pos, size, stride, block, inbuffer2, hyperslabLength(size));
 }
 
 template<typename T> void Dataset<T>::get3D( const std::vector<size_t> &pos,
-        T *outbuffer3, size_t dim1, size_t dim2, size_t dim3, unsigned dim1index, unsigned dim2index, unsigned dim3index )
+        T *outbuffer3, size_t dim1, size_t dim2, size_t dim3, unsigned dim1index, unsigned dim2index, unsigned dim3index,
+        const std::vector<size_t> &stride, const std::vector<size_t> &block )
 {
   std::vector<size_t> size(ndims(), 1);
 
@@ -261,11 +514,12 @@ template<typename T> void Dataset<T>::get3D( const std::vector<size_t> &pos,
   size[dim2index] = dim2;
   size[dim3index] = dim3;
 
-  getMatrix(pos, outbuffer3, size);
+  getHyperslab(pos, size, stride, block, outbuffer3, hyperslabLength(size));
 }
 
 template<typename T> void Dataset<T>::set3D( const std::vector<size_t> &pos,
-        const T *inbuffer3, size_t dim1, size_t dim2, size_t dim3, unsigned dim1index, unsigned dim2index, unsigned dim3index )
+        const T *inbuffer3, size_t dim1, size_t dim2, size_t dim3, unsigned dim1index, unsigned dim2index, unsigned dim3index,
+        const std::vector<size_t> &stride, const std::vector<size_t> &block )
 {
   std::vector<size_t> size(ndims(), 1);
 
@@ -289,11 +543,11 @@ template<typename T> void Dataset<T>::set3D( const std::vector<size_t> &pos,
   size[dim2index] = dim2;
   size[dim3index] = dim3;
 
-  setMatrix(pos, inbuffer3, size);
+  setHyperslab(pos, size, stride, block, inbuffer3, hyperslabLength(size));
 }
 
 template<typename T> void Dataset<T>::get1D( size_t pos, T *outbuffer, size_t len,
-        unsigned dimIndex )
+        unsigned dimIndex, size_t stride, size_t block )
 {
   std::vector<size_t> size(ndims(), 1);
 
@@ -303,11 +557,15 @@ template<typename T> void Dataset<T>::get1D( size_t pos, T *outbuffer, size_t le
   size[dimIndex] = len;
   std::vector<size_t> vpos(1, pos);
 
-  getMatrix(vpos, outbuffer, size);
+  std::vector<size_t> vstride(size.size(), 1), vblock(size.size(), 1);
+  vstride[dimIndex] = stride;
+  vblock[dimIndex] = block;
+
+  getHyperslab(vpos, size, vstride, vblock, outbuffer, len);
 }
 
 template<typename T> void Dataset<T>::set1D( size_t pos, const T *inbuffer, size_t len,
-        unsigned dimIndex )
+        unsigned dimIndex, size_t stride, size_t block )
 {
   std::vector<size_t> size(ndims(), 1);
 
@@ -317,7 +575,11 @@ template<typename T> void Dataset<T>::set1D( size_t pos, const T *inbuffer, size
   size[dimIndex] = len;
   std::vector<size_t> vpos(1, pos);
 
-  setMatrix(vpos, inbuffer, size);
+  std::vector<size_t> vstride(size.size(), 1), vblock(size.size(), 1);
+  vstride[dimIndex] = stride;
+  vblock[dimIndex] = block;
+
+  setHyperslab(vpos, size, vstride, vblock, inbuffer, len);
 }
 
 template<typename T> T Dataset<T>::getScalar( const std::vector<size_t> &pos )
@@ -351,8 +613,51 @@ template<typename T> void Dataset<T>::setScalar1D( size_t pos, T value )
 }
 
 template<typename T> void Dataset<T>::open( hid_t parent, const std::string &name ) {
-  _group = hid_gc(H5Dopen2(parent, name.c_str(), H5P_DEFAULT), H5Dclose, "Could not open dataset " + _name);
-  initNodes();
+  hid_gc_noref dapl(h5datasetAccessPlist(), H5Pclose, "Could not create dataset access property list to open dataset " + _name);
+
+  _group = hid_gc(H5Dopen2(parent, name.c_str(), dapl), H5Dclose, "Could not open dataset " + _name);
+  invalidateExtent();
+}
+
+template<typename T> void Dataset<T>::cacheExtent()
+{
+  // The rank of a dataset cannot change, but its dimensions can, so also check whether any
+  // dataset in this file has been resized since we cached ours.
+  if (extentCached && extentResizeCount == fileResizeCount())
+    return;
+
+  // group() may (re)open the dataset and thus invalidate the cache, so call it first
+  const hid_t dataset = group();
+  const unsigned long resizeCount = fileResizeCount();
+
+  hid_gc dataspace(H5Dget_space(dataset), H5Sclose, "Could not get dataspace of dataset " + _name);
+
+  int rank = H5Sget_simple_extent_ndims(dataspace);
+
+  if (rank < 0)
+    throw HDF5Exception("Could not get number of dimensions of dataset " + _name);
+
+  std::vector<hsize_t> dims(rank), maxdims(rank);
+
+  if (rank > 0 && H5Sget_simple_extent_dims(dataspace, &dims[0], &maxdims[0]) < 0)
+    throw HDF5Exception("Could not get dimensions of dataset " + _name);
+
+  cachedDims.swap(dims);
+  cachedMaxdims.swap(maxdims);
+  cachedDataspace = dataspace;
+  extentResizeCount = resizeCount;
+  extentCached = true;
+}
+
+template<typename T> void Dataset<T>::invalidateExtent()
+{
+  extentCached = false;
+  cachedDims.clear();
+  cachedMaxdims.clear();
+  cachedDataspace = hid_gc();
+
+  cachedMemspaceDims.clear();
+  cachedMemspace = hid_gc();
 }
 
 template<typename T> bool Dataset<T>::bigEndian( enum Endianness endianness ) const
@@ -366,12 +671,14 @@ template<typename T> bool Dataset<T>::bigEndian( enum Endianness endianness ) co
 }
 
 template<typename T> void Dataset<T>::matrixIO( const std::vector<size_t> &pos,
-        T *buffer, const std::vector<size_t> &size, const std::vector<size_t> &strides, bool read )
+        T *buffer, const std::vector<size_t> &size, const std::vector<size_t> &strides,
+        const std::vector<size_t> &fileStride, const std::vector<size_t> &fileBlock, bool read )
 {
   const size_t rank = ndims();
   const bool use_strides = strides.size() == rank;
+  const bool use_fileStride = !fileStride.empty() || !fileBlock.empty();
 
-  std::vector<hsize_t> offset(rank), count(rank), stride(rank);
+  std::vector<hsize_t> offset(rank), count(rank), stride(rank), block(rank);
 
   if (pos.size() != rank)
     throw DALValueError("Cannot perform matrixIO if specified position does not match dimensionality of dataset " + _name);
@@ -379,15 +686,37 @@ template<typename T> void Dataset<T>::matrixIO( const std::vector<size_t> &pos,
   if (size.size() != rank)
     throw DALValueError("Cannot perform matrixIO if specified block size does not match dimensionality of dataset " + _name);
 
+  if (!fileStride.empty() && fileStride.size() != rank)
+    throw DALValueError("Cannot perform matrixIO if specified stride does not match dimensionality of dataset " + _name);
+
+  if (!fileBlock.empty() && fileBlock.size() != rank)
+    throw DALValueError("Cannot perform matrixIO if specified stride block size does not match dimensionality of dataset " + _name);
+
   for (size_t i = 0; i < rank; i++) {
+    block[i]  = fileBlock.empty()  ? 1 : fileBlock[i];
+    stride[i] = fileStride.empty() ? block[i] : fileStride[i];
+
+    if (stride[i] == 0 || block[i] == 0)
+      throw DALValueError("Cannot perform matrixIO with a stride or stride block size of 0 on dataset " + _name);
+
+    // size[i] values are transferred in size[i] / block[i] blocks of block[i] values each
+    if (size[i] % block[i] != 0)
+      throw DALValueError("Cannot perform matrixIO if specified block size is not a multiple of the stride block size for dataset " + _name);
+
     offset[i] = pos[i];
-    count[i]  = size[i];
+    count[i]  = size[i] / block[i];
   }
 
-  hid_gc_noref dataspace(H5Dget_space(group()), H5Sclose, "Could not retrieve dataspace " + _name);
+  // ndims() above has filled the extent cache
+  const hid_t dataspace = cachedDataspace;
 
-  if (H5Sselect_hyperslab(dataspace, H5S_SELECT_SET, &offset[0], NULL, &count[0], NULL) < 0)
-    throw HDF5Exception("Could not select hyperslab to perform matrixIO on dataset " + _name);
+  if (use_fileStride) {
+    if (H5Sselect_hyperslab(dataspace, H5S_SELECT_SET, &offset[0], &stride[0], &count[0], &block[0]) < 0)
+      throw HDF5Exception("Could not select strided hyperslab to perform matrixIO on dataset " + _name);
+  } else {
+    if (H5Sselect_hyperslab(dataspace, H5S_SELECT_SET, &offset[0], NULL, &count[0], NULL) < 0)
+      throw HDF5Exception("Could not select hyperslab to perform matrixIO on dataset " + _name);
+  }
 
   if (use_strides) {
     // HDF5 doesn't support strides directly (*), so we present it with a larger continuous array which matches
@@ -409,17 +738,35 @@ template<typename T> void Dataset<T>::matrixIO( const std::vector<size_t> &pos,
     }
   }
 
-  hid_gc_noref memspace(H5Screate_simple(rank, &count[0], NULL), H5Sclose, "Could not create simple dataspace to perform matrixIO on dataset " + _name);
+  // Reuse the memory dataspace if the previous block had the same shape (common when reading in blocks).
+  if (!cachedMemspace.isset() || cachedMemspaceDims != count) {
+    cachedMemspace = hid_gc(H5Screate_simple(rank, &count[0], NULL), H5Sclose, "Could not create simple dataspace to perform matrixIO on dataset " + _name);
+    cachedMemspaceDims = count;
+  }
 
+  const hid_t memspace = cachedMemspace;
+
+  bool partial = false;
   for (size_t i = 0; i < rank; i++) {
     offset[i] = 0;
+    partial = partial || count[i] != size[i];
     count[i]  = size[i];
   }
 
-  if (H5Sselect_hyperslab(memspace, H5S_SELECT_SET, &offset[0], NULL, &count[0], NULL) < 0)
-    throw HDF5Exception("Could not select hyperslab (2) to perform matrixIO on dataset " + _name);
+  if (partial) {
+    if (H5Sselect_hyperslab(memspace, H5S_SELECT_SET, &offset[0], NULL, &count[0], NULL) < 0)
+      throw HDF5Exception("Could not select hyperslab (2) to perform matrixIO on dataset " + _name);
+  } else {
+    if (H5Sselect_all(memspace) < 0)
+      throw HDF5Exception("Could not select memory dataspace to perform matrixIO on dataset " + _name);
+  }
 
+  transferData(memspace, dataspace, buffer, read);
+}
 
+template<typename T> void Dataset<T>::transferData( hid_t memspace, hid_t filespace, T *buffer, bool read )
+{
+#ifndef DAL_HDF5_EFILE_PREFIX
   /*
    * Work around HDF5 1.8 issue where external datasets are accessed relative to the cwd (instead of the HDF5 file).
    * Always (try to) restore the cwd in case the application depends on it. See known issue KI 1 for more detail.
@@ -445,14 +792,15 @@ template<typename T> void Dataset<T>::matrixIO( const std::vector<size_t> &pos,
     sc.cwd_fd = ::open(".", O_RDONLY);
     if (::fchdir(fdirfd) == -1) { /* tough luck */ }
   }
+#endif
 
   if (read) {
-    if (H5Dread(group(), h5typemap<T>::memoryType(), memspace, dataspace, H5P_DEFAULT, buffer) < 0)
-      throw HDF5Exception("Could not perform matrixIO to read data from dataset " + _name);
+    if (H5Dread(group(), h5typemap<T>::memoryType(), memspace, filespace, H5P_DEFAULT, buffer) < 0)
+      throw HDF5Exception("Could not read data from dataset " + _name);
   } else {
-    if (H5Dwrite(group(), h5typemap<T>::memoryType(), memspace, dataspace, H5P_DEFAULT, buffer) < 0)
-      throw HDF5Exception("Could not perform matrixIO to write data to dataset " + _name);
-  }    
+    if (H5Dwrite(group(), h5typemap<T>::memoryType(), memspace, filespace, H5P_DEFAULT, buffer) < 0)
+      throw HDF5Exception("Could not write data to dataset " + _name);
+  }
 }
 
 }
@@ -0,0 +1,163 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#ifndef DAL_DATASET_APPENDER_H
+#define DAL_DATASET_APPENDER_H
+
+#include <cstddef>
+#include <vector>
+#include <sys/types.h>
+#include "Dataset.h"
+
+namespace dal {
+
+/*!
+ * \class DatasetAppender
+ *
+ * Appends samples (positions in the first dimension) to the end of a dataset, for
+ * example frame by frame to a TBB_DipoleDataset (samples) or a BF_StokesDataset
+ * (samples x channels). This replaces a resize1D() and set1D() pair per append.
+ *
+ * The appender keeps track of the length of the data itself. Small appends are
+ * collected in a buffer of `bufferLength` samples, and written as one block. The
+ * dataset is grown ahead of the data: by doubling it if `growLength` is 0, or else
+ * in steps of `growLength` samples (e.g. the chunk length of a chunked dataset).
+ * close() writes the buffer, and trims the dataset to the appended data.
+ *
+ * The dataset must be resizable in its first dimension (see Dataset::resize()),
+ * and must outlive the appender. Other dimensions are fixed.
+ *
+ * C++ example:
+ * \code
+ *    DatasetAppender<short> appender(dipole);
+ *
+ *    while (receiveFrame(frame))
+ *      appender.append(frame.samples, frame.nrSamples);
+ *
+ *    appender.close();
+ * \endcode
+ *
+ * Python example:
+ * \code
+ *    # Create a new HDF5 file called "example.h5" with an empty, resizable dataset
+ *    >>> f = File("example.h5", File.CREATE)
+ *    >>> d = DatasetShort(f, "EXAMPLE_DATASET")
+ *    >>> d.create1D(0, -1, "example.raw")
+ *    <...>
+ *
+ *    # Append two blocks of samples
+ *    >>> import numpy
+ *    >>> a = d.appender()
+ *    >>> a.append(numpy.arange(3, dtype=d.dtype))
+ *    >>> a.append(numpy.arange(4, dtype=d.dtype))
+ *    >>> a.length()
+ *    7
+ *
+ *    # Write the buffer, and trim the dataset
+ *    >>> a.close()
+ *    >>> d.dims1D()
+ *    7
+ *    >>> d[:].tolist()
+ *    [0, 1, 2, 0, 1, 2, 3]
+ *
+ *    # Clean up
+ *    >>> import os
+ *    >>> os.remove("example.h5")
+ *    >>> os.remove("example.raw")
+ * \endcode
+ */
+template<typename T> class DatasetAppender {
+public:
+  /*!
+   * Create an appender that appends to the data in `dataset`, buffering up to `bufferLength`
+   * samples, and growing the dataset by doubling it (`growLength` == 0) or in steps of
+   * `growLength` samples.
+   *
+   * Requires:
+   *    - dataset.ndims() > 0
+   */
+  DatasetAppender( Dataset<T> &dataset, size_t bufferLength = 65536, size_t growLength = 0 );
+
+  //! Calls close(), but ignores any errors. Call close() to handle them.
+  virtual ~DatasetAppender();
+
+  /*!
+   * Appends `len` values: len / rowLength() samples of rowLength() values each, in row-major order.
+   * Throws a DALValueError if len is not a multiple of rowLength(), if the dataset cannot grow
+   * that far, or if the appender has been closed.
+   */
+  virtual void append( const T *inbuffer, size_t len );
+
+  /*!
+   * Writes the buffered samples to the dataset. The dataset may remain longer than length()
+   * until close().
+   */
+  virtual void flush();
+
+  /*!
+   * Writes the buffered samples, and trims the dataset to length() samples.
+   * Afterwards, append() is no longer allowed. Calling close() again does nothing.
+   */
+  void close();
+
+  //! Returns whether close() has been called.
+  bool closed() const;
+
+  //! Returns the number of samples in the dataset, including those appended but still buffered.
+  size_t length() const;
+
+  //! Returns the number of values per sample (the product of all dimensions except the first).
+  size_t rowLength() const;
+
+  //! Returns the number of samples that are buffered before they are written.
+  size_t bufferLength() const;
+
+  //! Returns the number of samples the dataset can hold before it is grown again.
+  size_t extent() const;
+
+protected:
+  Dataset<T> &dataset;
+
+private:
+  const size_t _bufferLength;
+  const size_t growLength;
+
+  std::vector<size_t> rowDims; // dims of a block of samples, except for the first
+  size_t _rowLength;
+  ssize_t maxLength; // -1 if unbounded
+
+  size_t written;  // samples written to the dataset
+  size_t _extent;  // samples the dataset can hold
+
+  std::vector<T> buffer;
+  size_t buffered; // samples in buffer
+
+  bool _closed;
+
+  void write( const T *data, size_t nrSamples );
+  void grow( size_t minLength );
+
+  // not copyable
+  DatasetAppender( const DatasetAppender<T> & );
+  DatasetAppender<T> &operator=( const DatasetAppender<T> & );
+};
+
+}
+
+#include "DatasetAppender.tcc"
+
+#endif
+
@@ -0,0 +1,16 @@
+// SWIG customisations for class DatasetAppender
+
+%include hdf5/DatasetAppender.h
+
+namespace dal {
+  %template(DatasetAppenderShort)        DatasetAppender<short>;
+  %template(DatasetAppenderFloat)        DatasetAppender<float>;
+  %template(DatasetAppenderComplexFloat) DatasetAppender< std::complex<float> >;
+}
+
+%pythoncode %{
+  # record the appender to use for the various datasets
+  DatasetShort._datasetAppender = DatasetAppenderShort
+  DatasetFloat._datasetAppender = DatasetAppenderFloat
+  DatasetComplexFloat._datasetAppender = DatasetAppenderComplexFloat
+%}
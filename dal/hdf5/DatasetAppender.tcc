@@ -0,0 +1,182 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+namespace dal {
+
+template<typename T> DatasetAppender<T>::DatasetAppender( Dataset<T> &dataset, size_t bufferLength, size_t growLength )
+:
+  dataset(dataset),
+  _bufferLength(bufferLength),
+  growLength(growLength),
+  _rowLength(1),
+  buffered(0),
+  _closed(false)
+{
+  const std::vector<ssize_t> dims(dataset.dims());
+
+  if (dims.empty())
+    throw DALValueError("Cannot append to a scalar dataset " + dataset.name());
+
+  rowDims.assign(dims.begin(), dims.end());
+
+  for (size_t i = 1; i < dims.size(); i++)
+    _rowLength *= dims[i];
+
+  maxLength = dataset.maxdims()[0];
+  written   = dims[0];
+  _extent   = dims[0];
+
+  buffer.resize(bufferLength * _rowLength);
+}
+
+template<typename T> DatasetAppender<T>::~DatasetAppender()
+{
+  try {
+    close();
+  } catch (DALException &) {
+    // cannot throw from a destructor
+  }
+}
+
+template<typename T> void DatasetAppender<T>::append( const T *inbuffer, size_t len )
+{
+  if (_closed)
+    throw DALValueError("Cannot append to closed appender of dataset " + dataset.name());
+
+  if (len % _rowLength != 0)
+    throw DALValueError("Cannot append partial samples to dataset " + dataset.name());
+
+  const size_t nrSamples = len / _rowLength;
+
+  if (maxLength >= 0 && length() + nrSamples > (size_t)maxLength)
+    throw DALValueError("Cannot append beyond the maximum length of dataset " + dataset.name());
+
+  if (buffered + nrSamples <= _bufferLength) {
+    // copy into the buffer
+    std::copy(inbuffer, inbuffer + len, buffer.begin() + buffered * _rowLength);
+    buffered += nrSamples;
+
+    if (buffered == _bufferLength)
+      flush();
+  } else {
+    // keep the data in order, and write large appends directly
+    flush();
+
+    if (nrSamples < _bufferLength) {
+      std::copy(inbuffer, inbuffer + len, buffer.begin());
+      buffered = nrSamples;
+    } else {
+      write(inbuffer, nrSamples);
+    }
+  }
+}
+
+template<typename T> void DatasetAppender<T>::flush()
+{
+  if (buffered == 0)
+    return;
+
+  write(&buffer[0], buffered);
+  buffered = 0;
+}
+
+template<typename T> void DatasetAppender<T>::close()
+{
+  if (_closed)
+    return;
+
+  flush();
+
+  if (_extent > written) {
+    std::vector<ssize_t> newdims(rowDims.begin(), rowDims.end());
+    newdims[0] = written;
+
+    dataset.resize(newdims);
+    _extent = written;
+  }
+
+  _closed = true;
+}
+
+template<typename T> bool DatasetAppender<T>::closed() const
+{
+  return _closed;
+}
+
+template<typename T> size_t DatasetAppender<T>::length() const
+{
+  return written + buffered;
+}
+
+template<typename T> size_t DatasetAppender<T>::rowLength() const
+{
+  return _rowLength;
+}
+
+template<typename T> size_t DatasetAppender<T>::bufferLength() const
+{
+  return _bufferLength;
+}
+
+template<typename T> size_t DatasetAppender<T>::extent() const
+{
+  return _extent;
+}
+
+template<typename T> void DatasetAppender<T>::write( const T *data, size_t nrSamples )
+{
+  if (nrSamples == 0)
+    return;
+
+  grow(written + nrSamples);
+
+  std::vector<size_t> pos(rowDims.size(), 0);
+  pos[0] = written;
+
+  std::vector<size_t> size(rowDims);
+  size[0] = nrSamples;
+
+  dataset.setMatrix(pos, data, size);
+  written += nrSamples;
+}
+
+template<typename T> void DatasetAppender<T>::grow( size_t minLength )
+{
+  if (minLength <= _extent)
+    return;
+
+  size_t newLength;
+
+  if (growLength == 0) {
+    // double the dataset, to grow it only O(log(length)) times
+    newLength = std::max(2 * _extent, minLength);
+  } else {
+    // round up to a multiple of growLength
+    newLength = (minLength + growLength - 1) / growLength * growLength;
+  }
+
+  if (maxLength >= 0 && newLength > (size_t)maxLength)
+    newLength = maxLength;
+
+  std::vector<ssize_t> newdims(rowDims.begin(), rowDims.end());
+  newdims[0] = newLength;
+
+  dataset.resize(newdims);
+  _extent = newLength;
+}
+
+}
+
@@ -16,6 +16,9 @@
  */
 #include "File.h"
 #include "Attribute.h"
+#include <algorithm>
+#include <cstdio>
+#include <stdint.h>
 
 using namespace std;
 
@@ -23,10 +26,10 @@ namespace dal {
 
 File::File() {}
 
-File::File( const std::string &filename, FileMode mode, const std::string &versionAttrName )
+File::File( const std::string &filename, FileMode mode, const std::string &versionAttrName, const FileAccessProfile &profile )
 :
   // Store the file hid as the group hid.
-  Group(openFile(filename, mode), FileInfo(filename, mode, versionAttrName))
+  Group(openFile(filename, mode, profile), FileInfo(filename, mode, versionAttrName))
 {
   if (!versionAttrName.empty()) {
     // To make specialized VersionType [gs]et() functions usable, access HDF5 version string attribute around it.
@@ -41,8 +44,6 @@ File::File( const std::string &filename, FileMode mode, const std::string &versi
       // Try to set in-memory version from HDF5 attribute.
       setFileInfoVersion(h5StoredVersionAttr.get());
     }
-
-    initFileNodes();
   }
 }
 
@@ -59,9 +60,9 @@ void swap(File& first, File& second)
   swap(static_cast<Group&>(first), static_cast<Group&>(second));
 }
 
-void File::open( const std::string &filename, FileMode mode, const std::string &versionAttrName )
+void File::open( const std::string &filename, FileMode mode, const std::string &versionAttrName, const FileAccessProfile &profile )
 {
-  File ftmp(filename, mode, versionAttrName);
+  File ftmp(filename, mode, versionAttrName, profile);
   swap(*this, ftmp);
 }
 
@@ -71,13 +72,96 @@ void File::close()
   swap(*this, ftmp);
 }
 
-hid_gc File::openFile( const std::string &filename, FileMode mode ) const
+/*
+ * Tunes file access property list `fapl` to open `filename` according to `profile`.
+ */
+static void setFileAccessProfile( hid_t fapl, const std::string &filename, const FileAccessProfile &profile )
+{
+  switch (profile.driver()) {
+    case FileAccessProfile::SEC2:
+      break; // HDF5 default
+
+    case FileAccessProfile::STDIO:
+      if (H5Pset_fapl_stdio(fapl) < 0)
+        throw HDF5Exception("Could not select stdio driver to open file " + filename);
+      break;
+
+    case FileAccessProfile::CORE: {
+      const size_t increment = profile.coreIncrement() > 0 ? profile.coreIncrement() : 1024 * 1024;
+
+      if (H5Pset_fapl_core(fapl, increment, profile.coreBackingStore()) < 0)
+        throw HDF5Exception("Could not select core driver to open file " + filename);
+      break;
+    }
+
+    default:
+      throw DALValueError("Could not open file: unknown file driver for file " + filename);
+  }
+
+  if (!profile.fileImage().empty()) {
+    if (profile.driver() != FileAccessProfile::CORE)
+      throw DALValueError("Could not open file image: requires the core driver; file " + filename);
+
+    // HDF5 copies the image, so it does not have to outlive the file
+    const string &image = profile.fileImage();
+    if (H5Pset_file_image(fapl, const_cast<char *>(image.data()), image.size()) < 0)
+      throw HDF5Exception("Could not set file image to open file " + filename);
+  }
+
+  if (profile.alignment() > 0 && H5Pset_alignment(fapl, profile.alignmentThreshold(), profile.alignment()) < 0)
+    throw HDF5Exception("Could not set alignment to open file " + filename);
+
+  if (profile.metadataBlockSize() > 0 && H5Pset_meta_block_size(fapl, profile.metadataBlockSize()) < 0)
+    throw HDF5Exception("Could not set metadata block size to open file " + filename);
+
+  if (profile.sieveBufferSize() > 0 && H5Pset_sieve_buf_size(fapl, profile.sieveBufferSize()) < 0)
+    throw HDF5Exception("Could not set sieve buffer size to open file " + filename);
+
+  if (profile.metadataCacheSize() > 0) {
+    H5AC_cache_config_t config;
+    config.version = H5AC__CURR_CACHE_CONFIG_VERSION;
+
+    if (H5Pget_mdc_config(fapl, &config) < 0)
+      throw HDF5Exception("Could not get metadata cache configuration to open file " + filename);
+
+    config.set_initial_size = true;
+    config.initial_size = profile.metadataCacheSize();
+    if (config.max_size < config.initial_size)
+      config.max_size = config.initial_size;
+    if (config.min_size > config.initial_size)
+      config.min_size = config.initial_size;
+
+    if (H5Pset_mdc_config(fapl, &config) < 0)
+      throw HDF5Exception("Could not set metadata cache size to open file " + filename);
+  }
+
+  if (profile.chunkCacheSize() > 0) {
+    int mdcElements;
+    size_t slots, size;
+    double preemption;
+
+    if (H5Pget_cache(fapl, &mdcElements, &slots, &size, &preemption) < 0)
+      throw HDF5Exception("Could not get chunk cache configuration to open file " + filename);
+
+    if (profile.chunkCacheSlots() > 0)
+      slots = profile.chunkCacheSlots();
+
+    if (H5Pset_cache(fapl, mdcElements, slots, profile.chunkCacheSize(), profile.chunkCachePreemption()) < 0)
+      throw HDF5Exception("Could not set chunk cache size to open file " + filename);
+  }
+}
+
+hid_gc File::openFile( const std::string &filename, FileMode mode, const FileAccessProfile &profile ) const
 {
+  hid_gc_noref fapl(H5Pcreate(H5P_FILE_ACCESS), H5Pclose, "Could not create file access property list to open file " + filename);
+  setFileAccessProfile(fapl, filename, profile);
+
   switch (mode) {
     case CREATE:
     case CREATE_EXCL:
       {
-        hid_gc_noref fapl(H5Pcreate(H5P_FILE_ACCESS), H5Pclose, "Could not create file access property list to create file " + filename);
+        if (!profile.fileImage().empty())
+          throw DALValueError("Could not create file from a file image; open it with READ or READWRITE instead; file " + filename);
 
         /*
          * We want to use 1.8 features, but always be able to read back any created file.
@@ -102,10 +186,10 @@ hid_gc File::openFile( const std::string &filename, FileMode mode ) const
       }  
 
     case READ:  
-      return hid_gc(H5Fopen(filename.c_str(), H5F_ACC_RDONLY, H5P_DEFAULT), H5Fclose, "Could not open file for read-only access; file " + filename);
+      return hid_gc(H5Fopen(filename.c_str(), H5F_ACC_RDONLY, fapl), H5Fclose, "Could not open file for read-only access; file " + filename);
 
     case READWRITE:  
-      return hid_gc(H5Fopen(filename.c_str(), H5F_ACC_RDWR, H5P_DEFAULT), H5Fclose, "Could not open file for read-write access; file " + filename);
+      return hid_gc(H5Fopen(filename.c_str(), H5F_ACC_RDWR, fapl), H5Fclose, "Could not open file for read-write access; file " + filename);
 
     default:
       throw DALValueError("Could not open file: unknown mode argument");
@@ -117,19 +201,176 @@ void File::flush()
   H5Fflush(group(), H5F_SCOPE_GLOBAL);
 }
 
+/*
+ * Returns the Jenkins lookup3 hash of `data`, as HDF5 uses to checksum metadata.
+ */
+static uint32_t metadataChecksum( const unsigned char *data, size_t length )
+{
+#define ROT(x, k) (((x) << (k)) | ((x) >> (32 - (k))))
+
+  uint32_t a, b, c;
+  a = b = c = 0xdeadbeef + (uint32_t)length;
+
+  for (; length > 12; length -= 12, data += 12) {
+    a += data[0] + ((uint32_t)data[1] << 8) + ((uint32_t)data[2]  << 16) + ((uint32_t)data[3]  << 24);
+    b += data[4] + ((uint32_t)data[5] << 8) + ((uint32_t)data[6]  << 16) + ((uint32_t)data[7]  << 24);
+    c += data[8] + ((uint32_t)data[9] << 8) + ((uint32_t)data[10] << 16) + ((uint32_t)data[11] << 24);
+
+    a -= c; a ^= ROT(c,  4); c += b;
+    b -= a; b ^= ROT(a,  6); a += c;
+    c -= b; c ^= ROT(b,  8); b += a;
+    a -= c; a ^= ROT(c, 16); c += b;
+    b -= a; b ^= ROT(a, 19); a += c;
+    c -= b; c ^= ROT(b,  4); b += a;
+  }
+
+  // the last 1 to 12 bytes
+  switch (length) {
+    case 12: c += (uint32_t)data[11] << 24;
+    case 11: c += (uint32_t)data[10] << 16;
+    case 10: c += (uint32_t)data[9]  << 8;
+    case 9:  c += data[8];
+    case 8:  b += (uint32_t)data[7]  << 24;
+    case 7:  b += (uint32_t)data[6]  << 16;
+    case 6:  b += (uint32_t)data[5]  << 8;
+    case 5:  b += data[4];
+    case 4:  a += (uint32_t)data[3]  << 24;
+    case 3:  a += (uint32_t)data[2]  << 16;
+    case 2:  a += (uint32_t)data[1]  << 8;
+    case 1:  a += data[0];
+             break;
+    case 0:  return c;
+  }
+
+  c ^= b; c -= ROT(b, 14);
+  a ^= c; a -= ROT(c, 11);
+  b ^= a; b -= ROT(a, 25);
+  c ^= b; c -= ROT(b, 16);
+  a ^= c; a -= ROT(c,  4);
+  b ^= a; b -= ROT(a, 14);
+  c ^= b; c -= ROT(b, 24);
+
+#undef ROT
+
+  return c;
+}
+
+/*
+ * H5Fget_file_image() (at least up to HDF5 1.10) clears the file status flags in the
+ * superblock of the image of an open file, but leaves its checksum, so HDF5 cannot open
+ * the image. Recompute the checksum of a version 2+ superblock in `image`.
+ */
+static void fixSuperblockChecksum( std::string &image )
+{
+  static const char signature[] = "\x89HDF\r\n\x1a\n";
+  const size_t signatureSize = sizeof signature - 1;
+
+  // the superblock is at 0, or at 512, 1024, 2048, ... after a user block
+  for (size_t offset = 0; offset + signatureSize < image.size(); offset = offset == 0 ? 512 : 2 * offset) {
+    if (image.compare(offset, signatureSize, signature, signatureSize) != 0)
+      continue;
+
+    unsigned char *superblock = reinterpret_cast<unsigned char *>(&image[offset]);
+    const unsigned version = superblock[8];
+    if (version < 2)
+      return; // no checksum
+
+    // signature, version, size of offsets, size of lengths, flags, 4 addresses
+    const size_t size = signatureSize + 4 + 4 * superblock[9];
+    if (offset + size + 4 > image.size())
+      return;
+
+    const uint32_t checksum = metadataChecksum(superblock, size);
+    for (size_t i = 0; i < 4; i++)
+      superblock[size + i] = (checksum >> (8 * i)) & 0xff; // little endian
+
+    return;
+  }
+}
+
+string File::fileImage()
+{
+  // Without an explicit flush, H5Fget_file_image() can return an incomplete image.
+  if (H5Fflush(group(), H5F_SCOPE_GLOBAL) < 0)
+    throw HDF5Exception("Could not flush file to get file image of file " + filename());
+
+  const ssize_t size = H5Fget_file_image(group(), NULL, 0);
+  if (size < 0)
+    throw HDF5Exception("Could not get file image size of file " + filename());
+
+  string image(size, '\0');
+  if (size > 0 && H5Fget_file_image(group(), &image[0], image.size()) < 0)
+    throw HDF5Exception("Could not get file image of file " + filename());
+
+  fixSuperblockChecksum(image);
+
+  return image;
+}
+
+void File::writeImage( const std::string &imageFilename )
+{
+  const string image(fileImage());
+
+  FILE *f = fopen(imageFilename.c_str(), "wb");
+  if (f == NULL)
+    throw DALException("Could not open " + imageFilename + " to write file image of file " + filename());
+
+  const bool written = fwrite(image.data(), 1, image.size(), f) == image.size();
+  if (fclose(f) != 0 || !written)
+    throw DALException("Could not write file image to " + imageFilename + " of file " + filename());
+}
+
 bool File::exists() const
 {
   return true;
 }
 
+void File::setAttributeCaching( bool enable )
+{
+  fileAttributeCache().setEnabled(enable);
+}
+
+bool File::attributeCaching() const
+{
+  return fileAttributeCache().enabled();
+}
+
+unsigned long File::attributeCacheHits() const
+{
+  return fileAttributeCache().hits();
+}
+
+unsigned long File::attributeCacheMisses() const
+{
+  return fileAttributeCache().misses();
+}
+
 Attribute<VersionType> File::version()
 {
   return getNode(versionAttrName());
 }
 
-void File::initFileNodes()
+vector<string> File::nodeNames()
+{
+  vector<string> names(Group::nodeNames());
+
+  if (!versionAttrName().empty()) {
+    // keep the names sorted, like the other names
+    vector<string>::iterator pos = lower_bound(names.begin(), names.end(), versionAttrName());
+
+    if (pos == names.end() || *pos != versionAttrName())
+      names.insert(pos, versionAttrName());
+  }
+
+  return names;
+}
+
+Node *File::newNode( const std::string &name )
 {
-  addNode( new Attribute<VersionType>(*this, versionAttrName()) );
+  if (!versionAttrName().empty() && name == versionAttrName())
+    return new Attribute<VersionType>(*this, name);
+
+  return Group::newNode(name);
 }
 
 void File::open( hid_t parent, const std::string &name )
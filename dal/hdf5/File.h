@@ -20,6 +20,7 @@
 #include <string>
 #include <hdf5.h>
 #include "types/versiontype.h"
+#include "types/FileAccessProfile.h"
 #include "Group.h"
 #include "Attribute.h"
 
@@ -52,6 +53,7 @@ public:
    * Try to open or create `filename` with open mode `mode` and treat `versionAttrName` as the version attribute name.
    * For an existing file, the specified version attribute must exist. For a new file, it will be created.
    * The default value skips Node tracking (except Group's GROUPTYPE) and versioning.
+   * HDF5 accesses the file as tuned by `profile` (see FileAccessProfile).
    *
    * See the class description for more info on reopening and closing files.
    *
@@ -70,7 +72,8 @@ public:
    *    >>> os.remove("example.h5")
    * \endcode
    */
-  File( const std::string &filename, FileMode mode = READ, const std::string &versionAttrName = "");
+  File( const std::string &filename, FileMode mode = READ, const std::string &versionAttrName = "",
+        const FileAccessProfile &profile = FileAccessProfile() );
 
   /*!
    * Destruct File object.
@@ -95,10 +98,11 @@ public:
    * Upon return, the previously opened file reference (if any) has been closed.
    * If an exception is thrown, the previously opened file reference (if any) is unaltered.
    *
-   * See the File(filename, mode, versionAttrName) constructor for more info.
+   * See the File(filename, mode, versionAttrName, profile) constructor for more info.
    * See the class description for more info on reopening and closing files.
    */
-  void open( const std::string &filename, FileMode mode = READ, const std::string &versionAttrName = "");
+  void open( const std::string &filename, FileMode mode = READ, const std::string &versionAttrName = "",
+             const FileAccessProfile &profile = FileAccessProfile() );
 
   /*!
    * Indicate that this File object will not be used anymore to access the underlying HDF5 file (if any),
@@ -113,11 +117,106 @@ public:
    */
   void flush();
 
+  /*!
+   * Returns the current contents of the file as bytes (H5Fget_file_image()), after flushing it.
+   * Mostly useful for files kept in memory with the CORE driver, see FileAccessProfile.
+   * The image can be written to disk with writeImage(), or opened again through
+   * FileAccessProfile::setFileImage().
+   *
+   * Python example:
+   * \code
+   *    # Create a new HDF5 file in memory only
+   *    >>> f = File("example.h5", File.CREATE, "", FileAccessProfile("in-memory"))
+   *    >>> a = AttributeString(f, "EXAMPLE_STRING")
+   *    >>> a.value = "hello world!"
+   *
+   *    # Take its contents, and throw away the file
+   *    >>> image = f.fileImage()
+   *    >>> del a, f
+   *    >>> import os
+   *    >>> os.path.exists("example.h5")
+   *    False
+   *
+   *    # Open the image again
+   *    >>> profile = FileAccessProfile("in-memory")
+   *    >>> profile.setFileImage(image)
+   *    >>> f = File("example.h5", File.READ, "", profile)
+   *    >>> AttributeString(f, "EXAMPLE_STRING").value
+   *    'hello world!'
+   *
+   *    # Store the image as a normal file
+   *    >>> f.writeImage("example.h5")
+   *    >>> del f
+   *    >>> f = File("example.h5", File.READ)
+   *    >>> AttributeString(f, "EXAMPLE_STRING").value
+   *    'hello world!'
+   *
+   *    # Clean up
+   *    >>> os.remove("example.h5")
+   * \endcode
+   */
+  std::string fileImage();
+
+  /*!
+   * Writes the current contents of the file (see fileImage()) to `filename` on disk,
+   * replacing any existing file. The file remains open as it was.
+   */
+  void writeImage( const std::string &filename );
+
   /*!
    * Returns whether this file exists (i.e. true).
    */
   virtual bool exists() const;
 
+  /*!
+   * Enables or disables caching of attribute values read from this file. With caching,
+   * Attribute<T>::get() reads each attribute from HDF5 only once, even through different
+   * Attribute objects. Disabled by default. Disabling the cache also clears it.
+   *
+   * Cached values remain valid in READ mode. In other modes, set(), create() and remove()
+   * on attributes, and remove() and set() on groups and datasets invalidate the affected
+   * values. Changes made through other open File objects or processes are not detected.
+   *
+   * The cache belongs to this open file, and is shared with all objects in it.
+   * Reopening the file starts with a new, disabled cache.
+   *
+   * Python example:
+   * \code
+   *    # Create a new HDF5 file with some attribute
+   *    >>> f = File("example.h5", File.CREATE)
+   *    >>> a = AttributeString(f, "EXAMPLE_STRING")
+   *    >>> a.value = "hello world!"
+   *
+   *    # The first read is a miss, further reads are hits
+   *    >>> f.setAttributeCaching(True)
+   *    >>> a.get(), a.get()
+   *    ('hello world!', 'hello world!')
+   *    >>> f.attributeCacheHits(), f.attributeCacheMisses()
+   *    (1, 1)
+   *
+   *    # Writing invalidates the cached value
+   *    >>> a.value = "goodbye"
+   *    >>> a.get()
+   *    'goodbye'
+   *    >>> f.attributeCacheHits(), f.attributeCacheMisses()
+   *    (1, 2)
+   *
+   *    # Clean up
+   *    >>> import os
+   *    >>> os.remove("example.h5")
+   * \endcode
+   */
+  void setAttributeCaching( bool enable );
+
+  //! Returns whether attribute values are cached. See setAttributeCaching().
+  bool attributeCaching() const;
+
+  //! Returns the number of attribute reads answered from the cache. See setAttributeCaching().
+  unsigned long attributeCacheHits() const;
+
+  //! Returns the number of attribute reads that were not in the cache. See setAttributeCaching().
+  unsigned long attributeCacheMisses() const;
+
   /*!
    * Returns the version attribute using the `versionAttrName` passed when the file was opened or created.
    *
@@ -159,11 +258,20 @@ public:
    */
   Attribute<VersionType> version();
 
+  /*!
+   * Returns a list of the HDF5 names of all nodes registered
+   * in this class, including the version attribute (if any).
+   */
+  virtual std::vector<std::string> nodeNames();
+
+protected:
+  //! Also creates the version attribute, whose name is given when the file is opened.
+  virtual Node *newNode( const std::string &name );
+
 private:
   virtual void open( hid_t parent, const std::string &name );
 
-  hid_gc openFile( const std::string &filename, FileMode mode ) const;
-  void initFileNodes();
+  hid_gc openFile( const std::string &filename, FileMode mode, const FileAccessProfile &profile ) const;
 };
 
 }
@@ -15,12 +15,16 @@
  * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
  */
 #include "Group.h"
+#include <cstring>
+#include <set>
 
 using namespace std;
 
 namespace dal {
 
 Group::Group()
+:
+  memberCacheValid(false)
 {
 }
 
@@ -28,15 +32,16 @@ Group::Group( const Group &other )
 :
   Node(other.parent, other._name, other.fileInfo),
   _group(other._group),
-  nodeMap(other.nodeMap)
+  // nodeMap and memberCache are not copied: the copy fills its own on use
+  memberCacheValid(false)
 {
 }
 
 Group::Group( Group &parent, const std::string &name )
 :
-  Node(parent, name)
+  Node(parent, name),
   // _group is set once this Group obj is opened, which cannot be done now, because it may not exist
-  // nodeMap is set when opened: for files on obj construction, and for other groups on use (i.e. on group())
+  memberCacheValid(false)
 {
 }
 
@@ -44,7 +49,8 @@ Group::Group( Group &parent, const std::string &name )
 Group::Group( const hid_gc &fileId, FileInfo fileInfo )
 :
   Node(fileId, "/", fileInfo),
-  _group(fileId)
+  _group(fileId),
+  memberCacheValid(false)
 {
 }
 
@@ -63,6 +69,8 @@ void swap(Group& first, Group& second)
   swap(static_cast<Node&>(first), static_cast<Node&>(second));
   swap(first._group, second._group);
   swap(first.nodeMap, second.nodeMap);
+  std::swap(first.memberCache, second.memberCache);
+  std::swap(first.memberCacheValid, second.memberCacheValid);
 }
 
 /*
@@ -73,7 +81,6 @@ Group& Group::create() {
   hid_gc_noref gcpl(H5Pcreate(H5P_GROUP_CREATE), H5Pclose, "Could not create group creation property list to create group " + _name);
 
   _group = hid_gc(H5Gcreate2(parent, _name.c_str(), H5P_DEFAULT, gcpl, H5P_DEFAULT), H5Gclose, "Could not create group " + _name);
-  initNodes();
 
   return *this;
 }
@@ -89,6 +96,9 @@ bool Group::exists() const {
 }
 
 void Group::remove() const {
+  // the attributes of this group and its members are removed as well
+  fileAttributeCache().clear();
+
   if (H5Ldelete(parent, _name.c_str(), H5P_DEFAULT) < 0)
     throw HDF5Exception("Could not remove group " + _name); 
 }
@@ -99,6 +109,9 @@ void Group::set( const Group &other, bool deepcopy ) {
     remove();
   }
 
+  // the copy can replace the attributes of this group and its members
+  fileAttributeCache().clear();
+
   hid_gc ocpl(H5Pcreate(H5P_OBJECT_COPY), H5Pclose, "Could not create object creation property list to set group " + _name);
 
   if (!deepcopy) {
@@ -124,7 +137,6 @@ const hid_gc &Group::group() {
 void Group::open( hid_t parent, const std::string &name )
 {
   _group = hid_gc(H5Gopen2(parent, name.c_str(), H5P_DEFAULT), H5Gclose, "Could not open group " + _name);
-  initNodes();
 }
 
 Attribute<string> Group::groupType()
@@ -132,71 +144,324 @@ Attribute<string> Group::groupType()
   return getNode("GROUPTYPE");
 }
 
-void Group::initNodes()
+/*
+ * State of Group::loadAttributes() while H5Aiterate2() calls loadAttributesCallback().
+ * Exceptions cannot cross the HDF5 library, so they are stored and rethrown afterwards.
+ */
+struct LoadAttributes {
+  //! If set, only attributes with these names are read.
+  const set<string> *names;
+
+  vector<AttributeData> attributes;
+  string error;
+
+  LoadAttributes(): names(NULL) {}
+};
+
+static herr_t loadAttributesCallback( hid_t location, const char *name, const H5A_info_t *, void *op_data )
+{
+  LoadAttributes &state = *static_cast<LoadAttributes*>(op_data);
+
+  if (state.names && state.names->find(name) == state.names->end())
+    return 0;
+
+  try {
+    hid_gc_noref attr(H5Aopen(location, name, H5P_DEFAULT), H5Aclose, string("Could not open attribute ") + name);
+
+    state.attributes.push_back(AttributeData(attr, name));
+  } catch (std::exception &e) {
+    state.error = e.what();
+    return -1;
+  }
+
+  return 0;
+}
+
+vector<AttributeData> Group::loadAttributes()
+{
+  LoadAttributes state;
+
+  if (H5Aiterate2(group(), H5_INDEX_NAME, H5_ITER_INC, NULL, loadAttributesCallback, &state) < 0) {
+    if (!state.error.empty())
+      throw HDF5Exception(state.error);
+
+    throw HDF5Exception("Could not iterate over attributes of group " + _name);
+  }
+
+  return state.attributes;
+}
+
+#if H5_VERSION_GE(1,12,0)
+typedef H5O_info2_t SnapshotInfo;
+#else
+typedef H5O_info_t SnapshotInfo;
+#endif
+
+/*
+ * State of Group::snapshot() while H5Ovisit() calls snapshotCallback().
+ */
+struct TakeSnapshot {
+  const set<string> *names;
+
+  vector<ObjectSnapshot> objects;
+  string error;
+};
+
+static herr_t snapshotCallback( hid_t root, const char *name, const SnapshotInfo *oinfo, void *op_data )
+{
+  TakeSnapshot &state = *static_cast<TakeSnapshot*>(op_data);
+
+  // H5Ovisit() calls the group it starts from "."
+  const string path(strcmp(name, ".") == 0 ? "" : name);
+
+  GroupMember::Type type;
+  switch (oinfo->type) {
+    case H5O_TYPE_GROUP:          type = GroupMember::GROUP;    break;
+    case H5O_TYPE_DATASET:        type = GroupMember::DATASET;  break;
+    case H5O_TYPE_NAMED_DATATYPE: type = GroupMember::DATATYPE; break;
+    default:                      type = GroupMember::UNKNOWN;
+  }
+
+  try {
+    hid_gc_noref object(H5Oopen(root, name, H5P_DEFAULT), H5Oclose, "Could not open object " + path);
+
+    vector<ssize_t> dims;
+
+    if (type == GroupMember::DATASET) {
+      hid_gc_noref dataspace(H5Dget_space(object), H5Sclose, "Could not get dataspace of dataset " + path);
+
+      const int rank = H5Sget_simple_extent_ndims(dataspace);
+      if (rank < 0)
+        throw HDF5Exception("Could not get rank of dataset " + path);
+
+      vector<hsize_t> hdims(rank);
+      if (rank > 0 && H5Sget_simple_extent_dims(dataspace, &hdims[0], NULL) < 0)
+        throw HDF5Exception("Could not get dimensions of dataset " + path);
+
+      dims.assign(hdims.begin(), hdims.end());
+    }
+
+    LoadAttributes attributes;
+    attributes.names = state.names;
+
+    if (oinfo->num_attrs > 0 && H5Aiterate2(object, H5_INDEX_NAME, H5_ITER_INC, NULL, loadAttributesCallback, &attributes) < 0) {
+      if (!attributes.error.empty())
+        throw HDF5Exception(attributes.error + " of object " + path);
+
+      throw HDF5Exception("Could not iterate over attributes of object " + path);
+    }
+
+    state.objects.push_back(ObjectSnapshot(path, type, dims, attributes.attributes));
+  } catch (std::exception &e) {
+    state.error = e.what();
+    return -1;
+  }
+
+  return 0;
+}
+
+Snapshot Group::snapshot()
+{
+  return takeSnapshot(NULL);
+}
+
+Snapshot Group::snapshot( const std::vector<std::string> &attributeNames )
 {
-  addNode(new Attribute<string>(*this, "GROUPTYPE"));
+  const std::set<string> names(attributeNames.begin(), attributeNames.end());
+
+  return takeSnapshot(&names);
+}
+
+Snapshot Group::takeSnapshot( const std::set<std::string> *attributeNames )
+{
+  TakeSnapshot state;
+  state.names = attributeNames;
+
+#if H5_VERSION_GE(1,12,0)
+  herr_t result = H5Ovisit3(group(), H5_INDEX_NAME, H5_ITER_INC, snapshotCallback, &state, H5O_INFO_BASIC | H5O_INFO_NUM_ATTRS);
+#elif H5_VERSION_GE(1,10,3)
+  herr_t result = H5Ovisit2(group(), H5_INDEX_NAME, H5_ITER_INC, snapshotCallback, &state, H5O_INFO_BASIC | H5O_INFO_NUM_ATTRS);
+#else
+  herr_t result = H5Ovisit(group(), H5_INDEX_NAME, H5_ITER_INC, snapshotCallback, &state);
+#endif
+  if (result < 0) {
+    if (!state.error.empty())
+      throw HDF5Exception(state.error);
+
+    throw HDF5Exception("Could not visit the objects below group " + _name);
+  }
+
+  return Snapshot(state.objects);
 }
 
-void Group::addNode( Node *attr )
+const NodeSchema &Group::nodeSchema() const
 {
-  if (!attr)
-    throw DALValueError("Could not add NULL node");
+  static const NodeSchema schema = NodeSchema()
+    .add< Attribute<string> >("GROUPTYPE");
+
+  return schema;
+}
 
-  if (nodeMap.find(attr->name()) != nodeMap.end())
-    throw DALValueError("Could not add already existing node " + attr->name()); 
+Node *Group::newNode( const std::string &name )
+{
+  NodeSchema::Factory factory = nodeSchema().factory(name);
 
-  nodeMap[attr->name()] = attr;
+  return factory ? factory(*this, name) : NULL;
 }
 
 ImplicitDowncast<Node> Group::getNode( const std::string &name )
 {
-  // Make sure nodeMap is populated. If group does not exist, better know it early.
+  // If group does not exist, better know it early.
   group();
 
   std::map<std::string, Node*>::const_iterator it(nodeMap.find(name));
-  if (it == nodeMap.end())
-    throw DALValueError("Could not get (find) node " + name);
+  if (it == nodeMap.end()) {
+    Node *node = newNode(name);
+    if (!node)
+      throw DALValueError("Could not get (find) node " + name);
+
+    it = nodeMap.insert(make_pair(name, node)).first;
+  }
 
   return *it->second;
 }
 
 vector<string> Group::nodeNames() {
-  vector<string> names;
-  names.reserve(nodeMap.size());
+  return nodeSchema().names();
+}
 
+void Group::freeNodeMap()
+{
   for( map<string, Node*>::const_iterator i = nodeMap.begin(); i != nodeMap.end(); ++i ) {
+    delete i->second;
+  }
+
+  //nodeMap.clear(); // redundant
+}
+
+NodeSchema &NodeSchema::add( const std::string &name, Factory factory )
+{
+  if (!factories.insert(make_pair(name, factory)).second)
+    throw DALValueError("Could not add already existing node " + name);
+
+  return *this;
+}
+
+NodeSchema::Factory NodeSchema::factory( const std::string &name ) const
+{
+  map<string, Factory>::const_iterator it(factories.find(name));
+
+  return it == factories.end() ? NULL : it->second;
+}
+
+vector<string> NodeSchema::names() const
+{
+  vector<string> names;
+  names.reserve(factories.size());
+
+  for( map<string, Factory>::const_iterator i = factories.begin(); i != factories.end(); ++i ) {
     names.push_back(i->first);
   }
 
   return names;
 }
 
-void Group::freeNodeMap()
+/*
+ * State of Group::listMembers() while H5Literate() calls listMembersCallback().
+ */
+struct ListMembers {
+  string prefix;
+  vector<GroupMember> members;
+  string error;
+};
+
+static herr_t listMembersCallback( hid_t group, const char *name, const H5L_info_t *linfo, void *op_data )
 {
-  for( map<string, Node*>::const_iterator i = nodeMap.begin(); i != nodeMap.end(); ++i ) {
-    delete i->second;
+  ListMembers &state = *static_cast<ListMembers*>(op_data);
+
+  const int cmp = strncmp(name, state.prefix.c_str(), state.prefix.size());
+  if (cmp < 0)
+    return 0; // before the names with our prefix
+  if (cmp > 0)
+    return 1; // past the names with our prefix: links are visited in alphabetical order, so stop
+
+  GroupMember::Type type = GroupMember::LINK;
+
+  if (linfo->type == H5L_TYPE_HARD) {
+#if H5_VERSION_GE(1,12,0)
+    H5O_info2_t oinfo;
+    herr_t result = H5Oget_info_by_name3(group, name, &oinfo, H5O_INFO_BASIC, H5P_DEFAULT);
+#elif H5_VERSION_GE(1,10,3)
+    H5O_info_t oinfo;
+    herr_t result = H5Oget_info_by_name2(group, name, &oinfo, H5O_INFO_BASIC, H5P_DEFAULT);
+#else
+    H5O_info_t oinfo;
+    herr_t result = H5Oget_info_by_name(group, name, &oinfo, H5P_DEFAULT);
+#endif
+    if (result < 0) {
+      state.error = string("Could not get object info of member ") + name;
+      return -1;
+    }
+
+    switch (oinfo.type) {
+      case H5O_TYPE_GROUP:          type = GroupMember::GROUP;    break;
+      case H5O_TYPE_DATASET:        type = GroupMember::DATASET;  break;
+      case H5O_TYPE_NAMED_DATATYPE: type = GroupMember::DATATYPE; break;
+      default:                      type = GroupMember::UNKNOWN;
+    }
   }
 
-  //nodeMap.clear(); // redundant
+  state.members.push_back(GroupMember(name, type));
+  return 0;
 }
 
-vector<string> Group::memberNames() {
-  vector<string> names;
-  H5G_info_t groupInfo;
+vector<GroupMember> Group::listMembers( const std::string &prefix )
+{
+  ListMembers state;
+  state.prefix = prefix;
+
+  // Use H5_INDEX_NAME, because for H5_INDEX_CRT_ORDER, it had to be created with a creation index.
+  if (H5Literate(group(), H5_INDEX_NAME, H5_ITER_INC, NULL, listMembersCallback, &state) < 0) {
+    // the root group of a file has an empty _name
+    const string name = _name.empty() ? "/" : _name;
+
+    if (!state.error.empty())
+      throw HDF5Exception(state.error + " of group " + name);
 
-  if (H5Gget_info(group(), &groupInfo) < 0)
-    throw HDF5Exception("Could not get info with number of member names for group " + _name);
+    throw HDF5Exception("Could not iterate over members of group " + name);
+  }
+
+  return state.members;
+}
+
+vector<GroupMember> Group::members( const std::string &prefix )
+{
+  if (fileMode() != READ)
+    return listMembers(prefix);
+
+  if (!memberCacheValid) {
+    memberCache = listMembers("");
+    memberCacheValid = true;
+  }
 
-  // Loop around H5Lget_name_by_idx(). Can also use H5Literate(), but it is more fuss for what we need here.
-  char linkName[128];
-  for (size_t i = 0; i < groupInfo.nlinks; i++) {
-    // Use H5_INDEX_NAME, because for H5_INDEX_CRT_ORDER, it had to be created with a creation index.
-    ssize_t size = H5Lget_name_by_idx(group(), ".", H5_INDEX_NAME, H5_ITER_NATIVE, i, linkName, sizeof linkName, H5P_DEFAULT);
-    if (size < 0)
-      throw HDF5Exception("Could not get link member name by index for group " + _name); // TODO: _name is "" for TBB_File::stations(); should be "/"
-    linkName[sizeof linkName - 1] = '\0'; // unclear if H5Lget_name_by_idx() always terminates, so do it.
+  vector<GroupMember> result;
+
+  for (vector<GroupMember>::const_iterator it(memberCache.begin()); it != memberCache.end(); ++it) {
+    if (it->name().compare(0, prefix.size(), prefix) == 0)
+      result.push_back(*it);
+  }
+
+  return result;
+}
+
+vector<string> Group::memberNames( const std::string &prefix ) {
+  const vector<GroupMember> groupMembers(members(prefix));
+
+  vector<string> names;
+  names.reserve(groupMembers.size());
 
-    names.push_back(linkName);
+  for (vector<GroupMember>::const_iterator it(groupMembers.begin()); it != groupMembers.end(); ++it) {
+    names.push_back(it->name());
   }
 
   return names;
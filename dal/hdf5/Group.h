@@ -20,18 +20,60 @@
 #include <string>
 #include <vector>
 #include <map>
+#include <set>
 #include <hdf5.h>
 #include "types/implicitdowncast.h"
+#include "types/AttributeData.h"
+#include "types/GroupMember.h"
+#include "types/Snapshot.h"
 #include "Node.h"
 #include "Attribute.h"
 
 namespace dal {
 
+class Group;
+
+/*!
+ * The nodes that a Group class registers: maps their HDF5 names to functions that
+ * create them. Each class keeps a single static schema, which extends the one of
+ * its base class (see Group::nodeSchema()), so opening or copying a group does not
+ * create any nodes.
+ */
+class NodeSchema {
+public:
+  //! Creates a node `name` in `parent`.
+  typedef Node *(*Factory)( Group &parent, const std::string &name );
+
+  /*!
+   * Registers node `name` of type T, which is constructed as T(parent, name).
+   * Returns *this, so registrations can be chained.
+   */
+  template<typename T> NodeSchema &add( const std::string &name ) { return add(name, &newNode<T>); }
+
+  /*!
+   * Registers node `name`, created by `factory`. Throws a DALValueError
+   * if `name` is already registered.
+   */
+  NodeSchema &add( const std::string &name, Factory factory );
+
+  //! Returns the factory of node `name`, or NULL if `name` is not registered.
+  Factory factory( const std::string &name ) const;
+
+  //! Returns the names of all registered nodes, in alphabetical order.
+  std::vector<std::string> names() const;
+
+private:
+  std::map<std::string, Factory> factories;
+
+  template<typename T> static Node *newNode( Group &parent, const std::string &name ) { return new T(parent, name); }
+};
+
 /*!
  * Wraps an HDF5 group, providing core functionality.
  *
  * A Group maintains a set of registered Nodes that it
- * expects to be present.
+ * expects to be present. They are described by its nodeSchema(),
+ * and only created once they are looked up.
  */
 class Group: public Node {
 public:
@@ -99,18 +141,75 @@ public:
 
   Attribute<std::string> groupType();
 
+  /*!
+   * Reads all attributes of this group from the HDF5 file in a single pass over them
+   * (H5Aiterate2()), and returns them ordered by name. This is much faster than reading
+   * many attributes through their accessors, which each look up, open, read, and close
+   * one attribute. Attributes do not need to be registered to be read.
+   *
+   * Python example:
+   * \code
+   *    # Create a new HDF5 file with a predefined format
+   *    >>> f = BF_File("example.h5", File.CREATE)
+   *    >>> f.observationID().value = '12345'
+   *    >>> f.observationNofStations().value = 3
+   *    >>> f.observationStationsList().value = ['CS001', 'CS002', 'RS106']
+   *
+   *    # attrs() returns the values of all attributes as a dict
+   *    >>> a = f.attrs()
+   *    >>> a['OBSERVATION_ID'], a['OBSERVATION_NOF_STATIONS'], a['OBSERVATION_STATIONS_LIST']
+   *    ('12345', 3, ['CS001', 'CS002', 'RS106'])
+   *
+   *    # Clean up
+   *    >>> import os
+   *    >>> os.remove("example.h5")
+   * \endcode
+   */
+  std::vector<AttributeData> loadAttributes();
+
+  /*!
+   * Returns the members (links) of this group in alphabetical order, with their object
+   * types, in a single pass over the links (H5Literate()). If `prefix` is given, only
+   * the members whose names start with it are returned.
+   *
+   * In READ mode, the file cannot change, so the members are enumerated only
+   * once per group object, and later calls filter the stored list.
+   */
+  std::vector<GroupMember> members( const std::string &prefix = "" );
+
+  /*!
+   * Returns the attributes of this group and of all groups and datasets below it,
+   * as well as the dimensions of those datasets, read in a single traversal of the
+   * hierarchy (H5Ovisit() and H5Aiterate2()). The returned Snapshot can be queried
+   * without further HDF5 calls, so tools that display or index many attributes should
+   * prefer it over reading them through their accessors, group by group.
+   *
+   * Links that are not hard links are not followed, and objects that can be reached
+   * through multiple hard links are included only once.
+   *
+   * In Python, snapshot() returns the metadata as nested dicts instead,
+   * which can be stored directly as JSON or msgpack. See Snapshot.
+   */
+  Snapshot snapshot();
+
+  /*!
+   * Like snapshot(), but only reads the attributes called one of `attributeNames`,
+   * which saves reading (and converting) the others. All objects are still included.
+   */
+  Snapshot snapshot( const std::vector<std::string> &attributeNames );
+
   /*!
    * Returns a list of the HDF5 names of all nodes registered
    * in this class.
    */
-  std::vector<std::string> nodeNames();
+  virtual std::vector<std::string> nodeNames();
 
 #ifndef SWIG
 
   /*!
-   * Returns a reference to a node from the map. initNodes() is called
-   * if needed, and an exception is thrown if the group
-   * has not been opened or created yet.
+   * Returns a reference to a registered node. The node is created on its first
+   * lookup, and an exception is thrown if the group does not exist or
+   * if no node `name` is registered.
    *
    * ImplicitDowncast<Node> allows getNode to be automatically
    * cast to the required type (a subclass of Node), for example:
@@ -126,7 +225,7 @@ public:
 #endif
 
 protected:
-  //! hid of the Group. Always read it through group(). Set only once, then call initNodes().
+  //! hid of the Group. Always read it through group(). Set only once.
   hid_gc _group;
 
 
@@ -136,22 +235,47 @@ protected:
    */
   const hid_gc &group(); // protected w/ friend above to keep hid_gc inside DAL
 
-  virtual void initNodes();
+  /*!
+   * Returns the schema of the nodes registered by this class. Classes that
+   * register nodes override it and extend the schema of their base class once:
+   *
+   * \code
+   *   const NodeSchema &MyGroup::nodeSchema() const
+   *   {
+   *     static const NodeSchema schema = NodeSchema(Group::nodeSchema())
+   *       .add< Attribute<int> >("MY_INTEGER");
+   *
+   *     return schema;
+   *   }
+   * \endcode
+   */
+  virtual const NodeSchema &nodeSchema() const;
 
   /*!
-   * Add a node to the node map. Ownerschip is taken. Do not pass NULL.
+   * Returns a new node `name`, or NULL if `name` is not registered.
+   * Called by getNode() on the first lookup of each node.
    */
-  void addNode( Node *attr );
+  virtual Node *newNode( const std::string &name );
 
-  std::vector<std::string> memberNames();
+  //! Returns the names of members(prefix).
+  std::vector<std::string> memberNames( const std::string &prefix = "" );
 
   //! Constructor for root group (in File) only
   Group( const hid_gc &fileId, FileInfo fileInfo );
 
 private:
-  //! The map containing all (registered) nodes in this set
+  //! The registered nodes looked up so far. Owned by this object and not shared with copies.
   std::map<std::string, Node*> nodeMap;
 
+  //! All members, if enumerated in READ mode. Not shared with copies either.
+  std::vector<GroupMember> memberCache;
+  bool memberCacheValid;
+
+  std::vector<GroupMember> listMembers( const std::string &prefix );
+
+  //! Implements snapshot(), reading only `attributeNames` if not NULL.
+  Snapshot takeSnapshot( const std::set<std::string> *attributeNames );
+
   virtual void open( hid_t parent, const std::string &name );
 
   void freeNodeMap();
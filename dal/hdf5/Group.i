@@ -13,9 +13,9 @@
 // loading the actual class.
 %extend dal::Group {
   /*
-   * Each Group allows nodes to be registered in a generic
-   * map<string, Node*> using the addNode method. The getNode method
-   * is used for node lookup in that map. Nodes in the map are typically
+   * Each Group class registers nodes in its NodeSchema, which maps their
+   * names to functions that create them. The getNode method is used for
+   * node lookup, and creates the node on first use. Nodes are typically
    * subclasses of Node. In C++, we can use dynamic_cast to cast
    * the received object to its proper type.
    *
@@ -111,10 +111,167 @@
   }
 }
 
+// -------------------------------
+// Bulk attribute access
+// -------------------------------
+
+%{
+/*
+ * Returns value `index` of attribute `a` as a new Python object. Complex values are
+ * returned as complex, or as a [real, imag] list if `complexPairs` is set.
+ */
+static PyObject *AttributeData_valueAt( const dal::AttributeData &a, size_t index, bool complexPairs )
+{
+  switch (a.type()) {
+    case dal::AttributeData::INTEGER: {
+      const long long value = a.integers()[index];
+
+      if (value >= LONG_MIN && value <= LONG_MAX)
+        return PyInt_FromLong(static_cast<long>(value));
+      else
+        return PyLong_FromLongLong(value);
+    }
+
+    case dal::AttributeData::UNSIGNED: {
+      const unsigned long long value = a.unsignedIntegers()[index];
+
+      if (value <= static_cast<unsigned long long>(LONG_MAX))
+        return PyInt_FromLong(static_cast<long>(value));
+      else
+        return PyLong_FromUnsignedLongLong(value);
+    }
+
+    case dal::AttributeData::FLOAT:
+      return PyFloat_FromDouble(a.floats()[index]);
+
+    case dal::AttributeData::COMPLEX: {
+      const std::complex<double> &value = a.complexes()[index];
+
+      if (!complexPairs)
+        return PyComplex_FromDoubles(value.real(), value.imag());
+
+      return Py_BuildValue("[dd]", value.real(), value.imag());
+    }
+
+    case dal::AttributeData::STRING:
+      return PyString_FromStringAndSize(a.strings()[index].data(), a.strings()[index].size());
+
+    default:
+      Py_RETURN_NONE;
+  }
+}
+
+/*
+ * Returns element `index` of attribute `a` as a new Python object: a value, or a tuple of values.
+ */
+static PyObject *AttributeData_elementAt( const dal::AttributeData &a, size_t index, bool complexPairs )
+{
+  const size_t tupleSize = a.tupleSize();
+
+  if (a.type() == dal::AttributeData::STRING || tupleSize == 1)
+    return AttributeData_valueAt(a, index, complexPairs);
+
+  PyObject *tuple = PyTuple_New(tupleSize);
+  if (!tuple)
+    return NULL;
+
+  for (size_t i = 0; i < tupleSize; i++) {
+    PyObject *value = AttributeData_valueAt(a, index * tupleSize + i, complexPairs);
+
+    if (!value) {
+      Py_DECREF(tuple);
+      return NULL;
+    }
+
+    PyTuple_SET_ITEM(tuple, i, value);
+  }
+
+  return tuple;
+}
+%}
+
+// the values are returned through AttributeData._value() instead
+%ignore dal::AttributeData::integers;
+%ignore dal::AttributeData::unsignedIntegers;
+%ignore dal::AttributeData::floats;
+%ignore dal::AttributeData::complexes;
+%ignore dal::AttributeData::strings;
+
+%include hdf5/types/AttributeData.h
+
+%extend dal::AttributeData {
+  // The value of the attribute as a Python object: a scalar value (or a tuple of values),
+  // or a list of those for vectors. Values of unsupported types are returned as None.
+  // Complex values are returned as complex, or as [real, imag] lists (which JSON can
+  // store) if complexPairs is set.
+  PyObject *_value( bool complexPairs = false ) {
+    if ($self->type() == dal::AttributeData::UNSUPPORTED)
+      Py_RETURN_NONE;
+
+    if ($self->scalar())
+      return AttributeData_elementAt(*$self, 0, complexPairs);
+
+    PyObject *list = PyList_New($self->size());
+    if (!list)
+      return NULL;
+
+    for (size_t i = 0; i < $self->size(); i++) {
+      PyObject *element = AttributeData_elementAt(*$self, i, complexPairs);
+
+      if (!element) {
+        Py_DECREF(list);
+        return NULL;
+      }
+
+      PyList_SET_ITEM(list, i, element);
+    }
+
+    return list;
+  }
+}
+
+vector_typemap( dal::AttributeData );
+
+// -------------------------------
+// Member enumeration
+// -------------------------------
+
+%include hdf5/types/GroupMember.h
+
+vector_typemap( dal::GroupMember );
+
+// -------------------------------
+// Snapshots
+// -------------------------------
+
+// vectors are only converted when returned by value, so these are replaced below
+%ignore dal::Snapshot::objects;
+%ignore dal::ObjectSnapshot::dims;
+%ignore dal::ObjectSnapshot::attributes;
+
+%include hdf5/types/Snapshot.h
+
+vector_typemap( dal::ObjectSnapshot );
+
+%extend dal::Snapshot {
+  std::vector<dal::ObjectSnapshot> _objects() const { return $self->objects(); }
+}
+
+%extend dal::ObjectSnapshot {
+  std::vector<ssize_t> _dims() const { return $self->dims(); }
+  std::vector<dal::AttributeData> _attributes() const { return $self->attributes(); }
+}
+
+// snapshot() is replaced by a Python version that returns nested dicts
+%rename(_snapshot) dal::Group::snapshot;
+
 // ignore the original getNode routine, which cannot be exported
 // because it returns a fancy ImplicitDowncast<Node>.
 %ignore dal::Group::getNode;
 
+// the node schema only matters to classes that register nodes
+%ignore dal::NodeSchema;
+
 // do not bother renaming operator=: Python users do not need it
 %ignore dal::Group::operator=;
 
@@ -125,6 +282,62 @@
     def create(self, *args, **kwargs):
       self._create(*args, **kwargs)
       return self
+
+    def attrs(self):
+      """
+        Returns the values of all attributes of this group as a dict,
+        read in a single pass (see loadAttributes()). Vectors are returned
+        as lists, tuples as tuples, complex numbers as complex, and values
+        of unsupported types as None.
+      """
+      return dict((a.name(), a._value()) for a in self.loadAttributes())
+
+    def snapshot(self, attributeNames=None):
+      """
+        Returns the metadata of this group and of everything below it, read in
+        a single traversal of the file (see Snapshot), as nested dicts. Each
+        object is a dict with its "type" ('GROUP', 'DATASET' or 'DATATYPE') and
+        "attrs" (as returned by attrs(), except that complex values are
+        [real, imag] lists). Groups also have "members", which maps
+        the names of their members to such dicts, and datasets have "dims".
+
+        If `attributeNames' is given, only the attributes with those names are
+        read, although all objects are still included.
+
+        The result only contains strings, numbers, lists, tuples and dicts, so it
+        can be stored directly with json.dump() or msgpack.pack().
+      """
+      typeNames = {
+        GroupMember.GROUP:    'GROUP',
+        GroupMember.DATASET:  'DATASET',
+        GroupMember.DATATYPE: 'DATATYPE',
+      }
+
+      nodes = {}
+
+      # a group is always visited before its members
+      if attributeNames is None:
+        snapshot = self._snapshot()
+      else:
+        snapshot = self._snapshot(list(attributeNames))
+
+      for o in snapshot._objects():
+        node = {
+          "type":  typeNames.get(o.type(), 'UNKNOWN'),
+          "attrs": dict((a.name(), a._value(True)) for a in o._attributes()),
+        }
+
+        if o.type() == GroupMember.GROUP:
+          node["members"] = {}
+        elif o.type() == GroupMember.DATASET:
+          node["dims"] = o._dims()
+
+        nodes[o.path()] = node
+
+        if o.path():
+          nodes[o.parentPath()]["members"][o.name()] = node
+
+      return nodes[""]
   }    
 }
 
@@ -99,5 +99,17 @@ void Node::setFileInfoVersion(const VersionType& newVersion) {
   fileInfo.setFileVersion(newVersion);
 }
 
+unsigned long Node::fileResizeCount() const {
+  return fileInfo.resizeCount();
+}
+
+void Node::incFileResizeCount() {
+  fileInfo.incResizeCount();
+}
+
+AttributeCache& Node::fileAttributeCache() const {
+  return fileInfo.attributeCache();
+}
+
 }
 
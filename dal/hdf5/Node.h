@@ -237,7 +237,8 @@ protected:
 
   /*!
    * The file descriptor of the name of the dir in the file as it was opened,
-   * or -1 if "." or failed to open. Needed for a HDF5 issue workaround.
+   * or -1 if "." or failed to open. Needed for a HDF5 1.8 issue workaround.
+   * Always -1 on HDF5 1.10+, which resolves external data files itself.
    */
   int fileDirfd() const;
 
@@ -251,6 +252,18 @@ protected:
    * Use only after changing the version attribute in the HDF5 file (or for init).
    */
   void setFileInfoVersion(const VersionType& newVersion);
+
+  /*!
+   * Returns the number of dataset resizes done in this file through DAL.
+   * Used to detect stale cached dataset extents.
+   */
+  unsigned long fileResizeCount() const;
+
+  //! Register a dataset resize in this file. See fileResizeCount().
+  void incFileResizeCount();
+
+  //! Returns the attribute value cache of this file. See File::setAttributeCaching().
+  AttributeCache& fileAttributeCache() const;
 };
 
 }
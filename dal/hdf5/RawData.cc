@@ -0,0 +1,78 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#include "RawData.h"
+#include "exceptions/exceptions.h"
+
+#include <algorithm>
+#include <cerrno>
+#include <cstring>
+#include <fcntl.h>
+#include <unistd.h>
+#ifdef __APPLE__
+#include <machine/endian.h>
+#else
+#include <endian.h>
+#endif
+
+using namespace std;
+
+namespace dal {
+
+void readRawData( const std::string &filename, size_t offset, void *buffer, size_t nrWords, size_t wordSize, bool bigEndian )
+{
+  if (nrWords == 0)
+    return;
+
+  const int fd = ::open(filename.c_str(), O_RDONLY);
+  if (fd == -1)
+    throw DALException("Could not open raw data file " + filename + ": " + strerror(errno));
+
+  char *buf = static_cast<char *>(buffer);
+  const size_t nbytes = nrWords * wordSize;
+  size_t done = 0;
+
+  while (done < nbytes) {
+    const ssize_t n = ::pread(fd, buf + done, nbytes - done, offset + done);
+
+    if (n == -1) {
+      if (errno == EINTR)
+        continue;
+
+      const int err = errno;
+      ::close(fd);
+      throw DALException("Could not read raw data file " + filename + ": " + strerror(err));
+    }
+
+    if (n == 0)
+      break; // end of file
+
+    done += n;
+  }
+
+  ::close(fd);
+
+  // data beyond the end of the file has not been written yet
+  memset(buf + done, 0, nbytes - done);
+
+  if (wordSize > 1 && bigEndian != (BYTE_ORDER == BIG_ENDIAN)) {
+    for (size_t i = 0; i < nbytes; i += wordSize)
+      reverse(buf + i, buf + i + wordSize);
+  }
+}
+
+}
+
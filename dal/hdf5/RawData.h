@@ -0,0 +1,42 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#ifndef DAL_RAW_DATA_H
+#define DAL_RAW_DATA_H
+
+#include <cstddef>
+#include <string>
+
+namespace dal {
+
+/*!
+ * Reads `nrWords` words of `wordSize` bytes, starting at byte `offset` of the raw
+ * (external) data file `filename`, into `buffer`. The words are stored in big-endian
+ * byte order if `bigEndian` is set, and in little-endian byte order otherwise, and are
+ * converted to the byte order of this machine. Words beyond the end of the file read
+ * as 0, like in HDF5.
+ *
+ * Does not call HDF5, so it can be used from any thread. See Dataset::externalDataFile()
+ * for where to find the raw data of a dataset.
+ *
+ * Throws a DALException if the file cannot be opened or read.
+ */
+void readRawData( const std::string &filename, size_t offset, void *buffer, size_t nrWords, size_t wordSize, bool bigEndian );
+
+}
+
+#endif
+
@@ -5,25 +5,29 @@
 %include "exception.i"
 
 /*
- * Catch and marshall all C++ exceptions. Define the exception handler first,
- * to ensure that all calls will be wrapped.
+ * Catch and marshall all C++ exceptions. DAL_CATCH_EXCEPTIONS follows the try
+ * block of each exception handler, see below and threads.i.
  */
-%exception {
-  try {
-    $action
-
-  // Catch DAL exception classes
-
-  } catch (const dal::HDF5Exception &e) {
-    const std::string msg = std::string(e.what()) + ": " + e.stackSummary();
-
 #ifdef SWIGPYTHON
+%define DAL_SET_HDF5_EXCEPTION
     PyErr_SetString(pHDF5Exception, const_cast<char*>(msg.c_str()));
     return NULL;
+%enddef
 #else
+%define DAL_SET_HDF5_EXCEPTION
     SWIG_exception(SWIG_RuntimeError, msg.c_str());
+%enddef
 #endif
 
+%define DAL_CATCH_EXCEPTIONS
+
+  /* Catch DAL exception classes */
+
+  catch (const dal::HDF5Exception &e) {
+    const std::string msg = std::string(e.what()) + ": " + e.stackSummary();
+
+    DAL_SET_HDF5_EXCEPTION
+
   } catch (const dal::DALIndexError &e) {
     SWIG_exception(SWIG_IndexError, e.what());
   } catch (const dal::DALValueError &e) {
@@ -32,8 +36,22 @@
     SWIG_exception(SWIG_RuntimeError, e.what());
   }  
 
-  // Catch standard C++ exception classes (including std::exception)
+  /* Catch standard C++ exception classes (including std::exception) */
   SWIG_CATCH_STDEXCEPT
+%enddef
+
+/*
+ * Define the default exception handler first, to ensure that all calls will be wrapped.
+ * Calls keep the GIL, but hold the HDF5 lock, because other threads may be doing I/O
+ * with the GIL released (see threads.i).
+ */
+%exception {
+  try {
+    dal_python::HDF5Lock hdf5lock(true);
+
+    $action
+  }
+  DAL_CATCH_EXCEPTIONS
 }
 
 
@@ -0,0 +1,140 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#ifndef DAL_ATTRIBUTE_CACHE_H
+#define DAL_ATTRIBUTE_CACHE_H
+
+#include <string>
+#include <map>
+#include <utility>
+
+namespace dal {
+
+/*!
+ * Caches attribute values read from a file, keyed by the path of the object that
+ * holds the attribute and the name of the attribute. Values of any type can be cached,
+ * but each attribute caches a single value: reading it as another type replaces it.
+ *
+ * Each open file has one cache (see FileInfo), which is disabled by default.
+ * See File::setAttributeCaching() for when the cached values are valid.
+ */
+class AttributeCache {
+public:
+  AttributeCache(): _enabled(false), _hits(0), _misses(0) {}
+
+  ~AttributeCache() { clear(); }
+
+  //! Returns whether values are cached.
+  bool enabled() const { return _enabled; }
+
+  //! Enables or disables the cache. Disabling also clears it.
+  void setEnabled( bool enabled ) { _enabled = enabled; if (!enabled) clear(); }
+
+  /*!
+   * Sets `value` to the cached value of attribute `name` of object `path`, if it is
+   * cached as a T. Returns whether it was, and counts a hit or a miss accordingly.
+   */
+  template<typename T> bool get( const std::string &path, const std::string &name, T &value );
+
+  //! Caches `value` as the value of attribute `name` of object `path`.
+  template<typename T> void put( const std::string &path, const std::string &name, const T &value );
+
+  //! Returns whether attribute `name` of object `path` is cached.
+  bool contains( const std::string &path, const std::string &name ) const
+  { return entries.find(Key(path, name)) != entries.end(); }
+
+  //! Removes attribute `name` of object `path` from the cache, if it is cached.
+  void invalidate( const std::string &path, const std::string &name );
+
+  //! Removes all values from the cache.
+  void clear();
+
+  //! Returns the number of lookups that found a cached value.
+  unsigned long hits() const { return _hits; }
+
+  //! Returns the number of lookups that did not find a cached value.
+  unsigned long misses() const { return _misses; }
+
+private:
+  struct Entry {
+    virtual ~Entry() {}
+  };
+
+  template<typename T> struct Value: public Entry {
+    Value( const T &value ): value(value) {}
+
+    T value;
+  };
+
+  typedef std::pair<std::string, std::string> Key;
+
+  std::map<Key, Entry*> entries;
+
+  bool _enabled;
+  unsigned long _hits;
+  unsigned long _misses;
+
+  // not copyable
+  AttributeCache( const AttributeCache & );
+  AttributeCache &operator=( const AttributeCache & );
+};
+
+template<typename T> inline bool AttributeCache::get( const std::string &path, const std::string &name, T &value )
+{
+  const std::map<Key, Entry*>::const_iterator it(entries.find(Key(path, name)));
+  const Value<T> *cached = it == entries.end() ? 0 : dynamic_cast<const Value<T>*>(it->second);
+
+  if (!cached) {
+    _misses++;
+    return false;
+  }
+
+  _hits++;
+  value = cached->value;
+  return true;
+}
+
+template<typename T> inline void AttributeCache::put( const std::string &path, const std::string &name, const T &value )
+{
+  Entry *newEntry = new Value<T>(value);
+  Entry *&entry = entries[Key(path, name)];
+
+  delete entry;
+  entry = newEntry;
+}
+
+inline void AttributeCache::invalidate( const std::string &path, const std::string &name )
+{
+  const std::map<Key, Entry*>::iterator it(entries.find(Key(path, name)));
+
+  if (it != entries.end()) {
+    delete it->second;
+    entries.erase(it);
+  }
+}
+
+inline void AttributeCache::clear()
+{
+  for (std::map<Key, Entry*>::const_iterator it = entries.begin(); it != entries.end(); ++it)
+    delete it->second;
+
+  entries.clear();
+}
+
+}
+
+#endif
+
@@ -0,0 +1,231 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#include "AttributeData.h"
+#include "hid_gc.h"
+#include "h5tuple.h"
+#include "../exceptions/exceptions.h"
+
+using namespace std;
+
+namespace dal {
+
+/*
+ * Returns whether `datatype` is a compound of two floating point numbers, as
+ * h5complexType() creates to store complex numbers.
+ */
+static bool isComplexType( hid_t datatype )
+{
+  if (H5Tget_nmembers(datatype) != 2)
+    return false;
+
+  return H5Tget_member_class(datatype, 0) == H5T_FLOAT && H5Tget_member_class(datatype, 1) == H5T_FLOAT;
+}
+
+/*
+ * Returns the memory datatype to read complex compound `datatype` as std::complex<double>.
+ * HDF5 converts compounds by member name, so the names of `datatype` are used. The
+ * first member is the real part.
+ */
+static hid_gc complexMemType( hid_t datatype, const std::string &attrName )
+{
+  hid_gc memtype(H5Tcreate(H5T_COMPOUND, sizeof(complex<double>)), H5Tclose, "Could not create complex datatype to read attribute " + attrName);
+
+  for (unsigned i = 0; i < 2; i++) {
+    char *name = H5Tget_member_name(datatype, i);
+    if (!name)
+      throw HDF5Exception("Could not get member name of complex datatype of attribute " + attrName);
+
+    const herr_t result = H5Tinsert(memtype, name, i * sizeof(double), H5T_NATIVE_DOUBLE);
+    H5free_memory(name);
+
+    if (result < 0)
+      throw HDF5Exception("Could not create complex datatype to read attribute " + attrName);
+  }
+
+  return memtype;
+}
+
+AttributeData::AttributeData( hid_t attr, const std::string &name )
+:
+  _name(name),
+  _type(UNSUPPORTED),
+  _scalar(true),
+  _size(0),
+  _tupleSize(1)
+{
+  hid_gc_noref datatype(H5Aget_type(attr), H5Tclose, "Could not get datatype of attribute " + _name);
+  hid_gc_noref dataspace(H5Aget_space(attr), H5Sclose, "Could not get dataspace of attribute " + _name);
+
+  const H5S_class_t classType = H5Sget_simple_extent_type(dataspace);
+  if (classType == H5S_NO_CLASS)
+    throw HDF5Exception("Could not obtain class type of dataspace of attribute " + _name);
+
+  _scalar = classType == H5S_SCALAR;
+
+  const hssize_t nelems = H5Sget_simple_extent_npoints(dataspace);
+  if (nelems < 0)
+    throw HDF5Exception("Could not obtain size of dataspace of attribute " + _name);
+
+  _size = classType == H5S_NULL ? 0 : nelems;
+
+  H5T_class_t typeClass = H5Tget_class(datatype);
+
+  if (typeClass == H5T_STRING) {
+    _type = STRING;
+    readStrings(attr, datatype, dataspace);
+    return;
+  }
+
+  // tuples are stored as fixed-size arrays of numbers
+  const bool tuple = typeClass == H5T_ARRAY;
+  hid_t basetype = datatype;
+  hid_gc arraybasetype;
+
+  if (tuple) {
+    const int rank = H5Tget_array_ndims(datatype);
+    if (rank < 0)
+      throw HDF5Exception("Could not obtain rank of array datatype of attribute " + _name);
+
+    vector<hsize_t> dims(rank);
+    if (H5Tget_array_dims2(datatype, &dims[0]) < 0)
+      throw HDF5Exception("Could not obtain dimensions of array datatype of attribute " + _name);
+
+    for (int i = 0; i < rank; i++)
+      _tupleSize *= dims[i];
+
+    arraybasetype = hid_gc(H5Tget_super(datatype), H5Tclose, "Could not get base datatype of attribute " + _name);
+    basetype = arraybasetype;
+    typeClass = H5Tget_class(basetype);
+  }
+
+  hid_t memtype;
+  hid_gc memcomplextype;
+
+  if (typeClass == H5T_INTEGER) {
+    const H5T_sign_t sign = H5Tget_sign(basetype);
+    if (sign == H5T_SGN_ERROR)
+      throw HDF5Exception("Could not obtain sign of datatype of attribute " + _name);
+
+    if (sign == H5T_SGN_NONE) {
+      _type = UNSIGNED;
+      memtype = H5T_NATIVE_ULLONG;
+    } else {
+      _type = INTEGER;
+      memtype = H5T_NATIVE_LLONG;
+    }
+  } else if (typeClass == H5T_FLOAT) {
+    _type = FLOAT;
+    memtype = H5T_NATIVE_DOUBLE;
+  } else if (typeClass == H5T_COMPOUND && isComplexType(basetype)) {
+    _type = COMPLEX;
+    memcomplextype = complexMemType(basetype, _name);
+    memtype = memcomplextype;
+  } else {
+    // other compounds, enums, nested arrays, etc.
+    _size = 0;
+    return;
+  }
+
+  const size_t nrValues = _size * _tupleSize;
+
+  if (nrValues == 0)
+    return;
+
+  hid_gc memtupletype;
+  if (tuple) {
+    memtupletype = h5tupleType(memtype, _tupleSize);
+    memtype = memtupletype;
+  }
+
+  void *buffer;
+
+  switch (_type) {
+    case INTEGER:
+      _integers.resize(nrValues);
+      buffer = &_integers[0];
+      break;
+
+    case UNSIGNED:
+      _unsignedIntegers.resize(nrValues);
+      buffer = &_unsignedIntegers[0];
+      break;
+
+    case COMPLEX:
+      _complexes.resize(nrValues);
+      buffer = &_complexes[0];
+      break;
+
+    default:
+      _floats.resize(nrValues);
+      buffer = &_floats[0];
+      break;
+  }
+
+  if (H5Aread(attr, memtype, buffer) < 0)
+    throw HDF5Exception("Could not read attribute " + _name);
+}
+
+void AttributeData::readStrings( hid_t attr, hid_t datatype, hid_t dataspace )
+{
+  if (_size == 0)
+    return;
+
+  const htri_t isVariable = H5Tis_variable_str(datatype);
+  if (isVariable < 0)
+    throw HDF5Exception("Could not determine whether datatype is a variable or fixed length string for attribute " + _name);
+
+  hid_gc_noref memtype(H5Tcopy(H5T_C_S1), H5Tclose, "Could not create string datatype to read attribute " + _name);
+
+  _strings.resize(_size);
+
+  if (isVariable) {
+    // HDF5 allocates the strings
+    if (H5Tset_size(memtype, H5T_VARIABLE) < 0)
+      throw HDF5Exception("Could not create variable length string datatype to read attribute " + _name);
+
+    vector<char *> c_strs(_size, 0);
+
+    if (H5Aread(attr, memtype, &c_strs[0]) < 0)
+      throw HDF5Exception("Could not read attribute " + _name);
+
+    for (size_t i = 0; i < _size; i++)
+      if (c_strs[i])
+        _strings[i] = c_strs[i];
+
+    if (H5Dvlen_reclaim(memtype, dataspace, H5P_DEFAULT, &c_strs[0]) < 0)
+      throw DALException("Could not reclaim memory for variable-length attribute " + _name);
+  } else {
+    // fixed length strings, which do not need to be null terminated on disk
+    const size_t strsize = H5Tget_size(datatype);
+    if (strsize == 0)
+      throw HDF5Exception("Could not obtain string size of attribute " + _name);
+
+    if (H5Tset_size(memtype, strsize + 1) < 0 || H5Tset_strpad(memtype, H5T_STR_NULLTERM) < 0)
+      throw HDF5Exception("Could not create fixed length string datatype to read attribute " + _name);
+
+    vector<char> buf(_size * (strsize + 1));
+
+    if (H5Aread(attr, memtype, &buf[0]) < 0)
+      throw HDF5Exception("Could not read attribute " + _name);
+
+    for (size_t i = 0; i < _size; i++)
+      _strings[i] = &buf[i * (strsize + 1)];
+  }
+}
+
+}
+
@@ -0,0 +1,116 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#ifndef DAL_ATTRIBUTE_DATA_H
+#define DAL_ATTRIBUTE_DATA_H
+
+#include <cstddef>
+#include <complex>
+#include <string>
+#include <vector>
+#include <hdf5.h>
+
+namespace dal {
+
+/*!
+ * The name and value of an attribute of any type, as returned by Group::loadAttributes().
+ *
+ * The value is stored according to the class of its HDF5 datatype: signed integers as
+ * long long, unsigned integers as unsigned long long, floating point numbers as double,
+ * complex numbers (compounds of two floating point numbers, see h5complex.h) as
+ * std::complex<double>, and strings as std::string. Each element of an attribute can be a tuple (a fixed-size
+ * HDF5 array, see h5tuple.h) of tupleSize() numbers, which are stored consecutively.
+ * Attributes of other types (such as other compounds) have type() UNSUPPORTED and no values.
+ *
+ * Python example:
+ * \code
+ *    # Create a new HDF5 file with some attributes
+ *    >>> f = File("example.h5", File.CREATE)
+ *    >>> AttributeString(f, "EXAMPLE_STRING").value = "hello world!"
+ *    >>> AttributeVUInt(f, "EXAMPLE_UINTS").value = [1, 2, 3]
+ *
+ *    # Read them in one pass
+ *    >>> [(a.name(), a.type() == AttributeData.UNSIGNED, a.scalar()) for a in f.loadAttributes()]
+ *    [('EXAMPLE_STRING', False, True), ('EXAMPLE_UINTS', True, False)]
+ *
+ *    # Clean up
+ *    >>> import os
+ *    >>> os.remove("example.h5")
+ * \endcode
+ */
+class AttributeData {
+public:
+  enum Type { INTEGER = 0, UNSIGNED, FLOAT, STRING, COMPLEX, UNSUPPORTED };
+
+  AttributeData(): _type(UNSUPPORTED), _scalar(true), _size(0), _tupleSize(1) {}
+
+#ifndef SWIG
+  /*!
+   * Reads the open attribute `attr`, called `name`.
+   */
+  AttributeData( hid_t attr, const std::string &name );
+#endif
+
+  //! Returns the name of the attribute.
+  std::string name() const { return _name; }
+
+  //! Returns how the values are stored. See class description.
+  enum Type type() const { return _type; }
+
+  //! Returns whether the attribute is a scalar (or a string), instead of a vector.
+  bool scalar() const { return _scalar; }
+
+  //! Returns the number of elements (1 for a scalar, >= 0 for a vector).
+  size_t size() const { return _size; }
+
+  //! Returns the number of values per element (> 1 for tuples).
+  size_t tupleSize() const { return _tupleSize; }
+
+  //! Returns the values of an INTEGER attribute.
+  const std::vector<long long> &integers() const { return _integers; }
+
+  //! Returns the values of an UNSIGNED attribute.
+  const std::vector<unsigned long long> &unsignedIntegers() const { return _unsignedIntegers; }
+
+  //! Returns the values of a FLOAT attribute.
+  const std::vector<double> &floats() const { return _floats; }
+
+  //! Returns the values of a COMPLEX attribute.
+  const std::vector< std::complex<double> > &complexes() const { return _complexes; }
+
+  //! Returns the values of a STRING attribute.
+  const std::vector<std::string> &strings() const { return _strings; }
+
+private:
+  std::string _name;
+  enum Type _type;
+  bool _scalar;
+  size_t _size;
+  size_t _tupleSize;
+
+  std::vector<long long> _integers;
+  std::vector<unsigned long long> _unsignedIntegers;
+  std::vector<double> _floats;
+  std::vector< std::complex<double> > _complexes;
+  std::vector<std::string> _strings;
+
+  void readStrings( hid_t attr, hid_t datatype, hid_t dataspace );
+};
+
+}
+
+#endif
+
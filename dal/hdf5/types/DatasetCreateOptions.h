@@ -0,0 +1,115 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#ifndef DAL_DATASET_CREATE_OPTIONS_H
+#define DAL_DATASET_CREATE_OPTIONS_H
+
+#include <cstddef>
+#include <sys/types.h>
+#include <vector>
+
+namespace dal {
+
+/*!
+ * Storage layout options to pass to Dataset::create().
+ *
+ * By default, a dataset is stored contiguously without filters, which is what
+ * (externally stored) LOFAR data sets use. Chunked storage allows internally stored
+ * data sets to be compressed and to grow without bound, at the cost of some
+ * bookkeeping by HDF5. HDF5 does not support chunked storage in external files.
+ *
+ * Python example:
+ * \code
+ *    # Create a new HDF5 file called "example.h5"
+ *    >>> f = File("example.h5", File.CREATE)
+ *
+ *    # Store the data in compressed chunks of 128 x 16 values
+ *    >>> opts = DatasetCreateOptions()
+ *    >>> opts.setChunkDims([128, 16])
+ *    >>> opts.setDeflate(6)
+ *    >>> opts.setShuffle(True)
+ *
+ *    # A chunked dataset can have unbounded dimensions without an external file
+ *    >>> d = DatasetFloat(f, "EXAMPLE_DATASET")
+ *    >>> d.create([256, 16], [-1, 16], options=opts)
+ *    <...>
+ *    >>> d.maxdims()
+ *    (-1, 16)
+ *
+ *    # Clean up
+ *    >>> import os
+ *    >>> os.remove("example.h5")
+ * \endcode
+ */
+class DatasetCreateOptions {
+public:
+  /*!
+   * When HDF5 writes the fill value into newly allocated storage:
+   *  - FILL_IFSET: only if a fill value has been set explicitly (HDF5 default)
+   *  - FILL_ALLOC: always, when storage is allocated
+   *  - FILL_NEVER: never; unwritten data is undefined, but allocation is cheaper
+   */
+  enum FillPolicy { FILL_IFSET = 0, FILL_ALLOC, FILL_NEVER };
+
+  DatasetCreateOptions(): _deflate(0), _shuffle(false), _fillPolicy(FILL_IFSET) {}
+
+  /*!
+   * Use chunked storage with chunks of `chunkDims` values. An empty vector selects
+   * contiguous storage. Otherwise, chunkDims.size() must equal the rank of the dataset.
+   */
+  void setChunkDims( const std::vector<ssize_t> &chunkDims ) { _chunkDims = chunkDims; }
+
+  //! Returns the chunk dimensions, or an empty vector for contiguous storage.
+  std::vector<ssize_t> chunkDims() const { return _chunkDims; }
+
+  //! Returns whether chunked storage is selected.
+  bool chunked() const { return !_chunkDims.empty(); }
+
+  /*!
+   * Compress each chunk using deflate (zlib) at `level` (1-9). 0 disables compression.
+   * Requires chunked storage.
+   */
+  void setDeflate( unsigned level ) { _deflate = level; }
+
+  unsigned deflate() const { return _deflate; }
+
+  /*!
+   * Reorder the bytes of each chunk before compression, which typically improves
+   * the compression ratio of numerical data. Requires chunked storage.
+   */
+  void setShuffle( bool shuffle ) { _shuffle = shuffle; }
+
+  bool shuffle() const { return _shuffle; }
+
+  //! Returns whether any filter (deflate, shuffle) is selected.
+  bool filtered() const { return _deflate > 0 || _shuffle; }
+
+  //! Set when HDF5 writes fill values. See FillPolicy.
+  void setFillPolicy( enum FillPolicy fillPolicy ) { _fillPolicy = fillPolicy; }
+
+  enum FillPolicy fillPolicy() const { return _fillPolicy; }
+
+private:
+  std::vector<ssize_t> _chunkDims;
+  unsigned _deflate;
+  bool _shuffle;
+  enum FillPolicy _fillPolicy;
+};
+
+}
+
+#endif
+
@@ -0,0 +1,73 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#include "FileAccessProfile.h"
+#include "../exceptions/exceptions.h"
+
+using namespace std;
+
+namespace dal {
+
+FileAccessProfile::FileAccessProfile()
+:
+  _driver(SEC2),
+  _coreIncrement(0),
+  _coreBackingStore(false),
+  _alignmentThreshold(0),
+  _alignment(0),
+  _metadataBlockSize(0),
+  _metadataCacheSize(0),
+  _sieveBufferSize(0),
+  _chunkCacheSize(0),
+  _chunkCacheSlots(0),
+  _chunkCachePreemption(0.75)
+{
+}
+
+FileAccessProfile::FileAccessProfile( const std::string &preset )
+{
+  // start from the HDF5 defaults
+  *this = FileAccessProfile();
+
+  const size_t KiB = 1024;
+  const size_t MiB = 1024 * KiB;
+
+  if (preset == "default") {
+    // nothing to tune
+  } else if (preset == "sequential-scan") {
+    _sieveBufferSize = 4 * MiB;
+    setChunkCache(64 * MiB, 10007, 1.0);
+  } else if (preset == "random-access") {
+    _sieveBufferSize = 64 * KiB;
+    setChunkCache(256 * MiB, 100003, 0.75);
+  } else if (preset == "metadata-only") {
+    _metadataCacheSize = 8 * MiB;
+    _sieveBufferSize = 4 * KiB;
+    setChunkCache(1, 1, 0.75);
+  } else if (preset == "lustre-ingest") {
+    setAlignment(64 * KiB, 1 * MiB);
+    _metadataBlockSize = 1 * MiB;
+    _sieveBufferSize = 16 * MiB;
+  } else if (preset == "in-memory") {
+    _driver = CORE;
+    setCoreIncrement(1 * MiB, false);
+  } else {
+    throw DALValueError("Unknown file access profile preset " + preset);
+  }
+}
+
+}
+
@@ -0,0 +1,164 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#ifndef DAL_FILE_ACCESS_PROFILE_H
+#define DAL_FILE_ACCESS_PROFILE_H
+
+#include <cstddef>
+#include <string>
+
+namespace dal {
+
+/*!
+ * HDF5 file access tuning to pass when opening or creating a File (or BF_File, TBB_File).
+ *
+ * By default, nothing is tuned, and HDF5 uses its own defaults. Settings of 0 also
+ * leave the HDF5 default in place. The named presets tune for common access patterns:
+ *  - "default":         HDF5 defaults
+ *  - "sequential-scan": reading (large parts of) datasets front to back: a large sieve
+ *                       buffer, and a chunk cache that first evicts fully read chunks
+ *  - "random-access":   reading small selections all over datasets: a large chunk cache
+ *                       with many slots, and a small sieve buffer
+ *  - "metadata-only":   reading attributes and group structure only (header tools):
+ *                       a larger metadata cache, and no chunk cache or sieve buffer to speak of
+ *  - "lustre-ingest":   writing to striped (parallel) file systems: objects aligned to 1 MiB
+ *                       stripes, and large metadata blocks and sieve buffer
+ *  - "in-memory":       keep the file in memory only (CORE driver without backing store),
+ *                       e.g. to build a file and retrieve it with File::fileImage()
+ *
+ * Python example:
+ * \code
+ *    # Create a new HDF5 file called "example.h5"
+ *    >>> f = File("example.h5", File.CREATE)
+ *    >>> del f
+ *
+ *    # Open it again, tuned for reading datasets front to back
+ *    >>> f = File("example.h5", File.READ, "", FileAccessProfile("sequential-scan"))
+ *    >>> del f
+ *
+ *    # Profiles can also be tuned one setting at a time
+ *    >>> profile = FileAccessProfile("random-access")
+ *    >>> profile.setSieveBufferSize(1024 * 1024)
+ *    >>> profile.sieveBufferSize()
+ *    1048576
+ *
+ *    # Clean up
+ *    >>> import os
+ *    >>> os.remove("example.h5")
+ * \endcode
+ */
+class FileAccessProfile {
+public:
+  /*!
+   * The HDF5 file driver (virtual file layer) to use:
+   *  - SEC2:  POSIX read()/write() (HDF5 default)
+   *  - STDIO: buffered C stdio
+   *  - CORE:  keep the file in memory, see setCoreIncrement()
+   */
+  enum Driver { SEC2 = 0, STDIO, CORE };
+
+  //! Use the HDF5 defaults for everything.
+  FileAccessProfile();
+
+  //! Use the named preset (see class description). Throws a DALValueError for an unknown name.
+  explicit FileAccessProfile( const std::string &preset );
+
+  void setDriver( enum Driver driver ) { _driver = driver; }
+
+  enum Driver driver() const { return _driver; }
+
+  /*!
+   * For the CORE driver: grow the memory image in steps of `increment` bytes, and
+   * whether to write the image to the file when it is closed (`backingStore`).
+   */
+  void setCoreIncrement( size_t increment, bool backingStore ) { _coreIncrement = increment; _coreBackingStore = backingStore; }
+
+  size_t coreIncrement() const { return _coreIncrement; }
+
+  bool coreBackingStore() const { return _coreBackingStore; }
+
+  /*!
+   * For the CORE driver: open the file from the bytes in `image` (as returned by
+   * File::fileImage()) instead of from the file system (H5Pset_file_image()).
+   * The file name is then only used if the backing store is enabled.
+   * An empty `image` (default) opens the file from the file system.
+   *
+   * A file image can only be opened with mode READ or READWRITE. Writes change
+   * the in-memory copy, not `image`.
+   */
+  void setFileImage( const std::string &image ) { _fileImage = image; }
+
+  const std::string &fileImage() const { return _fileImage; }
+
+  /*!
+   * Align objects of at least `threshold` bytes in the file at multiples of
+   * `alignment` bytes (H5Pset_alignment()), e.g. to the stripe size of the file system.
+   */
+  void setAlignment( size_t threshold, size_t alignment ) { _alignmentThreshold = threshold; _alignment = alignment; }
+
+  size_t alignmentThreshold() const { return _alignmentThreshold; }
+
+  size_t alignment() const { return _alignment; }
+
+  //! Allocate metadata in blocks of `size` bytes (H5Pset_meta_block_size()).
+  void setMetadataBlockSize( size_t size ) { _metadataBlockSize = size; }
+
+  size_t metadataBlockSize() const { return _metadataBlockSize; }
+
+  //! Start with (and allow at least) a metadata cache of `size` bytes (H5Pset_mdc_config()).
+  void setMetadataCacheSize( size_t size ) { _metadataCacheSize = size; }
+
+  size_t metadataCacheSize() const { return _metadataCacheSize; }
+
+  //! Buffer up to `size` bytes of contiguous raw data per access (H5Pset_sieve_buf_size()).
+  void setSieveBufferSize( size_t size ) { _sieveBufferSize = size; }
+
+  size_t sieveBufferSize() const { return _sieveBufferSize; }
+
+  /*!
+   * Cache up to `size` bytes of chunks per chunked dataset in `slots` hash slots
+   * (preferably a prime, about 100 times the number of chunks that fit in the cache),
+   * evicting fully read or written chunks first with `preemption` in [0.0, 1.0]
+   * (H5Pset_cache()). A `size` of 0 leaves the HDF5 default; use 1 to effectively
+   * disable the chunk cache.
+   */
+  void setChunkCache( size_t size, size_t slots, double preemption ) { _chunkCacheSize = size; _chunkCacheSlots = slots; _chunkCachePreemption = preemption; }
+
+  size_t chunkCacheSize() const { return _chunkCacheSize; }
+
+  size_t chunkCacheSlots() const { return _chunkCacheSlots; }
+
+  double chunkCachePreemption() const { return _chunkCachePreemption; }
+
+private:
+  enum Driver _driver;
+  size_t _coreIncrement;
+  bool _coreBackingStore;
+  std::string _fileImage;
+  size_t _alignmentThreshold;
+  size_t _alignment;
+  size_t _metadataBlockSize;
+  size_t _metadataCacheSize;
+  size_t _sieveBufferSize;
+  size_t _chunkCacheSize;
+  size_t _chunkCacheSlots;
+  double _chunkCachePreemption;
+};
+
+}
+
+#endif
+
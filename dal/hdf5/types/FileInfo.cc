@@ -83,11 +83,29 @@ void FileInfo::setFileVersion(const VersionType& newVersion) {
   ptr->fileVersion = newVersion;
 }
 
+unsigned long FileInfo::resizeCount() const {
+  return ptr->resizeCount;
+}
+
+void FileInfo::incResizeCount() {
+  ptr->resizeCount += 1;
+}
+
+AttributeCache& FileInfo::attributeCache() const {
+  return ptr->attributeCache;
+}
+
 int FileInfo::openOtherDirname(const std::string& filename) {
+#ifdef DAL_HDF5_EFILE_PREFIX
+  // HDF5 finds external data files itself: no need to keep a file descriptor around
+  (void)filename;
+  return -1;
+#else
   string dirName(getDirname(filename));
   if (dirName == ".")
     return -1;
   return ::open(dirName.c_str(), O_RDONLY);
+#endif
 }
 
 // static functions
@@ -113,7 +131,7 @@ std::string FileInfo::getDirname(const std::string& filename) {
 
 ////////////////////////////////////////////////////////////////////////////////
 
-FileInfoType::FileInfoType() : refCount(1), fdirfd(-1), fileMode(0) { }
+FileInfoType::FileInfoType() : refCount(1), fdirfd(-1), fileMode(0), resizeCount(0) { }
 
 FileInfoType::FileInfoType(const std::string& filename, int fdirfd,
                            FileInfo::FileMode fileMode, const std::string& versionAttrName)
@@ -122,6 +140,7 @@ FileInfoType::FileInfoType(const std::string& filename, int fdirfd,
 , fdirfd(fdirfd)
 , fileMode(fileMode)
 , versionAttrName(versionAttrName)
+, resizeCount(0)
 { }
 
 
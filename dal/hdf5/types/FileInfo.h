@@ -18,7 +18,17 @@
 #define DAL_FILE_INFO_H
 
 #include <string>
+#include <hdf5.h>
 #include "versiontype.h"
+#include "AttributeCache.h"
+
+/*
+ * HDF5 1.10+ can resolve external data files relative to the HDF5 file instead of the cwd
+ * (H5Pset_efile_prefix() with "${ORIGIN}"). DAL then does not need to change the cwd. See KI 1.
+ */
+#if H5_VERS_MAJOR > 1 || (H5_VERS_MAJOR == 1 && H5_VERS_MINOR >= 10)
+#define DAL_HDF5_EFILE_PREFIX
+#endif
 
 namespace dal {
 
@@ -52,6 +62,11 @@ public:
 
   void setFileVersion(const VersionType& newVersion);
 
+  unsigned long resizeCount() const;
+  void incResizeCount();
+
+  AttributeCache& attributeCache() const;
+
 
   static std::string getBasename(const std::string& filename);
   static std::string getDirname(const std::string& filename);
@@ -65,7 +80,8 @@ private:
  * and may be needed by any object in the HDF5 hierarchy.
  * Once set, this info cannot be changed.
  * An exception is fileVersion which is needed everywhere, but is also stored
- * as an attribute and thus may be changed.
+ * as an attribute and thus may be changed. Other exceptions are resizeCount,
+ * which is used to invalidate cached dataset extents, and the attribute cache.
  *
  * FileInfoType objects are reference counted using FileInfo to remain open until all
  * file objects have been closed (i.e. the moment HDF5 can close the file).
@@ -86,6 +102,7 @@ class FileInfoType {
   /*!
    * File descriptor of the directory of the file opened, or -1 if "." or failed to open.
    * Needed to work around an HDF5 issue related to external data sets and the cwd.
+   * Always -1 if DAL_HDF5_EFILE_PREFIX is defined.
    */
   const int fdirfd;
 
@@ -100,6 +117,13 @@ class FileInfoType {
   // Not initialized by the constructor, because we don't know for sure if the file is already open.
   VersionType fileVersion;
 
+  // Number of dataset resizes done through any object referring to this file.
+  // Dataset objects compare it against their own copy to detect stale cached extents.
+  unsigned long resizeCount;
+
+  // Attribute values read from this file, if enabled. Kept up to date by writes through DAL.
+  AttributeCache attributeCache;
+
 
   FileInfoType();
   FileInfoType(const std::string& filename, const int fdirfd,
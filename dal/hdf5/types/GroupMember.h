@@ -0,0 +1,69 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#ifndef DAL_GROUP_MEMBER_H
+#define DAL_GROUP_MEMBER_H
+
+#include <string>
+
+namespace dal {
+
+/*!
+ * The name and object type of a member of a group, as returned by Group::members().
+ *
+ * Python example:
+ * \code
+ *    # Create a new HDF5 file with some members
+ *    >>> f = File("example.h5", File.CREATE)
+ *    >>> g = Group(f, "GROUP").create()
+ *    >>> d = DatasetFloat(f, "DATASET").create([10])
+ *
+ *    # List them in one pass
+ *    >>> [(m.name(), m.type() == GroupMember.DATASET) for m in f.members()]
+ *    [('DATASET', True), ('GROUP', False)]
+ *
+ *    # Clean up
+ *    >>> import os
+ *    >>> os.remove("example.h5")
+ * \endcode
+ */
+class GroupMember {
+public:
+  /*!
+   * GROUP, DATASET and DATATYPE are the HDF5 object types of hard links.
+   * Soft and external links are not followed, and have type LINK.
+   */
+  enum Type { GROUP = 0, DATASET, DATATYPE, LINK, UNKNOWN };
+
+  GroupMember(): _type(UNKNOWN) {}
+
+  GroupMember( const std::string &name, enum Type type ): _name(name), _type(type) {}
+
+  //! Returns the name of the member.
+  std::string name() const { return _name; }
+
+  //! Returns the object type of the member.
+  enum Type type() const { return _type; }
+
+private:
+  std::string _name;
+  enum Type _type;
+};
+
+}
+
+#endif
+
@@ -0,0 +1,78 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#ifndef DAL_SHARED_PTR_H
+#define DAL_SHARED_PTR_H
+
+#include <algorithm>
+
+namespace dal {
+
+/*!
+ * A reference counted pointer: the object pointed to is deleted when the last
+ * SharedPtr to it is destructed. Like std::shared_ptr in C++11, but minimal,
+ * and not thread-safe (like the HDF5 objects it is used for).
+ */
+template<typename T> class SharedPtr {
+public:
+  //! Take ownership of `ptr` (which may be NULL).
+  explicit SharedPtr( T *ptr = 0 ): ptr(ptr), count(0) {
+    if (ptr) {
+      try {
+        count = new unsigned(1);
+      } catch (...) {
+        delete ptr;
+        throw;
+      }
+    }
+  }
+
+  SharedPtr( const SharedPtr<T> &other ): ptr(other.ptr), count(other.count) {
+    if (count)
+      ++*count;
+  }
+
+  ~SharedPtr() {
+    if (count && --*count == 0) {
+      delete ptr;
+      delete count;
+    }
+  }
+
+  SharedPtr<T> &operator=( SharedPtr<T> rhs ) {
+    std::swap(ptr, rhs.ptr);
+    std::swap(count, rhs.count);
+    return *this;
+  }
+
+  T *get() const { return ptr; }
+
+  T &operator*() const { return *ptr; }
+
+  T *operator->() const { return ptr; }
+
+  //! Returns the number of SharedPtr objects that share the object pointed to (0 if NULL).
+  unsigned useCount() const { return count ? *count : 0; }
+
+private:
+  T *ptr;
+  unsigned *count;
+};
+
+}
+
+#endif
+
@@ -0,0 +1,109 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#include "Snapshot.h"
+#include "../exceptions/exceptions.h"
+
+using namespace std;
+
+namespace dal {
+
+ObjectSnapshot::ObjectSnapshot( const std::string &path, enum GroupMember::Type type, const std::vector<ssize_t> &dims, const std::vector<AttributeData> &attributes )
+:
+  _path(path),
+  _type(type),
+  _dims(dims),
+  _attributes(attributes)
+{
+}
+
+string ObjectSnapshot::name() const
+{
+  const size_t slash = _path.rfind('/');
+
+  return slash == string::npos ? _path : _path.substr(slash + 1);
+}
+
+string ObjectSnapshot::parentPath() const
+{
+  const size_t slash = _path.rfind('/');
+
+  return slash == string::npos ? "" : _path.substr(0, slash);
+}
+
+bool ObjectSnapshot::hasAttribute( const std::string &name ) const
+{
+  for (vector<AttributeData>::const_iterator it(_attributes.begin()); it != _attributes.end(); ++it) {
+    if (it->name() == name)
+      return true;
+  }
+
+  return false;
+}
+
+const AttributeData &ObjectSnapshot::attribute( const std::string &name ) const
+{
+  for (vector<AttributeData>::const_iterator it(_attributes.begin()); it != _attributes.end(); ++it) {
+    if (it->name() == name)
+      return *it;
+  }
+
+  throw DALValueError("Could not find attribute " + name + " in snapshot of object " + _path);
+}
+
+Snapshot::Snapshot( const std::vector<ObjectSnapshot> &objects )
+:
+  _objects(objects)
+{
+  for (size_t i = 0; i < _objects.size(); i++) {
+    if (!index.insert(make_pair(_objects[i].path(), i)).second)
+      throw DALValueError("Could not add already existing object to snapshot: " + _objects[i].path());
+  }
+}
+
+bool Snapshot::contains( const std::string &path ) const
+{
+  return index.find(path) != index.end();
+}
+
+const ObjectSnapshot &Snapshot::object( const std::string &path ) const
+{
+  map<string, size_t>::const_iterator it(index.find(path));
+  if (it == index.end())
+    throw DALValueError("Could not find object in snapshot: " + path);
+
+  return _objects[it->second];
+}
+
+vector<ObjectSnapshot> Snapshot::members( const std::string &path ) const
+{
+  vector<ObjectSnapshot> result;
+
+  // a group precedes its members, so they are stored after it
+  map<string, size_t>::const_iterator it(index.find(path));
+  if (it == index.end())
+    return result;
+
+  for (size_t i = it->second + 1; i < _objects.size(); i++) {
+    if (_objects[i].path() != "" && _objects[i].parentPath() == path)
+      result.push_back(_objects[i]);
+  }
+
+  return result;
+}
+
+}
+
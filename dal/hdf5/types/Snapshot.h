@@ -0,0 +1,146 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#ifndef DAL_SNAPSHOT_H
+#define DAL_SNAPSHOT_H
+
+#include <cstddef>
+#include <string>
+#include <vector>
+#include <map>
+#include <sys/types.h>
+#include "AttributeData.h"
+#include "GroupMember.h"
+
+namespace dal {
+
+/*!
+ * The metadata of a single group or dataset in a Snapshot: its path, object type,
+ * attributes, and (for datasets) dimensions.
+ */
+class ObjectSnapshot {
+public:
+  ObjectSnapshot(): _type(GroupMember::UNKNOWN) {}
+
+#ifndef SWIG
+  ObjectSnapshot( const std::string &path, enum GroupMember::Type type, const std::vector<ssize_t> &dims, const std::vector<AttributeData> &attributes );
+#endif
+
+  /*!
+   * Returns the path of the object relative to the group the snapshot was taken of,
+   * for example "STATION_CS001/001000000". The group itself has path "".
+   */
+  std::string path() const { return _path; }
+
+  //! Returns the last component of path(), or "" for the group the snapshot was taken of.
+  std::string name() const;
+
+  //! Returns the path of the group containing this object, or "" for direct members.
+  std::string parentPath() const;
+
+  //! Returns the HDF5 object type (GROUP, DATASET or DATATYPE).
+  enum GroupMember::Type type() const { return _type; }
+
+  //! Returns the dimensions of a dataset, or an empty vector for other objects.
+  const std::vector<ssize_t> &dims() const { return _dims; }
+
+  //! Returns all attributes of the object, ordered by name.
+  const std::vector<AttributeData> &attributes() const { return _attributes; }
+
+  //! Returns whether the object has an attribute `name`.
+  bool hasAttribute( const std::string &name ) const;
+
+  //! Returns attribute `name`. Throws a DALValueError if it does not exist.
+  const AttributeData &attribute( const std::string &name ) const;
+
+private:
+  std::string _path;
+  enum GroupMember::Type _type;
+  std::vector<ssize_t> _dims;
+  std::vector<AttributeData> _attributes;
+};
+
+/*!
+ * An immutable copy of the metadata (attributes and dataset dimensions) of a group and
+ * everything below it, as returned by Group::snapshot(). It is read in a single traversal
+ * of the file, after which it can be queried without any further HDF5 calls.
+ *
+ * Objects are stored in the order they were visited, in which a group always precedes
+ * its members. The first object is the group the snapshot was taken of.
+ *
+ * Python example:
+ * \code
+ *    # Create a new HDF5 file with some structure
+ *    >>> f = File("example.h5", File.CREATE)
+ *    >>> g = Group(f, "GROUP").create()
+ *    >>> AttributeString(g, "EXAMPLE_STRING").value = "hello world!"
+ *    >>> d = DatasetFloat(g, "DATASET").create([10])
+ *
+ *    # In Python, snapshot() returns nested dicts
+ *    >>> s = f.snapshot()
+ *    >>> s["members"]["GROUP"]["attrs"]
+ *    {'EXAMPLE_STRING': 'hello world!'}
+ *    >>> s["members"]["GROUP"]["members"]["DATASET"]["dims"]
+ *    [10]
+ *
+ *    # which can be stored as JSON
+ *    >>> import json
+ *    >>> json.loads(json.dumps(s))["members"]["GROUP"]["type"]
+ *    u'GROUP'
+ *
+ *    # Clean up
+ *    >>> import os
+ *    >>> os.remove("example.h5")
+ * \endcode
+ */
+class Snapshot {
+public:
+  Snapshot() {}
+
+#ifndef SWIG
+  /*!
+   * Creates a snapshot of `objects`, in which each group precedes its members.
+   * Throws a DALValueError if a path occurs twice.
+   */
+  explicit Snapshot( const std::vector<ObjectSnapshot> &objects );
+#endif
+
+  //! Returns all objects, in the order described above.
+  const std::vector<ObjectSnapshot> &objects() const { return _objects; }
+
+  //! Returns the number of objects.
+  size_t size() const { return _objects.size(); }
+
+  //! Returns whether an object with path `path` exists.
+  bool contains( const std::string &path ) const;
+
+  //! Returns the object with path `path`. Throws a DALValueError if it does not exist.
+  const ObjectSnapshot &object( const std::string &path ) const;
+
+  //! Returns the direct members of the group with path `path`, ordered by name.
+  std::vector<ObjectSnapshot> members( const std::string &path ) const;
+
+private:
+  std::vector<ObjectSnapshot> _objects;
+
+  //! Maps paths to indices in _objects.
+  std::map<std::string, size_t> index;
+};
+
+}
+
+#endif
+
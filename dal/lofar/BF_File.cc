@@ -22,19 +22,19 @@ namespace dal {
 
 BF_File::BF_File() {}
 
-BF_File::BF_File( const std::string &filename, FileMode mode )
+BF_File::BF_File( const std::string &filename, FileMode mode, const FileAccessProfile &profile )
 :
-  CLA_File(filename, mode)
+  CLA_File(filename, mode, profile)
 {
   openFile(mode);
 }
 
 BF_File::~BF_File() {}
 
-void BF_File::open( const std::string &filename, FileMode mode )
+void BF_File::open( const std::string &filename, FileMode mode, const FileAccessProfile &profile )
 {
   // As long as we have no member vars, keep open() and close() simple. See CLA_File::open().
-  CLA_File::open(filename, mode);
+  CLA_File::open(filename, mode, profile);
 
   openFile(mode);
 }
@@ -46,8 +46,6 @@ void BF_File::close()
 
 void BF_File::openFile( FileMode mode )
 {
-  initFileNodes();
-
   if (mode == CREATE || mode == CREATE_EXCL) {
     fileType().create().set("bf");
     docName() .create().set("ICD 3: Beam-Formed Data");
@@ -64,22 +62,24 @@ void BF_File::openFile( FileMode mode )
   }
 }
 
-void BF_File::initFileNodes() {
-  CLA_File::initNodes();
-  addNode( new Attribute<string>(*this, "CREATE_OFFLINE_ONLINE") );
-  addNode( new Attribute<string>(*this, "BF_FORMAT") );
-  addNode( new Attribute<string>(*this, "BF_VERSION") );
-  addNode( new Attribute<double>(*this, "TOTAL_INTEGRATION_TIME") );
-  addNode( new Attribute<string>(*this, "TOTAL_INTEGRATION_TIME_UNIT") );
-  addNode( new Attribute<string>(*this, "OBSERVATION_DATATYPE") );
-  addNode( new Attribute<double>(*this, "SUB_ARRAY_POINTING_DIAMETER") );
-  addNode( new Attribute<string>(*this, "SUB_ARRAY_POINTING_DIAMETER_UNIT") );
-  addNode( new Attribute<double>(*this, "BANDWIDTH") );
-  addNode( new Attribute<string>(*this, "BANDWIDTH_UNIT") );
-  addNode( new Attribute<double>(*this, "BEAM_DIAMETER") );
-  addNode( new Attribute<string>(*this, "BEAM_DIAMETER_UNIT") );
-  addNode( new Attribute<unsigned>(*this, "OBSERVATION_NOF_SUB_ARRAY_POINTINGS") );
-  addNode( new Attribute<unsigned>(*this, "NOF_SUB_ARRAY_POINTINGS") );
+const NodeSchema &BF_File::nodeSchema() const {
+  static const NodeSchema schema = NodeSchema(CLA_File::nodeSchema())
+    .add< Attribute<string> >("CREATE_OFFLINE_ONLINE")
+    .add< Attribute<string> >("BF_FORMAT")
+    .add< Attribute<string> >("BF_VERSION")
+    .add< Attribute<double> >("TOTAL_INTEGRATION_TIME")
+    .add< Attribute<string> >("TOTAL_INTEGRATION_TIME_UNIT")
+    .add< Attribute<string> >("OBSERVATION_DATATYPE")
+    .add< Attribute<double> >("SUB_ARRAY_POINTING_DIAMETER")
+    .add< Attribute<string> >("SUB_ARRAY_POINTING_DIAMETER_UNIT")
+    .add< Attribute<double> >("BANDWIDTH")
+    .add< Attribute<string> >("BANDWIDTH_UNIT")
+    .add< Attribute<double> >("BEAM_DIAMETER")
+    .add< Attribute<string> >("BEAM_DIAMETER_UNIT")
+    .add< Attribute<unsigned> >("OBSERVATION_NOF_SUB_ARRAY_POINTINGS")
+    .add< Attribute<unsigned> >("NOF_SUB_ARRAY_POINTINGS");
+
+  return schema;
 }
 
 Attribute<string> BF_File::createOfflineOnline()
@@ -178,24 +178,26 @@ BF_SubArrayPointing::BF_SubArrayPointing( Group &parent, const std::string &name
 {
 }
 
-void BF_SubArrayPointing::initNodes() {
-  Group::initNodes();
-  addNode( new Attribute<string>(*this, "EXPTIME_START_UTC") );
-  addNode( new Attribute<string>(*this, "EXPTIME_END_UTC") );
-  addNode( new Attribute<double>(*this, "EXPTIME_START_MJD") );
-  addNode( new Attribute<double>(*this, "EXPTIME_END_MJD") );
-  addNode( new Attribute<double>(*this, "TOTAL_INTEGRATION_TIME") );
-  addNode( new Attribute<string>(*this, "TOTAL_INTEGRATION_TIME_UNIT") );
-  addNode( new Attribute<double>(*this, "POINT_RA") );
-  addNode( new Attribute<string>(*this, "POINT_RA_UNIT") );
-  addNode( new Attribute<double>(*this, "POINT_DEC") );
-  addNode( new Attribute<string>(*this, "POINT_DEC_UNIT") );
-  addNode( new Attribute< vector<double> >(*this, "POINT_ALTITUDE") );
-  addNode( new Attribute< vector<string> >(*this, "POINT_ALTITUDE_UNIT") );
-  addNode( new Attribute< vector<double> >(*this, "POINT_AZIMUTH") );
-  addNode( new Attribute< vector<string> >(*this, "POINT_AZIMUTH_UNIT") );
-  addNode( new Attribute<unsigned>(*this, "OBSERVATION_NOF_BEAMS") );
-  addNode( new Attribute<unsigned>(*this, "NOF_BEAMS") );
+const NodeSchema &BF_SubArrayPointing::nodeSchema() const {
+  static const NodeSchema schema = NodeSchema(Group::nodeSchema())
+    .add< Attribute<string> >("EXPTIME_START_UTC")
+    .add< Attribute<string> >("EXPTIME_END_UTC")
+    .add< Attribute<double> >("EXPTIME_START_MJD")
+    .add< Attribute<double> >("EXPTIME_END_MJD")
+    .add< Attribute<double> >("TOTAL_INTEGRATION_TIME")
+    .add< Attribute<string> >("TOTAL_INTEGRATION_TIME_UNIT")
+    .add< Attribute<double> >("POINT_RA")
+    .add< Attribute<string> >("POINT_RA_UNIT")
+    .add< Attribute<double> >("POINT_DEC")
+    .add< Attribute<string> >("POINT_DEC_UNIT")
+    .add< Attribute< vector<double> > >("POINT_ALTITUDE")
+    .add< Attribute< vector<string> > >("POINT_ALTITUDE_UNIT")
+    .add< Attribute< vector<double> > >("POINT_AZIMUTH")
+    .add< Attribute< vector<string> > >("POINT_AZIMUTH_UNIT")
+    .add< Attribute<unsigned> >("OBSERVATION_NOF_BEAMS")
+    .add< Attribute<unsigned> >("NOF_BEAMS");
+
+  return schema;
 }
 
 Attribute<string> BF_SubArrayPointing::expTimeStartUTC()
@@ -303,48 +305,50 @@ BF_BeamGroup::BF_BeamGroup( Group &parent, const std::string &name )
 {
 }
 
-void BF_BeamGroup::initNodes() {
-  Group::initNodes();
-  addNode( new Attribute< vector<string> >(*this, "TARGETS") );
-  addNode( new Attribute<unsigned>(*this, "NOF_STATIONS") );
-  addNode( new Attribute< vector<string> >(*this, "STATIONS_LIST") );
-  addNode( new Attribute<unsigned>(*this, "NOF_SAMPLES") );
-  addNode( new Attribute<double>(*this, "SAMPLING_RATE") );
-  addNode( new Attribute<string>(*this, "SAMPLING_RATE_UNIT") );
-  addNode( new Attribute<double>(*this, "SAMPLING_TIME") );
-  addNode( new Attribute<string>(*this, "SAMPLING_TIME_UNIT") );
-  addNode( new Attribute<unsigned>(*this, "CHANNELS_PER_SUBBAND") );
-  addNode( new Attribute<double>(*this, "SUBBAND_WIDTH") );
-  addNode( new Attribute<string>(*this, "SUBBAND_WIDTH_UNIT") );
-  addNode( new Attribute<double>(*this, "CHANNEL_WIDTH") );
-  addNode( new Attribute<string>(*this, "CHANNEL_WIDTH_UNIT") );
-  addNode( new Attribute<string>(*this, "TRACKING") );
-  addNode( new Attribute<double>(*this, "POINT_RA") );
-  addNode( new Attribute<string>(*this, "POINT_RA_UNIT") );
-  addNode( new Attribute<double>(*this, "POINT_DEC") );
-  addNode( new Attribute<string>(*this, "POINT_DEC_UNIT") );
-  addNode( new Attribute<double>(*this, "POINT_OFFSET_RA") );
-  addNode( new Attribute<string>(*this, "POINT_OFFSET_RA_UNIT") );
-  addNode( new Attribute<double>(*this, "POINT_OFFSET_DEC") );
-  addNode( new Attribute<string>(*this, "POINT_OFFSET_DEC_UNIT") );
-  addNode( new Attribute<double>(*this, "BEAM_DIAMETER_RA") );
-  addNode( new Attribute<string>(*this, "BEAM_DIAMETER_RA_UNIT") );
-  addNode( new Attribute<double>(*this, "BEAM_DIAMETER_DEC") );
-  addNode( new Attribute<string>(*this, "BEAM_DIAMETER_DEC_UNIT") );
-  addNode( new Attribute<double>(*this, "BEAM_FREQUENCY_CENTER") );
-  addNode( new Attribute<string>(*this, "BEAM_FREQUENCY_CENTER_UNIT") );
-  addNode( new Attribute<bool>(*this, "FOLDED_DATA") );
-  addNode( new Attribute<double>(*this, "FOLD_PERIOD") );
-  addNode( new Attribute<string>(*this, "FOLD_PERIOD_UNIT") );
-  addNode( new Attribute<string>(*this, "DEDISPERSION") );
-  addNode( new Attribute<double>(*this, "DISPERSION_MEASURE") );
-  addNode( new Attribute<string>(*this, "DISPERSION_MEASURE_UNIT") );
-  addNode( new Attribute<bool>(*this, "BARYCENTERED") );
-  addNode( new Attribute<unsigned>(*this, "OBSERVATION_NOF_STOKES") );
-  addNode( new Attribute<unsigned>(*this, "NOF_STOKES") );
-  addNode( new Attribute< vector<string> >(*this, "STOKES_COMPONENTS") );
-  addNode( new Attribute<bool>(*this, "COMPLEX_VOLTAGE") );
-  addNode( new Attribute<string>(*this, "SIGNAL_SUM") );
+const NodeSchema &BF_BeamGroup::nodeSchema() const {
+  static const NodeSchema schema = NodeSchema(Group::nodeSchema())
+    .add< Attribute< vector<string> > >("TARGETS")
+    .add< Attribute<unsigned> >("NOF_STATIONS")
+    .add< Attribute< vector<string> > >("STATIONS_LIST")
+    .add< Attribute<unsigned> >("NOF_SAMPLES")
+    .add< Attribute<double> >("SAMPLING_RATE")
+    .add< Attribute<string> >("SAMPLING_RATE_UNIT")
+    .add< Attribute<double> >("SAMPLING_TIME")
+    .add< Attribute<string> >("SAMPLING_TIME_UNIT")
+    .add< Attribute<unsigned> >("CHANNELS_PER_SUBBAND")
+    .add< Attribute<double> >("SUBBAND_WIDTH")
+    .add< Attribute<string> >("SUBBAND_WIDTH_UNIT")
+    .add< Attribute<double> >("CHANNEL_WIDTH")
+    .add< Attribute<string> >("CHANNEL_WIDTH_UNIT")
+    .add< Attribute<string> >("TRACKING")
+    .add< Attribute<double> >("POINT_RA")
+    .add< Attribute<string> >("POINT_RA_UNIT")
+    .add< Attribute<double> >("POINT_DEC")
+    .add< Attribute<string> >("POINT_DEC_UNIT")
+    .add< Attribute<double> >("POINT_OFFSET_RA")
+    .add< Attribute<string> >("POINT_OFFSET_RA_UNIT")
+    .add< Attribute<double> >("POINT_OFFSET_DEC")
+    .add< Attribute<string> >("POINT_OFFSET_DEC_UNIT")
+    .add< Attribute<double> >("BEAM_DIAMETER_RA")
+    .add< Attribute<string> >("BEAM_DIAMETER_RA_UNIT")
+    .add< Attribute<double> >("BEAM_DIAMETER_DEC")
+    .add< Attribute<string> >("BEAM_DIAMETER_DEC_UNIT")
+    .add< Attribute<double> >("BEAM_FREQUENCY_CENTER")
+    .add< Attribute<string> >("BEAM_FREQUENCY_CENTER_UNIT")
+    .add< Attribute<bool> >("FOLDED_DATA")
+    .add< Attribute<double> >("FOLD_PERIOD")
+    .add< Attribute<string> >("FOLD_PERIOD_UNIT")
+    .add< Attribute<string> >("DEDISPERSION")
+    .add< Attribute<double> >("DISPERSION_MEASURE")
+    .add< Attribute<string> >("DISPERSION_MEASURE_UNIT")
+    .add< Attribute<bool> >("BARYCENTERED")
+    .add< Attribute<unsigned> >("OBSERVATION_NOF_STOKES")
+    .add< Attribute<unsigned> >("NOF_STOKES")
+    .add< Attribute< vector<string> > >("STOKES_COMPONENTS")
+    .add< Attribute<bool> >("COMPLEX_VOLTAGE")
+    .add< Attribute<string> >("SIGNAL_SUM");
+
+  return schema;
 }
 
 Attribute< vector<string> > BF_BeamGroup::targets()
@@ -582,14 +586,16 @@ BF_StokesDataset::BF_StokesDataset( Group &parent, const std::string &name )
 {
 }
 
-void BF_StokesDataset::initNodes()
+const NodeSchema &BF_StokesDataset::nodeSchema() const
 {
-  Dataset<float>::initNodes();
-  addNode( new Attribute<string>(*this, "DATATYPE") );
-  addNode( new Attribute<string>(*this, "STOKES_COMPONENT") );
-  addNode( new Attribute< vector<unsigned> >(*this, "NOF_CHANNELS") );
-  addNode( new Attribute<unsigned>(*this, "NOF_SUBBANDS") );
-  addNode( new Attribute<unsigned>(*this, "NOF_SAMPLES") );
+  static const NodeSchema schema = NodeSchema(Dataset<float>::nodeSchema())
+    .add< Attribute<string> >("DATATYPE")
+    .add< Attribute<string> >("STOKES_COMPONENT")
+    .add< Attribute< vector<unsigned> > >("NOF_CHANNELS")
+    .add< Attribute<unsigned> >("NOF_SUBBANDS")
+    .add< Attribute<unsigned> >("NOF_SAMPLES");
+
+  return schema;
 }
 
 Attribute<string> BF_StokesDataset::dataType()
@@ -43,11 +43,11 @@ public:
   /*!
    * Open `filename` for reading/writing/creation.
    */
-  BF_File( const std::string &filename, FileMode mode = READ );
+  BF_File( const std::string &filename, FileMode mode = READ, const FileAccessProfile &profile = FileAccessProfile() );
 
   virtual ~BF_File();
 
-  virtual void open( const std::string &filename, FileMode mode = READ );
+  virtual void open( const std::string &filename, FileMode mode = READ, const FileAccessProfile &profile = FileAccessProfile() );
   virtual void close();
 
   Attribute<std::string>  createOfflineOnline();
@@ -75,9 +75,10 @@ public:
 protected:
   std::string             subArrayPointingName( unsigned nr );
 
+  virtual const NodeSchema &nodeSchema() const;
+
 private:
   void                    openFile( FileMode mode );
-  void                    initFileNodes();
 };
 
 class BF_SysLog: public Group {
@@ -123,7 +124,7 @@ public:
 protected:
   std::string             beamName( unsigned nr );
 
-  virtual void            initNodes();
+  virtual const NodeSchema &nodeSchema() const;
 };
 
 class BF_BeamGroup: public Group {
@@ -194,7 +195,7 @@ protected:
   std::string             stokesName( unsigned nr );
   std::string             coordinatesName();
 
-  virtual void            initNodes();
+  virtual const NodeSchema &nodeSchema() const;
 };
 
 class BF_StokesDataset: public Dataset<float> {
@@ -209,7 +210,7 @@ public:
   Attribute<unsigned>     nofSamples();
 
 protected:
-  virtual void            initNodes();
+  virtual const NodeSchema &nodeSchema() const;
 };
 
 }
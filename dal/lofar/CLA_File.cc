@@ -30,19 +30,19 @@ namespace dal {
 
 CLA_File::CLA_File() {}
 
-CLA_File::CLA_File( const std::string &filename, FileMode mode )
+CLA_File::CLA_File( const std::string &filename, FileMode mode, const FileAccessProfile &profile )
 :
-  File(filename, mode, "DOC_VERSION")
+  File(filename, mode, "DOC_VERSION", profile)
 {
   openFile(filename, mode);
 }
 
 CLA_File::~CLA_File() {}
 
-void CLA_File::open( const std::string &filename, FileMode mode )
+void CLA_File::open( const std::string &filename, FileMode mode, const FileAccessProfile &profile )
 {
   // As long as we have no member vars, keep open() and close() simple. See File::open().
-  File::open(filename, mode, "DOC_VERSION");
+  File::open(filename, mode, "DOC_VERSION", profile);
 
   openFile(filename, mode);
 }
@@ -54,8 +54,6 @@ void CLA_File::close()
 
 void CLA_File::openFile( const std::string &filename, FileMode mode )
 {
-  initFileNodes();
-
   if (mode == CREATE || mode == CREATE_EXCL) {
     telescope().create().set("LOFAR");
     fileName().create().set(FileInfo::getBasename(File::filename()));
@@ -72,41 +70,42 @@ void CLA_File::openFile( const std::string &filename, FileMode mode )
   }
 }
 
-void CLA_File::initFileNodes()
-{
-  //addNode( new Attribute<string>(*this, "GROUPTYPE") ); // already added by Group
-  addNode( new Attribute<string>(*this, "FILENAME") );
-  addNode( new Attribute<string>(*this, "FILEDATE") );
-  addNode( new Attribute<string>(*this, "FILETYPE") );
-  addNode( new Attribute<string>(*this, "TELESCOPE") );
-  addNode( new Attribute<string>(*this, "PROJECT_ID") );
-  addNode( new Attribute<string>(*this, "PROJECT_TITLE") );
-  addNode( new Attribute<string>(*this, "PROJECT_PI") );
-  addNode( new Attribute<string>(*this, "PROJECT_CO_I") );
-  addNode( new Attribute<string>(*this, "PROJECT_CONTACT") );
-  addNode( new Attribute<string>(*this, "OBSERVATION_ID") );
-  addNode( new Attribute<string>(*this, "OBSERVATION_START_UTC") );
-  addNode( new Attribute<double>(*this, "OBSERVATION_START_MJD") );
-  addNode( new Attribute<string>(*this, "OBSERVATION_END_UTC") );
-  addNode( new Attribute<double>(*this, "OBSERVATION_END_MJD") );
-  addNode( new Attribute<unsigned>(*this, "OBSERVATION_NOF_STATIONS") );
-  addNode( new Attribute< vector<string> >(*this, "OBSERVATION_STATIONS_LIST") );
-  addNode( new Attribute<double>(*this, "OBSERVATION_FREQUENCY_MIN") );
-  addNode( new Attribute<double>(*this, "OBSERVATION_FREQUENCY_CENTER") );
-  addNode( new Attribute<double>(*this, "OBSERVATION_FREQUENCY_MAX") );
-  addNode( new Attribute<string>(*this, "OBSERVATION_FREQUENCY_UNIT") );
-  addNode( new Attribute<unsigned>(*this, "OBSERVATION_NOF_BITS_PER_SAMPLE") );
-  addNode( new Attribute<double>(*this, "CLOCK_FREQUENCY") );
-  addNode( new Attribute<string>(*this, "CLOCK_FREQUENCY_UNIT") );
-  addNode( new Attribute<string>(*this, "ANTENNA_SET") );
-  addNode( new Attribute<string>(*this, "FILTER_SELECTION") );
-  addNode( new Attribute< vector<string> >(*this, "TARGETS") );
-  addNode( new Attribute<string>(*this, "SYSTEM_VERSION") );
-  addNode( new Attribute<string>(*this, "PIPELINE_NAME") );
-  addNode( new Attribute<string>(*this, "PIPELINE_VERSION") );
-  addNode( new Attribute<string>(*this, "DOC_NAME") );
-  //addNode( new Attribute<VersionType>(*this, "DOC_VERSION") ); // already added by File
-  addNode( new Attribute<string>(*this, "NOTES") );
+const NodeSchema &CLA_File::nodeSchema() const
+{
+  static const NodeSchema schema = NodeSchema(File::nodeSchema())
+    .add< Attribute<string> >("FILENAME")
+    .add< Attribute<string> >("FILEDATE")
+    .add< Attribute<string> >("FILETYPE")
+    .add< Attribute<string> >("TELESCOPE")
+    .add< Attribute<string> >("PROJECT_ID")
+    .add< Attribute<string> >("PROJECT_TITLE")
+    .add< Attribute<string> >("PROJECT_PI")
+    .add< Attribute<string> >("PROJECT_CO_I")
+    .add< Attribute<string> >("PROJECT_CONTACT")
+    .add< Attribute<string> >("OBSERVATION_ID")
+    .add< Attribute<string> >("OBSERVATION_START_UTC")
+    .add< Attribute<double> >("OBSERVATION_START_MJD")
+    .add< Attribute<string> >("OBSERVATION_END_UTC")
+    .add< Attribute<double> >("OBSERVATION_END_MJD")
+    .add< Attribute<unsigned> >("OBSERVATION_NOF_STATIONS")
+    .add< Attribute< vector<string> > >("OBSERVATION_STATIONS_LIST")
+    .add< Attribute<double> >("OBSERVATION_FREQUENCY_MIN")
+    .add< Attribute<double> >("OBSERVATION_FREQUENCY_CENTER")
+    .add< Attribute<double> >("OBSERVATION_FREQUENCY_MAX")
+    .add< Attribute<string> >("OBSERVATION_FREQUENCY_UNIT")
+    .add< Attribute<unsigned> >("OBSERVATION_NOF_BITS_PER_SAMPLE")
+    .add< Attribute<double> >("CLOCK_FREQUENCY")
+    .add< Attribute<string> >("CLOCK_FREQUENCY_UNIT")
+    .add< Attribute<string> >("ANTENNA_SET")
+    .add< Attribute<string> >("FILTER_SELECTION")
+    .add< Attribute< vector<string> > >("TARGETS")
+    .add< Attribute<string> >("SYSTEM_VERSION")
+    .add< Attribute<string> >("PIPELINE_NAME")
+    .add< Attribute<string> >("PIPELINE_VERSION")
+    .add< Attribute<string> >("DOC_NAME")
+    .add< Attribute<string> >("NOTES");
+
+  return schema;
 }
 
 /*!
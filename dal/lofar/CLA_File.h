@@ -34,11 +34,11 @@ namespace dal {
 class CLA_File: public File {
 public:
   CLA_File();
-  CLA_File( const std::string &filename, FileMode mode = READ );
+  CLA_File( const std::string &filename, FileMode mode = READ, const FileAccessProfile &profile = FileAccessProfile() );
 
   virtual ~CLA_File();
 
-  void open( const std::string &filename, FileMode mode = READ );
+  void open( const std::string &filename, FileMode mode = READ, const FileAccessProfile &profile = FileAccessProfile() );
   virtual void close();
 
   Attribute<std::string> fileName();
@@ -88,9 +88,10 @@ protected:
   std::string             formatFilenameTimestamp( const struct timeval& tv, const char* output_format,
                                                   const char* output_format_secs, size_t output_size ) const;
 
+  virtual const NodeSchema &nodeSchema() const;
+
 private:
   void                    openFile( const std::string &filename, FileMode mode );
-  void                    initFileNodes();
 };
 
 }
@@ -15,6 +15,10 @@
  * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
  */
 #include "Coordinates.h"
+#include "../hdf5/exceptions/exceptions.h"
+
+#include <algorithm>
+#include <functional>
 
 using namespace std;
 
@@ -62,6 +66,9 @@ Attribute<unsigned> CoordinatesGroup::nofAxes()
 
 Attribute< vector<string> > CoordinatesGroup::coordinateTypes()
 {
+  // the caller can change the types through the returned attribute, so check them on next use
+  coordinateTypesLoaded = false;
+
   return Attribute< vector<string> >(*this, "COORDINATE_TYPES");
 }
 
@@ -73,17 +80,43 @@ string CoordinatesGroup::coordinateName( unsigned nr )
   return string(buf);
 }
 
+void CoordinatesGroup::loadCoordinateTypes()
+{
+  if (coordinateTypesLoaded)
+    return;
+
+  // not through coordinateTypes(), which would mark the types as not loaded again
+  Attribute< vector<string> > attr(*this, "COORDINATE_TYPES");
+  vector<string> types;
+
+  if (attr.exists())
+    types = attr.get();
+
+  // keep the coordinate objects, unless the types changed
+  if (types != coordinateTypesCache) {
+    coordinateTypesCache.swap(types);
+    coordinateCache.clear();
+    coordinateCache.resize(coordinateTypesCache.size());
+  }
+
+  coordinateTypesLoaded = true;
+}
+
 string CoordinatesGroup::coordinateType( unsigned nr )
 {
-  if (!coordinateTypes().exists())
+  loadCoordinateTypes();
+
+  if (nr >= coordinateTypesCache.size())
     return "";
 
-  const vector<string> types = coordinateTypes().get();
+  return coordinateTypesCache[nr];
+}
 
-  if (nr >= types.size())
-    return "";
+size_t CoordinatesGroup::nrCoordinates()
+{
+  loadCoordinateTypes();
 
-  return types[nr];
+  return coordinateTypesCache.size();
 }
 
 Coordinate *CoordinatesGroup::coordinate( unsigned nr )
@@ -107,6 +140,27 @@ Coordinate *CoordinatesGroup::coordinate( unsigned nr )
   return new Coordinate(*this, name);
 }
 
+SharedPtr<Coordinate> CoordinatesGroup::coordinatePtr( unsigned nr )
+{
+  if (nr >= nrCoordinates())
+    throw DALIndexError("Cannot get coordinate beyond the number of coordinates in " + _name);
+
+  if (!coordinateCache[nr].get())
+    coordinateCache[nr] = SharedPtr<Coordinate>(coordinate(nr));
+
+  return coordinateCache[nr];
+}
+
+vector< SharedPtr<Coordinate> > CoordinatesGroup::coordinates()
+{
+  const size_t n = nrCoordinates();
+
+  for (size_t i = 0; i < n; i++)
+    coordinatePtr(i);
+
+  return coordinateCache;
+}
+
 Attribute<string> Coordinate::coordinateType()
 {
   return Attribute<string>(*this, "COORDINATE_TYPE");
@@ -168,6 +222,126 @@ Attribute< vector<double> > NumericalCoordinate::axisValuesWorld()
 }
 
 
+bool NumericalCoordinate::tabular()
+{
+  if (storageType().exists()) {
+    const vector<string> types = storageType().get();
+
+    if (!types.empty())
+      return types[0] == "Tabular";
+  }
+
+  return axisValuesPixel().exists();
+}
+
+void NumericalCoordinate::loadAxis()
+{
+  if (axisLoaded)
+    return;
+
+  axisTabular = tabular();
+
+  if (axisTabular) {
+    const vector<unsigned> pixels = axisValuesPixel().get();
+    vector<double> worlds = axisValuesWorld().get();
+
+    if (pixels.empty() || pixels.size() != worlds.size())
+      throw DALValueError("Cannot convert coordinates without matching pixel and world values of tabular coordinate " + _name);
+
+    vector<double> dpixels(pixels.begin(), pixels.end());
+
+    if (adjacent_find(dpixels.begin(), dpixels.end(), greater_equal<double>()) != dpixels.end())
+      throw DALValueError("Cannot convert coordinates if pixel values are not strictly increasing for tabular coordinate " + _name);
+
+    axisPixels.swap(dpixels);
+    axisWorlds.swap(worlds);
+
+    if (adjacent_find(axisWorlds.begin(), axisWorlds.end(), greater_equal<double>()) == axisWorlds.end()) {
+      inverseWorlds = axisWorlds;
+      inversePixels = axisPixels;
+    } else if (adjacent_find(axisWorlds.begin(), axisWorlds.end(), less_equal<double>()) == axisWorlds.end()) {
+      inverseWorlds.assign(axisWorlds.rbegin(), axisWorlds.rend());
+      inversePixels.assign(axisPixels.rbegin(), axisPixels.rend());
+    }
+  } else {
+    axisReferenceValue = referenceValue().get();
+    axisReferencePixel = referencePixel().get();
+    axisIncrement      = increment().get();
+
+    if (pc().exists()) {
+      const vector<double> matrix = pc().get();
+
+      if (matrix.size() == 1)
+        axisIncrement *= matrix[0];
+    }
+
+    if (axisIncrement == 0.0)
+      throw DALValueError("Cannot convert coordinates with an increment of 0 for linear coordinate " + _name);
+  }
+
+  axisLoaded = true;
+}
+
+/*
+ * Maps the `len` values in `values` from the strictly increasing table `from` onto table `to`,
+ * in place, interpolating linearly between, and extrapolating beyond, the table entries.
+ */
+static void interpolate( const vector<double> &from, const vector<double> &to, double *values, size_t len )
+{
+  const size_t n = from.size();
+
+  if (n == 1) {
+    fill(values, values + len, to[0]);
+    return;
+  }
+
+  // interval [from[i-1], from[i]] of the previous value, to quickly find that of a next, nearby value
+  size_t i = 1;
+
+  for (size_t v = 0; v < len; v++) {
+    const double x = values[v];
+
+    if (!(from[i-1] <= x && x < from[i])) {
+      if (i + 1 < n && from[i] <= x && x < from[i+1])
+        i++;
+      else
+        i = upper_bound(from.begin() + 1, from.end() - 1, x) - from.begin();
+    }
+
+    values[v] = to[i-1] + (x - from[i-1]) * (to[i] - to[i-1]) / (from[i] - from[i-1]);
+  }
+}
+
+void NumericalCoordinate::toWorld( double *values, size_t len )
+{
+  loadAxis();
+
+  if (axisTabular) {
+    interpolate(axisPixels, axisWorlds, values, len);
+  } else {
+    for (size_t i = 0; i < len; i++)
+      values[i] = axisReferenceValue + axisIncrement * (values[i] - axisReferencePixel);
+  }
+}
+
+void NumericalCoordinate::toPixel( double *values, size_t len )
+{
+  loadAxis();
+
+  if (axisTabular) {
+    if (axisWorlds.size() == 1)
+      throw DALValueError("Cannot convert world to pixel coordinates with a single table entry for tabular coordinate " + _name);
+
+    if (inverseWorlds.empty())
+      throw DALValueError("Cannot convert world to pixel coordinates if world values are not monotonic for tabular coordinate " + _name);
+
+    interpolate(inverseWorlds, inversePixels, values, len);
+  } else {
+    for (size_t i = 0; i < len; i++)
+      values[i] = axisReferencePixel + (values[i] - axisReferenceValue) / axisIncrement;
+  }
+}
+
 Attribute< vector<double> > DirectionCoordinate::referenceValue()
 {
   return Attribute< vector<double> >(*this, "REFERENCE_VALUE");
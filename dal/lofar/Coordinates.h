@@ -18,9 +18,11 @@
 #define DAL_COORDINATES_H
 
 #include <string>
+#include <vector>
 #include <hdf5.h>
 #include "../hdf5/Attribute.h"
 #include "../hdf5/Group.h"
+#include "../hdf5/types/SharedPtr.h"
 
 /*
  * The coordinate system is described in ICD002, to closely match the FITS WCS (World Coordinate System) specification.
@@ -43,10 +45,15 @@ class Coordinate;
 
 /*!
  * Interface for coordinate groups.
+ *
+ * The coordinate types (COORDINATE_TYPES) are read once per CoordinatesGroup object,
+ * on first use, as are the coordinate objects returned by coordinates() and coordinatePtr().
+ * After a call to coordinateTypes(), e.g. to change them, the types are read again on
+ * next use, and the coordinate objects are recreated if the types changed.
  */
 class CoordinatesGroup: public Group {
 public:
-  CoordinatesGroup( Group &parent, const std::string &name ): Group(parent, name) {}
+  CoordinatesGroup( Group &parent, const std::string &name ): Group(parent, name), coordinateTypesLoaded(false) {}
 
   Attribute< std::vector<double> >      refLocationValue();
   Attribute< std::vector<std::string> > refLocationUnit();
@@ -60,11 +67,36 @@ public:
   Attribute<unsigned>     nofAxes();
   Attribute< std::vector<std::string> > coordinateTypes();
 
+  /*!
+   * Returns a new object for coordinate `nr`, of the class matching its type
+   * (e.g. SpectralCoordinate), or of class Coordinate for unknown types.
+   * The caller has to delete it. Prefer coordinatePtr() in C++.
+   */
   virtual Coordinate *    coordinate( unsigned nr );
 
+  /*!
+   * Returns coordinate `nr`, of the class matching its type (see coordinate()).
+   * Repeated calls return the same object, which is deleted when no longer referenced.
+   * Throws a DALIndexError if nr >= nrCoordinates().
+   */
+  SharedPtr<Coordinate>   coordinatePtr( unsigned nr );
+
+  //! Returns all coordinates, as coordinatePtr() does.
+  std::vector< SharedPtr<Coordinate> > coordinates();
+
+  //! Returns the number of coordinates listed in COORDINATE_TYPES, or 0 if it does not exist.
+  size_t                  nrCoordinates();
+
 protected:
   std::string             coordinateType( unsigned nr );
   std::string             coordinateName( unsigned nr );
+
+private:
+  bool                    coordinateTypesLoaded;
+  std::vector<std::string> coordinateTypesCache;
+  std::vector< SharedPtr<Coordinate> > coordinateCache;
+
+  void                    loadCoordinateTypes();
 };
 
 class Coordinate: public Group {
@@ -85,7 +117,7 @@ public:
  */
 class NumericalCoordinate: public Coordinate {
 public:
-  NumericalCoordinate( Group &parent, const std::string &name ): Coordinate(parent, name) {}
+  NumericalCoordinate( Group &parent, const std::string &name ): Coordinate(parent, name), axisLoaded(false) {}
 
   // linear coordinates use these attributes
   Attribute<double>                     referenceValue();
@@ -97,6 +129,50 @@ public:
   Attribute<unsigned>                   axisLength();
   Attribute< std::vector<unsigned> >    axisValuesPixel();
   Attribute< std::vector<double> >      axisValuesWorld();
+
+  /*!
+   * Returns whether the axis is tabular (or linear), as given by storageType(),
+   * or else by the presence of axisValuesPixel().
+   */
+  bool                                  tabular();
+
+  /*!
+   * Converts the `len` pixel coordinates in `values` to world coordinates, in place.
+   *
+   * Linear axes compute referenceValue() + increment() * pc() * (pixel - referencePixel()).
+   * Tabular axes interpolate linearly between the entries of axisValuesPixel() and
+   * axisValuesWorld(), and extrapolate from the first or last two entries. Successive
+   * values that fall in the same or the next table entry (e.g. all channels in order)
+   * take O(1) time each, others O(log(axis length)).
+   *
+   * The axis attributes are read on first use, and then cached in this object.
+   * Throws a DALValueError if the axis is not properly described, e.g. if the pixel
+   * values of a tabular axis are not strictly increasing.
+   */
+  void                                  toWorld( double *values, size_t len );
+
+  /*!
+   * Converts the `len` world coordinates in `values` to pixel coordinates, in place.
+   * The inverse of toWorld(). The world values of a tabular axis must be strictly
+   * increasing or strictly decreasing.
+   */
+  void                                  toPixel( double *values, size_t len );
+
+private:
+  // axis description, cached by loadAxis()
+  bool                                  axisLoaded;
+  bool                                  axisTabular;
+  double                                axisReferenceValue;
+  double                                axisReferencePixel;
+  double                                axisIncrement;
+  std::vector<double>                   axisPixels;
+  std::vector<double>                   axisWorlds;
+
+  // the table ordered by increasing world value, or empty if not monotonic
+  std::vector<double>                   inverseWorlds;
+  std::vector<double>                   inversePixels;
+
+  void                                  loadAxis();
 };
 
 /*!
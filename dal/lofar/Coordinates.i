@@ -0,0 +1,79 @@
+// SWIG customisations for the coordinate classes
+
+// toWorld()/toPixel() convert a numpy array of doubles in place
+%apply (double* INPLACE_ARRAY1, size_t DIM1) {(double *values, size_t len)}
+
+// reimplemented below to take and return numpy arrays (or scalars)
+%rename(_toWorld) dal::NumericalCoordinate::toWorld;
+%rename(_toPixel) dal::NumericalCoordinate::toPixel;
+
+%include "factory.i"
+
+// coordinate() returns a new object, which Python owns, as its most derived class
+%newobject dal::CoordinatesGroup::coordinate;
+%factory(dal::Coordinate *dal::CoordinatesGroup::coordinate, dal::TimeCoordinate, dal::SpectralCoordinate,
+         dal::DirectionCoordinate, dal::PolarizationCoordinate);
+
+// Python owns the objects returned by coordinate(), so does not need SharedPtr
+%ignore dal::SharedPtr;
+%ignore dal::CoordinatesGroup::coordinatePtr;
+%ignore dal::CoordinatesGroup::coordinates;
+
+%include dal/lofar/Coordinates.h
+
+%extend dal::CoordinatesGroup {
+  %pythoncode {
+    def coordinates(self):
+      """ Returns all coordinates, each of the class matching its type. See coordinate(). """
+      return [self.coordinate(nr) for nr in range(self.nrCoordinates())]
+  }
+}
+
+%extend dal::NumericalCoordinate {
+  %pythoncode {
+    def _convert(self, values, convert):
+      import numpy
+
+      result = numpy.array(values, dtype=numpy.double)
+      flat = result.reshape(-1)
+      convert(flat)
+
+      return float(flat[0]) if result.ndim == 0 else result
+
+    def toWorld(self, pixels):
+      """
+        Returns the world coordinates of `pixels`, a scalar or an array
+        of pixel coordinates, as a float or a numpy array of doubles.
+
+        Python example:
+
+             # Create a linear coordinate
+             >>> f = File("example.h5", File.CREATE)
+             >>> c = NumericalCoordinate(f, "COORDINATE")
+             >>> c.create()
+             <...>
+             >>> c.storageType().value = ["Linear"]
+             >>> c.referenceValue().value = 100.0
+             >>> c.referencePixel().value = 0.0
+             >>> c.increment().value = 0.5
+
+             # Convert both ways
+             >>> c.toWorld([0, 1, 2]).tolist()
+             [100.0, 100.5, 101.0]
+             >>> c.toPixel(101.0)
+             2.0
+
+             # Clean up
+             >>> import os
+             >>> os.remove("example.h5")
+      """
+      return self._convert(pixels, self._toWorld)
+
+    def toPixel(self, world):
+      """
+        Returns the pixel coordinates of `world`, a scalar or an array
+        of world coordinates, as a float or a numpy array of doubles.
+      """
+      return self._convert(world, self._toPixel)
+  }
+}
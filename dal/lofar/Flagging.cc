@@ -15,7 +15,9 @@
  * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
  */
 #include "Flagging.h"
+#include "../hdf5/exceptions/exceptions.h"
 
+#include <algorithm>
 #include <sstream>
 
 using namespace std;
@@ -34,5 +36,193 @@ string Range::to_string() {
   return oss.str();
 }
 
+// orders ranges by begin
+static bool beginsBefore( const Range &a, const Range &b )
+{
+  return a.begin < b.begin;
+}
+
+RangeSet::RangeSet() {}
+
+RangeSet::RangeSet( const std::vector<Range> &ranges )
+{
+  vector<Range> sorted(ranges);
+  sort(sorted.begin(), sorted.end(), beginsBefore);
+
+  for (size_t i = 0; i < sorted.size(); i++)
+    add(sorted[i].begin, sorted[i].end);
+}
+
+void RangeSet::add( unsigned long long begin, unsigned long long end )
+{
+  if (begin >= end)
+    return;
+
+  // common case: add at (or overlapping with) the end
+  if (_ranges.empty() || begin > _ranges.back().end) {
+    _ranges.push_back(Range(begin, end));
+    return;
+  }
+
+  if (begin >= _ranges.back().begin) {
+    _ranges.back().end = max(_ranges.back().end, end);
+    return;
+  }
+
+  // merge with all ranges that overlap or touch [begin, end)
+  vector<Range>::iterator first = lower_bound(_ranges.begin(), _ranges.end(), Range(begin, begin), beginsBefore);
+  if (first != _ranges.begin() && (first - 1)->end >= begin)
+    --first;
+
+  vector<Range>::iterator last = first;
+  while (last != _ranges.end() && last->begin <= end)
+    ++last;
+
+  if (first == last) {
+    _ranges.insert(first, Range(begin, end));
+    return;
+  }
+
+  first->begin = min(first->begin, begin);
+  first->end   = max((last - 1)->end, end);
+  _ranges.erase(first + 1, last);
+}
+
+vector<Range> RangeSet::ranges() const
+{
+  return _ranges;
+}
+
+size_t RangeSet::nrRanges() const
+{
+  return _ranges.size();
+}
+
+unsigned long long RangeSet::length() const
+{
+  unsigned long long result = 0;
+
+  for (size_t i = 0; i < _ranges.size(); i++)
+    result += _ranges[i].end - _ranges[i].begin;
+
+  return result;
+}
+
+bool RangeSet::contains( unsigned long long pos ) const
+{
+  // find the last range that begins at or before pos
+  vector<Range>::const_iterator it = upper_bound(_ranges.begin(), _ranges.end(), Range(pos, pos), beginsBefore);
+
+  return it != _ranges.begin() && pos < (it - 1)->end;
+}
+
+RangeSet RangeSet::unite( const RangeSet &other ) const
+{
+  RangeSet result;
+  vector<Range>::const_iterator a = _ranges.begin(), b = other._ranges.begin();
+
+  // merge both sorted lists, so add() only appends
+  while (a != _ranges.end() || b != other._ranges.end()) {
+    if (b == other._ranges.end() || (a != _ranges.end() && a->begin < b->begin)) {
+      result.add(a->begin, a->end);
+      ++a;
+    } else {
+      result.add(b->begin, b->end);
+      ++b;
+    }
+  }
+
+  return result;
+}
+
+RangeSet RangeSet::intersect( const RangeSet &other ) const
+{
+  RangeSet result;
+  vector<Range>::const_iterator a = _ranges.begin(), b = other._ranges.begin();
+
+  while (a != _ranges.end() && b != other._ranges.end()) {
+    result.add(max(a->begin, b->begin), min(a->end, b->end));
+
+    // advance the range that ends first
+    if (a->end < b->end)
+      ++a;
+    else
+      ++b;
+  }
+
+  return result;
+}
+
+RangeSet RangeSet::complement( unsigned long long length ) const
+{
+  RangeSet result;
+  unsigned long long pos = 0;
+
+  for (size_t i = 0; i < _ranges.size() && _ranges[i].begin < length; i++) {
+    result.add(pos, _ranges[i].begin);
+    pos = _ranges[i].end;
+  }
+
+  result.add(pos, length);
+
+  return result;
+}
+
+void RangeSet::getMask( unsigned long long pos, bool *outbuffer, size_t len ) const
+{
+  fill(outbuffer, outbuffer + len, false);
+
+  const unsigned long long end = pos + len;
+
+  for (size_t i = 0; i < _ranges.size() && _ranges[i].begin < end; i++) {
+    if (_ranges[i].end <= pos)
+      continue;
+
+    const unsigned long long b = max(_ranges[i].begin, pos);
+    const unsigned long long e = min(_ranges[i].end, end);
+
+    fill(outbuffer + (b - pos), outbuffer + (e - pos), true);
+  }
+}
+
+string RangeSet::to_string() const
+{
+  ostringstream oss;
+
+  oss << '[';
+  for (size_t i = 0; i < _ranges.size(); i++) {
+    Range range(_ranges[i]);
+
+    if (i > 0)
+      oss << ", ";
+    oss << range.to_string();
+  }
+  oss << ']';
+
+  return oss.str();
+}
+
+RangeSet zeroFrames( const short *inbuffer, size_t len, size_t frameLength, unsigned long long pos )
+{
+  if (frameLength == 0)
+    throw DALValueError("Cannot scan for zero frames of 0 samples");
+
+  RangeSet result;
+
+  for (size_t begin = 0; begin < len; begin += frameLength) {
+    const size_t end = min(begin + frameLength, len);
+
+    // real data is rarely zero, so this usually stops at the first sample
+    size_t i = begin;
+    while (i < end && inbuffer[i] == 0)
+      i++;
+
+    if (i == end)
+      result.add(pos + begin, pos + end);
+  }
+
+  return result;
+}
+
 }
 
@@ -19,6 +19,7 @@
 
 #include <cstddef>
 #include <string>
+#include <vector>
 #include "../hdf5/types/h5tuple.h"
 
 namespace dal {
@@ -42,6 +43,87 @@ struct Range : public TupleBase<unsigned long long, 2> {
   std::string to_string();
 };
 
+/*!
+ * A set of positions (e.g. flagged samples), stored as a sorted list of disjoint,
+ * non-adjacent ranges, as in the FLAG_OFFSETS attribute of a TBB_DipoleDataset.
+ * Overlapping and adjacent ranges are merged as they are added.
+ *
+ * Python example:
+ * \code
+ *    # Flag samples 0-9 and 20-29, in any order
+ *    >>> s = RangeSet()
+ *    >>> s.add(20, 30)
+ *    >>> s.add(0, 10)
+ *    >>> s.ranges()
+ *    [[0,10), [20,30)]
+ *
+ *    # Set operations
+ *    >>> s.intersect(RangeSet([Range(5, 25)])).ranges()
+ *    [[5,10), [20,25)]
+ *    >>> s.complement(40).ranges()
+ *    [[10,20), [30,40)]
+ *
+ *    # Convert to a boolean mask for samples 8-21
+ *    >>> s.mask(14, 8).tolist()
+ *    [True, True, False, False, False, False, False, False, False, False, False, False, True, True]
+ * \endcode
+ */
+class RangeSet {
+public:
+  //! Create an empty set.
+  RangeSet();
+
+  //! Create the set of positions in `ranges`, which can be in any order, and overlap.
+  explicit RangeSet( const std::vector<Range> &ranges );
+
+  //! Adds positions [begin, end) to the set. Adding to the end is O(1).
+  void add( unsigned long long begin, unsigned long long end );
+
+  //! Returns the ranges of the set: sorted, disjoint and non-adjacent.
+  std::vector<Range> ranges() const;
+
+  //! Returns the number of ranges in the set.
+  size_t nrRanges() const;
+
+  //! Returns the number of positions in the set.
+  unsigned long long length() const;
+
+  //! Returns whether position `pos` is in the set.
+  bool contains( unsigned long long pos ) const;
+
+  //! Returns the positions that are in this set, in `other`, or in both.
+  RangeSet unite( const RangeSet &other ) const;
+
+  //! Returns the positions that are in both this set and `other`.
+  RangeSet intersect( const RangeSet &other ) const;
+
+  //! Returns the positions in [0, length) that are not in this set, e.g. the unflagged samples of a dataset of `length` (dims1D()) samples.
+  RangeSet complement( unsigned long long length ) const;
+
+  /*!
+   * Sets outbuffer[i] to whether position pos + i is in the set, for all i in [0, len).
+   * Takes O(nrRanges() + len) time.
+   */
+  void getMask( unsigned long long pos, bool *outbuffer, size_t len ) const;
+
+  //! Returns a string representation of this set, e.g. "[[0,10), [20,30)]".
+  std::string to_string() const;
+
+private:
+  std::vector<Range> _ranges;
+};
+
+/*!
+ * Returns the positions of the frames of `frameLength` samples in `inbuffer` that
+ * only contain zeros, as TBB writers fill in missing data. Frames start at the
+ * first sample of `inbuffer`, which is at position `pos`. A shorter last frame
+ * is checked as well.
+ *
+ * Requires:
+ *    - frameLength > 0
+ */
+RangeSet zeroFrames( const short *inbuffer, size_t len, size_t frameLength, unsigned long long pos = 0 );
+
 }
 
 #endif
@@ -1,5 +1,9 @@
 AddAttributeAndVector( Range, %arg(dal::Range) );
 
+// RangeSet::getMask() fills a boolean numpy array
+%numpy_typemaps(bool, NPY_BOOL, size_t)
+%apply (bool* INPLACE_ARRAY1, size_t DIM1) {(bool *outbuffer, size_t len)}
+
 %include dal/lofar/Flagging.h
 
 %extend dal::Range {
@@ -9,3 +13,26 @@ AddAttributeAndVector( Range, %arg(dal::Range) );
   }
 }
 
+%extend dal::RangeSet {
+  %pythoncode {
+    __repr__ = to_string
+    __str__ = __repr__
+
+    def __len__(self):
+      return self.length()
+
+    def __contains__(self, pos):
+      return self.contains(pos)
+
+    def mask(self, length, pos=0):
+      """
+        Returns a boolean numpy array of `length` elements, in which
+        element i is True if position pos + i is in the set.
+      """
+      import numpy
+
+      result = numpy.empty(length, dtype=bool)
+      self.getMask(pos, result)
+      return result
+  }
+}
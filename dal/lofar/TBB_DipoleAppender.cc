@@ -0,0 +1,107 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#include "TBB_DipoleAppender.h"
+
+using namespace std;
+
+namespace dal {
+
+TBB_DipoleAppender::TBB_DipoleAppender( TBB_DipoleDataset &dipole, size_t bufferLength, size_t growLength )
+:
+  DatasetAppender<short>(dipole, bufferLength, growLength),
+  dipole(dipole),
+  flagsChanged(false),
+  zeroFrameLength(0)
+{
+  // keep the flags of the data already present
+  if (dipole.flagOffsets().exists())
+    _flags = RangeSet(dipole.flagOffsets().get());
+}
+
+TBB_DipoleAppender::~TBB_DipoleAppender()
+{
+  // close() here instead of in ~DatasetAppender() to still reach our flush()
+  try {
+    close();
+  } catch (DALException &) {
+    // cannot throw from a destructor
+  }
+}
+
+void TBB_DipoleAppender::append( const short *inbuffer, size_t len )
+{
+  const size_t begin = length();
+
+  DatasetAppender<short>::append(inbuffer, len);
+
+  if (zeroFrameLength > 0) {
+    const vector<Range> zeros(zeroFrames(inbuffer, len, zeroFrameLength, begin).ranges());
+
+    for (size_t i = 0; i < zeros.size(); i++)
+      flag(zeros[i].begin, zeros[i].end);
+  }
+}
+
+void TBB_DipoleAppender::appendFlagged( const short *inbuffer, size_t len )
+{
+  const size_t begin = length();
+
+  append(inbuffer, len);
+  flag(begin, length());
+}
+
+void TBB_DipoleAppender::flag( size_t begin, size_t end )
+{
+  if (begin > end || end > length())
+    throw DALValueError("Cannot flag samples beyond the appended data of dipole " + dipole.name());
+
+  const unsigned long long before = _flags.length();
+  _flags.add(begin, end);
+
+  if (_flags.length() != before)
+    flagsChanged = true;
+}
+
+void TBB_DipoleAppender::setFlagZeroFrames( size_t frameLength )
+{
+  zeroFrameLength = frameLength;
+}
+
+size_t TBB_DipoleAppender::flagZeroFrames() const
+{
+  return zeroFrameLength;
+}
+
+RangeSet TBB_DipoleAppender::flags() const
+{
+  return _flags;
+}
+
+void TBB_DipoleAppender::flush()
+{
+  DatasetAppender<short>::flush();
+
+  dipole.dataLength().value = length();
+
+  if (flagsChanged) {
+    dipole.flagOffsets().value = _flags.ranges();
+    flagsChanged = false;
+  }
+}
+
+}
+
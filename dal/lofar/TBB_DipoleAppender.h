@@ -0,0 +1,118 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#ifndef DAL_TBB_DIPOLE_APPENDER_H
+#define DAL_TBB_DIPOLE_APPENDER_H
+
+#include <cstddef>
+#include "../hdf5/DatasetAppender.h"
+#include "Flagging.h"
+#include "TBB_File.h"
+
+namespace dal {
+
+/*!
+ * Appends samples to a TBB_DipoleDataset, frame by frame, as a DatasetAppender<short>.
+ * It also keeps the DATA_LENGTH and FLAG_OFFSETS attributes of the dipole up to date:
+ * they are written on every flush() (and thus on close()).
+ *
+ * Samples can be flagged as they are appended (e.g. a frame with a bad CRC), or later.
+ * With setFlagZeroFrames(), appended frames that only contain zeros (as written in place
+ * of missing frames) are flagged automatically. Flags on existing data are kept.
+ *
+ * Python example:
+ * \code
+ *    # Create a new TBB file with an empty dipole dataset
+ *    >>> f = TBB_File("example_tbb.h5", TBB_File.CREATE)
+ *    >>> st = f.station("CS001")
+ *    >>> st.create()
+ *    <...>
+ *    >>> dp = st.dipole(1, 0, 0)
+ *    >>> dp.create1D(0, -1, "example_tbb.raw")
+ *    <...>
+ *
+ *    # Append a good frame, and zeros for a missing one
+ *    >>> import numpy
+ *    >>> a = dp.appender()
+ *    >>> a.append(numpy.ones(1024, dtype=dp.dtype))
+ *    >>> a.appendFlagged(numpy.zeros(1024, dtype=dp.dtype))
+ *    >>> a.close()
+ *
+ *    >>> dp.dataLength().value
+ *    2048L
+ *    >>> [str(r) for r in dp.flagOffsets().value]
+ *    ['[1024,2048)']
+ *
+ *    # Clean up
+ *    >>> import os
+ *    >>> os.remove("example_tbb.h5")
+ *    >>> os.remove("example_tbb.raw")
+ * \endcode
+ */
+class TBB_DipoleAppender: public DatasetAppender<short> {
+public:
+  /*!
+   * Create an appender for `dipole`. See DatasetAppender::DatasetAppender().
+   * The dipole must outlive the appender.
+   */
+  TBB_DipoleAppender( TBB_DipoleDataset &dipole, size_t bufferLength = 65536, size_t growLength = 0 );
+
+  //! Calls close(), but ignores any errors. Call close() to handle them.
+  virtual ~TBB_DipoleAppender();
+
+  //! Appends `len` samples. Also flags zero frames among them, see setFlagZeroFrames().
+  virtual void append( const short *inbuffer, size_t len );
+
+  //! Appends `len` samples, and flags them.
+  void appendFlagged( const short *inbuffer, size_t len );
+
+  /*!
+   * Flags samples [begin, end), in any order. Overlapping and adjacent
+   * flagged ranges are merged.
+   *
+   * Requires:
+   *    - begin <= end <= length()
+   */
+  void flag( size_t begin, size_t end );
+
+  /*!
+   * Makes append() flag each frame of `frameLength` samples that only contains
+   * zeros (see zeroFrames()). Frames start at the first sample of each append().
+   * A `frameLength` of 0 (default) disables this.
+   */
+  void setFlagZeroFrames( size_t frameLength );
+
+  //! Returns the frame length to flag zero frames, or 0 if disabled. See setFlagZeroFrames().
+  size_t flagZeroFrames() const;
+
+  //! Returns the flagged samples, as they will be written to FLAG_OFFSETS.
+  RangeSet flags() const;
+
+  //! Also writes DATA_LENGTH, and FLAG_OFFSETS if changed.
+  virtual void flush();
+
+private:
+  TBB_DipoleDataset &dipole;
+
+  RangeSet _flags;
+  bool flagsChanged;
+  size_t zeroFrameLength;
+};
+
+}
+
+#endif
+
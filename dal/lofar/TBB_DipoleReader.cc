@@ -0,0 +1,150 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#include "TBB_DipoleReader.h"
+#include "../hdf5/RawData.h"
+#include "../hdf5/exceptions/exceptions.h"
+
+#include <pthread.h>
+
+using namespace std;
+
+namespace dal {
+
+/*
+ * State shared by the workers of a single read(). Workers take the next row to read
+ * from a shared counter, so a few slow files do not hold up the others.
+ */
+struct TBB_DipoleReader::Job {
+  const vector<Row> *rows;
+  size_t pos;
+  short *outbuffer2;
+  size_t dim2;
+
+  pthread_mutex_t mutex;
+  size_t next;
+  string error; // first error encountered, if any
+};
+
+TBB_DipoleReader::TBB_DipoleReader( unsigned nrWorkers )
+:
+  _nrWorkers(nrWorkers)
+{
+}
+
+void TBB_DipoleReader::addRow( size_t row, const std::string &filename, size_t offset, size_t length, bool bigEndian )
+{
+  Row r;
+
+  r.row       = row;
+  r.filename  = filename;
+  r.offset    = offset;
+  r.length    = length;
+  r.bigEndian = bigEndian;
+
+  rows.push_back(r);
+}
+
+size_t TBB_DipoleReader::nrRows() const
+{
+  return rows.size();
+}
+
+unsigned TBB_DipoleReader::nrWorkers() const
+{
+  return _nrWorkers;
+}
+
+void TBB_DipoleReader::read( size_t pos, short *outbuffer2, size_t dim1, size_t dim2 ) const
+{
+  for (size_t i = 0; i < rows.size(); i++) {
+    if (rows[i].row >= dim1)
+      throw DALValueError("Cannot read dipole into row beyond the output buffer for raw file " + rows[i].filename);
+
+    if (pos + dim2 > rows[i].length)
+      throw DALValueError("Cannot read dipole samples beyond the end of the data for raw file " + rows[i].filename);
+  }
+
+  Job job;
+  job.rows       = &rows;
+  job.pos        = pos;
+  job.outbuffer2 = outbuffer2;
+  job.dim2       = dim2;
+  job.next       = 0;
+
+  if (pthread_mutex_init(&job.mutex, NULL) != 0)
+    throw DALException("Could not create mutex to read dipoles");
+
+  const size_t nrThreads = _nrWorkers < rows.size() ? _nrWorkers : rows.size();
+  vector<pthread_t> threads;
+
+  if (nrThreads > 1) {
+    threads.reserve(nrThreads);
+
+    for (size_t i = 0; i < nrThreads; i++) {
+      pthread_t thread;
+
+      // if we cannot start all threads, the ones that did start (or this thread) do the work
+      if (pthread_create(&thread, NULL, &worker, &job) != 0)
+        break;
+
+      threads.push_back(thread);
+    }
+  }
+
+  if (threads.empty())
+    worker(&job);
+
+  for (size_t i = 0; i < threads.size(); i++)
+    pthread_join(threads[i], NULL);
+
+  pthread_mutex_destroy(&job.mutex);
+
+  if (!job.error.empty())
+    throw DALException(job.error);
+}
+
+void *TBB_DipoleReader::worker( void *arg )
+{
+  Job &job = *static_cast<Job *>(arg);
+
+  for (;;) {
+    pthread_mutex_lock(&job.mutex);
+    const size_t i = job.next++;
+    const bool done = i >= job.rows->size() || !job.error.empty();
+    pthread_mutex_unlock(&job.mutex);
+
+    if (done)
+      break;
+
+    const Row &row = (*job.rows)[i];
+
+    try {
+      readRawData(row.filename, row.offset + job.pos * sizeof(short),
+                  job.outbuffer2 + row.row * job.dim2, job.dim2, sizeof(short), row.bigEndian);
+    } catch (DALException &e) {
+      pthread_mutex_lock(&job.mutex);
+      if (job.error.empty())
+        job.error = e.what();
+      pthread_mutex_unlock(&job.mutex);
+    }
+  }
+
+  return NULL;
+}
+
+}
+
@@ -0,0 +1,92 @@
+/* Copyright 2011-2012  ASTRON, Netherlands Institute for Radio Astronomy
+ * This file is part of the Data Access Library (DAL).
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 3 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#ifndef DAL_TBB_DIPOLE_READER_H
+#define DAL_TBB_DIPOLE_READER_H
+
+#include <cstddef>
+#include <string>
+#include <vector>
+
+namespace dal {
+
+/*!
+ * Reads a window of samples of many TBB dipoles in parallel, directly from their
+ * raw (external) data files, using a pool of worker threads.
+ *
+ * HDF5 is not thread-safe (unless built as such), so the workers do not call HDF5
+ * at all. Instead, the caller describes where the raw data of each dipole is stored,
+ * typically through Dataset::externalDataFile(), Dataset::externalDataOffset(),
+ * Dataset::dims1D() and Dataset::endianness(). read() can thus safely run while other
+ * threads use HDF5 (or, in Python, with the GIL released).
+ *
+ * See TBB_File::readDipoles() for the usual way to use this class.
+ */
+class TBB_DipoleReader {
+public:
+  /*!
+   * Create a reader that uses up to `nrWorkers` threads. With 0 or 1 worker, read()
+   * reads all rows in the calling thread.
+   */
+  explicit TBB_DipoleReader( unsigned nrWorkers = 4 );
+
+  /*!
+   * Read row `row` of the output from the `length` samples of 16 bit stored at byte
+   * `offset` in `filename`, in big-endian byte order if `bigEndian` is set.
+   * Samples beyond the end of the file (but within `length`) read as 0, like in HDF5.
+   */
+  void addRow( size_t row, const std::string &filename, size_t offset, size_t length, bool bigEndian );
+
+  //! Returns the number of rows added.
+  size_t nrRows() const;
+
+  /*!
+   * Reads samples [pos, pos + dim2) of each added row into row `row` of the
+   * dim1 x dim2 array `outbuffer2`. Rows that were not added are left untouched.
+   * Does not call HDF5.
+   *
+   * Throws a DALValueError if a row does not fit in outbuffer2 or the window exceeds the
+   * length of a row, and a DALException if a raw data file cannot be read.
+   *
+   * Requires:
+   *    - row < dim1 for all added rows
+   *    - pos + dim2 <= length for all added rows
+   */
+  void read( size_t pos, short *outbuffer2, size_t dim1, size_t dim2 ) const;
+
+  //! Returns the (maximum) number of worker threads.
+  unsigned nrWorkers() const;
+
+private:
+  struct Row {
+    size_t      row;
+    std::string filename;
+    size_t      offset;
+    size_t      length;
+    bool        bigEndian;
+  };
+
+  std::vector<Row> rows;
+  unsigned _nrWorkers;
+
+  struct Job;
+  static void *worker( void *arg );
+};
+
+}
+
+#endif
+
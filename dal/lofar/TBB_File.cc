@@ -15,6 +15,10 @@
  * License along with this library.  If not, see <http://www.gnu.org/licenses/>.
  */
 #include "TBB_File.h"
+#include "TBB_DipoleReader.h"
+#include "../hdf5/BlockIterator.h"
+
+#include <algorithm>
 
 using namespace std;
 
@@ -22,19 +26,19 @@ namespace dal {
 
 TBB_File::TBB_File() {}
 
-TBB_File::TBB_File( const std::string &filename, FileMode mode )
+TBB_File::TBB_File( const std::string &filename, FileMode mode, const FileAccessProfile &profile )
 :
-  CLA_File(filename, mode)
+  CLA_File(filename, mode, profile)
 {
   openFile(mode);
 }
 
 TBB_File::~TBB_File() {}
 
-void TBB_File::open( const std::string &filename, FileMode mode )
+void TBB_File::open( const std::string &filename, FileMode mode, const FileAccessProfile &profile )
 {
   // As long as we have no member vars, keep open() and close() simple. See CLA_File::open().
-  CLA_File::open(filename, mode);
+  CLA_File::open(filename, mode, profile);
 
   openFile(mode);
 }
@@ -46,8 +50,6 @@ void TBB_File::close()
 
 void TBB_File::openFile( FileMode mode )
 {
-  initFileNodes();
-
   if (mode == CREATE || mode == CREATE_EXCL) {
     fileType().create().set("tbb");
     docName() .create().set("ICD 1: TBB Time-Series Data");
@@ -64,10 +66,12 @@ void TBB_File::openFile( FileMode mode )
   }
 }
 
-void TBB_File::initFileNodes() {
-  CLA_File::initNodes();
-  addNode( new Attribute<string>(*this, "OPERATING_MODE") );
-  addNode( new Attribute<unsigned>(*this, "NOF_STATIONS") );
+const NodeSchema &TBB_File::nodeSchema() const {
+  static const NodeSchema schema = NodeSchema(CLA_File::nodeSchema())
+    .add< Attribute<string> >("OPERATING_MODE")
+    .add< Attribute<unsigned> >("NOF_STATIONS");
+
+  return schema;
 }
 
 Attribute<string> TBB_File::operatingMode()
@@ -82,15 +86,13 @@ Attribute<unsigned> TBB_File::nofStations()
 
 vector<TBB_Station> TBB_File::stations()
 {
-  const string stPrefix("STATION_");
   vector<TBB_Station> stationGroups;
-  vector<string> membNames(memberNames());
+  vector<string> membNames(memberNames("STATION_"));
 
+  // Fill the vector with objects of the right type.
+  stationGroups.reserve(membNames.size());
   for (vector<string>::const_iterator it(membNames.begin()); it != membNames.end(); ++it) {
-    // Filter the names that appear to be stations and fill the vector with objects of the right type.
-    if (it->find(stPrefix) == 0) {
-      stationGroups.push_back(TBB_Station(*this, *it));
-    }
+    stationGroups.push_back(TBB_Station(*this, *it));
   }
 
   return stationGroups;
@@ -110,6 +112,40 @@ TBB_Trigger TBB_File::trigger()
   return TBB_Trigger(*this, "TRIGGER");
 }
 
+void TBB_File::readDipoles( std::vector<TBB_DipoleDataset> &dipoles, size_t pos, short *outbuffer2, size_t dim1, size_t dim2, unsigned nrWorkers )
+{
+  if (dipoles.size() != dim1)
+    throw DALValueError("Cannot readDipoles if the number of dipoles does not match the number of rows of the output buffer");
+
+  TBB_DipoleReader reader(nrWorkers);
+
+  // Query HDF5 in this thread only; the reader does not use HDF5.
+  for (size_t i = 0; i < dipoles.size(); i++) {
+    TBB_DipoleDataset &dp = dipoles[i];
+
+    const ssize_t len = dp.dims1D();
+    if (len < 0 || pos + dim2 > (size_t)len)
+      throw DALValueError("Cannot readDipoles beyond the end of dipole dataset " + dp.name());
+
+    string filename;
+    size_t offset = 0;
+
+    try {
+      filename = dp.externalDataFile();
+      offset = dp.externalDataOffset();
+    } catch (DALValueError& ) {
+      // not stored in a single external file: read through HDF5
+      if (dim2 > 0)
+        dp.get1D(pos, outbuffer2 + i * dim2, dim2);
+      continue;
+    }
+
+    reader.addRow(i, filename, offset, len, dp.endianness() == TBB_DipoleDataset::BIG);
+  }
+
+  reader.read(pos, outbuffer2, dim1, dim2);
+}
+
 
 TBB_Trigger::TBB_Trigger( Group &parent, const std::string &name )
 :
@@ -117,15 +153,17 @@ TBB_Trigger::TBB_Trigger( Group &parent, const std::string &name )
 {
 }
 
-void TBB_Trigger::initNodes() {
-  Group::initNodes();
-  addNode( new Attribute<string>(*this, "TRIGGER_TYPE") );
-  addNode( new Attribute<int>(*this, "TRIGGER_VERSION") );
-  addNode( new Attribute<int>(*this, "PARAM_COINCIDENCE_CHANNELS") );
-  addNode( new Attribute<double>(*this, "PARAM_COINCIDENCE_TIME") );
-  addNode( new Attribute<string>(*this, "PARAM_DIRECTION_FIT") );
-  addNode( new Attribute<double>(*this, "PARAM_ELEVATION_MIN") );
-  addNode( new Attribute<double>(*this, "PARAM_FIT_VARIANCE_MAX") );
+const NodeSchema &TBB_Trigger::nodeSchema() const {
+  static const NodeSchema schema = NodeSchema(Group::nodeSchema())
+    .add< Attribute<string> >("TRIGGER_TYPE")
+    .add< Attribute<int> >("TRIGGER_VERSION")
+    .add< Attribute<int> >("PARAM_COINCIDENCE_CHANNELS")
+    .add< Attribute<double> >("PARAM_COINCIDENCE_TIME")
+    .add< Attribute<string> >("PARAM_DIRECTION_FIT")
+    .add< Attribute<double> >("PARAM_ELEVATION_MIN")
+    .add< Attribute<double> >("PARAM_FIT_VARIANCE_MAX");
+
+  return schema;
 }
 
 Attribute<string> TBB_Trigger::triggerType()
@@ -170,18 +208,20 @@ TBB_Station::TBB_Station( Group &parent, const std::string &name )
 {
 }
 
-void TBB_Station::initNodes() {
-  Group::initNodes();
-  addNode( new Attribute<string>(*this, "STATION_NAME") );
-  addNode( new Attribute< vector<double> >(*this, "STATION_POSITION") );
-  addNode( new Attribute<string>(*this, "STATION_POSITION_UNIT") );
-  addNode( new Attribute<string>(*this, "STATION_POSITION_FRAME") );
-  addNode( new Attribute< vector<double> >(*this, "BEAM_DIRECTION") );
-  addNode( new Attribute<string>(*this, "BEAM_DIRECTION_UNIT") );
-  addNode( new Attribute<string>(*this, "BEAM_DIRECTION_FRAME") );
-  addNode( new Attribute<double>(*this, "CLOCK_OFFSET") );
-  addNode( new Attribute<string>(*this, "CLOCK_OFFSET_UNIT") );
-  addNode( new Attribute<unsigned>(*this, "NOF_DIPOLES") );
+const NodeSchema &TBB_Station::nodeSchema() const {
+  static const NodeSchema schema = NodeSchema(Group::nodeSchema())
+    .add< Attribute<string> >("STATION_NAME")
+    .add< Attribute< vector<double> > >("STATION_POSITION")
+    .add< Attribute<string> >("STATION_POSITION_UNIT")
+    .add< Attribute<string> >("STATION_POSITION_FRAME")
+    .add< Attribute< vector<double> > >("BEAM_DIRECTION")
+    .add< Attribute<string> >("BEAM_DIRECTION_UNIT")
+    .add< Attribute<string> >("BEAM_DIRECTION_FRAME")
+    .add< Attribute<double> >("CLOCK_OFFSET")
+    .add< Attribute<string> >("CLOCK_OFFSET_UNIT")
+    .add< Attribute<unsigned> >("NOF_DIPOLES");
+
+  return schema;
 }
 
 Attribute<string> TBB_Station::stationName()
@@ -236,15 +276,13 @@ Attribute<unsigned> TBB_Station::nofDipoles()
 
 vector<TBB_DipoleDataset> TBB_Station::dipoles()
 {
-  const string dpPrefix("DIPOLE_");
   vector<TBB_DipoleDataset> dipoleDatasets;
+  vector<string> membNames(memberNames("DIPOLE_"));
 
-  vector<string> membNames(memberNames());
+  // Fill the vector with objects of the right type.
+  dipoleDatasets.reserve(membNames.size());
   for (vector<string>::const_iterator it(membNames.begin()); it != membNames.end(); ++it) {
-    // Filter the names that appear to be dipoles and fill the vector with objects of the right type.
-    if (it->find(dpPrefix) == 0) {
-      dipoleDatasets.push_back(TBB_DipoleDataset(*this, *it));
-    }
+    dipoleDatasets.push_back(TBB_DipoleDataset(*this, *it));
   }
 
   return dipoleDatasets;
@@ -270,34 +308,36 @@ TBB_DipoleDataset::TBB_DipoleDataset( Group &parent, const std::string &name )
 {
 }
 
-void TBB_DipoleDataset::initNodes() {
-  Dataset<short>::initNodes();
-  addNode( new Attribute<unsigned>(*this, "STATION_ID") );
-  addNode( new Attribute<unsigned>(*this, "RSP_ID") );
-  addNode( new Attribute<unsigned>(*this, "RCU_ID") );
-  addNode( new Attribute<double>(*this, "SAMPLE_FREQUENCY") );
-  addNode( new Attribute<string>(*this, "SAMPLE_FREQUENCY_UNIT") );
-  addNode( new Attribute<unsigned>(*this, "TIME") );
-  addNode( new Attribute<unsigned>(*this, "SAMPLE_NUMBER") );
-  addNode( new Attribute<unsigned>(*this, "SAMPLES_PER_FRAME") );
-  addNode( new Attribute<unsigned long long>(*this, "DATA_LENGTH") );
-  addNode( new Attribute< vector<Range> >(*this, "FLAG_OFFSETS") );
-  addNode( new Attribute<unsigned>(*this, "NYQUIST_ZONE") );
-  addNode( new Attribute<double>(*this, "CABLE_DELAY") );
-  addNode( new Attribute<string>(*this, "CABLE_DELAY_UNIT") );
-  addNode( new Attribute<double>(*this, "DIPOLE_CALIBRATION_DELAY") );
-  addNode( new Attribute<string>(*this, "DIPOLE_CALIBRATION_DELAY_UNIT") );
-  addNode( new Attribute< vector<complex<double> > >(*this, "DIPOLE_CALIBRATION_DELAY_GAIN_CURVE") );
-  addNode( new Attribute< vector<double> >(*this, "ANTENNA_POSITION") );
-  addNode( new Attribute<string>(*this, "ANTENNA_POSITION_UNIT") );
-  addNode( new Attribute<string>(*this, "ANTENNA_POSITION_FRAME") );
-  addNode( new Attribute< vector<double> >(*this, "ANTENNA_NORMAL_VECTOR") );
-  addNode( new Attribute< vector<double> >(*this, "ANTENNA_ROTATION_MATRIX") );
-  addNode( new Attribute< vector<double> >(*this, "TILE_BEAM") );
-  addNode( new Attribute<string>(*this, "TILE_BEAM_UNIT") );
-  addNode( new Attribute<string>(*this, "TILE_BEAM_FRAME") );
-  addNode( new Attribute<double>(*this, "DISPERSION_MEASURE") );
-  addNode( new Attribute<string>(*this, "DISPERSION_MEASURE_UNIT") );
+const NodeSchema &TBB_DipoleDataset::nodeSchema() const {
+  static const NodeSchema schema = NodeSchema(Dataset<short>::nodeSchema())
+    .add< Attribute<unsigned> >("STATION_ID")
+    .add< Attribute<unsigned> >("RSP_ID")
+    .add< Attribute<unsigned> >("RCU_ID")
+    .add< Attribute<double> >("SAMPLE_FREQUENCY")
+    .add< Attribute<string> >("SAMPLE_FREQUENCY_UNIT")
+    .add< Attribute<unsigned> >("TIME")
+    .add< Attribute<unsigned> >("SAMPLE_NUMBER")
+    .add< Attribute<unsigned> >("SAMPLES_PER_FRAME")
+    .add< Attribute<unsigned long long> >("DATA_LENGTH")
+    .add< Attribute< vector<Range> > >("FLAG_OFFSETS")
+    .add< Attribute<unsigned> >("NYQUIST_ZONE")
+    .add< Attribute<double> >("CABLE_DELAY")
+    .add< Attribute<string> >("CABLE_DELAY_UNIT")
+    .add< Attribute<double> >("DIPOLE_CALIBRATION_DELAY")
+    .add< Attribute<string> >("DIPOLE_CALIBRATION_DELAY_UNIT")
+    .add< Attribute< vector<complex<double> > > >("DIPOLE_CALIBRATION_DELAY_GAIN_CURVE")
+    .add< Attribute< vector<double> > >("ANTENNA_POSITION")
+    .add< Attribute<string> >("ANTENNA_POSITION_UNIT")
+    .add< Attribute<string> >("ANTENNA_POSITION_FRAME")
+    .add< Attribute< vector<double> > >("ANTENNA_NORMAL_VECTOR")
+    .add< Attribute< vector<double> > >("ANTENNA_ROTATION_MATRIX")
+    .add< Attribute< vector<double> > >("TILE_BEAM")
+    .add< Attribute<string> >("TILE_BEAM_UNIT")
+    .add< Attribute<string> >("TILE_BEAM_FRAME")
+    .add< Attribute<double> >("DISPERSION_MEASURE")
+    .add< Attribute<string> >("DISPERSION_MEASURE_UNIT");
+
+  return schema;
 }
 
 Attribute<unsigned> TBB_DipoleDataset::stationID()
@@ -430,5 +470,25 @@ Attribute<string> TBB_DipoleDataset::dispersionMeasureUnit()
   return Attribute<string>(*this, "DISPERSION_MEASURE_UNIT");
 }
 
+RangeSet TBB_DipoleDataset::findZeroFrames( size_t frameLength )
+{
+  if (frameLength == 0)
+    throw DALValueError("Cannot scan for zero frames of 0 samples in dipole " + _name);
+
+  RangeSet result;
+
+  // read whole frames of about 64k samples at a time
+  const size_t blockLength = max<size_t>(65536 / frameLength, 1) * frameLength;
+  BlockIterator<short> it(*this, blockLength);
+
+  while (it.next()) {
+    const vector<Range> zeros(zeroFrames(it.data(), it.length(), frameLength, it.pos()).ranges());
+
+    for (size_t i = 0; i < zeros.size(); i++)
+      result.add(zeros[i].begin, zeros[i].end);
+  }
+
+  return result;
 }
 
+}
@@ -42,11 +42,11 @@ public:
   /*!
    * Open `filename` for reading/writing/creation.
    */
-  TBB_File( const std::string &filename, FileMode mode = READ );
+  TBB_File( const std::string &filename, FileMode mode = READ, const FileAccessProfile &profile = FileAccessProfile() );
 
   virtual ~TBB_File();
 
-  virtual void open( const std::string &filename, FileMode mode = READ );
+  virtual void open( const std::string &filename, FileMode mode = READ, const FileAccessProfile &profile = FileAccessProfile() );
   virtual void close();
 
   Attribute<std::string> operatingMode();
@@ -57,9 +57,27 @@ public:
 
   virtual TBB_Trigger    trigger();
 
+  /*!
+   * Reads samples [pos, pos + dim2) of each of the `dim1` given dipoles into the rows of
+   * `outbuffer2`, using up to `nrWorkers` threads.
+   *
+   * Dipoles stored in a single external raw file (as TBB data normally is) are read
+   * directly from that file by the worker threads, in parallel, without calling HDF5.
+   * Other dipoles are read through HDF5 by the calling thread.
+   *
+   * The Python binding releases the GIL while the worker threads read.
+   *
+   * Requires:
+   *    - dipoles.size() == dim1
+   *    - pos + dim2 <= dims1D() of each dipole
+   */
+  void                   readDipoles( std::vector<TBB_DipoleDataset> &dipoles, size_t pos, short *outbuffer2, size_t dim1, size_t dim2, unsigned nrWorkers = 4 );
+
+protected:
+  virtual const NodeSchema &nodeSchema() const;
+
 private:
   void                   openFile( FileMode mode );
-  void                   initFileNodes();
 
   std::string            stationGroupName( const std::string &stationName );
 };
@@ -78,7 +96,7 @@ public:
   Attribute<double>      paramFitVarianceMax();
 
 protected:
-  virtual void           initNodes();
+  virtual const NodeSchema &nodeSchema() const;
 };
 
 class TBB_Station: public Group {
@@ -107,7 +125,7 @@ private:
   std::string                           dipoleDatasetName( unsigned stationID, unsigned rspID, unsigned rcuID );
 
 protected:
-  virtual void                          initNodes();
+  virtual const NodeSchema &nodeSchema() const;
 };
 
 class TBB_DipoleDataset: public Dataset<short> {
@@ -149,8 +167,20 @@ public:
   Attribute<double>                     dispersionMeasure();
   Attribute<std::string>                dispersionMeasureUnit();
 
+  /*!
+   * Returns the samples in frames of `frameLength` samples that only contain zeros,
+   * as TBB writers fill in missing data (see zeroFrames()). Frames start at sample 0.
+   * The data is read in blocks of many frames, with read-ahead (see BlockIterator).
+   *
+   * To flag them: flagOffsets().set(findZeroFrames(1024).ranges())
+   *
+   * Requires:
+   *    - frameLength > 0
+   */
+  RangeSet                              findZeroFrames( size_t frameLength );
+
 protected:
-  virtual void                          initNodes();
+  virtual const NodeSchema &nodeSchema() const;
 };
 
 }
@@ -1,5 +1,90 @@
 vector_typemap( dal::TBB_Station );
 vector_typemap( dal::TBB_DipoleDataset );
 
+%include dal/lofar/TBB_DipoleReader.h
+
+// Reimplemented below to release the GIL only while no HDF5 calls are made.
+%ignore dal::TBB_File::readDipoles;
+
 %include dal/lofar/TBB_File.h
+%include dal/lofar/TBB_DipoleAppender.h
+
+%extend dal::TBB_DipoleDataset {
+  %pythoncode {
+    def appender(self, bufferLength=65536, growLength=0):
+      """
+        Returns a TBB_DipoleAppender that appends samples to this dipole,
+        and keeps its DATA_LENGTH and FLAG_OFFSETS attributes up to date.
+        Call close() on the appender to trim the dataset to the appended
+        data. See TBB_DipoleAppender.
+      """
+      appender = TBB_DipoleAppender(self, bufferLength, growLength)
+
+      # the appender refers to this dipole, so keep it alive
+      appender._dataset = self
+      return appender
+  }
+}
+
+%extend dal::TBB_File {
+  %pythoncode {
+    def readDipoles(self, dipoles, pos, outbuffer2, nrWorkers=4):
+      """
+        Reads samples [pos, pos + outbuffer2.shape[1]) of each of the given
+        dipoles into the rows of the 2D numpy array `outbuffer2`, using up to
+        `nrWorkers` threads. Dipoles stored in a single external raw file are
+        read directly from that file in parallel, with the GIL released.
+        Other dipoles are read through HDF5 first.
+
+        Python example:
+
+             >>> f = TBB_File("example_tbb.h5", TBB_File.CREATE)
+             >>> st = f.station("CS001")
+             >>> st.create()
+             <...>
+             >>> import numpy
+             >>> for rcu in range(3):
+             ...   dp = st.dipole(1, 0, rcu)
+             ...   dp.create1D(100, 100, "example_tbb_%u.raw" % rcu)
+             ...   dp.set1D(0, numpy.arange(100, dtype=dp.dtype) + 100 * rcu)
+             <...>
+
+             # Read samples 10-14 of all dipoles
+             >>> dipoles = st.dipoles()
+             >>> x = numpy.zeros((len(dipoles), 5), dtype=TBB_DipoleDataset.dtype)
+             >>> f.readDipoles(dipoles, 10, x)
+             >>> x.tolist()
+             [[10, 11, 12, 13, 14], [110, 111, 112, 113, 114], [210, 211, 212, 213, 214]]
+
+             # Clean up
+             >>> import os
+             >>> os.remove("example_tbb.h5")
+             >>> for rcu in range(3):
+             ...   os.remove("example_tbb_%u.raw" % rcu)
+      """
+      if len(dipoles) != outbuffer2.shape[0]:
+        raise ValueError("Cannot readDipoles if the number of dipoles does not match the number of rows of the output buffer")
+
+      nrSamples = outbuffer2.shape[1]
+      reader = TBB_DipoleReader(nrWorkers)
+
+      # Query HDF5 with the GIL held; the reader does not use HDF5.
+      for row, dp in enumerate(dipoles):
+        length = dp.dims1D()
+        if pos + nrSamples > length:
+          raise ValueError("Cannot readDipoles beyond the end of dipole dataset " + dp.name())
+
+        try:
+          filename = dp.externalDataFile()
+          offset = dp.externalDataOffset()
+        except ValueError:
+          # not stored in a single external file: read through HDF5
+          if nrSamples > 0:
+            dp.get1D(pos, outbuffer2[row])
+          continue
+
+        reader.addRow(row, filename, offset, length, dp.endianness() == dp.BIG)
 
+      reader.read(pos, outbuffer2)
+  }
+}
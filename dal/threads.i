@@ -0,0 +1,141 @@
+// -------------------------------
+// Threads: GIL and HDF5 lock
+// -------------------------------
+
+/*
+ * HDF5 is not thread safe (unless built as such), so DAL calls from different
+ * Python threads must not run concurrently. The GIL used to take care of that.
+ * Blocking I/O calls now release the GIL, so that other Python threads can run,
+ * and all DAL calls hold the HDF5 lock instead.
+ *
+ * To avoid deadlocks, a thread never waits for the HDF5 lock while holding the GIL.
+ */
+%{
+  #include <pthread.h>
+
+  namespace dal_python {
+
+    //! Releases the GIL for the lifetime of this object.
+    class GILRelease {
+    public:
+      GILRelease(): state(PyEval_SaveThread()) {}
+      ~GILRelease() { PyEval_RestoreThread(state); }
+
+    private:
+      PyThreadState *state;
+
+      GILRelease( const GILRelease & );
+      GILRelease &operator=( const GILRelease & );
+    };
+
+    //! Holds the HDF5 lock for the lifetime of this object.
+    class HDF5Lock {
+    public:
+      /*
+       * If `holdingGIL` and another thread holds the HDF5 lock (doing I/O),
+       * the GIL is released while waiting for it.
+       */
+      HDF5Lock( bool holdingGIL ) {
+        if (!holdingGIL) {
+          pthread_mutex_lock(&mutex);
+        } else if (pthread_mutex_trylock(&mutex) != 0) {
+          GILRelease nogil;
+          pthread_mutex_lock(&mutex);
+        }
+      }
+
+      ~HDF5Lock() { pthread_mutex_unlock(&mutex); }
+
+    private:
+      static pthread_mutex_t mutex;
+
+      HDF5Lock( const HDF5Lock & );
+      HDF5Lock &operator=( const HDF5Lock & );
+    };
+
+    pthread_mutex_t HDF5Lock::mutex = PTHREAD_MUTEX_INITIALIZER;
+  }
+%}
+
+// Releases the GIL while `function` does HDF5 I/O.
+%define RELEASE_GIL( function )
+%exception function {
+  try {
+    dal_python::GILRelease nogil;
+    dal_python::HDF5Lock hdf5lock(false);
+
+    $action
+  }
+  DAL_CATCH_EXCEPTIONS
+}
+%enddef
+
+// Releases the GIL while `function` runs. `function` must not call HDF5 (nor Python).
+%define RELEASE_GIL_NO_HDF5( function )
+%exception function {
+  try {
+    dal_python::GILRelease nogil;
+
+    $action
+  }
+  DAL_CATCH_EXCEPTIONS
+}
+%enddef
+
+// File open, flush and close
+RELEASE_GIL(dal::File::File);
+RELEASE_GIL(dal::File::~File);
+RELEASE_GIL(dal::File::open);
+RELEASE_GIL(dal::File::flush);
+RELEASE_GIL(dal::File::fileImage);
+RELEASE_GIL(dal::File::writeImage);
+RELEASE_GIL(dal::File::close);
+RELEASE_GIL(dal::CLA_File::CLA_File);
+RELEASE_GIL(dal::CLA_File::~CLA_File);
+RELEASE_GIL(dal::CLA_File::open);
+RELEASE_GIL(dal::CLA_File::close);
+RELEASE_GIL(dal::BF_File::BF_File);
+RELEASE_GIL(dal::BF_File::~BF_File);
+RELEASE_GIL(dal::BF_File::open);
+RELEASE_GIL(dal::BF_File::close);
+RELEASE_GIL(dal::TBB_File::TBB_File);
+RELEASE_GIL(dal::TBB_File::~TBB_File);
+RELEASE_GIL(dal::TBB_File::open);
+RELEASE_GIL(dal::TBB_File::close);
+
+// Group (deep) copies
+RELEASE_GIL(dal::Group::set);
+RELEASE_GIL(dal::Group::loadAttributes);
+RELEASE_GIL(dal::Group::members);
+RELEASE_GIL(dal::Group::snapshot);
+
+// Dataset I/O
+RELEASE_GIL(dal::Dataset::get1D);
+RELEASE_GIL(dal::Dataset::set1D);
+RELEASE_GIL(dal::Dataset::get2D);
+RELEASE_GIL(dal::Dataset::set2D);
+RELEASE_GIL(dal::Dataset::get3D);
+RELEASE_GIL(dal::Dataset::set3D);
+RELEASE_GIL(dal::Dataset::getHyperslab);
+RELEASE_GIL(dal::Dataset::setHyperslab);
+RELEASE_GIL(dal::Dataset::getRegions);
+RELEASE_GIL(dal::Dataset::getScalar);
+RELEASE_GIL(dal::Dataset::setScalar);
+RELEASE_GIL(dal::Dataset::getScalar1D);
+RELEASE_GIL(dal::Dataset::setScalar1D);
+
+// Raw TBB data is read without HDF5, so other threads can use HDF5 meanwhile
+RELEASE_GIL_NO_HDF5(dal::TBB_DipoleReader::read);
+
+// Waiting for a block that is read ahead does not need HDF5, but reading one without read-ahead does
+RELEASE_GIL(dal::BlockIterator::next);
+RELEASE_GIL_NO_HDF5(dal::BlockIterator::~BlockIterator);
+
+// Appending writes through HDF5 once the buffer is full
+RELEASE_GIL(dal::DatasetAppender::append);
+RELEASE_GIL(dal::DatasetAppender::flush);
+RELEASE_GIL(dal::DatasetAppender::close);
+RELEASE_GIL(dal::DatasetAppender::~DatasetAppender);
+RELEASE_GIL(dal::TBB_DipoleAppender::appendFlagged);
+RELEASE_GIL(dal::TBB_DipoleAppender::flush);
+RELEASE_GIL(dal::TBB_DipoleAppender::~TBB_DipoleAppender);
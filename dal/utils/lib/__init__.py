@@ -1,4 +1,4 @@
 from dal import *
 from bfheader import *
 from bfmeta import *
-
+from metaindex import *
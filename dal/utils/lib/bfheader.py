@@ -22,6 +22,7 @@ class bfheader:
       self.fh=dal.BF_File(filename)     # open file    
     else:
       self.fh=fh                        # take handle
+    self.snapshot=self.fh.snapshot()    # all attributes, read in one pass
     
     #self.args=args
     self.paths=[]                       # list of HDF5 paths to search for
@@ -108,6 +109,20 @@ class bfheader:
     print "SAPNr = ", SAPNr
     self.createHDF5Path(SAPNr, BeamNr, StokesNr, attribute)
     
+  # Snapshot of member group or dataset of snapshot node, or None if it doesn't exist
+  #
+  def member(self, node, group):
+    if node==None:
+      return None
+    return node.get("members", {}).get(group.name())
+
+  # Value of attribute in snapshot node, or None if it doesn't exist
+  #
+  def value(self, node, attribute):
+    if node==None:
+      return None
+    return node["attrs"].get(attribute.name())
+
   # Create a complete HDF5 path
   #
   def createHDF5Path(self, sapNr=None, beamNr=None, stokesNr=None, attribute=None):
@@ -123,38 +138,44 @@ class bfheader:
       #if self.SubArrayPointing(sapNr).exists():
       path += "SUB_ARRAY_POINTING_%(sapNr)03d" %{'sapNr': sapNr}
     else:
-      for sap in range(0, self.fh.nofSubArrayPointings().value):    # all SAPS
+      for sap in range(0, self.value(self.snapshot, self.fh.nofSubArrayPointings()) or 0):    # all SAPS
         #print "sap =", sap         # DEBUG
-        if self.fh.subArrayPointing(sap).exists():
-          path += "SUB_ARRAY_POINTING_%(sap)03d" %{'sap': sap}
+        sapGroup=self.fh.subArrayPointing(sap)
+        sapNode=self.member(self.snapshot, sapGroup)
+        if sapNode==None:
+          continue
+        path += "SUB_ARRAY_POINTING_%(sap)03d" %{'sap': sap}
         if beamNr!=None and beamNr!="all":                          # BEAM
-          if self.fh.subArrayPointing(sap).beam(beamNr).exists:
-            path += "/BEAM_%(beamNr)03d" %{'beamNr': beamNr}
-            self.paths.append(path)
+          beamNode=self.member(sapNode, sapGroup.beam(beamNr))
+          if beamNode==None:
+            continue
+          path += "/BEAM_%(beamNr)03d" %{'beamNr': beamNr}
+          self.paths.append(path)
           if stokesNr!=None and stokesNr!="all":                    # STOKES
-            if self.fh.subArrayPointing(sap).beam(beamNr).stokes(stokesNr).exists():
+            if self.member(beamNode, sapGroup.beam(beamNr).stokes(stokesNr))!=None:
               path += "/STOKES_%(stokesNr)1d" %{'stokesNr': stokesNr}
               self.paths.append(path)
           else:
-            for s in range(0, self.fh.subArrayPointing(sap).beam(beamNr).nofStokes().value):
+            for s in range(0, self.value(beamNode, sapGroup.beam(beamNr).nofStokes()) or 0):
               #print "s = ", s       # DEBUG
-              if self.fh.subArrayPointing(sap).beam(beamNr).stokes(s).exists():
+              if self.member(beamNode, sapGroup.beam(beamNr).stokes(s))!=None:
                 path += "/STOKES_%(s)01d" %{'s': s}
                 path=path.upper()             # convert path to upper case
                 self.paths.append(path)
         else:
-          for b in range(0, self.fh.observationNofBeams().value):      # use here then nofObservedBeams()
+          for b in range(0, self.value(sapNode, sapGroup.observationNofBeams()) or 0):      # use here then nofObservedBeams()
             #print "b = ", b         # DEBUG           # check if BeamNr exists in this hdf5
-            if fh.subArrayPointing(sap).beam(b).exists():
+            beamNode=self.member(sapNode, sapGroup.beam(b))
+            if beamNode!=None:
               path += "/BEAM_%(beam)03d" %{'beam': b}
               if stokesNr!=None and stokesNr!="all":
-                if fh.SubArrayPointing().beam(b).stokes(stokesNr).exists():
+                if self.member(beamNode, sapGroup.beam(b).stokes(stokesNr))!=None:
                   path += "/STOKES_%(stokesNr)1d" %{'stokesNr': stokesNr}
                   self.paths.append(path)
               else:
-                for s in range(0, self.fh.subArrayPointing(sap).beam(b).nofStokes().value):
+                for s in range(0, self.value(beamNode, sapGroup.beam(b).nofStokes()) or 0):
                   #print "s = ", s       # DEBUG
-                  if self.fh.SubArrayPointing().beam(b).stokes(s).exists():
+                  if self.member(beamNode, sapGroup.beam(b).stokes(s))!=None:
                     path += "/STOKES_%(s)01d" %{'s': s}
                     path=path.upper()             # convert path to upper case
                     self.paths.append(path)
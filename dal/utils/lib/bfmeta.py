@@ -28,10 +28,19 @@ class bfmeta:
     self.beam=beam
     self.stokes=stokes
     self.verbose=verbose
+    # Read all attributes in one pass; the accessors below only provide their names
+    self.snapshot=self.fh.snapshot()
     self.displayInfo()
 
     print bcolors.ENDC    # End all colourization
     
+  # Snapshot of member group or dataset of snapshot node, or None if it doesn't exist
+  #
+  def member(self, node, group):
+    if node==None:
+      return None
+    return node.get("members", {}).get(group.name())
+
   # High-level function to display all info, calling display ftns for classes
   #  
   def displayInfo(self):
@@ -46,55 +55,56 @@ class bfmeta:
     if self.level < 1:
       print "ROOT"
       return
-    print self.fh.groupType().name(), "\t\t=", self.fh.groupType().value
-    print self.fh.fileName().name(), "\t\t=", self.fh.fileName().value
-    print self.fh.fileDate().name(), "\t\t=", self.fh.fileDate().value
-    print self.fh.fileType().name(), "\t\t=", self.fh.fileType().value
-    print self.fh.telescope().name(), "\t\t=", self.fh.telescope().value
-    print self.fh.projectID().name(), "\t\t=", self.fh.projectID().value
-    print self.fh.projectTitle().name(), "\t\t=", self.fh.projectTitle().value
-    print self.fh.projectPI().name(), "\t\t=", self.fh.projectPI().value
-    print self.fh.projectCOI().name(), "\t\t=", self.fh.projectCOI().value
-    print self.fh.projectContact().name(), "\t=", self.fh.projectContact().value
-    print self.fh.observationID().name(), "\t\t=", self.fh.observationID().value
-    print self.fh.observationStartUTC().name(), "\t=", self.fh.observationStartUTC().value
-    print self.fh.observationEndUTC().name(), "\t=", self.fh.observationEndUTC().value
-    if self.fh.observationStartMJD().value != None:
-      print self.fh.observationStartMJD().name(), "\t=%(mjd)19.12f" %{'mjd':self.fh.observationStartMJD().value}
-    if self.fh.observationEndMJD().value != None:
-      print self.fh.observationEndMJD().name(), "\t=%(mjd)19.12f" %{'mjd':self.fh.observationEndMJD().value}
-#    print self.fh.observationStartTAI().name(), "\t=", self.fh.observationStartTAI().value
-#    print self.fh.observationEndTAI().name(), "\t=", self.fh.observationEndTAI().value
-    print self.fh.observationNofStations().name(), "=", self.fh.observationNofStations().value
-    print self.fh.observationStationsList().name(), "=", self.fh.observationStationsList().value
-    print self.fh.observationFrequencyMin().name(), "\t=", self.fh.observationFrequencyMin().value, self.fh.observationFrequencyUnit().value
-    print self.fh.observationFrequencyCenter().name(), "\t=", self.fh.observationFrequencyCenter().value, self.fh.observationFrequencyUnit().value
-    print self.fh.observationFrequencyMax().name(), "\t=", self.fh.observationFrequencyMax().value, self.fh.observationFrequencyUnit().value
-    print self.fh.observationNofBitsPerSample().name(), "=", self.fh.observationNofBitsPerSample().value
-    print self.fh.clockFrequency().name(), "\t=", self.fh.clockFrequency().value, self.fh.clockFrequencyUnit().value
-    print self.fh.antennaSet().name(), "\t\t=", self.fh.antennaSet().value
-    print self.fh.filterSelection().name(), "\t=", self.fh.filterSelection().value
-    print self.fh.targets().name(), "\t\t=", self.fh.targets().value
-    print self.fh.systemVersion().name(), "\t\t=", self.fh.systemVersion().value
-    print self.fh.pipelineName().name(), "\t\t=", self.fh.pipelineName().value
-    print self.fh.pipelineVersion().name(), "\t=", self.fh.pipelineVersion().value
-    print self.fh.docName().name(), "\t\t=", self.fh.docName().value
-    print self.fh.docVersion().name(), "\t\t=", self.fh.docVersion().value
-    print self.fh.createOfflineOnline().name(), "\t=", self.fh.createOfflineOnline().value
-    print self.fh.BFFormat().name(), "\t\t=", self.fh.BFFormat().value
-    print self.fh.BFVersion().name(), "\t\t=", self.fh.BFVersion().value
-    if self.fh.totalIntegrationTime().value != None:
-      print self.fh.totalIntegrationTime().name(), " = %(ti).2f %(tiu)s" %{'ti':self.fh.totalIntegrationTime().value, 'tiu':self.fh.totalIntegrationTimeUnit().value}
-    print self.fh.observationDatatype().name(), "\t=", self.fh.observationDatatype().value
-    print self.fh.subArrayPointingDiameter().name(), " =", self.fh.subArrayPointingDiameter().value, self.fh.subArrayPointingDiameterUnit().value
-    if self.fh.bandwidth().value != None:
-      print self.fh.bandwidth().name(), "\t\t= %(bw).2f %(bwu)s" %{'bw':self.fh.bandwidth().value, 'bwu':self.fh.bandwidthUnit().value}
-#    print self.fh.beamDiameter().name(), "\t\t=", self.fh.beamDiameter().value, self.fh.beamDiameterUnit().value
-#    print self.fh.weatherTemperature().name(), "\t=", self.fh.weatherTemperature().value, self.fh.weatherTemperatureUnit().value
-#    print self.fh.weatherHumidity().name(), "\t=", self.fh.weatherHumidity().value, self.fh.weatherHumidityUnit().value
-#    print self.fh.systemTemperature().name(), "\t=", self.fh.systemTemperature().value, self.fh.systemTemperatureUnit().value
-    print self.fh.observationNofSubArrayPointings().name(), "=", self.fh.observationNofSubArrayPointings().value
-    print self.fh.nofSubArrayPointings().name(), "=", self.fh.nofSubArrayPointings().value
+    attrs=self.snapshot["attrs"]
+    print self.fh.groupType().name(), "\t\t=", attrs.get(self.fh.groupType().name())
+    print self.fh.fileName().name(), "\t\t=", attrs.get(self.fh.fileName().name())
+    print self.fh.fileDate().name(), "\t\t=", attrs.get(self.fh.fileDate().name())
+    print self.fh.fileType().name(), "\t\t=", attrs.get(self.fh.fileType().name())
+    print self.fh.telescope().name(), "\t\t=", attrs.get(self.fh.telescope().name())
+    print self.fh.projectID().name(), "\t\t=", attrs.get(self.fh.projectID().name())
+    print self.fh.projectTitle().name(), "\t\t=", attrs.get(self.fh.projectTitle().name())
+    print self.fh.projectPI().name(), "\t\t=", attrs.get(self.fh.projectPI().name())
+    print self.fh.projectCOI().name(), "\t\t=", attrs.get(self.fh.projectCOI().name())
+    print self.fh.projectContact().name(), "\t=", attrs.get(self.fh.projectContact().name())
+    print self.fh.observationID().name(), "\t\t=", attrs.get(self.fh.observationID().name())
+    print self.fh.observationStartUTC().name(), "\t=", attrs.get(self.fh.observationStartUTC().name())
+    print self.fh.observationEndUTC().name(), "\t=", attrs.get(self.fh.observationEndUTC().name())
+    if attrs.get(self.fh.observationStartMJD().name()) != None:
+      print self.fh.observationStartMJD().name(), "\t=%(mjd)19.12f" %{'mjd':attrs.get(self.fh.observationStartMJD().name())}
+    if attrs.get(self.fh.observationEndMJD().name()) != None:
+      print self.fh.observationEndMJD().name(), "\t=%(mjd)19.12f" %{'mjd':attrs.get(self.fh.observationEndMJD().name())}
+#    print self.fh.observationStartTAI().name(), "\t=", attrs.get(self.fh.observationStartTAI().name())
+#    print self.fh.observationEndTAI().name(), "\t=", attrs.get(self.fh.observationEndTAI().name())
+    print self.fh.observationNofStations().name(), "=", attrs.get(self.fh.observationNofStations().name())
+    print self.fh.observationStationsList().name(), "=", attrs.get(self.fh.observationStationsList().name())
+    print self.fh.observationFrequencyMin().name(), "\t=", attrs.get(self.fh.observationFrequencyMin().name()), attrs.get(self.fh.observationFrequencyUnit().name())
+    print self.fh.observationFrequencyCenter().name(), "\t=", attrs.get(self.fh.observationFrequencyCenter().name()), attrs.get(self.fh.observationFrequencyUnit().name())
+    print self.fh.observationFrequencyMax().name(), "\t=", attrs.get(self.fh.observationFrequencyMax().name()), attrs.get(self.fh.observationFrequencyUnit().name())
+    print self.fh.observationNofBitsPerSample().name(), "=", attrs.get(self.fh.observationNofBitsPerSample().name())
+    print self.fh.clockFrequency().name(), "\t=", attrs.get(self.fh.clockFrequency().name()), attrs.get(self.fh.clockFrequencyUnit().name())
+    print self.fh.antennaSet().name(), "\t\t=", attrs.get(self.fh.antennaSet().name())
+    print self.fh.filterSelection().name(), "\t=", attrs.get(self.fh.filterSelection().name())
+    print self.fh.targets().name(), "\t\t=", attrs.get(self.fh.targets().name())
+    print self.fh.systemVersion().name(), "\t\t=", attrs.get(self.fh.systemVersion().name())
+    print self.fh.pipelineName().name(), "\t\t=", attrs.get(self.fh.pipelineName().name())
+    print self.fh.pipelineVersion().name(), "\t=", attrs.get(self.fh.pipelineVersion().name())
+    print self.fh.docName().name(), "\t\t=", attrs.get(self.fh.docName().name())
+    print self.fh.docVersion().name(), "\t\t=", attrs.get(self.fh.docVersion().name())
+    print self.fh.createOfflineOnline().name(), "\t=", attrs.get(self.fh.createOfflineOnline().name())
+    print self.fh.BFFormat().name(), "\t\t=", attrs.get(self.fh.BFFormat().name())
+    print self.fh.BFVersion().name(), "\t\t=", attrs.get(self.fh.BFVersion().name())
+    if attrs.get(self.fh.totalIntegrationTime().name()) != None:
+      print self.fh.totalIntegrationTime().name(), " = %(ti).2f %(tiu)s" %{'ti':attrs.get(self.fh.totalIntegrationTime().name()), 'tiu':attrs.get(self.fh.totalIntegrationTimeUnit().name())}
+    print self.fh.observationDatatype().name(), "\t=", attrs.get(self.fh.observationDatatype().name())
+    print self.fh.subArrayPointingDiameter().name(), " =", attrs.get(self.fh.subArrayPointingDiameter().name()), attrs.get(self.fh.subArrayPointingDiameterUnit().name())
+    if attrs.get(self.fh.bandwidth().name()) != None:
+      print self.fh.bandwidth().name(), "\t\t= %(bw).2f %(bwu)s" %{'bw':attrs.get(self.fh.bandwidth().name()), 'bwu':attrs.get(self.fh.bandwidthUnit().name())}
+#    print self.fh.beamDiameter().name(), "\t\t=", attrs.get(self.fh.beamDiameter().name()), attrs.get(self.fh.beamDiameterUnit().name())
+#    print self.fh.weatherTemperature().name(), "\t=", attrs.get(self.fh.weatherTemperature().name()), attrs.get(self.fh.weatherTemperatureUnit().name())
+#    print self.fh.weatherHumidity().name(), "\t=", attrs.get(self.fh.weatherHumidity().name()), attrs.get(self.fh.weatherHumidityUnit().name())
+#    print self.fh.systemTemperature().name(), "\t=", attrs.get(self.fh.systemTemperature().name()), attrs.get(self.fh.systemTemperatureUnit().name())
+    print self.fh.observationNofSubArrayPointings().name(), "=", attrs.get(self.fh.observationNofSubArrayPointings().name())
+    print self.fh.nofSubArrayPointings().name(), "=", attrs.get(self.fh.nofSubArrayPointings().name())
     
     if self.level==1:
       print self.prefix + "--------------------------------------"
@@ -105,8 +115,9 @@ class bfmeta:
   # Display Sub Array Pointing information for SAPs
   #
   def displaySAP(self):
+    attrs=self.snapshot["attrs"]
     if self.sap=="all":
-      for nr in range(0, self.fh.nofSubArrayPointings().value):   
+      for nr in range(0, attrs.get(self.fh.nofSubArrayPointings().name())):   
         self.displaySAPInfo(nr)
     else:
       if isinstance(self.sap, list):
@@ -123,7 +134,8 @@ class bfmeta:
     if self.useColor:
       self.prefix=self.prefix + bcolors.SAP
 
-    if self.fh.subArrayPointing(nr).exists():
+    sapNode=self.member(self.snapshot, self.fh.subArrayPointing(nr))
+    if sapNode!=None:
       if self.level < 2:
         if self.useColor:
           print bcolors.SAP + "   |"
@@ -132,9 +144,8 @@ class bfmeta:
           print "   |"
           print "   SAP_%(sap)03d" %{'sap': nr}
 
-        if self.fh.subArrayPointing(nr).exists():
-          sap=self.fh.subArrayPointing(nr)
-          self.displayBeam(sap)
+        sap=self.fh.subArrayPointing(nr)
+        self.displayBeam(sap, sapNode)
         return
       if str(nr) in self.sap or self.sap=="all":
         sap=self.fh.subArrayPointing(nr)
@@ -153,52 +164,54 @@ class bfmeta:
       print self.prefix
       return    
 
-    print self.prefix + sap.groupType().name() +  "\t\t= " + sap.groupType().value
-    print self.prefix + sap.expTimeStartUTC().name() +  "\t= " + str(sap.expTimeStartUTC().value)
-    print self.prefix + sap.expTimeEndUTC().name() +  "\t\t= " + str(sap.expTimeEndUTC().value)
-    if sap.expTimeStartMJD().value != None:
-      print self.prefix + sap.expTimeStartMJD().name() + "\t=%(mjd)19.12f" %{'mjd':sap.expTimeStartMJD().value}
-    if sap.expTimeEndMJD().value != None:
-      print self.prefix + sap.expTimeEndMJD().name() + "\t\t=%(mjd)19.12f" %{'mjd':sap.expTimeEndMJD().value}
-#    if sap.expTimeStartTAI().value != None:
-#      print self.prefix + sap.expTimeStartTAI().name() + "\t= %(tai)s" %{'tai':sap.expTimeStartTAI().value}
-#    if sap.expTimeEndTAI().value != None:
-#      print self.prefix + sap.expTimeEndTAI().name() + "\t\t= %(tai)s" %{'tai':sap.expTimeEndTAI().value}
-    if sap.totalIntegrationTime().value != None and sap.totalIntegrationTimeUnit().value != None: 
-      print self.prefix + sap.totalIntegrationTime().name(), " = %(ti).2f %(tiu)s" %{'ti':sap.totalIntegrationTime().value, 'tiu':sap.totalIntegrationTimeUnit().value}
-    if sap.pointRA().value != None:
-      print self.prefix + sap.pointRA().name() + "\t\t= %(pra)3.10f %(prau)s" %{ 'pra': sap.pointRA().value, 'prau': sap.pointRAUnit().value}
-    if sap.pointDEC().value != None:
-      print self.prefix + sap.pointDEC().name() + "\t\t= %(decra)4.10f %(decrau)s" %{'decra': sap.pointDEC().value, 'decrau': sap.pointDECUnit().value}
-    print self.prefix + sap.pointAltitude().name() + "\t\t=", sap.pointAltitude().value, sap.pointAltitudeUnit().value   # optional attribute
-    print self.prefix + sap.pointAltitude().name() + "\t\t=", sap.pointAzimuth().value, sap.pointAzimuthUnit().value      # optional attribute
-    print self.prefix + sap.observationNofBeams().name() + "\t=", sap.observationNofBeams().value
-    print self.prefix + sap.nofBeams().name() + "\t\t=", sap .nofBeams().value
+    attrs=sapNode["attrs"]
+    print self.prefix + sap.groupType().name() +  "\t\t= " + attrs.get(sap.groupType().name())
+    print self.prefix + sap.expTimeStartUTC().name() +  "\t= " + str(attrs.get(sap.expTimeStartUTC().name()))
+    print self.prefix + sap.expTimeEndUTC().name() +  "\t\t= " + str(attrs.get(sap.expTimeEndUTC().name()))
+    if attrs.get(sap.expTimeStartMJD().name()) != None:
+      print self.prefix + sap.expTimeStartMJD().name() + "\t=%(mjd)19.12f" %{'mjd':attrs.get(sap.expTimeStartMJD().name())}
+    if attrs.get(sap.expTimeEndMJD().name()) != None:
+      print self.prefix + sap.expTimeEndMJD().name() + "\t\t=%(mjd)19.12f" %{'mjd':attrs.get(sap.expTimeEndMJD().name())}
+#    if attrs.get(sap.expTimeStartTAI().name()) != None:
+#      print self.prefix + sap.expTimeStartTAI().name() + "\t= %(tai)s" %{'tai':attrs.get(sap.expTimeStartTAI().name())}
+#    if attrs.get(sap.expTimeEndTAI().name()) != None:
+#      print self.prefix + sap.expTimeEndTAI().name() + "\t\t= %(tai)s" %{'tai':attrs.get(sap.expTimeEndTAI().name())}
+    if attrs.get(sap.totalIntegrationTime().name()) != None and attrs.get(sap.totalIntegrationTimeUnit().name()) != None: 
+      print self.prefix + sap.totalIntegrationTime().name(), " = %(ti).2f %(tiu)s" %{'ti':attrs.get(sap.totalIntegrationTime().name()), 'tiu':attrs.get(sap.totalIntegrationTimeUnit().name())}
+    if attrs.get(sap.pointRA().name()) != None:
+      print self.prefix + sap.pointRA().name() + "\t\t= %(pra)3.10f %(prau)s" %{ 'pra': attrs.get(sap.pointRA().name()), 'prau': attrs.get(sap.pointRAUnit().name())}
+    if attrs.get(sap.pointDEC().name()) != None:
+      print self.prefix + sap.pointDEC().name() + "\t\t= %(decra)4.10f %(decrau)s" %{'decra': attrs.get(sap.pointDEC().name()), 'decrau': attrs.get(sap.pointDECUnit().name())}
+    print self.prefix + sap.pointAltitude().name() + "\t\t=", attrs.get(sap.pointAltitude().name()), attrs.get(sap.pointAltitudeUnit().name())   # optional attribute
+    print self.prefix + sap.pointAltitude().name() + "\t\t=", attrs.get(sap.pointAzimuth().name()), attrs.get(sap.pointAzimuthUnit().name())      # optional attribute
+    print self.prefix + sap.observationNofBeams().name() + "\t=", attrs.get(sap.observationNofBeams().name())
+    print self.prefix + sap.nofBeams().name() + "\t\t=", attrs.get(sap.nofBeams().name())
     if self.level==2:
       print self.prefix + "--------------------------------------"
 
     # Beams within this SAP
-    self.displayBeam(sap)
+    self.displayBeam(sap, sapNode)
     self.prefix=bcolors.ENDC
     print self.prefix
 
   # Display Sub Array Pointing information for Beams
   #  
-  def displayBeam(self, sap):
+  def displayBeam(self, sap, sapNode):
     #print "displayBeam()"               # DEBUG
+    attrs=sapNode["attrs"]
     if self.beam=="all":
-      #for n in range(0, sap.nofBeams().value):
-      for n in range(0, sap.observationNofBeams().value):   
-          self.displayBeamInfo(sap, int(n))
+      #for n in range(0, attrs.get(sap.nofBeams().name())):
+      for n in range(0, attrs.get(sap.observationNofBeams().name())):   
+          self.displayBeamInfo(sap, sapNode, int(n))
     elif isinstance(self.beam, list):
       for b in self.beam:
-        self.displayBeamInfo(sap, int(b))
+        self.displayBeamInfo(sap, sapNode, int(b))
     else:   # single beam integer
-      self.displayBeamInfo(sap, int(self.beam))
+      self.displayBeamInfo(sap, sapNode, int(self.beam))
 
   # Display Beam information
   #  
-  def displayBeamInfo(self, sap, nr):
+  def displayBeamInfo(self, sap, sapNode, nr):
     #print "displayBeamInfo()"
     if self.useTabs:
       self.prefix="\t"
@@ -206,8 +219,10 @@ class bfmeta:
       self.prefix=self.prefix + bcolors.BEAM
 
     # Check if this beam exists in this SAP
-    if sap.beam(nr).exists() and (str(nr) == self.beam or self.beam=="all"):
+    beamNode=self.member(sapNode, sap.beam(nr))
+    if beamNode!=None and (str(nr) == self.beam or self.beam=="all"):
       beam=sap.beam(nr)
+      attrs=beamNode["attrs"]
       if self.level < 3:            # display tree
         if self.useColor:
           print bcolors.BEAM + "         |"
@@ -216,9 +231,9 @@ class bfmeta:
           print "         |"
           print "         BEAM_%(beam)03d" %{'beam': nr}
 
-        for d in range(0, beam.observationNofStokes().value):
-          self.displayStokesDatasetInfo(beam, d)
-        self.displayCoordinates(beam)
+        for d in range(0, attrs.get(beam.observationNofStokes().name())):
+          self.displayStokesDatasetInfo(beam, beamNode, d)
+        self.displayCoordinates(beam, beamNode)
         return
     else:
       if self.useTabs==False:
@@ -237,39 +252,39 @@ class bfmeta:
     print self.prefix + "------------------------------------"
     print self.prefix + "BEAM_%(bnr)03d" %{'bnr': nr}
    
-    print self.prefix + beam.groupType().name() + "\t\t= " + beam.groupType().value
-    print self.prefix + beam.targets().name() + "\t\t\t=", beam.targets().value
-    print self.prefix + beam.nofStations().name() +"\t\t=", beam.nofStations().value
-    print self.prefix + beam.stationsList().name() + "\t\t=", beam.stationsList().value
-    print self.prefix + beam.nofSamples().name() + "\t\t=", beam.nofSamples().value
-    print self.prefix + beam.samplingRate().name() + "\t\t=", beam.samplingRate().value, beam.samplingRateUnit().value
-    print self.prefix + beam.samplingTime().name() + "\t\t=", beam.samplingTime().value, beam.samplingTimeUnit().value
-    print self.prefix + beam.channelsPerSubband().name() + "\t=", beam.channelsPerSubband().value
-    print self.prefix + beam.subbandWidth().name() + "\t\t=", beam.subbandWidth().value, beam.subbandWidthUnit().value
-    print self.prefix + beam.channelWidth().name() + "\t\t=", beam.channelWidth().value, beam.channelWidthUnit().value
-    print self.prefix + beam.tracking().name() + "\t\t=", beam.tracking().value
-    print self.prefix + beam.pointRA().name() + "\t\t=", beam.pointRA().value, beam.pointRAUnit().value
-    print self.prefix + beam.pointDEC().name() + "\t\t=", beam.pointDEC().value, beam.pointDECUnit().value
-    print self.prefix + beam.pointOffsetRA().name() + "\t\t=", beam.pointOffsetRA().value, beam.pointOffsetRAUnit().value
-    print self.prefix + beam.pointOffsetDEC().name() + "\t=", beam.pointOffsetDEC().value, beam.pointOffsetDECUnit().value
-    print self.prefix + beam.beamDiameterRA().name() + "\t=", beam.beamDiameterRA().value, beam.beamDiameterRAUnit().value
-    print self.prefix + beam.beamDiameterDEC().name() + "\t=", beam.beamDiameterDEC().value, beam.beamDiameterDECUnit().value
-    print self.prefix + beam.beamFrequencyCenter().name() + "\t=", beam.beamFrequencyCenter().value, beam.beamFrequencyCenterUnit().value
-    print self.prefix + beam.foldedData().name() + "\t\t=", beam.foldedData().value
-    print self.prefix + beam.foldPeriod().name() + "\t\t=", beam.foldPeriod().value, beam.foldPeriodUnit().value
-    print self.prefix + beam.dedispersion().name() + "\t\t=", beam.dedispersion().value
-#   if beam.dispersionMeasure().value != None:
-#    print self.prefix + beam.dispersionMeasure().name() + "\t= %(dm) %(dmu)" %{'dm': beam.dispersionMeasure().value, 'dmu': beam.dispersionMeasureUnit().value}
-    print self.prefix + beam.dispersionMeasure().name() + "\t=", beam.dispersionMeasure().value, beam.dispersionMeasureUnit().value
-    print self.prefix + beam.barycentered().name() + "\t\t=", beam.barycentered().value
-    print self.prefix + beam.observationNofStokes().name() + "\t=", beam.observationNofStokes().value
-    print self.prefix + beam.nofStokes().name() + "\t\t=", beam.nofStokes().value
-    print self.prefix + beam.stokesComponents().name() + "\t= ", beam.stokesComponents().value
-    print self.prefix + beam.complexVoltage().name() + "\t\t=", beam.complexVoltage().value
-    print self.prefix + beam.signalSum().name() + "\t\t=", beam.signalSum().value
+    print self.prefix + beam.groupType().name() + "\t\t= " + attrs.get(beam.groupType().name())
+    print self.prefix + beam.targets().name() + "\t\t\t=", attrs.get(beam.targets().name())
+    print self.prefix + beam.nofStations().name() +"\t\t=", attrs.get(beam.nofStations().name())
+    print self.prefix + beam.stationsList().name() + "\t\t=", attrs.get(beam.stationsList().name())
+    print self.prefix + beam.nofSamples().name() + "\t\t=", attrs.get(beam.nofSamples().name())
+    print self.prefix + beam.samplingRate().name() + "\t\t=", attrs.get(beam.samplingRate().name()), attrs.get(beam.samplingRateUnit().name())
+    print self.prefix + beam.samplingTime().name() + "\t\t=", attrs.get(beam.samplingTime().name()), attrs.get(beam.samplingTimeUnit().name())
+    print self.prefix + beam.channelsPerSubband().name() + "\t=", attrs.get(beam.channelsPerSubband().name())
+    print self.prefix + beam.subbandWidth().name() + "\t\t=", attrs.get(beam.subbandWidth().name()), attrs.get(beam.subbandWidthUnit().name())
+    print self.prefix + beam.channelWidth().name() + "\t\t=", attrs.get(beam.channelWidth().name()), attrs.get(beam.channelWidthUnit().name())
+    print self.prefix + beam.tracking().name() + "\t\t=", attrs.get(beam.tracking().name())
+    print self.prefix + beam.pointRA().name() + "\t\t=", attrs.get(beam.pointRA().name()), attrs.get(beam.pointRAUnit().name())
+    print self.prefix + beam.pointDEC().name() + "\t\t=", attrs.get(beam.pointDEC().name()), attrs.get(beam.pointDECUnit().name())
+    print self.prefix + beam.pointOffsetRA().name() + "\t\t=", attrs.get(beam.pointOffsetRA().name()), attrs.get(beam.pointOffsetRAUnit().name())
+    print self.prefix + beam.pointOffsetDEC().name() + "\t=", attrs.get(beam.pointOffsetDEC().name()), attrs.get(beam.pointOffsetDECUnit().name())
+    print self.prefix + beam.beamDiameterRA().name() + "\t=", attrs.get(beam.beamDiameterRA().name()), attrs.get(beam.beamDiameterRAUnit().name())
+    print self.prefix + beam.beamDiameterDEC().name() + "\t=", attrs.get(beam.beamDiameterDEC().name()), attrs.get(beam.beamDiameterDECUnit().name())
+    print self.prefix + beam.beamFrequencyCenter().name() + "\t=", attrs.get(beam.beamFrequencyCenter().name()), attrs.get(beam.beamFrequencyCenterUnit().name())
+    print self.prefix + beam.foldedData().name() + "\t\t=", attrs.get(beam.foldedData().name())
+    print self.prefix + beam.foldPeriod().name() + "\t\t=", attrs.get(beam.foldPeriod().name()), attrs.get(beam.foldPeriodUnit().name())
+    print self.prefix + beam.dedispersion().name() + "\t\t=", attrs.get(beam.dedispersion().name())
+#   if attrs.get(beam.dispersionMeasure().name()) != None:
+#    print self.prefix + beam.dispersionMeasure().name() + "\t= %(dm) %(dmu)" %{'dm': attrs.get(beam.dispersionMeasure().name()), 'dmu': attrs.get(beam.dispersionMeasureUnit().name())}
+    print self.prefix + beam.dispersionMeasure().name() + "\t=", attrs.get(beam.dispersionMeasure().name()), attrs.get(beam.dispersionMeasureUnit().name())
+    print self.prefix + beam.barycentered().name() + "\t\t=", attrs.get(beam.barycentered().name())
+    print self.prefix + beam.observationNofStokes().name() + "\t=", attrs.get(beam.observationNofStokes().name())
+    print self.prefix + beam.nofStokes().name() + "\t\t=", attrs.get(beam.nofStokes().name())
+    print self.prefix + beam.stokesComponents().name() + "\t= ", attrs.get(beam.stokesComponents().name())
+    print self.prefix + beam.complexVoltage().name() + "\t\t=", attrs.get(beam.complexVoltage().name())
+    print self.prefix + beam.signalSum().name() + "\t\t=", attrs.get(beam.signalSum().name())
 
     # Only beams with selected Stokes components
-    if self.stokes not in beam.stokesComponents().value and self.stokes!="all":
+    if self.stokes not in attrs.get(beam.stokesComponents().name()) and self.stokes!="all":
       #print self.prefix
       self.prefix=self.prefix + bcolors.DATASET
       if self.level < 3:
@@ -285,30 +300,32 @@ class bfmeta:
       print self.prefix + "--------------------------------------"
 
     # Display Stokes datasets
-    for d in range(0, beam.observationNofStokes().value):
-      self.displayStokesDatasetInfo(beam, d)
-    self.displayCoordinates(beam)
+    for d in range(0, attrs.get(beam.observationNofStokes().name())):
+      self.displayStokesDatasetInfo(beam, beamNode, d)
+    self.displayCoordinates(beam, beamNode)
     self.prefix=bcolors.ENDC          # reset printing options
     print self.prefix
     
   # Display info of Stokes dataset
   #
-  def displayStokesDataset(self, beam, nr="all"):
+  def displayStokesDataset(self, beam, beamNode, nr="all"):
     if nr=="all":
-      for n in range(0, beam.observationNofStokes().value):
-        self.displayStokesDatasetInfo(n)
+      for n in range(0, beamNode["attrs"].get(beam.observationNofStokes().name())):
+        self.displayStokesDatasetInfo(beam, beamNode, n)
     else:
-      self.displayStokesDatasetInfo(nr)
+      self.displayStokesDatasetInfo(beam, beamNode, nr)
 
-  def displayStokesDatasetInfo(self, beam, nr):
+  def displayStokesDatasetInfo(self, beam, beamNode, nr):
     if self.useTabs==True:
       self.prefix="\t\t"
     if self.useColor==True:
       self.prefix=self.prefix + bcolors.DATASET
 
-    if beam.stokes(nr).exists():
+    stokesNode=self.member(beamNode, beam.stokes(nr))
+    if stokesNode!=None:
       stokes=beam.stokes(nr)
-      if self.stokes == "all" or stokes.stokesComponent().value == self.stokes:
+      attrs=stokesNode["attrs"]
+      if self.stokes == "all" or attrs.get(stokes.stokesComponent().name()) == self.stokes:
         if self.level < 4:
           if self.useTabs:
             print self.prefix + "|"
@@ -320,11 +337,11 @@ class bfmeta:
         else:
           stokes=beam.stokes(nr)
           print self.prefix + "------------------------------------"
-          print self.prefix + stokes.stokesComponent().name() + "\t=", stokes.stokesComponent().value    
-          print self.prefix + stokes.dataType().name() + "\t\t=", stokes.dataType().value    
-          print self.prefix + stokes.nofSamples().name() + "\t\t=", stokes.nofSamples().value    
-          print self.prefix + stokes.nofSubbands().name() + "\t\t=", stokes.nofSubbands().value    
-          print self.prefix + stokes.nofChannels().name() + "\t\t=", stokes.nofChannels().value        
+          print self.prefix + stokes.stokesComponent().name() + "\t=", attrs.get(stokes.stokesComponent().name())    
+          print self.prefix + stokes.dataType().name() + "\t\t=", attrs.get(stokes.dataType().name())    
+          print self.prefix + stokes.nofSamples().name() + "\t\t=", attrs.get(stokes.nofSamples().name())    
+          print self.prefix + stokes.nofSubbands().name() + "\t\t=", attrs.get(stokes.nofSubbands().name())    
+          print self.prefix + stokes.nofChannels().name() + "\t\t=", attrs.get(stokes.nofChannels().name())        
           self.prefix=bcolors.ENDC        # reset printing options     
           print self.prefix
       if self.level==4:
@@ -334,7 +351,7 @@ class bfmeta:
     
   # Display coordinategroup info (only in verbose mode)
   #
-  def displayCoordinates(self, beam):
+  def displayCoordinates(self, beam, beamNode):
     if self.useTabs==True:
       self.prefix="\t\t\t"
     if self.useColor==True:
@@ -348,30 +365,35 @@ class bfmeta:
         print bcolors.COORD + "                |"
         print bcolors.COORD + "                COORDINATES"
       coords=beam.coordinates()
-      for c in range(0, coords.nofCoordinates().value):
-        self.displayCoordinate(coords, c)
+      coordsNode=self.member(beamNode, coords)
+      if coordsNode==None:
+        return
+      for c in range(0, coordsNode["attrs"].get(coords.nofCoordinates().name())):
+        self.displayCoordinate(coords, coordsNode, c)
       return
     print self.prefix + "----------------------------------"
     #print self.prefix + "Coordinates"
-    if beam.coordinates().exists()==False:
+    coordsNode=self.member(beamNode, beam.coordinates())
+    if coordsNode==None:
       return
     else:
       coords=beam.coordinates()
+      attrs=coordsNode["attrs"]
       # This is buggy in the Swig bindings
-      print self.prefix + coords.groupType().name() + "\t\t=", coords.groupType().value
-      print self.prefix + coords.refLocationValue().name() + "\t=", coords.refLocationValue().value, coords.refLocationUnit().value
-      print self.prefix + coords.refLocationFrame().name() + "\t=", coords.refLocationFrame().value
-      print self.prefix + coords.refTimeValue().name() + "\t\t=", coords.refTimeValue().value, coords.refTimeUnit().value
-      print self.prefix + coords.refTimeFrame().name() + "\t\t=", coords.refTimeFrame().value
-      print self.prefix + coords.nofCoordinates().name() + "\t\t=", coords.nofCoordinates().value
-      print self.prefix + coords.nofAxes().name() + "\t\t=", coords.nofAxes().value
-      print self.prefix + coords.coordinateTypes().name() + "\t=", coords.coordinateTypes().value
+      print self.prefix + coords.groupType().name() + "\t\t=", attrs.get(coords.groupType().name())
+      print self.prefix + coords.refLocationValue().name() + "\t=", attrs.get(coords.refLocationValue().name()), attrs.get(coords.refLocationUnit().name())
+      print self.prefix + coords.refLocationFrame().name() + "\t=", attrs.get(coords.refLocationFrame().name())
+      print self.prefix + coords.refTimeValue().name() + "\t\t=", attrs.get(coords.refTimeValue().name()), attrs.get(coords.refTimeUnit().name())
+      print self.prefix + coords.refTimeFrame().name() + "\t\t=", attrs.get(coords.refTimeFrame().name())
+      print self.prefix + coords.nofCoordinates().name() + "\t\t=", attrs.get(coords.nofCoordinates().name())
+      print self.prefix + coords.nofAxes().name() + "\t\t=", attrs.get(coords.nofAxes().name())
+      print self.prefix + coords.coordinateTypes().name() + "\t=", attrs.get(coords.coordinateTypes().name())
 
       if self.level==5:
         print self.prefix + "--------------------------------------"
 
-      for c in range(0, coords.nofCoordinates().value):
-        self.displayCoordinate(coords, c)
+      for c in range(0, attrs.get(coords.nofCoordinates().name())):
+        self.displayCoordinate(coords, coordsNode, c)
         if self.useTabs==True:
           self.prefix="\t\t\t"
         else:
@@ -381,7 +403,7 @@ class bfmeta:
 
   # Display a particular coordinate
   #
-  def displayCoordinate(self, coords, nr):
+  def displayCoordinate(self, coords, coordsNode, nr):
     if self.level < 6:
       if self.useTabs==True:
         print "\t\t" + "          |"
@@ -392,39 +414,41 @@ class bfmeta:
       return
     print self.prefix + "--------------------------------"
     print self.prefix + "COORDINATE_"+ str(nr)
-    if coords.coordinate(nr).exists()==False:
+    coord=dal.Coordinate(coords, "COORDINATE_" + str(nr))   # generic coord, its type is in the snapshot
+    coordNode=self.member(coordsNode, coord)
+    if coordNode==None:
       print bcolors.FAIL + "COORDINATE_" + str(nr) + " does not exist."
       self.prefix=bcolors.ENDC
       return
     else:
-      coord=coords.coordinate(nr)         # pick coordinate
+      attrs=coordNode["attrs"]
       # Common coordinate attributes
-      print self.prefix + coord.groupType().name() + "\t\t=", coord.groupType().value
-      print self.prefix + coord.coordinateType().name() + "\t\t=", coord.coordinateType().value
-      print self.prefix + coord.storageType().name() + "\t\t=", coord.storageType().value
-      print self.prefix + coord.nofAxes().name() + "\t\t=", coord.nofAxes().value
-      print self.prefix + coord.axisNames().name() + "\t\t=", coord.axisNames().value
-      print self.prefix + coord.axisUnits().name() + "\t\t=", coord.axisUnits().value
+      print self.prefix + coord.groupType().name() + "\t\t=", attrs.get(coord.groupType().name())
+      print self.prefix + coord.coordinateType().name() + "\t\t=", attrs.get(coord.coordinateType().name())
+      print self.prefix + coord.storageType().name() + "\t\t=", attrs.get(coord.storageType().name())
+      print self.prefix + coord.nofAxes().name() + "\t\t=", attrs.get(coord.nofAxes().name())
+      print self.prefix + coord.axisNames().name() + "\t\t=", attrs.get(coord.axisNames().name())
+      print self.prefix + coord.axisUnits().name() + "\t\t=", attrs.get(coord.axisUnits().name())
 
       # Now identify coordinate
-      if coord.groupType().value == "TimeCoord":
+      if attrs.get(coord.groupType().name()) == "TimeCoord":
         timeCoord=dal.TimeCoordinate(coords, coord.name())   # create a TimeCoord from the generic coord
-        print self.prefix + timeCoord.referenceValue().name() + "\t\t=", timeCoord.referenceValue().value
-        print self.prefix + timeCoord.referencePixel().name() + "\t\t=", timeCoord.referencePixel().value
-        print self.prefix + timeCoord.increment().name() + "\t\t=", timeCoord.increment().value     
-        print self.prefix + timeCoord.pc().name() + "\t\t\t=", timeCoord.pc().value     
-        print self.prefix + timeCoord.axisValuesPixel().name() + "\t=", timeCoord.axisValuesPixel().value     
-        print self.prefix + timeCoord.axisValuesWorld().name() + "\t=", timeCoord.axisValuesWorld().value     
-      elif coord.groupType().value == "SpectralCoord":
+        print self.prefix + timeCoord.referenceValue().name() + "\t\t=", attrs.get(timeCoord.referenceValue().name())
+        print self.prefix + timeCoord.referencePixel().name() + "\t\t=", attrs.get(timeCoord.referencePixel().name())
+        print self.prefix + timeCoord.increment().name() + "\t\t=", attrs.get(timeCoord.increment().name())     
+        print self.prefix + timeCoord.pc().name() + "\t\t\t=", attrs.get(timeCoord.pc().name())     
+        print self.prefix + timeCoord.axisValuesPixel().name() + "\t=", attrs.get(timeCoord.axisValuesPixel().name())     
+        print self.prefix + timeCoord.axisValuesWorld().name() + "\t=", attrs.get(timeCoord.axisValuesWorld().name())     
+      elif attrs.get(coord.groupType().name()) == "SpectralCoord":
         spectralCoord=dal.SpectralCoordinate(coords, coord.name())   # create a SpectralCoord from the generic coord
-        print self.prefix + spectralCoord.referenceValue().name() + "\t\t=", spectralCoord.referenceValue().value
-        print self.prefix + spectralCoord.referencePixel().name() + "\t\t=", spectralCoord.referencePixel().value
-        print self.prefix + spectralCoord.increment().name() + "\t\t=", spectralCoord.increment().value     
-        print self.prefix + spectralCoord.pc().name() + "\t\t\t=", spectralCoord.pc().value     
-        print self.prefix + spectralCoord.axisValuesPixel().name() + "\t=", spectralCoord.axisValuesPixel().value     
-        print self.prefix + spectralCoord.axisValuesWorld().name() + "\t=", spectralCoord.axisValuesWorld().value
+        print self.prefix + spectralCoord.referenceValue().name() + "\t\t=", attrs.get(spectralCoord.referenceValue().name())
+        print self.prefix + spectralCoord.referencePixel().name() + "\t\t=", attrs.get(spectralCoord.referencePixel().name())
+        print self.prefix + spectralCoord.increment().name() + "\t\t=", attrs.get(spectralCoord.increment().name())     
+        print self.prefix + spectralCoord.pc().name() + "\t\t\t=", attrs.get(spectralCoord.pc().name())     
+        print self.prefix + spectralCoord.axisValuesPixel().name() + "\t=", attrs.get(spectralCoord.axisValuesPixel().name())     
+        print self.prefix + spectralCoord.axisValuesWorld().name() + "\t=", attrs.get(spectralCoord.axisValuesWorld().name())
       else:
-        print coord.name() + " is of type " + coord.groupType()
+        print coord.name() + " is of type " + str(attrs.get(coord.groupType().name()))
         self.prefix=bcolors.ENDC
         return
       self.prefix=bcolors.ENDC
@@ -0,0 +1,371 @@
+#!/usr/bin/env python
+#
+# metaindex.py
+# Python class that keeps an SQLite index of the headers of many LOFAR HDF5 files
+#
+# File:         metaindex.py
+
+import os
+import math
+import json
+import sqlite3
+import dal
+
+__all__ = [ "metaindex", "angularDistance" ]
+
+# Bump when the layout of the tables changes. Older indices are rebuilt.
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE files (
+  id INTEGER PRIMARY KEY,
+  path TEXT UNIQUE NOT NULL,
+  mtime REAL NOT NULL,
+  size INTEGER NOT NULL,
+  filetype TEXT,
+  telescope TEXT,
+  observation_id TEXT,
+  start_mjd REAL,
+  end_mjd REAL,
+  attrs TEXT
+);
+
+CREATE TABLE saps (
+  file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+  path TEXT NOT NULL,
+  sap INTEGER,
+  point_ra REAL,
+  point_dec REAL,
+  start_mjd REAL,
+  end_mjd REAL,
+  attrs TEXT
+);
+
+CREATE TABLE beams (
+  file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+  path TEXT NOT NULL,
+  sap INTEGER,
+  beam INTEGER,
+  point_ra REAL,
+  point_dec REAL,
+  targets TEXT,
+  attrs TEXT
+);
+
+CREATE TABLE stations (
+  file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+  path TEXT NOT NULL,
+  station TEXT,
+  attrs TEXT
+);
+
+CREATE TABLE dipoles (
+  file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+  path TEXT NOT NULL,
+  station TEXT,
+  station_id INTEGER,
+  rsp_id INTEGER,
+  rcu_id INTEGER,
+  start_time REAL,
+  end_time REAL,
+  attrs TEXT
+);
+
+CREATE INDEX beams_dec ON beams(point_dec);
+CREATE INDEX dipoles_station ON dipoles(station, rsp_id, rcu_id);
+CREATE INDEX dipoles_time ON dipoles(start_time, end_time);
+"""
+
+# Factors to convert to the units stored in the index (degrees, Hz).
+ANGLE_UNITS     = { 'deg': 1.0, 'rad': 180.0 / math.pi, 'arcmin': 1.0 / 60, 'arcsec': 1.0 / 3600 }
+FREQUENCY_UNITS = { 'Hz': 1.0, 'kHz': 1e3, 'MHz': 1e6, 'GHz': 1e9 }
+
+def _number(attrs, name, unitName=None, units=None):
+  """ Returns attribute `name' as a float, converted according to the unit in
+      attribute `unitName' (if given), or None if either is missing or unknown. """
+  value = attrs.get(name)
+  if not isinstance(value, (int, long, float)):
+    return None
+
+  if unitName is None:
+    return float(value)
+
+  factor = units.get(attrs.get(unitName))
+  if factor is None:
+    return None
+
+  return value * factor
+
+def _suffix(name):
+  """ Returns the number at the end of a group name like SUB_ARRAY_POINTING_001, or None. """
+  try:
+    return int(name.rsplit('_', 1)[-1])
+  except ValueError:
+    return None
+
+def _join(path, name):
+  return path + "/" + name if path else name
+
+def _groups(node, prefix):
+  """ Returns the (name, node) of the member groups of `node' whose names start with `prefix'. """
+  return [(name, member) for (name, member) in sorted(node.get("members", {}).items())
+          if name.startswith(prefix) and member["type"] == 'GROUP']
+
+def angularDistance(ra1, dec1, ra2, dec2):
+  """ Returns the angle in degrees between two directions, given in degrees. """
+  ra1, dec1, ra2, dec2 = map(math.radians, (ra1, dec1, ra2, dec2))
+
+  # haversine formula, which is accurate for small angles
+  h = math.sin((dec2 - dec1) / 2) ** 2 + math.cos(dec1) * math.cos(dec2) * math.sin((ra2 - ra1) / 2) ** 2
+  return math.degrees(2 * math.asin(min(1.0, math.sqrt(h))))
+
+class metaindex:
+  """
+    An index of the headers of LOFAR BF and TBB HDF5 files, stored in an SQLite database.
+
+    update() reads the CLA attributes of each file, as well as those of its
+    sub-array pointings and beams (BF) or stations and dipoles (TBB), from a
+    single snapshot of the file (see Group.snapshot()). Files whose
+    modification time and size are unchanged since they were indexed are
+    skipped, so an index can be kept up to date cheaply.
+
+    The queries return (file path, HDF5 path) pairs from the database alone,
+    without opening any HDF5 file.
+
+    Python example:
+
+         index = metaindex("index.db")
+         index.update(glob.glob("/data/L*/*_tbb.h5"))
+
+         # which files contain RCU 10 of RS307 at this time?
+         for (filename, dipolePath) in index.dipoles(station="RS307", rcu=10, start=1311073541, end=1311073542):
+           print filename, dipolePath
+  """
+
+  def __init__(self, filename):
+    self.db = sqlite3.connect(filename)
+    self.db.execute("PRAGMA foreign_keys = ON")
+
+    version = self.db.execute("PRAGMA user_version").fetchone()[0]
+    if version != SCHEMA_VERSION:
+      self._createSchema()
+
+  def close(self):
+    self.db.close()
+
+  def _createSchema(self):
+    with self.db:
+      for table in ("dipoles", "stations", "beams", "saps", "files"):
+        self.db.execute("DROP TABLE IF EXISTS %s" % table)
+
+      self.db.executescript(SCHEMA)
+      self.db.execute("PRAGMA user_version = %d" % SCHEMA_VERSION)
+
+  # -------------------------------
+  # Indexing
+  # -------------------------------
+
+  def update(self, filenames, prune=False):
+    """
+      Indexes the files in `filenames' that are new or have changed since they were
+      last indexed. If `prune' is set, files that no longer exist are removed from
+      the index as well (see prune()).
+
+      Returns a dict with the number of files "indexed" and "unchanged", and the
+      (filename, error message) of the files that could not be read or indexed as "failed".
+    """
+    result = { "indexed": 0, "unchanged": 0, "failed": [] }
+
+    for filename in filenames:
+      path = os.path.abspath(filename)
+
+      try:
+        st = os.stat(path)
+      except OSError as e:
+        result["failed"].append((filename, str(e)))
+        continue
+
+      row = self.db.execute("SELECT mtime, size FROM files WHERE path = ?", (path,)).fetchone()
+      if row is not None and row[0] == st.st_mtime and row[1] == st.st_size:
+        result["unchanged"] += 1
+        continue
+
+      try:
+        snapshot = self._snapshot(path)
+
+        # replace all rows of the file at once, or keep the old ones if that fails
+        with self.db:
+          self.db.execute("DELETE FROM files WHERE path = ?", (path,))
+          self._insert(path, st, snapshot)
+      except Exception as e:
+        result["failed"].append((filename, str(e)))
+        continue
+
+      result["indexed"] += 1
+
+    if prune:
+      self.prune()
+
+    return result
+
+  def prune(self):
+    """ Removes the files that no longer exist from the index. Returns their number. """
+    paths = [path for (path,) in self.db.execute("SELECT path FROM files") if not os.path.exists(path)]
+
+    with self.db:
+      self.db.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in paths])
+
+    return len(paths)
+
+  def _snapshot(self, path):
+    fh = dal.File(path, dal.File.READ, "", dal.FileAccessProfile("metadata-only"))
+    try:
+      return fh.snapshot()
+    finally:
+      fh.close()
+
+  def _insert(self, path, st, snapshot):
+    attrs = snapshot["attrs"]
+
+    cursor = self.db.execute(
+      "INSERT INTO files (path, mtime, size, filetype, telescope, observation_id, start_mjd, end_mjd, attrs) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+      (path, st.st_mtime, st.st_size, attrs.get("FILETYPE"), attrs.get("TELESCOPE"), attrs.get("OBSERVATION_ID"),
+       _number(attrs, "OBSERVATION_START_MJD"), _number(attrs, "OBSERVATION_END_MJD"), json.dumps(attrs)))
+    fileID = cursor.lastrowid
+
+    # BF: sub-array pointings and their beams
+    for (sapName, sap) in _groups(snapshot, "SUB_ARRAY_POINTING_"):
+      a = sap["attrs"]
+      self.db.execute(
+        "INSERT INTO saps (file_id, path, sap, point_ra, point_dec, start_mjd, end_mjd, attrs) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (fileID, sapName, _suffix(sapName),
+         _number(a, "POINT_RA", "POINT_RA_UNIT", ANGLE_UNITS), _number(a, "POINT_DEC", "POINT_DEC_UNIT", ANGLE_UNITS),
+         _number(a, "EXPTIME_START_MJD"), _number(a, "EXPTIME_END_MJD"), json.dumps(a)))
+
+      for (beamName, beam) in _groups(sap, "BEAM_"):
+        a = beam["attrs"]
+        self.db.execute(
+          "INSERT INTO beams (file_id, path, sap, beam, point_ra, point_dec, targets, attrs) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+          (fileID, _join(sapName, beamName), _suffix(sapName), _suffix(beamName),
+           _number(a, "POINT_RA", "POINT_RA_UNIT", ANGLE_UNITS), _number(a, "POINT_DEC", "POINT_DEC_UNIT", ANGLE_UNITS),
+           json.dumps(a.get("TARGETS")), json.dumps(a)))
+
+    # TBB: stations and their dipoles
+    for (stationName, station) in _groups(snapshot, "STATION_"):
+      a = station["attrs"]
+      name = a.get("STATION_NAME", stationName[len("STATION_"):])
+      self.db.execute("INSERT INTO stations (file_id, path, station, attrs) VALUES (?, ?, ?, ?)",
+        (fileID, stationName, name, json.dumps(a)))
+
+      for (dipoleName, dipole) in sorted(station.get("members", {}).items()):
+        if dipole["type"] != 'DATASET':
+          continue
+
+        a = dipole["attrs"]
+        (start, end) = self._dipoleTimes(a)
+        self.db.execute(
+          "INSERT INTO dipoles (file_id, path, station, station_id, rsp_id, rcu_id, start_time, end_time, attrs) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+          (fileID, _join(stationName, dipoleName), name, a.get("STATION_ID"), a.get("RSP_ID"), a.get("RCU_ID"),
+           start, end, json.dumps(a)))
+
+  def _dipoleTimes(self, attrs):
+    """ Returns the (start, end) time of the data of a dipole in seconds since 1970, or (None, None). """
+    time = _number(attrs, "TIME")
+    if time is None:
+      return (None, None)
+
+    frequency = _number(attrs, "SAMPLE_FREQUENCY", "SAMPLE_FREQUENCY_UNIT", FREQUENCY_UNITS)
+    if not frequency:
+      return (time, time)
+
+    start = time + (attrs.get("SAMPLE_NUMBER") or 0) / frequency
+    return (start, start + (attrs.get("DATA_LENGTH") or 0) / frequency)
+
+  # -------------------------------
+  # Queries
+  # -------------------------------
+
+  def files(self, filetype=None, observationID=None, startMJD=None, endMJD=None):
+    """
+      Returns the paths of the indexed files, optionally only those of `filetype'
+      ('bf', 'tbb', ...), of observation `observationID', or whose observation
+      overlaps [startMJD, endMJD].
+    """
+    (where, args) = self._conditions([
+      ("filetype = ?",       filetype),
+      ("observation_id = ?", observationID),
+      ("end_mjd >= ?",       startMJD),
+      ("start_mjd <= ?",     endMJD),
+    ])
+
+    return [path for (path,) in self.db.execute("SELECT path FROM files" + where + " ORDER BY path", args)]
+
+  def stations(self, station=None):
+    """ Returns the (file path, HDF5 path) of the TBB station groups, optionally only of `station' (such as 'RS307'). """
+    (where, args) = self._conditions([("s.station = ?", station)])
+
+    return self.db.execute(
+      "SELECT f.path, s.path FROM stations s JOIN files f ON f.id = s.file_id" + where + " ORDER BY f.path, s.path", args).fetchall()
+
+  def dipoles(self, station=None, rsp=None, rcu=None, start=None, end=None):
+    """
+      Returns the (file path, HDF5 path) of the TBB dipole datasets, optionally only of
+      `station' (such as 'RS307'), RSP `rsp', RCU `rcu', or whose data overlaps the
+      time range [start, end] (in seconds since 1970, like the TIME attribute).
+    """
+    (where, args) = self._conditions([
+      ("d.station = ?",     station),
+      ("d.rsp_id = ?",      rsp),
+      ("d.rcu_id = ?",      rcu),
+      ("d.end_time >= ?",   start),
+      ("d.start_time <= ?", end),
+    ])
+
+    return self.db.execute(
+      "SELECT f.path, d.path FROM dipoles d JOIN files f ON f.id = d.file_id" + where + " ORDER BY f.path, d.path", args).fetchall()
+
+  def beams(self, ra, dec, radius):
+    """
+      Returns the (file path, HDF5 path) of the BF beams that point within `radius'
+      degrees of (`ra', `dec'), in degrees, ordered by their distance to it.
+    """
+    # narrow down the candidates on declination, which the index can do
+    candidates = self.db.execute(
+      "SELECT f.path, b.path, b.point_ra, b.point_dec FROM beams b JOIN files f ON f.id = b.file_id WHERE b.point_dec BETWEEN ? AND ?",
+      (dec - radius, dec + radius))
+
+    result = []
+    for (path, beamPath, beamRA, beamDEC) in candidates:
+      distance = angularDistance(ra, dec, beamRA, beamDEC)
+      if distance <= radius:
+        result.append((distance, path, beamPath))
+
+    return [(path, beamPath) for (distance, path, beamPath) in sorted(result)]
+
+  def attrs(self, path, objectPath=""):
+    """
+      Returns the attributes of object `objectPath' in file `path' as stored in the index,
+      as a dict (see Group.attrs()), or None if it is not indexed.
+    """
+    path = os.path.abspath(path)
+
+    if objectPath == "":
+      row = self.db.execute("SELECT attrs FROM files WHERE path = ?", (path,)).fetchone()
+    else:
+      row = None
+      for table in ("saps", "beams", "stations", "dipoles"):
+        row = self.db.execute(
+          "SELECT t.attrs FROM %s t JOIN files f ON f.id = t.file_id WHERE f.path = ? AND t.path = ?" % table,
+          (path, objectPath)).fetchone()
+        if row is not None:
+          break
+
+    return json.loads(row[0]) if row is not None else None
+
+  def _conditions(self, conditions):
+    """ Returns the WHERE clause and its arguments for the (condition, value) pairs whose value is not None. """
+    used = [(condition, value) for (condition, value) in conditions if value is not None]
+    if not used:
+      return ("", ())
+
+    return (" WHERE " + " AND ".join(condition for (condition, value) in used), tuple(value for (condition, value) in used))
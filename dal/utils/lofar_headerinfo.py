@@ -24,7 +24,7 @@ def dispatch_to_headerinfo_util(filename):
 	elif ftype is None:
 		print 'The file', filename, 'does not appear to be a LOFAR data product, or it just lacks the FILETYPE attribute.'
 	else:
-		lofar_tbb_headerinfo.print_cla(fh)
+		lofar_tbb_headerinfo.print_cla(fh, fh.attrs())
 
 def print_usage():
 	print 'Print basic info about a LOFAR HDF5 file.'
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+#
+# lofar_headerscan.py
+# Python script that extracts header information from many LOFAR .h5 files in parallel,
+# as JSON lines or CSV
+#
+# File:         lofar_headerscan.py
+
+import os
+import sys
+import csv
+import glob
+import json
+import signal
+import fnmatch
+import multiprocessing
+from optparse import OptionParser
+import dal
+
+USAGE = """%prog [options] FILE|GLOB|DIRECTORY ...
+
+Prints the attributes of LOFAR HDF5 files, one line (JSON) or row (CSV) per file.
+Directories are searched recursively for files matching --pattern. Files are read
+in parallel by --jobs processes (HDF5 is not thread-safe). A file that cannot be
+read gets an error message instead of attributes, and does not stop the scan.
+
+Each field is [PATH/]NAME, for example OBSERVATION_ID or STATION_*/NOF_DIPOLES,
+where PATH is the path of a group or dataset, which may contain wildcards (*, ?).
+Only attributes with the requested names are read. Without --fields, JSON lines
+contain all attributes, and CSV rows the fields in DEFAULT_CSV_FIELDS."""
+
+# Fields that describe a LOFAR file in general (see CLA_File)
+DEFAULT_CSV_FIELDS = [ "FILETYPE", "FILENAME", "TELESCOPE", "PROJECT_ID", "OBSERVATION_ID",
+                       "OBSERVATION_START_UTC", "OBSERVATION_END_UTC", "OBSERVATION_NOF_STATIONS",
+                       "ANTENNA_SET", "FILTER_SELECTION", "TARGETS" ]
+
+def find_files(args, pattern):
+	""" Returns the files named by args, which are file names, globs, or directories to search for pattern. """
+	filenames = []
+
+	for arg in args:
+		# names that match nothing are kept, to report them as unreadable
+		for path in sorted(glob.glob(arg)) or [arg]:
+			if os.path.isdir(path):
+				for (dirpath, dirnames, names) in os.walk(path):
+					dirnames.sort()
+					filenames.extend(os.path.join(dirpath, name) for name in sorted(names) if fnmatch.fnmatch(name, pattern))
+			else:
+				filenames.append(path)
+
+	return filenames
+
+def has_wildcards(field):
+	return any(c in field for c in "*?[")
+
+def flatten(node, path, attrs):
+	""" Adds the attributes of snapshot `node' at `path' and below to attrs, as PATH/NAME: value. """
+	for (name, value) in node["attrs"].items():
+		attrs[path + "/" + name if path else name] = value
+
+	for (name, member) in node.get("members", {}).items():
+		flatten(member, path + "/" + name if path else name, attrs)
+
+	return attrs
+
+def select(attrs, fields):
+	""" Returns the attributes in attrs that match one of fields. """
+	selected = {}
+
+	for field in fields:
+		if has_wildcards(field):
+			selected.update((key, value) for (key, value) in attrs.items() if fnmatch.fnmatchcase(key, field))
+		elif field in attrs:
+			selected[field] = attrs[field]
+
+	return selected
+
+def scan_file(task):
+	""" Returns a dict with the "file" name, and its "attrs" or "error". Runs in a worker process. """
+	(filename, fields) = task
+
+	try:
+		names = None
+		if fields is not None:
+			names = set(field.rsplit("/", 1)[-1] for field in fields)
+
+			# wildcards in attribute names require reading all attributes
+			if any(has_wildcards(name) for name in names):
+				names = None
+
+		fh = dal.File(filename, dal.File.READ, "", dal.FileAccessProfile("metadata-only"))
+		try:
+			attrs = flatten(fh.snapshot(names), "", {})
+		finally:
+			fh.close()
+
+		if fields is not None:
+			attrs = select(attrs, fields)
+
+		return { "file": filename, "error": None, "attrs": attrs }
+	except Exception as exc:
+		return { "file": filename, "error": str(exc), "attrs": {} }
+
+def csv_value(value):
+	if value is None:
+		return ""
+	if isinstance(value, str):
+		return value
+	if isinstance(value, (list, tuple, dict)):
+		return json.dumps(value)
+	return repr(value)
+
+def csv_row(result, fields):
+	""" Returns the CSV row for result: file, error, and a column per field. Fields with
+	    wildcards are stored as a JSON object of the attributes they match. """
+	row = [ result["file"], result["error"] or "" ]
+
+	for field in fields:
+		if has_wildcards(field):
+			matches = select(result["attrs"], [field])
+			row.append(json.dumps(matches) if matches else "")
+		else:
+			row.append(csv_value(result["attrs"].get(field)))
+
+	return row
+
+def init_worker():
+	# let the main process handle Ctrl-C
+	signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def main():
+	parser = OptionParser(USAGE)
+	parser.add_option("-j", "--jobs", dest="jobs", type="int", default=multiprocessing.cpu_count(),
+	                  help="number of worker processes (default=number of CPUs)")
+	parser.add_option("-f", "--format", dest="format", default="jsonl", choices=["jsonl", "csv"],
+	                  help="output format: jsonl or csv (default=jsonl)")
+	parser.add_option("--fields", dest="fields",
+	                  help="comma-separated list of fields to output (default: see above)")
+	parser.add_option("-p", "--pattern", dest="pattern", default="*.h5",
+	                  help="names of the files to scan in directories (default=*.h5)")
+	parser.add_option("-o", "--output", dest="output",
+	                  help="write to this file instead of to stdout")
+	(options, args) = parser.parse_args()
+
+	if not args:
+		parser.print_help()
+		return 2
+
+	fields = options.fields.split(",") if options.fields else None
+	if fields is None and options.format == "csv":
+		fields = DEFAULT_CSV_FIELDS
+
+	filenames = find_files(args, options.pattern)
+	tasks = [(filename, fields) for filename in filenames]
+
+	out = open(options.output, "wb") if options.output else sys.stdout
+	if options.format == "csv":
+		writer = csv.writer(out)
+		writer.writerow(["file", "error"] + fields)
+
+	exit_status = 0
+	pool = None
+	try:
+		if options.jobs > 1 and len(tasks) > 1:
+			pool = multiprocessing.Pool(options.jobs, init_worker)
+			results = pool.imap(scan_file, tasks)
+		else:
+			results = (scan_file(task) for task in tasks)
+
+		for result in results:
+			if result["error"] is not None:
+				exit_status = 1
+
+			if options.format == "csv":
+				writer.writerow(csv_row(result, fields))
+			else:
+				out.write(json.dumps(result, sort_keys=True) + "\n")
+
+		if pool is not None:
+			pool.close()
+	except KeyboardInterrupt as exc:
+		if pool is not None:
+			pool.terminate()
+		exit_status = 1
+	finally:
+		if pool is not None:
+			pool.join()
+		if out is not sys.stdout:
+			out.close()
+
+	return exit_status
+
+if __name__ == '__main__':
+	sys.exit(main())
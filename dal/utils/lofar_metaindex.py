@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+#
+# lofar_metaindex.py
+# Python script that maintains and queries an index of the headers of LOFAR .h5 files
+#
+# File:         lofar_metaindex.py
+
+import sys
+from optparse import OptionParser
+import dal
+
+USAGE = """%prog [options] INDEX COMMAND [FILE ...]
+
+Commands:
+  update FILE ...   (re)index the given files that are new or have changed
+  prune             remove the files that no longer exist from the index
+  files             list the indexed files, optionally observed between --start and --end
+  stations          list the TBB station groups
+  dipoles           list the TBB dipole datasets
+  beams             list the BF beams within --radius degrees of --ra, --dec
+
+The queries print a file name and an HDF5 path per line, and only read the index."""
+
+def mjd(seconds):
+	""" Returns the Modified Julian Date of `seconds' since 1970, or None if seconds is None. """
+	if seconds is None:
+		return None
+	return seconds / 86400.0 + 40587.0
+
+def main():
+	parser = OptionParser(USAGE)
+	parser.add_option("-t", "--type", dest="filetype", help="only list files of this type (bf, tbb, ...)")
+	parser.add_option("-o", "--observation", dest="observation", help="only list files of this observation ID")
+	parser.add_option("-s", "--station", dest="station", help="only list this station (for example RS307)")
+	parser.add_option("--rsp", dest="rsp", type="int", help="only list dipoles of this RSP")
+	parser.add_option("--rcu", dest="rcu", type="int", help="only list dipoles of this RCU")
+	parser.add_option("--start", dest="start", type="float", help="only list files observed, or dipoles with data, after this time (seconds since 1970)")
+	parser.add_option("--end", dest="end", type="float", help="only list files observed, or dipoles with data, before this time (seconds since 1970)")
+	parser.add_option("--ra", dest="ra", type="float", help="RA of the direction to look for beams (degrees)")
+	parser.add_option("--dec", dest="dec", type="float", help="DEC of the direction to look for beams (degrees)")
+	parser.add_option("--radius", dest="radius", type="float", default=1.0, help="maximum distance of beams to --ra, --dec (degrees, default=1)")
+	(options, args) = parser.parse_args()
+
+	if len(args) < 2:
+		parser.print_help()
+		return 2
+
+	(indexname, command, filenames) = (args[0], args[1], args[2 : ])
+
+	index = dal.metaindex(indexname)
+	try:
+		if command == "update":
+			result = index.update(filenames)
+			for (filename, error) in result["failed"]:
+				sys.stderr.write('Error: ' + filename + ': ' + error + '\n')
+			print 'indexed', result["indexed"], 'unchanged', result["unchanged"], 'failed', len(result["failed"])
+			return 1 if result["failed"] else 0
+		elif command == "prune":
+			print 'removed', index.prune()
+		elif command == "files":
+			for filename in index.files(options.filetype, options.observation, mjd(options.start), mjd(options.end)):
+				print filename
+		elif command == "stations":
+			for (filename, path) in index.stations(options.station):
+				print filename, path
+		elif command == "dipoles":
+			for (filename, path) in index.dipoles(options.station, options.rsp, options.rcu, options.start, options.end):
+				print filename, path
+		elif command == "beams":
+			if options.ra is None or options.dec is None:
+				parser.error("beams requires --ra and --dec")
+			for (filename, path) in index.beams(options.ra, options.dec, options.radius):
+				print filename, path
+		else:
+			parser.error("unknown command " + command)
+	finally:
+		index.close()
+
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -12,21 +12,40 @@ import sys
 import numpy
 import dal
 
-def get_lost_frame_nrs(data, block_len):
+# Number of frames to read and check per get1D() call. Bounds the memory used per dipole.
+FRAMES_PER_READ = 16384
+
+def get_lost_frame_nrs(dp, block_len, total_len=None):
+	"""Returns the numbers of the frames of block_len values in dipole dataset dp that are all zeros.
+
+	The data is read in blocks of FRAMES_PER_READ frames and checked a block at a time.
+	Values beyond the end of the data are considered zero (as HDF5 does), so a zero-ended
+	partial frame at the end counts as lost, as do all frames up to total_len, if given.
+	"""
+	data_len = dp.dims1D()
+	if total_len is None or total_len < data_len:
+		total_len = data_len
+
 	lost_frame_nrs = [ ]
 
-	offset = 0
-	nr_zeros_seen = 0
-	while offset < len(data):
-		if data[offset] != 0:
-			offset += block_len - nr_zeros_seen
-			nr_zeros_seen = 0
-		else:
-			nr_zeros_seen += 1
-			if nr_zeros_seen == block_len:
-				lost_frame_nrs.append(offset / block_len)
-				nr_zeros_seen = 0
-			offset += 1
+	read_len = FRAMES_PER_READ * block_len
+	buf = numpy.empty(min(read_len, data_len), dtype=numpy.int16)
+
+	for offset in range(0, data_len, read_len):
+		data = buf[ : min(read_len, data_len - offset)]
+		dp.get1D(offset, data)
+
+		nr_frames = len(data) // block_len
+		frames = data[ : nr_frames * block_len].reshape(nr_frames, block_len)
+		lost = numpy.flatnonzero(~frames.any(axis=1)) + offset // block_len
+		lost_frame_nrs.extend(lost.tolist())
+
+		if len(data) % block_len != 0 and not data[nr_frames * block_len : ].any():
+			lost_frame_nrs.append(offset // block_len + nr_frames)
+
+	# frames that start at or beyond the end of the data, up to total_len (a partial last frame was checked above)
+	first_trailing = (data_len + block_len-1) // block_len
+	lost_frame_nrs.extend(range(first_trailing, (total_len + block_len-1) // block_len))
 
 	return lost_frame_nrs
 
@@ -38,29 +57,28 @@ def print_lost_frame_nrs(filename):
 	total_lost = 0
 
 	station_groups = fh.stations();
-	for st in station_groups:
-		dipole_datasets = st.dipoles();
-		for dp in dipole_datasets:
-			datasets_found = True
-			data_len = dp.dims1D() # actual data len; should be equal to dp.dataLength().get()
-			data = numpy.zeros((data_len, ), dtype=dp.dtype)
-			#data = numpy.array(dp, dtype=dp.dtype) # only works if Python binding of TBB_DipoleDataset exposes the array interface, __array__ returns an array or any (nested) sequence.
-			start_idx = 0
-			dp.get1D(start_idx, data)
-
-			# Not always available when this program was written, but will be always there.
-			# Use .get() instead of .value to have an exc raised instead of None returned.
-			block_len = dp.samplesPerFrame().value
-			if block_len is None:
-				block_len = 1024 # the TBBs always send 1024 samples/frame for transient data
-			total_frames += (data_len + block_len-1) // block_len # add rounded up #frames
-			dp_lost_frame_nrs = get_lost_frame_nrs(data, block_len)
-			if dp_lost_frame_nrs: # Does not account for missing frames at the end. We'd have to max(<len(any dipole datasets)>) and even then we could miss the true max.
-				total_lost += len(dp_lost_frame_nrs)
-				print 'Station', st.stationName().value, 'rsp', str(dp.rspID().value), 'rcu', str(dp.rcuID().value) + ':', 'numbers of zeroed frames of', str(block_len), 'values each:'
-				for frame_nr in dp_lost_frame_nrs:
-					print frame_nr,
-				print
+	dipoles = [(st, dp) for st in station_groups for dp in st.dipoles()]
+
+	# Frames lost at the end of a dipole can only be detected relative to the other dipoles.
+	# Even then we could miss the true end if the last frames were lost for all dipoles.
+	max_data_len = max([dp.dims1D() for (st, dp) in dipoles] or [0])
+
+	for (st, dp) in dipoles:
+		datasets_found = True
+
+		# Not always available when this program was written, but will be always there.
+		# Use .get() instead of .value to have an exc raised instead of None returned.
+		block_len = dp.samplesPerFrame().value
+		if block_len is None:
+			block_len = 1024 # the TBBs always send 1024 samples/frame for transient data
+		total_frames += (max_data_len + block_len-1) // block_len # add rounded up #frames
+		dp_lost_frame_nrs = get_lost_frame_nrs(dp, block_len, max_data_len)
+		if dp_lost_frame_nrs:
+			total_lost += len(dp_lost_frame_nrs)
+			print 'Station', st.stationName().value, 'rsp', str(dp.rspID().value), 'rcu', str(dp.rcuID().value) + ':', 'numbers of zeroed frames of', str(block_len), 'values each:'
+			for frame_nr in dp_lost_frame_nrs:
+				print frame_nr,
+			print
 
 	if not datasets_found:
 		print 'Warning: no dipole datasets found in filename', filename
@@ -11,120 +11,128 @@
 import sys
 import dal
 
-def print_cla(fh):
-	print fh.groupType().name(), "\t\t\t=", fh.groupType().value
-	print fh.fileName().name(), "\t\t\t=", fh.fileName().value
-	print fh.fileDate().name(), "\t\t\t=", fh.fileDate().value
-	print fh.fileType().name(), "\t\t\t=", fh.fileType().value
-	print fh.telescope().name(), "\t\t\t=", fh.telescope().value
-	print fh.projectID().name(), "\t\t\t=", fh.projectID().value
-	print fh.projectTitle().name(), "\t\t\t=", fh.projectTitle().value
-	print fh.projectPI().name(), "\t\t\t=", fh.projectPI().value
-	print fh.projectCOI().name(), "\t\t\t=", fh.projectCOI().value
-	print fh.projectContact().name(), "\t\t=", fh.projectContact().value
-	print fh.observationID().name(), "\t\t\t=", fh.observationID().value
-	print fh.observationStartUTC().name(), "\t\t=", fh.observationStartUTC().value
-	print fh.observationEndUTC().name(), "\t\t=", fh.observationEndUTC().value
-
-	observationStartMJDVal = fh.observationStartMJD().value
+def print_cla(fh, attrs):
+	print fh.groupType().name(), "\t\t\t=", attrs.get(fh.groupType().name())
+	print fh.fileName().name(), "\t\t\t=", attrs.get(fh.fileName().name())
+	print fh.fileDate().name(), "\t\t\t=", attrs.get(fh.fileDate().name())
+	print fh.fileType().name(), "\t\t\t=", attrs.get(fh.fileType().name())
+	print fh.telescope().name(), "\t\t\t=", attrs.get(fh.telescope().name())
+	print fh.projectID().name(), "\t\t\t=", attrs.get(fh.projectID().name())
+	print fh.projectTitle().name(), "\t\t\t=", attrs.get(fh.projectTitle().name())
+	print fh.projectPI().name(), "\t\t\t=", attrs.get(fh.projectPI().name())
+	print fh.projectCOI().name(), "\t\t\t=", attrs.get(fh.projectCOI().name())
+	print fh.projectContact().name(), "\t\t=", attrs.get(fh.projectContact().name())
+	print fh.observationID().name(), "\t\t\t=", attrs.get(fh.observationID().name())
+	print fh.observationStartUTC().name(), "\t\t=", attrs.get(fh.observationStartUTC().name())
+	print fh.observationEndUTC().name(), "\t\t=", attrs.get(fh.observationEndUTC().name())
+
+	observationStartMJDVal = attrs.get(fh.observationStartMJD().name())
 	if observationStartMJDVal is None:
 		observationStartMJDVal = '-'
 	print fh.observationStartMJD().name(), "\t\t=%(mjd)19.12f" %{'mjd':observationStartMJDVal}
 
-	observationEndMJDVal = fh.observationEndMJD().value
+	observationEndMJDVal = attrs.get(fh.observationEndMJD().name())
 	if observationEndMJDVal is None:
 		observationEndMJDVal = '-'
 	print fh.observationEndMJD().name(), "\t\t=%(mjd)19.12f" %{'mjd':observationEndMJDVal}
 
-	print fh.observationNofStations().name(), "\t=", fh.observationNofStations().value
-	print fh.observationStationsList().name(), "\t=", fh.observationStationsList().value
-	print fh.observationFrequencyMin().name(), "\t=", fh.observationFrequencyMin().value, fh.observationFrequencyUnit().value
-	print fh.observationFrequencyCenter().name(), "\t=", fh.observationFrequencyCenter().value, fh.observationFrequencyUnit().value
-	print fh.observationFrequencyMax().name(), "\t=", fh.observationFrequencyMax().value, fh.observationFrequencyUnit().value
-	print fh.observationNofBitsPerSample().name(), "=", fh.observationNofBitsPerSample().value
-	print fh.clockFrequency().name(), "\t\t=", fh.clockFrequency().value, fh.clockFrequencyUnit().value
-	print fh.antennaSet().name(), "\t\t\t=", fh.antennaSet().value
-	print fh.filterSelection().name(), "\t\t=", fh.filterSelection().value
-	print fh.targets().name(), "\t\t\t=", fh.targets().value
-	print fh.systemVersion().name(), "\t\t\t=", fh.systemVersion().value
-
-	pipelineNameVal = fh.pipelineName().value
+	print fh.observationNofStations().name(), "\t=", attrs.get(fh.observationNofStations().name())
+	print fh.observationStationsList().name(), "\t=", attrs.get(fh.observationStationsList().name())
+	print fh.observationFrequencyMin().name(), "\t=", attrs.get(fh.observationFrequencyMin().name()), attrs.get(fh.observationFrequencyUnit().name())
+	print fh.observationFrequencyCenter().name(), "\t=", attrs.get(fh.observationFrequencyCenter().name()), attrs.get(fh.observationFrequencyUnit().name())
+	print fh.observationFrequencyMax().name(), "\t=", attrs.get(fh.observationFrequencyMax().name()), attrs.get(fh.observationFrequencyUnit().name())
+	print fh.observationNofBitsPerSample().name(), "=", attrs.get(fh.observationNofBitsPerSample().name())
+	print fh.clockFrequency().name(), "\t\t=", attrs.get(fh.clockFrequency().name()), attrs.get(fh.clockFrequencyUnit().name())
+	print fh.antennaSet().name(), "\t\t\t=", attrs.get(fh.antennaSet().name())
+	print fh.filterSelection().name(), "\t\t=", attrs.get(fh.filterSelection().name())
+	print fh.targets().name(), "\t\t\t=", attrs.get(fh.targets().name())
+	print fh.systemVersion().name(), "\t\t\t=", attrs.get(fh.systemVersion().name())
+
+	pipelineNameVal = attrs.get(fh.pipelineName().name())
 	if pipelineNameVal is None:
 		pipelineNameVal = '-'
 	print fh.pipelineName().name(), "\t\t\t=", pipelineNameVal
 
-	pipelineVersionVal = fh.pipelineVersion().value
+	pipelineVersionVal = attrs.get(fh.pipelineVersion().name())
 	if pipelineVersionVal is None:
 		pipelineVersionVal = '-'
 	print fh.pipelineVersion().name(), "\t\t=", pipelineVersionVal
 
-	print fh.docName().name(), "\t\t\t=", fh.docName().value
-	print fh.docVersion().name(), "\t\t\t=", fh.docVersion().value
-
-def print_tbb_root(fh):
-	print fh.operatingMode().name(), '\t\t\t=', fh.operatingMode().value
-	print fh.nofStations().name(), '\t\t\t=', fh.nofStations().value
-
-def print_trigger_info(trgp):
-	print trgp.groupType().name(), '\t\t\t=', trgp.groupType().value
-	print trgp.triggerType().name(), '\t\t\t=', trgp.triggerType().value
-	print trgp.triggerVersion().name(), '\t\t=', trgp.triggerVersion().value
-	print trgp.paramCoincidenceChannels().name(), '\t=', trgp.paramCoincidenceChannels().value
-	print trgp.paramCoincidenceTime().name(), '\t\t=', trgp.paramCoincidenceTime().value
-	print trgp.paramDirectionFit().name(), '\t\t=', trgp.paramDirectionFit().value
-	print trgp.paramElevationMin().name(), '\t\t=', trgp.paramElevationMin().value
-	print trgp.paramFitVarianceMax().name(), '\t\t=', trgp.paramFitVarianceMax().value
-
-def print_basic_station_dipole_info(stationList):
-	for st in stationList:
-		print_basic_station_info(st)
+	print fh.docName().name(), "\t\t\t=", attrs.get(fh.docName().name())
+	print fh.docVersion().name(), "\t\t\t=", attrs.get(fh.docVersion().name())
+
+def print_tbb_root(fh, attrs):
+	print fh.operatingMode().name(), '\t\t\t=', attrs.get(fh.operatingMode().name())
+	print fh.nofStations().name(), '\t\t\t=', attrs.get(fh.nofStations().name())
+
+def print_trigger_info(trgp, attrs):
+	print trgp.groupType().name(), '\t\t\t=', attrs.get(trgp.groupType().name())
+	print trgp.triggerType().name(), '\t\t\t=', attrs.get(trgp.triggerType().name())
+	print trgp.triggerVersion().name(), '\t\t=', attrs.get(trgp.triggerVersion().name())
+	print trgp.paramCoincidenceChannels().name(), '\t=', attrs.get(trgp.paramCoincidenceChannels().name())
+	print trgp.paramCoincidenceTime().name(), '\t\t=', attrs.get(trgp.paramCoincidenceTime().name())
+	print trgp.paramDirectionFit().name(), '\t\t=', attrs.get(trgp.paramDirectionFit().name())
+	print trgp.paramElevationMin().name(), '\t\t=', attrs.get(trgp.paramElevationMin().name())
+	print trgp.paramFitVarianceMax().name(), '\t\t=', attrs.get(trgp.paramFitVarianceMax().name())
+
+def print_basic_station_dipole_info(fh, snapshot):
+	stations = [(name, member) for (name, member) in sorted(snapshot['members'].items())
+	            if name.startswith('STATION_') and member['type'] == 'GROUP']
+
+	# The accessors are only used for the names of the attributes, which are read from the snapshot.
+	for (name, station) in stations:
+		print_basic_station_info(dal.TBB_Station(fh, name), station['attrs'])
 	print
 
 	# Print some dipole info once that is likely to be the same for all.
-	if stationList:
-		dp = stationList[0].dipoles()[0]
-		print_basic_dipole_info(dp)
-
-def print_basic_station_info(st):
+	if stations:
+		(name, station) = stations[0]
+		dipoles = [(dpname, member) for (dpname, member) in sorted(station['members'].items())
+		           if member['type'] == 'DATASET']
+		if dipoles:
+			(dpname, dipole) = dipoles[0]
+			print_basic_dipole_info(dal.TBB_DipoleDataset(dal.TBB_Station(fh, name), dpname), dipole['attrs'])
+
+def print_basic_station_info(st, attrs):
 	# Don't print everything. We may get this up to 48x and users already know.
-	print st.groupType().name(), '\t\t\t=', st.groupType().value
-	print st.stationName().name(), '\t\t\t=', st.stationName().value
-	print st.nofDipoles().name(), '\t\t\t=', st.nofDipoles().value
+	print st.groupType().name(), '\t\t\t=', attrs.get(st.groupType().name())
+	print st.stationName().name(), '\t\t\t=', attrs.get(st.stationName().name())
+	print st.nofDipoles().name(), '\t\t\t=', attrs.get(st.nofDipoles().name())
 
-def print_basic_dipole_info(dp):
+def print_basic_dipole_info(dp, attrs):
 	print 'Basic dipole info from the first dipole found:'
-	print dp.groupType().name(), '\t\t\t=', dp.groupType().value
+	print dp.groupType().name(), '\t\t\t=', attrs.get(dp.groupType().name())
 
 	# try dal.stationIDToName() translation (we already have the station name, but ok)
-	stID = dp.stationID().value
+	stID = attrs.get(dp.stationID().name())
 	if stID is not None:
 		stName = dal.stationIDToName(stID)
 	else:
 		stName = '-'
-	print 'Station name,', dp.rspID().name() + ',', dp.rcuID().name(), '\t=', stName + ',', str(dp.rspID().value) + ',', dp.rcuID().value
+	print 'Station name,', dp.rspID().name() + ',', dp.rcuID().name(), '\t=', stName + ',', str(attrs.get(dp.rspID().name())) + ',', attrs.get(dp.rcuID().name())
 
-	print dp.sampleFrequency().name(), '\t\t=', dp.sampleFrequency().value, dp.sampleFrequencyUnit().value
-	datalen = dp.dataLength().value
+	print dp.sampleFrequency().name(), '\t\t=', attrs.get(dp.sampleFrequency().name()), attrs.get(dp.sampleFrequencyUnit().name())
+	datalen = attrs.get(dp.dataLength().name())
 	print dp.dataLength().name(), '\t\t\t=', datalen
 
 	nflaggedSamp = 0 # i.e. for this dipole
-	for flrange in dp.flagOffsets().value:
-		nflaggedSamp += flrange.end - flrange.begin
+	for (begin, end) in attrs.get(dp.flagOffsets().name()):
+		nflaggedSamp += end - begin
 	print dp.flagOffsets().name(), 'summary\t\t=', nflaggedSamp, '(' + str(100.0 * nflaggedSamp / datalen) + '%)'
 
-	print dp.nyquistZone().name(), '\t\t\t=', dp.nyquistZone().value
-	print dp.dispersionMeasure().name(), '\t\t=', dp.dispersionMeasure().value, dp.dispersionMeasureUnit().value
+	print dp.nyquistZone().name(), '\t\t\t=', attrs.get(dp.nyquistZone().name())
+	print dp.dispersionMeasure().name(), '\t\t=', attrs.get(dp.dispersionMeasure().name()), attrs.get(dp.dispersionMeasureUnit().name())
 
 def print_tbb_header(filename):
 	fh = dal.TBB_File(filename)
-	print_cla(fh)
-	print_tbb_root(fh)
+	snapshot = fh.snapshot() # read all attributes of the file in a single pass
+	print_cla(fh, snapshot['attrs'])
+	print_tbb_root(fh, snapshot['attrs'])
 	print
 	trgp = fh.trigger()
-	print_trigger_info(trgp)
+	print_trigger_info(trgp, snapshot['members'].get(trgp.name(), {}).get('attrs', {}))
 	print
-	stationList = fh.stations();
-	print_basic_station_dipole_info(stationList)
+	print_basic_station_dipole_info(fh, snapshot)
 
 def print_usage():
 	print 'Print basic info about a LOFAR TBB HDF5 file.'
@@ -71,6 +71,10 @@ def printData(bffile):
 
         print "            First two samples of the first two channels are:\n%s" % (x,)
 
+        # data sets can also be indexed like numpy arrays, which reads the selection
+        # (which may include steps) into a new numpy array of the right type.
+        print "            Every 4th channel of the first sample is:\n%s" % (stokes[0, ::4],)
+
 
 # open the file for reading
 for filename in filenames:
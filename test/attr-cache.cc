@@ -0,0 +1,99 @@
+// attr-cache.cc
+// Check the attribute value cache of a file (File::setAttributeCaching()): repeated reads
+// are served from the cache, also through other Attribute objects, and writes through
+// DAL invalidate the cached values.
+// Build: c++ -Wall attr-cache.cc -llofardal -lhdf5
+#include <string>
+#include <vector>
+#include <iostream>
+
+#include <dal/lofar/BF_File.h>
+
+using namespace std;
+
+static int exit_status;
+
+static void check(bool ok, const string &what) {
+	if (!ok) {
+		cerr << "unexpected " << what << endl;
+		exit_status = 1;
+	}
+}
+
+static void checkCounts(const dal::File &file, unsigned long hits, unsigned long misses, const string &what) {
+	if (file.attributeCacheHits() != hits || file.attributeCacheMisses() != misses) {
+		cerr << what << ": " << file.attributeCacheHits() << " hits and " << file.attributeCacheMisses()
+		     << " misses instead of " << hits << " and " << misses << endl;
+		exit_status = 1;
+	}
+}
+
+int main() {
+	const string filename("test-attr-cache_bf.h5");
+
+	{
+		dal::BF_File file(filename, dal::BF_File::CREATE);
+		file.observationID().value = "12345";
+		file.subArrayPointing(0).create();
+		file.subArrayPointing(0).beam(0).create();
+		file.subArrayPointing(0).beam(0).pointRA().value = 1.5;
+
+		vector<string> targets(2, "B0329+54");
+		file.targets().value = targets;
+
+		// disabled by default
+		check(!file.attributeCaching(), "caching enabled by default");
+		(void)file.observationID().get();
+		checkCounts(file, 0, 0, "disabled cache");
+
+		file.setAttributeCaching(true);
+
+		check(file.observationID().get() == "12345", "value of OBSERVATION_ID");
+		check(file.observationID().get() == "12345", "cached value of OBSERVATION_ID");
+		checkCounts(file, 1, 1, "repeated read");
+
+		// other objects in the same file share the cache
+		dal::BF_BeamGroup beam(file.subArrayPointing(0).beam(0));
+		check(beam.pointRA().get() == 1.5, "value of POINT_RA");
+		check(file.subArrayPointing(0).beam(0).pointRA().get() == 1.5, "cached value of POINT_RA");
+		checkCounts(file, 2, 2, "read through other objects");
+
+		// set() invalidates
+		file.observationID().value = "54321";
+		check(file.observationID().get() == "54321", "value of OBSERVATION_ID after set()");
+		checkCounts(file, 2, 3, "read after set()");
+
+		// vectors are cached too, and set() can change their length
+		check(file.targets().get() == targets, "value of TARGETS");
+		targets.push_back("B1919+21");
+		file.targets().value = targets;
+		check(file.targets().get() == targets, "value of TARGETS after set()");
+		check(file.targets().get() == targets, "cached value of TARGETS");
+		checkCounts(file, 3, 5, "vector read after set()");
+
+		// remove() invalidates
+		file.observationID().remove();
+		check(!file.observationID().exists(), "existence of OBSERVATION_ID after remove()");
+
+		// removing a group invalidates the attributes in it
+		(void)beam.pointRA().get();
+		file.subArrayPointing(0).beam(0).remove();
+		file.subArrayPointing(0).beam(0).create();
+		check(!file.subArrayPointing(0).beam(0).pointRA().exists(), "existence of POINT_RA after removing its group");
+
+		file.setAttributeCaching(false);
+		check(!file.attributeCaching(), "caching enabled after disabling it");
+	}
+
+	{
+		dal::BF_File file(filename, dal::BF_File::READ);
+		file.setAttributeCaching(true);
+
+		for (unsigned i = 0; i < 10; i++) {
+			check(file.targets().get().size() == 3, "length of TARGETS");
+		}
+		checkCounts(file, 9, 1, "repeated read in READ mode");
+	}
+
+	return exit_status;
+}
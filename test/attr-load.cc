@@ -0,0 +1,122 @@
+// attr-load.cc
+// Read all attributes of a group in one pass with Group::loadAttributes(), and check
+// their types and values (also of complex numbers) against those written through Attribute<T>.
+// Build: c++ -Wall attr-load.cc -llofardal -lhdf5
+#include <cstdlib>
+#include <complex>
+#include <string>
+#include <vector>
+#include <iostream>
+
+#include <dal/lofar/TBB_File.h>
+
+using namespace std;
+
+static int exit_status;
+
+static const dal::AttributeData &find(const vector<dal::AttributeData> &attrs, const string &name) {
+	for (size_t i = 0; i < attrs.size(); i++) {
+		if (attrs[i].name() == name) {
+			return attrs[i];
+		}
+	}
+
+	cerr << "attribute " << name << " not loaded" << endl;
+	exit(1);
+}
+
+static void check(bool ok, const string &what) {
+	if (!ok) {
+		cerr << "unexpected " << what << endl;
+		exit_status = 1;
+	}
+}
+
+int main() {
+	dal::TBB_File file("test-attr-load_tbb.h5", dal::TBB_File::CREATE);
+
+	file.observationID().value = "12345";
+	file.observationNofStations().value = 2;
+	file.observationFrequencyCenter().value = 60.5;
+
+	vector<string> stations;
+	stations.push_back("CS001");
+	stations.push_back("RS106");
+	file.observationStationsList().value = stations;
+
+	dal::Attribute<int> negative(file, "NEGATIVE");
+	negative.value = -7;
+
+	dal::Attribute< vector<dal::Range> > ranges(file, "RANGES");
+	vector<dal::Range> rangesValue;
+	rangesValue.push_back(dal::Range(1, 5));
+	rangesValue.push_back(dal::Range(10, 20));
+	ranges.value = rangesValue;
+
+	// stored as compounds of two floating point numbers
+	dal::Attribute< vector< complex<double> > > gains(file, "GAINS");
+	vector< complex<double> > gainsValue;
+	gainsValue.push_back(complex<double>(1.5, -2.0));
+	gainsValue.push_back(complex<double>(0.0, 3.25));
+	gains.value = gainsValue;
+
+	dal::Attribute< complex<float> > gain(file, "GAIN");
+	gain.value = complex<float>(0.5f, 0.25f);
+
+	dal::Attribute< vector<double> > empty(file, "EMPTY");
+	empty.value = vector<double>();
+
+	const vector<dal::AttributeData> attrs(file.loadAttributes());
+
+	for (size_t i = 1; i < attrs.size(); i++) {
+		check(attrs[i - 1].name() < attrs[i].name(), "attribute order");
+	}
+
+	const dal::AttributeData &obsID = find(attrs, "OBSERVATION_ID");
+	check(obsID.type() == dal::AttributeData::STRING && obsID.scalar(), "type of OBSERVATION_ID");
+	check(obsID.strings().size() == 1 && obsID.strings()[0] == "12345", "value of OBSERVATION_ID");
+
+	const dal::AttributeData &nofStations = find(attrs, "OBSERVATION_NOF_STATIONS");
+	check(nofStations.type() == dal::AttributeData::UNSIGNED && nofStations.scalar(), "type of OBSERVATION_NOF_STATIONS");
+	check(nofStations.unsignedIntegers().size() == 1 && nofStations.unsignedIntegers()[0] == 2, "value of OBSERVATION_NOF_STATIONS");
+
+	const dal::AttributeData &center = find(attrs, "OBSERVATION_FREQUENCY_CENTER");
+	check(center.type() == dal::AttributeData::FLOAT, "type of OBSERVATION_FREQUENCY_CENTER");
+	check(center.floats().size() == 1 && center.floats()[0] == 60.5, "value of OBSERVATION_FREQUENCY_CENTER");
+
+	const dal::AttributeData &stationsList = find(attrs, "OBSERVATION_STATIONS_LIST");
+	check(stationsList.type() == dal::AttributeData::STRING && !stationsList.scalar(), "type of OBSERVATION_STATIONS_LIST");
+	check(stationsList.strings() == stations, "value of OBSERVATION_STATIONS_LIST");
+
+	const dal::AttributeData &neg = find(attrs, "NEGATIVE");
+	check(neg.type() == dal::AttributeData::INTEGER, "type of NEGATIVE");
+	check(neg.integers().size() == 1 && neg.integers()[0] == -7, "value of NEGATIVE");
+
+	const dal::AttributeData &rangesData = find(attrs, "RANGES");
+	check(rangesData.type() == dal::AttributeData::UNSIGNED && rangesData.size() == 2 && rangesData.tupleSize() == 2, "type of RANGES");
+	check(rangesData.unsignedIntegers().size() == 4 && rangesData.unsignedIntegers()[0] == 1 && rangesData.unsignedIntegers()[3] == 20, "value of RANGES");
+
+	const dal::AttributeData &gainsData = find(attrs, "GAINS");
+	check(gainsData.type() == dal::AttributeData::COMPLEX && !gainsData.scalar() && gainsData.size() == 2, "type of GAINS");
+	check(gainsData.complexes() == gainsValue, "value of GAINS");
+
+	const dal::AttributeData &gainData = find(attrs, "GAIN");
+	check(gainData.type() == dal::AttributeData::COMPLEX && gainData.scalar(), "type of GAIN");
+	check(gainData.complexes().size() == 1 && gainData.complexes()[0] == complex<double>(0.5, 0.25), "value of GAIN");
+
+	const dal::AttributeData &emptyData = find(attrs, "EMPTY");
+	check(emptyData.type() == dal::AttributeData::FLOAT && !emptyData.scalar() && emptyData.size() == 0, "type of EMPTY");
+	check(emptyData.floats().empty(), "value of EMPTY");
+
+	// set by CLA_File on creation
+	const dal::AttributeData &docVersion = find(attrs, "DOC_VERSION");
+	check(docVersion.type() == dal::AttributeData::STRING, "type of DOC_VERSION");
+	check(docVersion.strings().size() == 1 && docVersion.strings()[0] == file.docVersion().get().to_string(), "value of DOC_VERSION");
+
+	// a group without attributes
+	dal::TBB_Station st(file.station("CS001"));
+	st.create();
+	check(st.loadAttributes().empty(), "attributes in new station group");
+
+	return exit_status;
+}
@@ -0,0 +1,116 @@
+// attr-vector.cc
+// Check reading and writing vector attributes through buffers (getValues()/setValues()),
+// including their use of the attribute cache, and reading string vectors stored with
+// variable and fixed length strings.
+// Build: c++ -Wall attr-vector.cc -llofardal -lhdf5
+#include <cstring>
+#include <string>
+#include <vector>
+#include <iostream>
+
+#include <hdf5.h>
+#include <dal/hdf5/File.h>
+
+using namespace std;
+
+static int exit_status;
+
+int main() {
+	const string filename("test-attr-vector.h5");
+
+	{
+		// a vector of fixed length strings, as written by other tools
+		hid_t file = H5Fcreate(filename.c_str(), H5F_ACC_TRUNC, H5P_DEFAULT, H5P_DEFAULT);
+		hid_t type = H5Tcopy(H5T_C_S1);
+		H5Tset_size(type, 5);
+		H5Tset_strpad(type, H5T_STR_NULLPAD);
+		hsize_t dims[1] = { 3 };
+		hid_t space = H5Screate_simple(1, dims, NULL);
+		hid_t attr = H5Acreate2(file, "FIXED_STRINGS", type, space, H5P_DEFAULT, H5P_DEFAULT);
+		const char values[] = "CS001" "RS2\0\0" "\0\0\0\0\0"; // full width, padded, and empty
+		H5Awrite(attr, type, values);
+		H5Aclose(attr);
+		H5Sclose(space);
+		H5Tclose(type);
+		H5Fclose(file);
+	}
+
+	dal::File file(filename, dal::File::READWRITE);
+
+	dal::Attribute< vector<string> > fixedStrings(file, "FIXED_STRINGS");
+	vector<string> strings(fixedStrings.get());
+	if (strings.size() != 3 || strings[0] != "CS001" || strings[1] != "RS2" || strings[2] != "") {
+		cerr << "unexpected value of fixed length string vector" << endl;
+		exit_status = 1;
+	}
+
+	dal::Attribute< vector<string> > variableStrings(file, "VARIABLE_STRINGS");
+	variableStrings.create().set(strings);
+	if (variableStrings.get() != strings) {
+		cerr << "unexpected value of variable length string vector" << endl;
+		exit_status = 1;
+	}
+
+	dal::Attribute< vector<double> > doubles(file, "DOUBLES");
+	doubles.create();
+
+	// setValues() changes the length as needed
+	const double values[] = { 1.0, 2.5, -3.0, 4.0 };
+	doubles.setValues(values, 4);
+	if (doubles.size() != 4 || doubles.get() != vector<double>(values, values + 4)) {
+		cerr << "unexpected value after setValues()" << endl;
+		exit_status = 1;
+	}
+
+	double buf[4] = { 0 };
+	doubles.getValues(buf, 4);
+	if (memcmp(buf, values, sizeof buf) != 0) {
+		cerr << "unexpected value from getValues()" << endl;
+		exit_status = 1;
+	}
+
+	try {
+		doubles.getValues(buf, 3);
+		cerr << "getValues() with wrong length did not throw" << endl;
+		exit_status = 1;
+	} catch (dal::DALValueError &) {
+	}
+
+	// also from the attribute cache
+	file.setAttributeCaching(true);
+	(void)doubles.get();
+	memset(buf, 0, sizeof buf);
+	doubles.getValues(buf, 4);
+	if (memcmp(buf, values, sizeof buf) != 0 || file.attributeCacheHits() != 1) {
+		cerr << "unexpected value from getValues() with caching" << endl;
+		exit_status = 1;
+	}
+
+	// getValues() caches the value it read, so a second read is a cache hit
+	dal::Attribute< vector<double> > moreDoubles(file, "MORE_DOUBLES");
+	moreDoubles.create();
+	moreDoubles.setValues(values, 4);
+	const unsigned long hits = file.attributeCacheHits();
+	const unsigned long misses = file.attributeCacheMisses();
+	for (unsigned i = 0; i < 2; i++) {
+		memset(buf, 0, sizeof buf);
+		moreDoubles.getValues(buf, 4);
+		if (memcmp(buf, values, sizeof buf) != 0) {
+			cerr << "unexpected value from repeated getValues() with caching" << endl;
+			exit_status = 1;
+		}
+	}
+	if (file.attributeCacheHits() != hits + 1 || file.attributeCacheMisses() != misses + 1) {
+		cerr << "getValues() twice: " << file.attributeCacheHits() - hits << " hits and "
+		     << file.attributeCacheMisses() - misses << " misses instead of 1 and 1" << endl;
+		exit_status = 1;
+	}
+
+	doubles.setValues(NULL, 0);
+	if (doubles.size() != 0 || !doubles.get().empty()) {
+		cerr << "unexpected value after setValues() of empty vector" << endl;
+		exit_status = 1;
+	}
+
+	return exit_status;
+}
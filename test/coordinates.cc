@@ -0,0 +1,149 @@
+// coordinates.cc
+// Check the typed coordinate objects of a coordinates group, and the pixel <-> world
+// conversions of linear and tabular coordinates, against the axes stored in a BF file,
+// and for some synthetic tables. Also check that changing COORDINATE_TYPES updates them.
+// Build: c++ -Wall coordinates.cc -llofardal -lhdf5
+#include <cmath>
+#include <vector>
+#include <string>
+#include <iostream>
+
+#include <dal/lofar/BF_File.h>
+
+using namespace std;
+
+static int exit_status;
+
+static void check(bool ok, const string &what) {
+	if (!ok) {
+		cerr << what << endl;
+		exit_status = 1;
+	}
+}
+
+static bool near(double a, double b) {
+	return fabs(a - b) <= 1e-9 * max(fabs(a), fabs(b));
+}
+
+int main() {
+	{
+		dal::BF_File file("data/L63876_SAP000_B000_S0_P000_bf.h5");
+		dal::CoordinatesGroup coordinates(file.subArrayPointing(0).beam(0).coordinates());
+
+		// linear time axis
+		dal::TimeCoordinate time(coordinates, "COORDINATE_0");
+		check(!time.tabular(), "time axis is not linear");
+
+		vector<double> values(3);
+		values[0] = 0.0; values[1] = 1.0; values[2] = 10.5;
+		time.toWorld(&values[0], values.size());
+
+		const double increment = time.increment().get();
+		check(near(values[1], increment) && near(values[2], 10.5 * increment), "unexpected time axis values");
+
+		time.toPixel(&values[0], values.size());
+		check(values[0] == 0.0 && near(values[1], 1.0) && near(values[2], 10.5), "time axis does not convert back");
+
+		// typed, shared coordinate objects
+		vector< dal::SharedPtr<dal::Coordinate> > all(coordinates.coordinates());
+		check(all.size() == 2 && coordinates.nrCoordinates() == 2, "unexpected number of coordinates");
+		check(dynamic_cast<dal::TimeCoordinate *>(all[0].get()) != NULL, "coordinate 0 is not a TimeCoordinate");
+		check(dynamic_cast<dal::SpectralCoordinate *>(all[1].get()) != NULL, "coordinate 1 is not a SpectralCoordinate");
+		check(coordinates.coordinatePtr(1).get() == all[1].get(), "coordinatePtr() does not return the shared object");
+		check(all[1].useCount() == 2, "coordinate not shared between the group and the caller");
+
+		try {
+			coordinates.coordinatePtr(2);
+			check(false, "coordinatePtr() beyond the number of coordinates did not throw");
+		} catch (dal::DALIndexError &) {
+		}
+
+		// tabular frequency axis
+		dal::SpectralCoordinate spectral(coordinates, "COORDINATE_1");
+		check(spectral.tabular(), "spectral axis is not tabular");
+
+		const vector<unsigned> pixels(spectral.axisValuesPixel().get());
+		const vector<double> frequencies(spectral.axisValuesWorld().get());
+
+		vector<double> channels(pixels.begin(), pixels.end());
+		spectral.toWorld(&channels[0], channels.size());
+		check(channels == frequencies, "spectral axis does not reproduce its table");
+
+		spectral.toPixel(&channels[0], channels.size());
+		for (size_t i = 0; i < channels.size(); i++) {
+			if (!near(channels[i], pixels[i])) {
+				cerr << "spectral axis does not convert back at channel " << i << endl;
+				exit_status = 1;
+				break;
+			}
+		}
+
+		// in between, and in reverse order
+		double half[] = { 2.5, 0.5 };
+		spectral.toWorld(half, 2);
+		check(near(half[0], (frequencies[2] + frequencies[3]) / 2) && near(half[1], (frequencies[0] + frequencies[1]) / 2), "unexpected interpolation");
+	}
+
+	{
+		dal::File file("test-coordinates.h5", dal::File::CREATE);
+
+		// decreasing world values, with extrapolation
+		dal::NumericalCoordinate decreasing(file, "DECREASING");
+		decreasing.create();
+		decreasing.storageType().value = vector<string>(1, "Tabular");
+		vector<unsigned> pixels(3);
+		pixels[0] = 0; pixels[1] = 10; pixels[2] = 20;
+		vector<double> worlds(3);
+		worlds[0] = 300.0; worlds[1] = 200.0; worlds[2] = 150.0;
+		decreasing.axisValuesPixel().value = pixels;
+		decreasing.axisValuesWorld().value = worlds;
+
+		double values[] = { -10.0, 5.0, 15.0, 30.0 };
+		decreasing.toWorld(values, 4);
+		check(values[0] == 400.0 && values[1] == 250.0 && values[2] == 175.0 && values[3] == 100.0, "unexpected tabular values");
+
+		decreasing.toPixel(values, 4);
+		check(values[0] == -10.0 && values[1] == 5.0 && values[2] == 15.0 && values[3] == 30.0, "decreasing axis does not convert back");
+
+		// world values need to be monotonic to convert to pixels
+		dal::NumericalCoordinate nonmonotonic(file, "NONMONOTONIC");
+		nonmonotonic.create();
+		nonmonotonic.storageType().value = vector<string>(1, "Tabular");
+		worlds[2] = 250.0;
+		nonmonotonic.axisValuesPixel().value = pixels;
+		nonmonotonic.axisValuesWorld().value = worlds;
+
+		nonmonotonic.toWorld(values, 4);
+		try {
+			nonmonotonic.toPixel(values, 4);
+			check(false, "converting a non-monotonic axis to pixels did not throw");
+		} catch (dal::DALValueError &) {
+		}
+
+		// changing the coordinate types through the group updates its coordinates
+		dal::CoordinatesGroup coordinates(file, "COORDINATES");
+		coordinates.create();
+		coordinates.coordinateTypes().value = vector<string>(1, "Time");
+		check(coordinates.nrCoordinates() == 1 && coordinates.coordinates().size() == 1, "unexpected number of coordinates before changing their types");
+		dal::SharedPtr<dal::Coordinate> first(coordinates.coordinatePtr(0));
+		check(dynamic_cast<dal::TimeCoordinate *>(first.get()) != NULL, "coordinate 0 is not a TimeCoordinate");
+
+		check(coordinates.coordinateTypes().get().size() == 1, "unexpected number of coordinate types");
+		check(coordinates.coordinatePtr(0).get() == first.get(), "coordinate object not kept after reading unchanged types");
+
+		vector<string> types(1, "Spectral");
+		types.push_back("Time");
+		coordinates.coordinateTypes().value = types;
+		check(coordinates.nrCoordinates() == 2 && coordinates.coordinates().size() == 2, "unexpected number of coordinates after changing their types");
+		check(dynamic_cast<dal::SpectralCoordinate *>(coordinates.coordinatePtr(0).get()) != NULL, "coordinate 0 is not a SpectralCoordinate after changing its type");
+		check(dynamic_cast<dal::TimeCoordinate *>(coordinates.coordinatePtr(1).get()) != NULL, "coordinate 1 is not a TimeCoordinate");
+
+		// the axis is cached: later changes to its attributes are not seen
+		decreasing.axisValuesWorld().value = worlds;
+		double value = 20.0;
+		decreasing.toWorld(&value, 1);
+		check(value == 150.0, "axis not cached");
+	}
+
+	return exit_status;
+}
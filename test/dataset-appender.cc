@@ -0,0 +1,136 @@
+// dataset-appender.cc
+// Check that DatasetAppender appends to (buffered), grows and trims a dataset,
+// and that TBB_DipoleAppender keeps DATA_LENGTH and FLAG_OFFSETS up to date.
+// Build: c++ -Wall dataset-appender.cc -llofardal -lhdf5
+#include <vector>
+#include <string>
+#include <iostream>
+
+#include <dal/lofar/TBB_DipoleAppender.h>
+
+using namespace std;
+
+static int exit_status;
+
+static void check(bool ok, const string &what) {
+	if (!ok) {
+		cerr << what << endl;
+		exit_status = 1;
+	}
+}
+
+int main() {
+	dal::TBB_File file("test-dataset-appender_tbb.h5", dal::TBB_File::CREATE);
+
+	// generic 2D dataset: samples x 3 values
+	{
+		dal::Dataset<float> data(file, "DATA");
+		vector<ssize_t> dims(2, 3), maxdims(2, 3);
+		dims[0] = 0;
+		maxdims[0] = -1;
+		data.create(dims, maxdims, "test-dataset-appender.raw");
+
+		vector<float> values(3 * 100);
+		for (size_t i = 0; i < values.size(); i++) {
+			values[i] = i;
+		}
+
+		{
+			dal::DatasetAppender<float> appender(data, 8);
+			check(appender.rowLength() == 3, "unexpected row length");
+
+			try {
+				appender.append(&values[0], 2);
+				check(false, "appending a partial sample did not throw");
+			} catch (dal::DALValueError &) {
+			}
+
+			// small appends are buffered, large ones are written directly
+			size_t pos = 0;
+			const size_t lengths[] = { 1, 2, 5, 3, 20, 1, 68 };
+			for (size_t i = 0; i < sizeof lengths / sizeof lengths[0]; i++) {
+				appender.append(&values[3 * pos], 3 * lengths[i]);
+				pos += lengths[i];
+			}
+			check(appender.length() == 100, "unexpected appended length");
+			check(appender.extent() >= 100 - appender.bufferLength(), "dataset did not grow");
+
+			appender.close();
+			check(appender.closed(), "appender not closed");
+			check(appender.extent() == 100, "dataset not trimmed on close");
+
+			try {
+				appender.append(&values[0], 3);
+				check(false, "appending after close did not throw");
+			} catch (dal::DALValueError &) {
+			}
+		}
+
+		check(data.dims()[0] == 100, "unexpected dataset length after close");
+
+		vector<float> readback(values.size());
+		vector<size_t> pos(2, 0);
+		data.get2D(pos, &readback[0], 100, 3);
+		check(readback == values, "unexpected data after appending");
+
+		// appending continues at the end, and grows in steps of growLength
+		{
+			dal::DatasetAppender<float> appender(data, 0, 64);
+			appender.append(&values[0], 3);
+			check(appender.length() == 101, "unexpected length appending to existing data");
+			check(appender.extent() == 128, "dataset not grown to a multiple of growLength");
+		}
+		check(data.dims()[0] == 101, "dataset not trimmed on destruction");
+	}
+
+	// a bounded dataset cannot grow beyond its maximum
+	{
+		dal::Dataset<float> data(file, "BOUNDED");
+		data.create1D(0, 10, "test-dataset-appender-bounded.raw");
+
+		vector<float> values(11);
+		dal::DatasetAppender<float> appender(data, 4);
+		appender.append(&values[0], 10);
+		check(appender.extent() == 10, "bounded dataset grown beyond its maximum");
+
+		try {
+			appender.append(&values[0], 1);
+			check(false, "appending beyond the maximum length did not throw");
+		} catch (dal::DALValueError &) {
+		}
+	}
+
+	// TBB dipole
+	{
+		dal::TBB_Station station(file.station("CS001"));
+		station.create();
+		dal::TBB_DipoleDataset dipole(station.dipole(1, 0, 0));
+		dipole.create1D(0, -1, "test-dataset-appender_tbb.raw");
+
+		vector<short> frame(1024, 1);
+
+		dal::TBB_DipoleAppender appender(dipole, 4096);
+		appender.append(&frame[0], frame.size());
+		appender.appendFlagged(&frame[0], frame.size());
+		appender.appendFlagged(&frame[0], frame.size());
+		appender.append(&frame[0], frame.size());
+		appender.flag(3000, 3500);
+
+		appender.flag(100, 200); // flags can be added in any order
+
+		// the last append filled the buffer, so the attributes have been written
+		check(dipole.dataLength().get() == 4096, "unexpected DATA_LENGTH after flush");
+
+		appender.append(&frame[0], 10);
+		appender.close();
+
+		check(dipole.dims1D() == 4106, "unexpected dipole length");
+		check(dipole.dataLength().get() == 4106, "unexpected DATA_LENGTH");
+
+		vector<dal::Range> flags(dipole.flagOffsets().get());
+		check(flags.size() == 2 && flags[0].begin == 100 && flags[0].end == 200 &&
+		      flags[1].begin == 1024 && flags[1].end == 3500, "unexpected FLAG_OFFSETS");
+	}
+
+	return exit_status;
+}
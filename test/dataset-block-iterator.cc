@@ -0,0 +1,143 @@
+// dataset-block-iterator.cc
+// Iterate over blocks of samples of 2D datasets with BlockIterator, and check the blocks
+// against the data written. Covers read-ahead from raw files in both byte orders,
+// a dataset stored inside the HDF5 file, a short last block and a start position.
+// Build: c++ -Wall dataset-block-iterator.cc -llofardal -lhdf5
+#include <vector>
+#include <algorithm>
+#include <string>
+#include <iostream>
+
+#include <dal/hdf5/File.h>
+#include <dal/hdf5/BlockIterator.h>
+
+using namespace std;
+
+static int checkBlocks(dal::Dataset<float> &ds, size_t blockLength, size_t pos,
+                       size_t nrSamples, size_t nrChannels, bool readAhead) {
+	dal::BlockIterator<float> it(ds, blockLength, pos);
+
+	if (it.readAhead() != readAhead) {
+		cerr << ds.name() << ": unexpected read-ahead setting" << endl;
+		return 1;
+	}
+
+	if (it.rowLength() != nrChannels) {
+		cerr << ds.name() << ": row length " << it.rowLength() << " != " << nrChannels << endl;
+		return 1;
+	}
+
+	const float *firstBuffer = NULL;
+	size_t expectedPos = pos;
+
+	while (it.next()) {
+		if (it.pos() != expectedPos) {
+			cerr << ds.name() << ": block at " << it.pos() << " instead of " << expectedPos << endl;
+			return 1;
+		}
+
+		const size_t expectedLength = min(blockLength, nrSamples - expectedPos);
+		if (it.length() != expectedLength) {
+			cerr << ds.name() << ": block length " << it.length() << " != " << expectedLength << endl;
+			return 1;
+		}
+
+		// the two buffers are reused
+		if (it.pos() == pos + 2 * blockLength && it.data() != firstBuffer) {
+			cerr << ds.name() << ": block buffers are not reused" << endl;
+			return 1;
+		}
+		if (it.pos() == pos) {
+			firstBuffer = it.data();
+		}
+
+		for (size_t i = 0; i < it.length() * nrChannels; i++) {
+			if (it.data()[i] != (float)(it.pos() * nrChannels + i)) {
+				cerr << ds.name() << ": value " << i << " of block at " << it.pos() << " is " << it.data()[i] << endl;
+				return 1;
+			}
+		}
+
+		vector<float> copy(it.length() * nrChannels);
+		it.getBlock(&copy[0], copy.size());
+		if (!equal(copy.begin(), copy.end(), it.data())) {
+			cerr << ds.name() << ": getBlock() does not match data()" << endl;
+			return 1;
+		}
+
+		expectedPos += it.length();
+	}
+
+	if (expectedPos != nrSamples) {
+		cerr << ds.name() << ": iteration stopped at " << expectedPos << " instead of " << nrSamples << endl;
+		return 1;
+	}
+
+	// remains at the end
+	if (it.next()) {
+		cerr << ds.name() << ": next() after the last block returned true" << endl;
+		return 1;
+	}
+
+	return 0;
+}
+
+int main() {
+	int exit_status = 0;
+
+	const size_t nrSamples = 1000;
+	const size_t nrChannels = 3;
+
+	dal::File file("test-dataset-block-iterator.h5", dal::File::CREATE);
+
+	vector<float> data(nrSamples * nrChannels);
+	for (size_t i = 0; i < data.size(); i++) {
+		data[i] = i;
+	}
+
+	vector<ssize_t> dims(2);
+	dims[0] = nrSamples;
+	dims[1] = nrChannels;
+	vector<size_t> pos(2, 0);
+
+	dal::Dataset<float> big(file, "BIG");
+	big.create(dims, dims, "test-dataset-block-iterator-big.raw", dal::Dataset<float>::BIG);
+	big.set2D(pos, &data[0], nrSamples, nrChannels);
+
+	dal::Dataset<float> little(file, "LITTLE");
+	little.create(dims, dims, "test-dataset-block-iterator-little.raw", dal::Dataset<float>::LITTLE);
+	little.set2D(pos, &data[0], nrSamples, nrChannels);
+
+	dal::Dataset<float> internal(file, "INTERNAL");
+	internal.create(dims, dims);
+	internal.set2D(pos, &data[0], nrSamples, nrChannels);
+
+	exit_status |= checkBlocks(big, 64, 0, nrSamples, nrChannels, true);
+	exit_status |= checkBlocks(little, 100, 0, nrSamples, nrChannels, true);
+	exit_status |= checkBlocks(little, 64, 10, nrSamples, nrChannels, true);
+	exit_status |= checkBlocks(big, 5000, 0, nrSamples, nrChannels, true);
+	exit_status |= checkBlocks(internal, 64, 0, nrSamples, nrChannels, false);
+	exit_status |= checkBlocks(internal, 64, nrSamples, nrSamples, nrChannels, false);
+
+	try {
+		dal::BlockIterator<float> it(big, 0);
+		cerr << "block length 0 did not throw" << endl;
+		exit_status = 1;
+	} catch (dal::DALValueError &) {
+	}
+
+	try {
+		dal::BlockIterator<float> it(big, 64, nrSamples + 1);
+		cerr << "starting beyond the end did not throw" << endl;
+		exit_status = 1;
+	} catch (dal::DALIndexError &) {
+	}
+
+	// the iterator is destroyed while a block is being read ahead
+	{
+		dal::BlockIterator<float> it(big, 64);
+		it.next();
+	}
+
+	return exit_status;
+}
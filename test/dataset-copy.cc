@@ -0,0 +1,102 @@
+// dataset-copy.cc
+// Check that a copy of a Dataset object (copy constructor and assignment) does not share
+// the extent cache of the original: each creates and keeps its own file and memory dataspace,
+// and both read the right data after the other read a block of a different shape.
+// Build: c++ -Wall dataset-copy.cc -llofardal -lhdf5
+#include <string>
+#include <vector>
+#include <iostream>
+
+#include <dal/hdf5/File.h>
+#include <dal/hdf5/Dataset.h>
+
+using namespace std;
+
+static int exit_status;
+
+static void check(bool ok, const string &what) {
+	if (!ok) {
+		cerr << "unexpected " << what << endl;
+		exit_status = 1;
+	}
+}
+
+// HDF5 does not count library ids for us (H5Inmembers() refuses H5I_DATASPACE), but it hands
+// out dataspace ids in increasing order, so count the valid ones created since firstDataspace.
+static hid_t firstDataspace;
+
+static hid_t newDataspace() {
+	const hid_t dataspace = H5Screate(H5S_SCALAR);
+	H5Sclose(dataspace);
+	return dataspace;
+}
+
+// Returns the number of open HDF5 dataspace ids, which includes the dataspaces cached by Dataset objects.
+static hsize_t nofDataspaces() {
+	const hid_t end = newDataspace();
+	hsize_t n = 0;
+	for (hid_t id = firstDataspace; id < end; id++)
+		if (H5Iis_valid(id) > 0)
+			n++;
+	return n;
+}
+
+// Reads the block of dim1 x dim2 values at [0, 0] and returns how many dataspaces were opened by doing so.
+static long readBlock(dal::Dataset<float> &ds, size_t dim1, size_t dim2, const string &what) {
+	vector<float> buf(dim1 * dim2);
+	const hsize_t before = nofDataspaces();
+
+	ds.get2D(vector<size_t>(2, 0), &buf[0], dim1, dim2);
+
+	for (size_t i = 0; i < dim1; i++)
+		for (size_t j = 0; j < dim2; j++)
+			check(buf[i * dim2 + j] == i * 16 + j, what + ": value read");
+
+	return (long)nofDataspaces() - (long)before;
+}
+
+int main() {
+	const string filename("test-dataset-copy.h5");
+	firstDataspace = newDataspace();
+
+	dal::File file(filename, dal::File::CREATE);
+	{
+		dal::Dataset<float> writer(file, "DATA");
+		vector<ssize_t> dims(2);
+		dims[0] = 16;
+		dims[1] = 16;
+		writer.create(dims);
+
+		vector<float> data(16 * 16);
+		for (size_t i = 0; i < data.size(); i++)
+			data[i] = i;
+		writer.set2D(vector<size_t>(2, 0), &data[0], 16, 16);
+	}
+
+	dal::Dataset<float> ds(file, "DATA");
+
+	// a first read caches a file and a memory dataspace, a repeated read reuses them
+	const long cached = readBlock(ds, 4, 4, "original");
+	check(cached > 0, "number of dataspaces cached by the original");
+	check(readBlock(ds, 4, 4, "original again") == 0, "number of dataspaces opened by a repeated read");
+
+	// a copy caches its own dataspaces instead of using those of the original
+	dal::Dataset<float> copy(ds);
+	check(readBlock(copy, 4, 4, "copy") == cached, "number of dataspaces cached by the copy");
+
+	// a different block shape in the copy does not affect the original, and vice versa
+	check(readBlock(copy, 2, 8, "copy, other shape") == 0, "number of dataspaces still open after the copy changed its memory dataspace");
+	check(readBlock(ds, 4, 4, "original after the copy") == 0, "number of dataspaces opened by the original after reads through the copy");
+	check(readBlock(copy, 2, 8, "copy again") == 0, "number of dataspaces opened by a repeated read of the copy");
+
+	// the same holds for assignment, which also drops the cache of the assigned-to object
+	dal::Dataset<float> assigned(file, "DATA");
+	check(readBlock(assigned, 2, 2, "assigned") == cached, "number of dataspaces cached before assignment");
+	const hsize_t beforeAssignment = nofDataspaces();
+	assigned = ds;
+	check(nofDataspaces() + cached == beforeAssignment, "number of dataspaces closed by assignment");
+	check(readBlock(assigned, 4, 4, "assigned after assignment") == cached, "number of dataspaces cached after assignment");
+	check(readBlock(ds, 4, 4, "original after assignment") == 0, "number of dataspaces opened by the original after assignment");
+
+	return exit_status;
+}
@@ -0,0 +1,71 @@
+// dataset-create-chunked.cc
+// Create a chunked, compressed dataset with an unbounded dimension in the HDF5 file itself,
+// grow it and read back what was written. Also check that invalid layout options throw.
+// Build: c++ -Wall dataset-create-chunked.cc -llofardal -lhdf5
+#include <vector>
+#include <iostream>
+
+#include <dal/lofar/TBB_File.h>
+
+using namespace std;
+
+int main() {
+	int exit_status = 0;
+
+	dal::TBB_File file("test-dataset-create-chunked_tbb.h5", dal::TBB_File::CREATE);
+	dal::TBB_Station st(file.station("CS001"));
+	st.create();
+
+	dal::DatasetCreateOptions opts;
+	opts.setChunkDims(vector<ssize_t>(1, 1024));
+	opts.setShuffle(true);
+	opts.setDeflate(6);
+	opts.setFillPolicy(dal::DatasetCreateOptions::FILL_ALLOC);
+
+	dal::TBB_DipoleDataset dp(st.dipole(1, 2, 3));
+	dp.create1D(2048, -1, "", dal::TBB_DipoleDataset::NATIVE, opts);
+
+	if (dp.maxdims1D() != -1) {
+		cerr << "chunked dataset did not get an unbounded maximum dimension" << endl;
+		exit_status = 1;
+	}
+
+	vector<short> data(4096);
+	for (size_t i = 0; i < data.size(); i++) {
+		data[i] = i % 7;
+	}
+
+	// grow beyond the initial size, which requires chunked storage for internal data
+	dp.resize1D(data.size());
+	dp.set1D(0, &data[0], data.size());
+
+	vector<short> readback(data.size());
+	dp.get1D(0, &readback[0], readback.size());
+	if (readback != data) {
+		cerr << "failed to read back data written to chunked dataset" << endl;
+		exit_status = 1;
+	}
+
+	// chunked storage cannot be combined with external files
+	try {
+		dal::TBB_DipoleDataset dp2(st.dipole(1, 2, 4));
+		dp2.create1D(2048, -1, "test-dataset-create-chunked_tbb.raw", dal::TBB_DipoleDataset::NATIVE, opts);
+		cerr << "creating a chunked dataset in an external file did not throw" << endl;
+		exit_status = 1;
+	} catch (dal::DALValueError& ) {
+	}
+
+	// compression requires chunked storage
+	try {
+		dal::DatasetCreateOptions contiguousOpts;
+		contiguousOpts.setDeflate(6);
+
+		dal::TBB_DipoleDataset dp3(st.dipole(1, 2, 5));
+		dp3.create1D(2048, 2048, "", dal::TBB_DipoleDataset::NATIVE, contiguousOpts);
+		cerr << "creating a compressed contiguous dataset did not throw" << endl;
+		exit_status = 1;
+	} catch (dal::DALValueError& ) {
+	}
+
+	return exit_status;
+}
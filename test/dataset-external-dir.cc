@@ -0,0 +1,73 @@
+// dataset-external-dir.cc
+// Write and read back a dataset stored in an external file, with the HDF5 file in another directory
+// than the cwd. The external file must end up next to the HDF5 file, and the cwd must be left alone.
+// Build: c++ -Wall dataset-external-dir.cc -llofardal -lhdf5
+#include <cerrno>
+#include <vector>
+#include <string>
+#include <iostream>
+#include <sys/types.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include <dal/lofar/TBB_File.h>
+
+using namespace std;
+
+static string getCwd() {
+	char buf[4096];
+	if (getcwd(buf, sizeof buf) == NULL)
+		return "";
+	return buf;
+}
+
+int main() {
+	int exit_status = 0;
+
+	const string dirname("test-dataset-external-dir");
+	if (mkdir(dirname.c_str(), 0755) == -1 && errno != EEXIST) {
+		cerr << "could not create directory " << dirname << endl;
+		return 1;
+	}
+
+	const string cwd(getCwd());
+
+	vector<short> data(1000);
+	for (size_t i = 0; i < data.size(); i++) {
+		data[i] = i;
+	}
+
+	{
+		dal::TBB_File file(dirname + "/test-dataset-external-dir_tbb.h5", dal::TBB_File::CREATE);
+		dal::TBB_Station st(file.station("CS001"));
+		st.create();
+		dal::TBB_DipoleDataset dp(st.dipole(1, 2, 3));
+		dp.create1D(data.size(), data.size(), "test-dataset-external-dir_tbb.raw");
+		dp.set1D(0, &data[0], data.size());
+	}
+
+	struct stat st;
+	if (stat((dirname + "/test-dataset-external-dir_tbb.raw").c_str(), &st) == -1) {
+		cerr << "external data file was not created next to the HDF5 file" << endl;
+		exit_status = 1;
+	}
+
+	{
+		dal::TBB_File file(dirname + "/test-dataset-external-dir_tbb.h5");
+		dal::TBB_DipoleDataset dp(file.station("CS001").dipole(1, 2, 3));
+
+		vector<short> readback(data.size());
+		dp.get1D(0, &readback[0], readback.size());
+		if (readback != data) {
+			cerr << "failed to read back data from external file" << endl;
+			exit_status = 1;
+		}
+	}
+
+	if (getCwd() != cwd) {
+		cerr << "cwd changed from " << cwd << " to " << getCwd() << endl;
+		exit_status = 1;
+	}
+
+	return exit_status;
+}
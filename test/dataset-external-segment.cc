@@ -0,0 +1,84 @@
+// dataset-external-segment.cc
+// Check that the external file segment info of a BF stokes dataset suffices to read
+// its data directly from the raw file, bypassing HDF5 (as Dataset.mmap() does in Python).
+// Build: c++ -Wall dataset-external-segment.cc -llofardal -lhdf5
+#include <cstdio>
+#include <cstring>
+#include <vector>
+#include <string>
+#include <iostream>
+
+#include <dal/lofar/BF_File.h>
+
+using namespace std;
+
+static float fromBytes(const unsigned char *bytes, bool bigEndian) {
+	unsigned char swapped[sizeof(float)];
+	for (size_t i = 0; i < sizeof(float); i++) {
+		// assumes a little-endian host, like the endianness check below
+		swapped[i] = bigEndian ? bytes[sizeof(float) - 1 - i] : bytes[i];
+	}
+
+	float value;
+	memcpy(&value, swapped, sizeof value);
+	return value;
+}
+
+int main() {
+	int exit_status = 0;
+
+	dal::BF_File file("data/L63876_SAP000_B000_S0_P000_bf.h5");
+	dal::BF_StokesDataset stokes(file.subArrayPointing(0).beam(0).stokes(0));
+
+	const string rawname(stokes.externalDataFile());
+	if (rawname != "data/L63876_SAP000_B000_S0_P000_bf.raw") {
+		cerr << "unexpected external data file " << rawname << endl;
+		return 1;
+	}
+
+	const bool bigEndian = stokes.endianness() == dal::BF_StokesDataset::BIG;
+	if (BYTE_ORDER != LITTLE_ENDIAN) {
+		return 0; // fromBytes() is too simple for this host
+	}
+
+	vector<ssize_t> dims(stokes.dims());
+	const size_t nrValues = 2 * dims[1];
+
+	vector<float> viaHDF5(nrValues);
+	vector<size_t> pos(2, 0);
+	stokes.get2D(pos, &viaHDF5[0], 2, dims[1]);
+
+	FILE *raw = fopen(rawname.c_str(), "rb");
+	if (raw == NULL) {
+		cerr << "could not open " << rawname << endl;
+		return 1;
+	}
+
+	vector<unsigned char> bytes(nrValues * sizeof(float));
+	if (fseek(raw, stokes.externalDataOffset(), SEEK_SET) != 0 ||
+	    fread(&bytes[0], 1, bytes.size(), raw) != bytes.size()) {
+		cerr << "could not read " << rawname << endl;
+		exit_status = 1;
+	}
+	fclose(raw);
+
+	for (size_t i = 0; exit_status == 0 && i < nrValues; i++) {
+		if (fromBytes(&bytes[i * sizeof(float)], bigEndian) != viaHDF5[i]) {
+			cerr << "value " << i << " in raw file does not match value read through HDF5" << endl;
+			exit_status = 1;
+		}
+	}
+
+	// a dataset stored inside the HDF5 file has no external data file
+	dal::File memfile("test-dataset-external-segment.h5", dal::File::CREATE);
+	dal::Dataset<float> internal(memfile, "INTERNAL");
+	internal.create1D(10, 10);
+	try {
+		internal.externalDataFile();
+		cerr << "externalDataFile() on internal dataset did not throw" << endl;
+		exit_status = 1;
+	} catch (dal::DALValueError& ) {
+	}
+
+	return exit_status;
+}
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# Check that numpy indexing of datasets selects the same values as indexing a numpy array.
+import sys
+import numpy
+import dal
+
+exit_status = 0
+
+f = dal.File('test-dataset-getitem.h5', dal.File.CREATE)
+d = dal.DatasetFloat(f, 'DATA')
+d.create([6, 7, 5], [6, 7, 5])
+
+ref = numpy.arange(6 * 7 * 5, dtype=d.dtype).reshape(6, 7, 5)
+d[...] = ref
+
+if not (numpy.asarray(d) == ref).all():
+  print "numpy.asarray() of the dataset differs from the data written"
+  exit_status = 1
+
+keys = [
+  0, -1, (1, 2), (1, 2, 3), (-1, -2, -3),
+  slice(None), slice(1, 4), slice(None, None, 2), slice(None, None, -1), slice(4, 0, -3),
+  (slice(1, 5, 2), slice(None, None, 3)),
+  (Ellipsis, 1), (2, Ellipsis), (Ellipsis, slice(None, None, -2)),
+  (slice(3, 3), 0), (slice(5, 1), slice(None)),
+  (numpy.int64(3), slice(None, None, 4), -1),
+]
+
+for key in keys:
+  got = d[key]
+  expected = ref[key]
+  if numpy.shape(got) != numpy.shape(expected) or not (numpy.asarray(got) == expected).all():
+    print "d[%r] differs from numpy indexing: %r instead of %r" % (key, got, expected)
+    exit_status = 1
+
+# writes, including broadcasting and negative steps
+d[1, ::-2, 4] = [100, 101, 102, 103]
+ref[1, ::-2, 4] = [100, 101, 102, 103]
+d[5] = -1
+ref[5] = -1
+
+if not (d[...] == ref).all():
+  print "writing through numpy indexing did not store the expected values"
+  exit_status = 1
+
+for key in [6, -7, (0, 0, 0, 0), (Ellipsis, Ellipsis), 'a']:
+  try:
+    d[key]
+    print "d[%r] did not raise IndexError" % (key,)
+    exit_status = 1
+  except IndexError:
+    pass
+
+sys.exit(exit_status)
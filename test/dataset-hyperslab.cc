@@ -0,0 +1,122 @@
+// dataset-hyperslab.cc
+// Read and write strided blocks of a 2D dataset with getHyperslab()/setHyperslab(),
+// as the Python bindings do for numpy indexing with steps, and read decimated data
+// with the stride and block arguments of get1D() and get2D().
+// Build: c++ -Wall dataset-hyperslab.cc -llofardal -lhdf5
+#include <vector>
+#include <iostream>
+
+#include <dal/hdf5/File.h>
+#include <dal/hdf5/Dataset.h>
+
+using namespace std;
+
+int main() {
+	int exit_status = 0;
+
+	dal::File file("test-dataset-hyperslab.h5", dal::File::CREATE);
+	dal::Dataset<float> ds(file, "DATA");
+
+	vector<ssize_t> dims(2);
+	dims[0] = 10;
+	dims[1] = 8;
+	ds.create(dims, dims);
+
+	vector<float> data(dims[0] * dims[1]);
+	for (size_t i = 0; i < data.size(); i++) {
+		data[i] = i;
+	}
+	vector<size_t> pos(2, 0);
+	ds.set2D(pos, &data[0], dims[0], dims[1]);
+
+	// every 3rd row from row 1, every 2nd column from column 0
+	vector<size_t> size(2), step(2);
+	const vector<size_t> noBlock;
+	pos[0] = 1;  pos[1] = 0;
+	size[0] = 3; size[1] = 4;
+	step[0] = 3; step[1] = 2;
+
+	vector<float> block(size[0] * size[1]);
+	ds.getHyperslab(pos, size, step, noBlock, &block[0], block.size());
+
+	for (size_t i = 0; i < size[0]; i++) {
+		for (size_t j = 0; j < size[1]; j++) {
+			const float expected = (pos[0] + i * step[0]) * dims[1] + pos[1] + j * step[1];
+			if (block[i * size[1] + j] != expected) {
+				cerr << "strided read returned " << block[i * size[1] + j] << " instead of " << expected << endl;
+				exit_status = 1;
+			}
+		}
+	}
+
+	// write the block negated and check that only the selected values changed
+	for (size_t i = 0; i < block.size(); i++) {
+		block[i] = -block[i];
+	}
+	ds.setHyperslab(pos, size, step, noBlock, &block[0], block.size());
+
+	vector<float> readback(data.size());
+	pos[0] = 0;
+	ds.get2D(pos, &readback[0], dims[0], dims[1]);
+
+	for (size_t i = 0; i < (size_t)dims[0]; i++) {
+		for (size_t j = 0; j < (size_t)dims[1]; j++) {
+			const bool selected = i >= 1 && (i - 1) % 3 == 0 && j % 2 == 0;
+			const float expected = (selected ? -1.0f : 1.0f) * (i * dims[1] + j);
+			if (readback[i * dims[1] + j] != expected) {
+				cerr << "value at (" << i << "," << j << ") is " << readback[i * dims[1] + j] << " instead of " << expected << endl;
+				exit_status = 1;
+			}
+		}
+	}
+
+	// every 4th sample of every 3rd channel, i.e. a decimated dynamic spectrum
+	vector<size_t> stride(2);
+	stride[0] = 4; stride[1] = 3;
+	vector<float> decimated(3 * 3);
+	ds.get2D(pos, &decimated[0], 3, 3, 0, 1, stride);
+
+	for (size_t i = 0; i < 3; i++) {
+		for (size_t j = 0; j < 3; j++) {
+			const float expected = readback[(i * stride[0]) * dims[1] + j * stride[1]];
+			if (decimated[i * 3 + j] != expected) {
+				cerr << "decimated get2D() returned " << decimated[i * 3 + j] << " instead of " << expected << endl;
+				exit_status = 1;
+			}
+		}
+	}
+
+	// blocks of 2 values, 8 values apart, from a 1D dataset: 0, 1, 8, 9, 16, 17, ...
+	dal::Dataset<float> ds1(file, "DATA1D");
+	ds1.create1D(data.size(), data.size());
+	ds1.set1D(0, &data[0], data.size());
+
+	vector<float> pairs(10);
+	ds1.get1D(0, &pairs[0], pairs.size(), 0, 8, 2);
+
+	for (size_t i = 0; i < pairs.size(); i++) {
+		const float expected = (i / 2) * 8 + i % 2;
+		if (pairs[i] != expected) {
+			cerr << "get1D() with stride 8 and block 2 returned " << pairs[i] << " instead of " << expected << endl;
+			exit_status = 1;
+		}
+	}
+
+	// the number of values must be a multiple of the block size
+	try {
+		ds1.get1D(0, &pairs[0], 9, 0, 8, 2);
+		cerr << "get1D() with a partial block did not throw" << endl;
+		exit_status = 1;
+	} catch (dal::DALValueError& ) {
+	}
+
+	// the buffer length must match the selection
+	try {
+		ds.getHyperslab(pos, size, step, noBlock, &block[0], block.size() - 1);
+		cerr << "getHyperslab() with a too small buffer did not throw" << endl;
+		exit_status = 1;
+	} catch (dal::DALValueError& ) {
+	}
+
+	return exit_status;
+}
@@ -0,0 +1,97 @@
+// dataset-read-overhead.cc
+// Micro-benchmark of the per-call overhead of reading many small blocks from a dataset.
+// Compares reads with the dataset extent cache in place against reads that drop the cache
+// before every call (i.e. query the dataspace and create a memory dataspace every time,
+// as DAL did before the cache was introduced). Also checks that both read the same data.
+// Build: c++ -Wall dataset-read-overhead.cc -llofardal -lhdf5
+// Run with a number of iterations as argument for more stable timings.
+#include <cstdlib>
+#include <vector>
+#include <iostream>
+#include <sys/time.h>
+
+#include <dal/hdf5/File.h>
+#include <dal/hdf5/Dataset.h>
+
+using namespace std;
+
+// Exposes the protected cache invalidation to emulate the uncached read path.
+class UncachedDataset: public dal::Dataset<float> {
+public:
+	UncachedDataset( dal::Group &parent, const string &name ): dal::Dataset<float>(parent, name) {}
+
+	void get2DUncached( const vector<size_t> &pos, float *outbuffer2, size_t dim1, size_t dim2 ) {
+		invalidateExtent();
+		get2D(pos, outbuffer2, dim1, dim2);
+	}
+};
+
+static double now() {
+	struct timeval tv;
+	gettimeofday(&tv, NULL);
+	return tv.tv_sec + tv.tv_usec / 1.0e6;
+}
+
+int main(int argc, char *argv[]) {
+	const size_t nrSamples = argc >= 2 ? atol(argv[1]) : 1000;
+	const size_t nrChannels = 16;
+	const size_t blockLen = 4;
+	int exit_status = 0;
+
+	dal::File file("test-dataset-read-overhead.h5", dal::File::CREATE);
+	UncachedDataset ds(file, "DATA");
+
+	vector<ssize_t> dims(2);
+	dims[0] = nrSamples * blockLen;
+	dims[1] = nrChannels;
+	ds.create(dims);
+
+	vector<float> data(dims[0] * dims[1]);
+	for (size_t i = 0; i < data.size(); i++) {
+		data[i] = i;
+	}
+	vector<size_t> pos(2, 0);
+	ds.set2D(pos, &data[0], dims[0], dims[1]);
+
+	vector<float> block(blockLen * nrChannels);
+	vector<float> blockUncached(blockLen * nrChannels);
+
+	double start = now();
+	for (size_t i = 0; i < nrSamples; i++) {
+		pos[0] = i * blockLen;
+		ds.get2DUncached(pos, &blockUncached[0], blockLen, nrChannels);
+	}
+	const double uncached = now() - start;
+
+	start = now();
+	for (size_t i = 0; i < nrSamples; i++) {
+		pos[0] = i * blockLen;
+		ds.get2D(pos, &block[0], blockLen, nrChannels);
+	}
+	const double cached = now() - start;
+
+	if (block != blockUncached || block[0] != (float)((nrSamples - 1) * blockLen * nrChannels)) {
+		cerr << "cached and uncached reads returned different data" << endl;
+		exit_status = 1;
+	}
+
+	cout << "per get2D() call: uncached " << 1.0e6 * uncached / nrSamples << " us, "
+	     << "cached " << 1.0e6 * cached / nrSamples << " us" << endl;
+
+	// a resize must be noticed, also through another object referring to the same dataset
+	dal::Dataset<float> ext(file, "EXTERNAL_DATA");
+	ext.create1D(100, 200, "test-dataset-read-overhead.raw");
+	if (ext.dims1D() != 100) {
+		cerr << "dims1D() does not match the created length" << endl;
+		exit_status = 1;
+	}
+
+	dal::Dataset<float> other(file, "EXTERNAL_DATA");
+	other.resize1D(150);
+	if (ext.dims1D() != 150) {
+		cerr << "resize through another object was not noticed; dims1D() = " << ext.dims1D() << endl;
+		exit_status = 1;
+	}
+
+	return exit_status;
+}
@@ -0,0 +1,111 @@
+// dataset-regions.cc
+// Read many disjoint windows of a dataset with a single getRegions() call, both in order
+// (selected as a union of hyperslabs) and out of order or overlapping (selected as points),
+// and check that they match what per-window reads return.
+// Build: c++ -Wall dataset-regions.cc -llofardal -lhdf5
+#include <vector>
+#include <algorithm>
+#include <iostream>
+
+#include <dal/hdf5/File.h>
+#include <dal/hdf5/Dataset.h>
+
+using namespace std;
+
+static int checkRegions(dal::Dataset<short> &ds, const vector<size_t> &offsets, const vector<size_t> &lengths) {
+	size_t total = 0;
+	for (size_t r = 0; r < lengths.size(); r++) {
+		total += lengths[r];
+	}
+
+	vector<short> packed(total);
+	ds.getRegions(offsets, lengths, &packed[0], packed.size());
+
+	size_t start = 0;
+	for (size_t r = 0; r < offsets.size(); r++) {
+		vector<short> window(lengths[r]);
+		if (!window.empty()) {
+			ds.get1D(offsets[r], &window[0], window.size());
+		}
+
+		if (!equal(window.begin(), window.end(), packed.begin() + start)) {
+			cerr << "region " << r << " at offset " << offsets[r] << " does not match get1D()" << endl;
+			return 1;
+		}
+
+		start += lengths[r];
+	}
+
+	return 0;
+}
+
+int main() {
+	int exit_status = 0;
+
+	dal::File file("test-dataset-regions.h5", dal::File::CREATE);
+
+	dal::Dataset<short> ds(file, "DATA");
+	ds.create1D(10000, 10000);
+
+	vector<short> data(10000);
+	for (size_t i = 0; i < data.size(); i++) {
+		data[i] = i;
+	}
+	ds.set1D(0, &data[0], data.size());
+
+	// sorted, disjoint windows
+	vector<size_t> offsets, lengths;
+	for (size_t i = 0; i < 50; i++) {
+		offsets.push_back(i * 190 + 7);
+		lengths.push_back(i % 5 + 1);
+	}
+	exit_status |= checkRegions(ds, offsets, lengths);
+
+	// windows in reverse order, one overlapping and one empty
+	vector<size_t> revOffsets(offsets.rbegin(), offsets.rend());
+	vector<size_t> revLengths(lengths.rbegin(), lengths.rend());
+	revOffsets.push_back(revOffsets[0]);
+	revLengths.push_back(10);
+	revOffsets.push_back(0);
+	revLengths.push_back(0);
+	exit_status |= checkRegions(ds, revOffsets, revLengths);
+
+	// 2D boxes that interleave in the first dimension
+	dal::Dataset<short> ds2(file, "DATA2D");
+	vector<ssize_t> dims(2);
+	dims[0] = 100;
+	dims[1] = 100;
+	ds2.create(dims, dims);
+	vector<size_t> pos(2, 0);
+	ds2.set2D(pos, &data[0], dims[0], dims[1]);
+
+	vector<size_t> boxPos, boxSize;
+	boxPos.push_back(10); boxPos.push_back(20); boxSize.push_back(3); boxSize.push_back(4);
+	boxPos.push_back(11); boxPos.push_back(60); boxSize.push_back(2); boxSize.push_back(5);
+
+	vector<short> boxes(3 * 4 + 2 * 5);
+	ds2.getRegions(boxPos, boxSize, &boxes[0], boxes.size());
+
+	size_t n = 0;
+	for (size_t r = 0; r < 2; r++) {
+		for (size_t i = 0; i < boxSize[r * 2]; i++) {
+			for (size_t j = 0; j < boxSize[r * 2 + 1]; j++, n++) {
+				const short expected = (boxPos[r * 2] + i) * dims[1] + boxPos[r * 2 + 1] + j;
+				if (boxes[n] != expected) {
+					cerr << "box " << r << " value (" << i << "," << j << ") is " << boxes[n] << " instead of " << expected << endl;
+					exit_status = 1;
+				}
+			}
+		}
+	}
+
+	// the buffer length must match the total size of the regions
+	try {
+		ds2.getRegions(boxPos, boxSize, &boxes[0], boxes.size() - 1);
+		cerr << "getRegions() with a too small buffer did not throw" << endl;
+		exit_status = 1;
+	} catch (dal::DALValueError& ) {
+	}
+
+	return exit_status;
+}
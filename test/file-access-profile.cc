@@ -0,0 +1,80 @@
+// file-access-profile.cc
+// Check that files can be opened and created with each FileAccessProfile preset and driver,
+// and that the alignment of the "lustre-ingest" preset is applied.
+// Build: c++ -Wall file-access-profile.cc -llofardal -lhdf5
+#include <string>
+#include <vector>
+#include <iostream>
+
+#include <hdf5.h>
+#include <dal/lofar/BF_File.h>
+
+using namespace std;
+
+static int exit_status;
+
+int main() {
+	const string filename("test-file-access-profile_bf.h5");
+
+	const char *presets[] = { "default", "sequential-scan", "random-access", "metadata-only", "lustre-ingest" };
+	for (size_t i = 0; i < sizeof presets / sizeof presets[0]; i++) {
+		const dal::FileAccessProfile profile(presets[i]);
+
+		{
+			dal::BF_File file(filename, dal::BF_File::CREATE, profile);
+			file.observationID().value = presets[i];
+
+			dal::Dataset<float> data(file, "DATA");
+			data.create1D(32 * 1024, 32 * 1024);
+			vector<float> values(32 * 1024, 1.0f);
+			data.set1D(0, &values[0], values.size());
+		}
+
+		dal::BF_File file(filename, dal::BF_File::READ, profile);
+		if (file.observationID().get() != presets[i]) {
+			cerr << "unexpected value written with preset " << presets[i] << endl;
+			exit_status = 1;
+		}
+	}
+
+	try {
+		dal::FileAccessProfile profile("no-such-preset");
+		cerr << "unknown preset did not throw" << endl;
+		exit_status = 1;
+	} catch (dal::DALValueError &) {
+	}
+
+	// datasets of at least 64 KiB start at a multiple of 1 MiB
+	{
+		hid_t file = H5Fopen(filename.c_str(), H5F_ACC_RDONLY, H5P_DEFAULT);
+		hid_t dataset = H5Dopen2(file, "DATA", H5P_DEFAULT);
+		const haddr_t offset = H5Dget_offset(dataset);
+		H5Dclose(dataset);
+		H5Fclose(file);
+
+		if (offset == HADDR_UNDEF || offset % (1024 * 1024) != 0) {
+			cerr << "dataset not aligned with preset lustre-ingest: offset " << offset << endl;
+			exit_status = 1;
+		}
+	}
+
+	const dal::FileAccessProfile::Driver drivers[] = { dal::FileAccessProfile::SEC2, dal::FileAccessProfile::STDIO, dal::FileAccessProfile::CORE };
+	for (size_t i = 0; i < sizeof drivers / sizeof drivers[0]; i++) {
+		dal::FileAccessProfile profile;
+		profile.setDriver(drivers[i]);
+		profile.setCoreIncrement(64 * 1024, true); // only used by the core driver
+
+		{
+			dal::BF_File file(filename, dal::BF_File::CREATE, profile);
+			file.observationID().value = "driver";
+		}
+
+		dal::BF_File file(filename, dal::BF_File::READ, profile);
+		if (file.observationID().get() != "driver") {
+			cerr << "unexpected value written with driver " << drivers[i] << endl;
+			exit_status = 1;
+		}
+	}
+
+	return exit_status;
+}
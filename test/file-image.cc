@@ -0,0 +1,116 @@
+// file-image.cc
+// Check that files can be built in memory with the core driver, retrieved as a file image,
+// opened again from that image, and written to disk.
+// Build: c++ -Wall file-image.cc -llofardal -lhdf5
+#include <cstdio>
+#include <string>
+#include <iostream>
+
+#include <dal/lofar/BF_File.h>
+
+using namespace std;
+
+static int exit_status;
+
+static bool fileExists(const string &filename) {
+	FILE *f = fopen(filename.c_str(), "rb");
+	if (f != NULL) {
+		fclose(f);
+	}
+	return f != NULL;
+}
+
+int main() {
+	const string filename("test-file-image_bf.h5");
+	remove(filename.c_str());
+
+	string image;
+	{
+		dal::BF_File file(filename, dal::BF_File::CREATE, dal::FileAccessProfile("in-memory"));
+		file.observationID().value = "in memory";
+		image = file.fileImage();
+	}
+
+	if (fileExists(filename)) {
+		cerr << "in-memory file was written to disk" << endl;
+		exit_status = 1;
+	}
+
+	if (image.compare(0, 8, "\x89HDF\r\n\x1a\n") != 0) {
+		cerr << "file image does not start with the HDF5 signature" << endl;
+		exit_status = 1;
+	}
+
+	dal::FileAccessProfile profile("in-memory");
+	profile.setFileImage(image);
+
+	{
+		dal::BF_File file(filename, dal::BF_File::READ, profile);
+		if (file.observationID().get() != "in memory") {
+			cerr << "unexpected value read from file image" << endl;
+			exit_status = 1;
+		}
+	}
+
+	// writes change the in-memory copy, which can be stored on disk
+	{
+		dal::BF_File file(filename, dal::BF_File::READWRITE, profile);
+		file.observationID().value = "on disk";
+		file.writeImage(filename);
+	}
+
+	{
+		dal::BF_File file(filename, dal::BF_File::READ);
+		if (file.observationID().get() != "on disk") {
+			cerr << "unexpected value read from written file image" << endl;
+			exit_status = 1;
+		}
+	}
+
+	// the image equals the file HDF5 writes when the file is closed
+	{
+		dal::FileAccessProfile backed;
+		backed.setDriver(dal::FileAccessProfile::CORE);
+		backed.setCoreIncrement(64 * 1024, true);
+
+		{
+			dal::BF_File file(filename, dal::BF_File::CREATE, backed);
+			file.observationID().value = "backed";
+			image = file.fileImage();
+		}
+
+		string onDisk;
+		FILE *f = fopen(filename.c_str(), "rb");
+		if (f != NULL) {
+			char buf[4096];
+			size_t n;
+			while ((n = fread(buf, 1, sizeof buf, f)) > 0) {
+				onDisk.append(buf, n);
+			}
+			fclose(f);
+		}
+
+		if (image != onDisk) {
+			cerr << "file image differs from file written on close" << endl;
+			exit_status = 1;
+		}
+	}
+
+	try {
+		dal::BF_File file(filename, dal::BF_File::CREATE, profile);
+		cerr << "creating a file from a file image did not throw" << endl;
+		exit_status = 1;
+	} catch (dal::DALValueError &) {
+	}
+
+	try {
+		dal::FileAccessProfile sec2;
+		sec2.setFileImage(image);
+		dal::BF_File file(filename, dal::BF_File::READ, sec2);
+		cerr << "opening a file image without the core driver did not throw" << endl;
+		exit_status = 1;
+	} catch (dal::DALValueError &) {
+	}
+
+	return exit_status;
+}
@@ -0,0 +1,103 @@
+// group-members.cc
+// Check Group::members(): names (also long ones), object types, prefix filtering,
+// and the enumeration of TBB stations and dipoles built on it.
+// Build: c++ -Wall group-members.cc -llofardal -lhdf5
+#include <string>
+#include <vector>
+#include <iostream>
+
+#include <hdf5.h>
+#include <dal/lofar/TBB_File.h>
+
+using namespace std;
+
+static int exit_status;
+
+static void checkMembers(const vector<dal::GroupMember> &members, const vector<string> &names,
+                         const vector<dal::GroupMember::Type> &types, const string &what) {
+	bool ok = members.size() == names.size();
+
+	for (size_t i = 0; ok && i < members.size(); i++) {
+		ok = members[i].name() == names[i] && members[i].type() == types[i];
+	}
+
+	if (!ok) {
+		cerr << "unexpected members " << what << ":";
+		for (size_t i = 0; i < members.size(); i++) {
+			cerr << " " << members[i].name() << "/" << members[i].type();
+		}
+		cerr << endl;
+		exit_status = 1;
+	}
+}
+
+int main() {
+	const string filename("test-group-members.h5");
+	const string longName(300, 'L');
+
+	// create the links with HDF5 directly, as DAL cannot create soft links
+	hid_t file = H5Fcreate(filename.c_str(), H5F_ACC_TRUNC, H5P_DEFAULT, H5P_DEFAULT);
+	H5Gclose(H5Gcreate2(file, "B_GROUP", H5P_DEFAULT, H5P_DEFAULT, H5P_DEFAULT));
+	H5Gclose(H5Gcreate2(file, "B_GROUP2", H5P_DEFAULT, H5P_DEFAULT, H5P_DEFAULT));
+	H5Gclose(H5Gcreate2(file, longName.c_str(), H5P_DEFAULT, H5P_DEFAULT, H5P_DEFAULT));
+	H5Lcreate_soft("/B_GROUP", file, "A_LINK", H5P_DEFAULT, H5P_DEFAULT);
+	hsize_t dims[1] = { 10 };
+	hid_t space = H5Screate_simple(1, dims, NULL);
+	H5Dclose(H5Dcreate2(file, "C_DATASET", H5T_NATIVE_FLOAT, space, H5P_DEFAULT, H5P_DEFAULT, H5P_DEFAULT));
+	H5Sclose(space);
+	H5Fclose(file);
+
+	for (int mode = 0; mode < 2; mode++) {
+		// READ mode enumerates once and filters the stored list, READWRITE enumerates each time
+		dal::File f(filename, mode == 0 ? dal::File::READ : dal::File::READWRITE);
+
+		vector<string> names;
+		vector<dal::GroupMember::Type> types;
+
+		checkMembers(f.members("X"), names, types, "with prefix X");
+
+		names.push_back("A_LINK");    types.push_back(dal::GroupMember::LINK);
+		names.push_back("B_GROUP");   types.push_back(dal::GroupMember::GROUP);
+		names.push_back("B_GROUP2");  types.push_back(dal::GroupMember::GROUP);
+		names.push_back("C_DATASET"); types.push_back(dal::GroupMember::DATASET);
+		names.push_back(longName);    types.push_back(dal::GroupMember::GROUP);
+
+		checkMembers(f.members(), names, types, "of file");
+		checkMembers(f.members(""), names, types, "of file (again)");
+
+		names.erase(names.begin());   types.erase(types.begin());
+		names.resize(2);              types.resize(2);
+		checkMembers(f.members("B_GROUP"), names, types, "with prefix B_GROUP");
+
+		names.erase(names.begin());   types.erase(types.begin());
+		checkMembers(f.members("B_GROUP2"), names, types, "with prefix B_GROUP2");
+
+		checkMembers(dal::Group(f, "B_GROUP").members(), vector<string>(), vector<dal::GroupMember::Type>(), "of empty group");
+	}
+
+	{
+		dal::TBB_File tbb("test-group-members_tbb.h5", dal::TBB_File::CREATE);
+		tbb.station("CS001").create();
+		tbb.station("CS002").create();
+		tbb.trigger().create();
+
+		dal::TBB_Station station(tbb.station("CS002"));
+		station.dipole(2, 0, 1).create1D(10, 10);
+		station.dipole(2, 0, 0).create1D(10, 10);
+		dal::Group(station, "NOT_A_DIPOLE").create();
+
+		vector<dal::TBB_Station> stations(tbb.stations());
+		if (stations.size() != 2 || stations[0].name() != "STATION_CS001" || stations[1].name() != "STATION_CS002") {
+			cerr << "unexpected stations" << endl;
+			exit_status = 1;
+		}
+
+		vector<dal::TBB_DipoleDataset> dipoles(station.dipoles());
+		if (dipoles.size() != 2 || dipoles[0].name() != "DIPOLE_002000000" || dipoles[1].name() != "DIPOLE_002000001") {
+			cerr << "unexpected dipoles" << endl;
+			exit_status = 1;
+		}
+	}
+
+	return exit_status;
+}
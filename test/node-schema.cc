@@ -0,0 +1,78 @@
+// node-schema.cc
+// Check that groups create their registered nodes on lookup (see Group::nodeSchema()),
+// and that copies of a group do not share those nodes.
+// Build: c++ -Wall node-schema.cc -llofardal -lhdf5
+#include <string>
+#include <vector>
+#include <algorithm>
+#include <functional>
+#include <iostream>
+
+#include <dal/lofar/TBB_File.h>
+
+using namespace std;
+
+static int exit_status;
+
+static bool hasName(const vector<string> &names, const string &name) {
+	return find(names.begin(), names.end(), name) != names.end();
+}
+
+int main() {
+	dal::TBB_File file("test-node-schema_tbb.h5", dal::TBB_File::CREATE);
+
+	// registered nodes of the file, its base classes, and its version attribute
+	const vector<string> fileNames(file.nodeNames());
+	if (!hasName(fileNames, "GROUPTYPE") || !hasName(fileNames, "TELESCOPE") ||
+	    !hasName(fileNames, "OPERATING_MODE") || !hasName(fileNames, "DOC_VERSION")) {
+		cerr << "missing registered node of TBB_File" << endl;
+		exit_status = 1;
+	}
+	if (adjacent_find(fileNames.begin(), fileNames.end(), greater_equal<string>()) != fileNames.end()) {
+		cerr << "node names of TBB_File not sorted or not unique" << endl;
+		exit_status = 1;
+	}
+
+	dal::Attribute<string> &telescope = file.getNode("TELESCOPE");
+	if (telescope.get() != "LOFAR") {
+		cerr << "unexpected TELESCOPE value " << telescope.get() << endl;
+		exit_status = 1;
+	}
+
+	try {
+		file.getNode("NOT_REGISTERED");
+		cerr << "getNode() of unregistered node did not throw" << endl;
+		exit_status = 1;
+	} catch (dal::DALValueError &) {
+	}
+
+	// the registered nodes are known before the group is opened
+	dal::TBB_Station station(file.station("CS001"));
+	if (!hasName(station.nodeNames(), "STATION_NAME")) {
+		cerr << "missing registered node STATION_NAME of TBB_Station" << endl;
+		exit_status = 1;
+	}
+	station.create();
+	station.stationName().create().set("CS001");
+
+	{
+		// copies (also through vector) look up their own nodes, which outlive the copies
+		dal::TBB_Station copy(station);
+		dal::Attribute<string> &name = copy.getNode("STATION_NAME");
+		vector<dal::TBB_Station> stations(3, copy);
+		stations.clear();
+
+		if (name.get() != "CS001") {
+			cerr << "unexpected STATION_NAME value in copy " << name.get() << endl;
+			exit_status = 1;
+		}
+	}
+
+	dal::Attribute<string> &name = station.getNode("STATION_NAME");
+	if (name.get() != "CS001") {
+		cerr << "unexpected STATION_NAME value " << name.get() << endl;
+		exit_status = 1;
+	}
+
+	return exit_status;
+}
@@ -0,0 +1,102 @@
+// range-set.cc
+// Check the set operations and mask of RangeSet, and flagging zero frames
+// while appending to and reading from a TBB dipole.
+// Build: c++ -Wall range-set.cc -llofardal -lhdf5
+#include <vector>
+#include <string>
+#include <iostream>
+
+#include <dal/lofar/TBB_DipoleAppender.h>
+
+using namespace std;
+
+static int exit_status;
+
+static void check(const dal::RangeSet &set, const string &expected, const string &what) {
+	if (set.to_string() != expected) {
+		cerr << what << ": expected " << expected << ", got " << set.to_string() << endl;
+		exit_status = 1;
+	}
+}
+
+int main() {
+	// merging, in any order
+	dal::RangeSet set;
+	set.add(20, 30);
+	set.add(0, 10);
+	set.add(40, 50);
+	set.add(5, 12);  // overlaps
+	set.add(12, 15); // adjacent
+	set.add(60, 60); // empty
+	check(set, "[[0,15), [20,30), [40,50)]", "add");
+
+	set.add(14, 41); // spans several ranges
+	check(set, "[[0,50)]", "add spanning ranges");
+
+	vector<dal::Range> ranges;
+	ranges.push_back(dal::Range(40, 50));
+	ranges.push_back(dal::Range(0, 10));
+	ranges.push_back(dal::Range(5, 20));
+	dal::RangeSet a(ranges);
+	check(a, "[[0,20), [40,50)]", "construct from unsorted ranges");
+
+	if (a.length() != 30 || a.nrRanges() != 2) {
+		cerr << "unexpected length or number of ranges" << endl;
+		exit_status = 1;
+	}
+
+	if (!a.contains(0) || !a.contains(19) || a.contains(20) || a.contains(39) || !a.contains(49) || a.contains(50)) {
+		cerr << "unexpected contains()" << endl;
+		exit_status = 1;
+	}
+
+	dal::RangeSet b;
+	b.add(15, 45);
+	b.add(60, 70);
+
+	check(a.unite(b), "[[0,50), [60,70)]", "unite");
+	check(a.intersect(b), "[[15,20), [40,45)]", "intersect");
+	check(a.complement(60), "[[20,40), [50,60)]", "complement");
+	check(b.complement(65), "[[0,15), [45,60)]", "complement shorter than set");
+	check(dal::RangeSet().complement(5), "[[0,5)]", "complement of empty set");
+
+	// mask
+	bool mask[12];
+	a.getMask(15, mask, 12); // positions 15-26
+	for (size_t i = 0; i < 12; i++) {
+		if (mask[i] != (i < 5)) {
+			cerr << "unexpected mask at position " << 15 + i << endl;
+			exit_status = 1;
+		}
+	}
+
+	// zero frames: frames of 4 samples, starting at position 100
+	const short samples[] = { 1, 2, 3, 4,  0, 0, 0, 0,  0, 0, 0, 0,  0, 5, 0, 0,  0, 0 };
+	const size_t nrSamples = sizeof samples / sizeof samples[0];
+	check(dal::zeroFrames(samples, nrSamples, 4, 100), "[[104,112), [116,118)]", "zeroFrames");
+
+	// ... while appending, and while reading
+	{
+		dal::TBB_File file("test-range-set_tbb.h5", dal::TBB_File::CREATE);
+		dal::TBB_Station station(file.station("CS001"));
+		station.create();
+		dal::TBB_DipoleDataset dipole(station.dipole(1, 0, 0));
+		dipole.create1D(0, -1, "test-range-set_tbb.raw");
+
+		{
+			dal::TBB_DipoleAppender appender(dipole, 16);
+			appender.setFlagZeroFrames(4);
+
+			for (size_t i = 0; i < nrSamples; i += 4) {
+				appender.append(&samples[i], min<size_t>(4, nrSamples - i));
+			}
+			check(appender.flags(), "[[4,12), [16,18)]", "flags while appending");
+		}
+
+		check(dal::RangeSet(dipole.flagOffsets().get()), "[[4,12), [16,18)]", "FLAG_OFFSETS after appending");
+		check(dipole.findZeroFrames(4), "[[4,12), [16,18)]", "findZeroFrames");
+		check(dipole.findZeroFrames(8), "[[16,18)]", "findZeroFrames of longer frames");
+	}
+
+	return exit_status;
+}
@@ -0,0 +1,156 @@
+// snapshot.cc
+// Check Group::snapshot() against the attributes, members and dataset dimensions
+// read group by group, for a TBB and a BF file, its lookups, and the selection of attributes.
+// Build: c++ -Wall snapshot.cc -llofardal -lhdf5
+#include <string>
+#include <vector>
+#include <iostream>
+
+#include <dal/lofar/BF_File.h>
+#include <dal/lofar/TBB_File.h>
+
+using namespace std;
+
+static int exit_status;
+
+static void check(bool ok, const string &what) {
+	if (!ok) {
+		cerr << what << endl;
+		exit_status = 1;
+	}
+}
+
+static bool sameAttributes(const vector<dal::AttributeData> &a, const vector<dal::AttributeData> &b) {
+	if (a.size() != b.size())
+		return false;
+
+	for (size_t i = 0; i < a.size(); i++) {
+		if (a[i].name() != b[i].name() || a[i].type() != b[i].type() || a[i].size() != b[i].size() ||
+		    a[i].integers() != b[i].integers() || a[i].unsignedIntegers() != b[i].unsignedIntegers() ||
+		    a[i].floats() != b[i].floats() || a[i].complexes() != b[i].complexes() || a[i].strings() != b[i].strings())
+			return false;
+	}
+
+	return true;
+}
+
+// Compares the snapshot of everything below `group` (at `path`) with what is read group by group.
+static void checkGroup(const dal::Snapshot &snapshot, dal::Group &group, const string &path) {
+	check(snapshot.contains(path), "snapshot does not contain " + path);
+	if (!snapshot.contains(path))
+		return;
+
+	const dal::ObjectSnapshot &object = snapshot.object(path);
+	check(object.path() == path, "wrong path of " + path);
+	check(object.type() == dal::GroupMember::GROUP, "wrong type of " + path);
+	check(sameAttributes(object.attributes(), group.loadAttributes()), "wrong attributes of " + path);
+
+	const vector<dal::GroupMember> members(group.members());
+	const vector<dal::ObjectSnapshot> snapshotMembers(snapshot.members(path));
+	check(members.size() == snapshotMembers.size(), "wrong number of members of " + path);
+
+	for (size_t i = 0; i < members.size() && i < snapshotMembers.size(); i++) {
+		const string memberPath = path.empty() ? members[i].name() : path + "/" + members[i].name();
+
+		check(snapshotMembers[i].path() == memberPath, "wrong member path " + snapshotMembers[i].path());
+		check(snapshotMembers[i].name() == members[i].name(), "wrong member name " + snapshotMembers[i].name());
+		check(snapshotMembers[i].parentPath() == path, "wrong parent path of " + memberPath);
+
+		if (members[i].type() == dal::GroupMember::GROUP) {
+			dal::Group member(group, members[i].name());
+			checkGroup(snapshot, member, memberPath);
+		} else if (members[i].type() == dal::GroupMember::DATASET) {
+			dal::Dataset<short> member(group, members[i].name());
+			check(snapshotMembers[i].type() == dal::GroupMember::DATASET, "wrong type of " + memberPath);
+			check(snapshotMembers[i].dims() == member.dims(), "wrong dims of " + memberPath);
+			check(sameAttributes(snapshotMembers[i].attributes(), member.loadAttributes()), "wrong attributes of " + memberPath);
+			check(snapshot.members(memberPath).empty(), "dataset has members " + memberPath);
+		}
+	}
+}
+
+int main() {
+	{
+		dal::TBB_File file("data/L59640_CS011_D20110719T110541.036Z_tbb.h5");
+		const dal::Snapshot snapshot(file.snapshot());
+
+		check(snapshot.size() > 0 && snapshot.objects()[0].path() == "", "root is not the first object");
+		check(snapshot.objects()[0].name() == "", "root has a name");
+		checkGroup(snapshot, file, "");
+
+		// groups precede their members
+		for (size_t i = 0; i < snapshot.size(); i++) {
+			const string parent(snapshot.objects()[i].parentPath());
+			bool found = false;
+
+			for (size_t j = 0; !found && j < i; j++) {
+				found = snapshot.objects()[j].path() == parent;
+			}
+
+			check(i == 0 || found, "object visited before its group: " + snapshot.objects()[i].path());
+		}
+
+		const dal::TBB_Station station(file.stations()[0]);
+		const string stationPath(station.name());
+		const dal::ObjectSnapshot &stationSnapshot = snapshot.object(stationPath);
+		check(stationSnapshot.hasAttribute("STATION_NAME"), "no STATION_NAME in snapshot of " + stationPath);
+		check(stationSnapshot.attribute("STATION_NAME").strings()[0] == "CS011", "wrong STATION_NAME in snapshot of " + stationPath);
+		check(!stationSnapshot.hasAttribute("NO_SUCH_ATTRIBUTE"), "snapshot has a nonexisting attribute");
+
+		try {
+			stationSnapshot.attribute("NO_SUCH_ATTRIBUTE");
+			check(false, "attribute() of nonexisting attribute did not throw");
+		} catch (dal::DALValueError &) {
+		}
+
+		try {
+			snapshot.object("NO_SUCH_GROUP");
+			check(false, "object() of nonexisting object did not throw");
+		} catch (dal::DALValueError &) {
+		}
+
+		check(snapshot.members("NO_SUCH_GROUP").empty(), "nonexisting group has members");
+
+		// a snapshot of a subgroup has paths relative to it
+		dal::TBB_Station stationGroup(file.stations()[0]);
+		const dal::Snapshot stationOnly(stationGroup.snapshot());
+		check(stationOnly.size() == snapshot.members(stationPath).size() + 1, "wrong number of objects in snapshot of " + stationPath);
+		checkGroup(stationOnly, stationGroup, "");
+
+		// reading only some attributes still includes all objects
+		vector<string> names;
+		names.push_back("STATION_NAME");
+		names.push_back("RCU_ID");
+		const dal::Snapshot selected(file.snapshot(names));
+		check(selected.size() == snapshot.size(), "wrong number of objects in snapshot of selected attributes");
+
+		for (size_t i = 0; i < selected.size() && i < snapshot.size(); i++) {
+			const dal::ObjectSnapshot &object = selected.objects()[i];
+			check(object.path() == snapshot.objects()[i].path(), "wrong object in snapshot of selected attributes: " + object.path());
+
+			for (size_t j = 0; j < object.attributes().size(); j++) {
+				const string name(object.attributes()[j].name());
+				check(name == "STATION_NAME" || name == "RCU_ID", "unselected attribute " + name + " in snapshot of " + object.path());
+			}
+
+			check(object.hasAttribute("STATION_NAME") == snapshot.objects()[i].hasAttribute("STATION_NAME") &&
+			      object.hasAttribute("RCU_ID") == snapshot.objects()[i].hasAttribute("RCU_ID"),
+			      "selected attribute missing in snapshot of " + object.path());
+		}
+
+		check(selected.object(stationPath).attribute("STATION_NAME").strings()[0] == "CS011", "wrong selected STATION_NAME");
+	}
+
+	{
+		dal::BF_File file("data/L63876_SAP000_B000_S0_P000_bf.h5");
+		const dal::Snapshot snapshot(file.snapshot());
+
+		checkGroup(snapshot, file, "");
+
+		const dal::ObjectSnapshot &stokes = snapshot.object("SUB_ARRAY_POINTING_000/BEAM_000/STOKES_0");
+		check(stokes.type() == dal::GroupMember::DATASET, "STOKES_0 is not a dataset");
+		check(stokes.dims().size() == 2, "wrong rank of STOKES_0");
+	}
+
+	return exit_status;
+}
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# Check the frame numbers that lofar_tbb_flaggeddata.get_lost_frame_nrs() reports as lost:
+# all-zero frames, a zero partial frame at the end of the data, and the trailing frames
+# beyond the end of the data up to total_len. Also reads in several blocks.
+import os
+import sys
+import numpy
+import dal
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'dal', 'utils'))
+import lofar_tbb_flaggeddata
+
+BLOCK_LEN = 4
+
+def check(dp, total_len, expected):
+  for frames_per_read in (1, 2, 16384):
+    lofar_tbb_flaggeddata.FRAMES_PER_READ = frames_per_read
+    lost = lofar_tbb_flaggeddata.get_lost_frame_nrs(dp, BLOCK_LEN, total_len)
+    if lost != expected:
+      print 'unexpected lost frames', lost, 'instead of', expected, 'with total_len', total_len, 'and', frames_per_read, 'frames per read'
+      return 1
+  return 0
+
+def dataset(f, name, values):
+  d = dal.DatasetShort(f, name)
+  d.create1D(len(values), len(values))
+  d.set1D(0, numpy.array(values, dtype=d.dtype))
+  return d
+
+f = dal.File('test-tbb-lost-frames.h5', dal.File.CREATE)
+status = 0
+
+# 4.5 frames: frame 1 and the partial frame 4 are zero
+d = dataset(f, 'PARTIAL_ZERO', [1,2,3,4, 0,0,0,0, 0,0,0,5, 6,0,0,0, 0,0])
+status |= check(d, None, [1, 4])
+status |= check(d, 10,   [1, 4])      # a total_len below the data length is ignored
+status |= check(d, 30,   [1, 4, 5, 6, 7])
+
+# the partial frame 4 has data, so trailing frames start at frame 5
+d = dataset(f, 'PARTIAL_DATA', [1,2,3,4, 0,0,0,0, 0,0,0,5, 6,0,0,0, 0,7])
+status |= check(d, None, [1])
+status |= check(d, 30,   [1, 5, 6, 7])
+
+# whole frames only: trailing frames start right after the data
+d = dataset(f, 'WHOLE', [1,2,3,4, 0,0,0,0, 0,0,0,5, 6,0,0,0])
+status |= check(d, 16, [1])
+status |= check(d, 17, [1, 4])
+status |= check(d, 24, [1, 4, 5])
+
+del d
+del f
+os.remove('test-tbb-lost-frames.h5')
+
+sys.exit(status)
@@ -0,0 +1,78 @@
+// tbb-read-dipoles.cc
+// Read a window of samples of many dipoles with TBB_File::readDipoles() using several
+// worker threads, and check the result against per-dipole get1D() calls. Covers raw files
+// in both byte orders, a dipole stored inside the HDF5 file, and a short raw file.
+// Build: c++ -Wall tbb-read-dipoles.cc -llofardal -lhdf5
+#include <cstdio>
+#include <vector>
+#include <iostream>
+
+#include <dal/lofar/TBB_File.h>
+
+using namespace std;
+
+int main() {
+	int exit_status = 0;
+
+	const size_t nrDipoles = 12;
+	const size_t len = 5000;
+
+	dal::TBB_File file("test-tbb-read-dipoles_tbb.h5", dal::TBB_File::CREATE);
+	dal::TBB_Station st(file.station("CS001"));
+	st.create();
+
+	vector<short> data(len);
+	for (size_t d = 0; d < nrDipoles; d++) {
+		dal::TBB_DipoleDataset dp(st.dipole(1, d / 8, d % 8));
+
+		if (d == 3) {
+			// stored inside the HDF5 file
+			dp.create1D(len, len);
+		} else {
+			char rawname[64];
+			snprintf(rawname, sizeof rawname, "test-tbb-read-dipoles_%02u.raw", (unsigned)d);
+			dp.create1D(len, len, rawname, d % 2 ? dal::TBB_DipoleDataset::BIG : dal::TBB_DipoleDataset::LITTLE);
+		}
+
+		for (size_t i = 0; i < len; i++) {
+			data[i] = (short)(d * 1000 + i) * (i % 2 ? -1 : 1);
+		}
+
+		// leave the end of one raw file unwritten, which reads as zeroes
+		dp.set1D(0, &data[0], d == 5 ? len / 2 : len);
+	}
+
+	vector<dal::TBB_DipoleDataset> dipoles(st.dipoles());
+	if (dipoles.size() != nrDipoles) {
+		cerr << "expected " << nrDipoles << " dipoles, found " << dipoles.size() << endl;
+		return 1;
+	}
+
+	const size_t pos = len / 2 - 100;
+	const size_t nrSamples = 1000;
+	vector<short> samples(nrDipoles * nrSamples);
+	file.readDipoles(dipoles, pos, &samples[0], nrDipoles, nrSamples, 4);
+
+	vector<short> expected(nrSamples);
+	for (size_t d = 0; d < nrDipoles; d++) {
+		dipoles[d].get1D(pos, &expected[0], nrSamples);
+
+		for (size_t i = 0; i < nrSamples; i++) {
+			if (samples[d * nrSamples + i] != expected[i]) {
+				cerr << "dipole " << dipoles[d].name() << " sample " << pos + i << " is " << samples[d * nrSamples + i] << " instead of " << expected[i] << endl;
+				exit_status = 1;
+				break;
+			}
+		}
+	}
+
+	// the window must lie within every dipole
+	try {
+		file.readDipoles(dipoles, len - 10, &samples[0], nrDipoles, 20, 4);
+		cerr << "readDipoles() beyond the end of the data did not throw" << endl;
+		exit_status = 1;
+	} catch (dal::DALValueError& ) {
+	}
+
+	return exit_status;
+}
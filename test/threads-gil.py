@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# Check that Python threads run while another thread is blocked in DAL I/O,
+# i.e. that Dataset.get1D() releases the GIL. One thread reads a large dataset
+# through HDF5, while another reads the same data through a numpy.memmap.
+import sys
+import time
+import threading
+import numpy
+import dal
+
+NR_SAMPLES = 32 * 1024 * 1024
+NR_READS = 5
+
+f = dal.File('test-threads-gil.h5', dal.File.CREATE)
+d = dal.DatasetShort(f, 'DATA')
+d.create1D(NR_SAMPLES, NR_SAMPLES, 'test-threads-gil.raw')
+d.set1D(0, numpy.arange(NR_SAMPLES, dtype=d.dtype))
+
+intervals = []  # (start, end) of each get1D() call
+ticks = []      # times at which the other thread made progress
+done = threading.Event()
+
+def hdf5Reader():
+  buf = numpy.empty((NR_SAMPLES,), dtype=d.dtype)
+  for i in range(NR_READS):
+    start = time.time()
+    d.get1D(0, buf)
+    intervals.append((start, time.time()))
+  done.set()
+
+def mmapReader():
+  m = d.mmap()
+  pos = 0
+  while not done.isSet():
+    ticks.append(time.time())
+    m[pos:pos + 4096].sum()
+    pos = (pos + 4096) % NR_SAMPLES
+
+threads = [threading.Thread(target=hdf5Reader), threading.Thread(target=mmapReader)]
+for t in threads:
+  t.start()
+for t in threads:
+  t.join()
+
+overlapping = [t for t in ticks if any(start < t < end for (start, end) in intervals)]
+
+if not overlapping:
+  print "The mmap reader made no progress during any of the %u get1D() calls (%u ticks total)" % (len(intervals), len(ticks))
+  sys.exit(1)